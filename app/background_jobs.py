@@ -1,14 +1,24 @@
 """
-Bounded concurrency for utility background jobs (provider contact lookup, pending verification).
-Jobs are run by a fixed-size thread pool; excess jobs are queued and run when a worker is free.
+Bounded concurrency for background jobs.
+
+Utility jobs (provider contact lookup, pending verification) run on a fixed-size thread pool; excess jobs are queued
+and run when a worker is free. Deferred per-user work (e.g. Status Confirmation materialization after sign-in) runs on
+a separate pool so it never waits behind slow utility lookups, and is debounced per key.
 """
+import logging
 import threading
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable
 
+logger = logging.getLogger(__name__)
+
 _executor: ThreadPoolExecutor | None = None
 _executor_lock = threading.Lock()
 
+_deferred_executor: ThreadPoolExecutor | None = None
+_deferred_pending: set[str] = set()
+_deferred_lock = threading.Lock()
+
 
 def _get_executor() -> ThreadPoolExecutor:
     global _executor
@@ -32,3 +42,46 @@ def submit_utility_job(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Non
     the actual work is limited by utility_background_jobs_max_workers.
     """
     _get_executor().submit(fn, *args, **kwargs)
+
+
+def _get_deferred_executor() -> ThreadPoolExecutor:
+    global _deferred_executor
+    if _deferred_executor is None:
+        with _deferred_lock:
+            if _deferred_executor is None:
+                from app.config import get_settings
+                n = get_settings().deferred_user_jobs_max_workers
+                _deferred_executor = ThreadPoolExecutor(
+                    max_workers=max(1, n),
+                    thread_name_prefix="deferred_bg",
+                )
+    return _deferred_executor
+
+
+def submit_keyed_job(key: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> bool:
+    """
+    Submit a job to the deferred-work pool unless a job with the same key is already queued or running
+    (debounce: e.g. several sign-ins by one user in quick succession queue one job). Returns whether it was submitted.
+    Failures are logged; the caller's request has already returned.
+    """
+    with _deferred_lock:
+        if key in _deferred_pending:
+            return False
+        _deferred_pending.add(key)
+
+    def _run() -> None:
+        try:
+            fn(*args, **kwargs)
+        except Exception:
+            logger.exception("Deferred background job failed; key=%s", key)
+        finally:
+            with _deferred_lock:
+                _deferred_pending.discard(key)
+
+    try:
+        _get_deferred_executor().submit(_run)
+    except Exception:
+        with _deferred_lock:
+            _deferred_pending.discard(key)
+        raise
+    return True
@@ -59,6 +59,18 @@ class Settings(BaseSettings):
     def strip_mailgun(cls, v: str) -> str:
         return (v or "").strip()
 
+    # Outbound email dispatcher (app.services.email_dispatcher). When running (API process), send_email persists the
+    # message and enqueues its row; a background thread delivers over one keep-alive HTTP client, batching identical
+    # messages into one Mailgun call and retrying transient failures with exponential backoff. Disabled (or scripts /
+    # tests) = send inline as before.
+    email_dispatcher_enabled: bool = True
+    email_queue_maxsize: int = 1000  # in-memory bound on ids awaiting the worker; overflow is left to the DB sweep
+    email_batch_size: int = 100  # messages taken off the queue per delivery pass
+    email_max_attempts: int = 5
+    email_retry_base_seconds: int = 30  # delay before retry n is base * 2**(n-1), capped at one hour
+    email_poll_seconds: float = 15.0  # how often the worker checks the DB for due retries / overflow rows
+    email_attempt_retention_days: int = 30  # sent/failed email rows (bodies already cleared) are purged after this
+
     twilio_account_sid: str = ""
     twilio_auth_token: str = ""
     twilio_from_phone_number: str = ""
@@ -88,6 +100,67 @@ class Settings(BaseSettings):
     # Vacant-unit monitoring: prompt interval (days) and response deadline (days after each prompt)
     vacant_monitoring_interval_days: int = 7
     vacant_monitoring_response_days: int = 7
+    # Stay notification job: properties are split into this many shards that run in parallel on background sessions
+    # (capped at half the DB pool; SQLite always runs one). Env: STAY_JOB_SHARDS
+    stay_job_shards: int = 4
+    # Public live page cache (app.services.live_page_cache): per-worker entries for GET /public/live/{slug}, dropped on
+    # writes to the property and after this many seconds at most. 0 disables the cache.
+    live_page_cache_ttl_seconds: int = 300
+    live_page_cache_max_entries: int = 2000
+    # GET /dashboard/alerts/unread-count reads a per-user counter maintained with alert writes; it is recounted from
+    # dashboard_alerts when older than this (absorbs drift from cascaded deletes or concurrent first use)
+    dashboard_alert_unread_reconcile_seconds: int = 900
+    # Nightly property state snapshot reconcile (app.services.property_state): server-local hour, at :05
+    property_state_reconcile_hour: int = 0
+    # Commits that touch a property drop its snapshot rows and queue it for a background refresh in the API / worker
+    # process, coalescing ids for this long; elsewhere (scripts, tests, disabled) the refresh runs inside the commit
+    property_state_refresh_async: bool = True
+    property_state_refresh_delay_seconds: float = 0.5
+    # Cron jobs (app.services.scheduler) run only on the elected leader: a PostgreSQL advisory lock, or a lease row in
+    # scheduler_leases elsewhere (SQLite). "embedded": every API process runs a scheduler and one of them leads;
+    # "off": API processes run none and `python -m app.worker` does the cron work. Env: SCHEDULER_MODE
+    scheduler_mode: str = "embedded"
+    # The leader re-checks its lock every heartbeat; a lease row it stops renewing lapses after scheduler_lease_seconds
+    # and a standby takes over (an advisory lock is released as soon as the leader's connection drops)
+    scheduler_heartbeat_seconds: int = 10
+    scheduler_lease_seconds: int = 30
+    # Startup (app.services.startup): create_all and reference-data seeding run only when the schema / seed fingerprint
+    # differs from the one stored in startup_fingerprints; False forces both on every boot. Env: STARTUP_FINGERPRINT_ENABLED
+    startup_fingerprint_enabled: bool = True
+    # Release identifier recorded with each boot's startup timing report (startup_runs, GET /admin/startup). Env: APP_RELEASE
+    app_release: str = ""
+    # Authenticated principal cache (app.services.principal_cache): per-worker role / identity / POA status by user id,
+    # dropped on writes to the user and after this many seconds at most. 0 disables the cache.
+    principal_cache_ttl_seconds: int = 30
+    principal_cache_max_entries: int = 10000
+    # Rendered agreement PDF cache (app.services.agreement_pdf_cache), keyed by title + content hash: per-worker memory
+    # LRU, plus an optional disk directory shared by workers (relative to project root; empty = memory only)
+    agreement_pdf_cache_max_entries: int = 256
+    agreement_pdf_cache_max_bytes: int = 64 * 1024 * 1024
+    agreement_pdf_cache_dir: str = ""
+    agreement_pdf_cache_disk_max_entries: int = 5000
+    # Public verify (POST /public/verify[/batch]): unknown tokens are remembered per worker for this long (0 = off);
+    # attempts are audit-logged through a buffered writer in the API process (app.services.verify_attempt_log)
+    verify_negative_cache_ttl_seconds: int = 60
+    verify_negative_cache_max_entries: int = 10000
+    verify_attempt_log_buffered: bool = True
+    verify_attempt_log_batch_size: int = 200
+    verify_attempt_log_flush_seconds: float = 1.0
+    verify_attempt_log_queue_maxsize: int = 10000
+    verify_batch_max_tokens: int = 500
+    # POST /public/verify/batch requires an owner / manager login; each caller may check this many tokens per window
+    # (per worker; 0 = unlimited)
+    verify_batch_rate_limit_tokens: int = 2000
+    verify_batch_rate_limit_window_seconds: int = 60
+    # Per-request SQL profiling (app.services.sql_profiler), opt-in: query count / DB time / pool wait per request,
+    # X-DB-Queries and Server-Timing headers, slow-request log and GET /admin/perf. Env: SQL_PROFILING_ENABLED
+    sql_profiling_enabled: bool = False
+    sql_profiling_slow_request_ms: int = 500
+    # A statement repeated more than this many times in one request is flagged as a likely N+1
+    sql_profiling_n_plus_one_threshold: int = 10
+    sql_profiling_slow_log_size: int = 200
+    # When True, a response from a route over its @query_budget raises QueryBudgetExceeded (tests); otherwise logged
+    sql_query_budget_strict: bool = False
 
     # Smarty US Street API (address standardization / ZIP-code utility bucket)
     smarty_auth_id: str = ""
@@ -115,6 +188,22 @@ class Settings(BaseSettings):
     serpapi_key: str = ""
     # Max concurrent utility background jobs (provider contact lookup, pending verification); excess jobs are queued
     utility_background_jobs_max_workers: int = 2
+    # Max concurrent deferred per-user jobs (Status Confirmation materialization after sign-in); see app.background_jobs
+    deferred_user_jobs_max_workers: int = 2
+    # Async CSV bulk upload: rows per committed chunk, and max chunks ingested concurrently (also capped to half the
+    # DB pool so HTTP requests keep their slots; SQLite always runs one chunk at a time)
+    bulk_upload_chunk_rows: int = 250
+    bulk_upload_max_workers: int = 4
+    # A "processing" job with no committed progress for this long is treated as orphaned (dead worker / restart) and
+    # resumed by the sweep; after bulk_upload_max_attempts worker runs it is marked failed instead
+    bulk_upload_stale_after_seconds: int = 900
+    bulk_upload_max_attempts: int = 3
+    # How often a running job refreshes heartbeat_at while a chunk is still being ingested, so a slow chunk is never
+    # mistaken for an orphan (not on SQLite, where the write would wait behind the chunk's own transaction)
+    bulk_upload_heartbeat_seconds: int = 60
+    # Content-addressed blob store for signed PDFs and ownership proofs (app.services.blob_store); relative paths are
+    # resolved under the project root, empty = data/blobs. Use a shared volume when several hosts serve the API.
+    blob_store_path: str = ""
     # Development: email for "Test provider" shown per utility type (frontend-only); emails to providers can be sent here
     test_provider_email: str = ""
     # Base URL of the frontend app (for provider authority letter links in emails), e.g. https://app.docustay.com
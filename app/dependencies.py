@@ -1,4 +1,9 @@
-"""Shared dependencies: DB session, current user."""
+"""Shared dependencies: DB session, current user / principal.
+
+Owner and owner-or-manager guards decide on the cached Principal. Each has a ``*_principal`` variant that returns it,
+for routes that only need the caller's id, role or email, and a variant that also loads the User row for routes that
+read other columns or write to it.
+"""
 import logging
 from fastapi import Depends, HTTPException, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -7,32 +12,38 @@ from sqlalchemy.exc import SQLAlchemyError, OperationalError as SQLOperationalEr
 from app.config import get_settings
 from app.database import get_db
 from app.models.user import User, UserRole
-from app.models.owner_poa_signature import OwnerPOASignature
 from app.models.pending_registration import PendingRegistration
 from app.services.auth import decode_token_with_error
+from app.services.principal_cache import Principal, get_principal
 
 logger = logging.getLogger(__name__)
 
 security = HTTPBearer(auto_error=False)
 
 
+def _token_claims(credentials: HTTPAuthorizationCredentials | None) -> tuple[int, str | None]:
+    """User id and role claim of a valid user JWT; raises 401 otherwise."""
+    if not credentials:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    token_str = (credentials.credentials or "").strip()
+    payload, _ = decode_token_with_error(token_str)
+    if not payload:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+    if payload.get("sub") == "pending":
+        raise HTTPException(status_code=401, detail="Use the pending-owner flow to complete signup.")
+    try:
+        user_id = int(payload.get("sub"))
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=401, detail="Invalid token")
+    return user_id, payload.get("role")
+
+
 def get_current_user(
     db: Session = Depends(get_db),
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
 ) -> User:
     try:
-        if not credentials:
-            raise HTTPException(status_code=401, detail="Not authenticated")
-        token_str = (credentials.credentials or "").strip()
-        payload, _ = decode_token_with_error(token_str)
-        if not payload:
-            raise HTTPException(status_code=401, detail="Invalid or expired token")
-        if payload.get("sub") == "pending":
-            raise HTTPException(status_code=401, detail="Use the pending-owner flow to complete signup.")
-        try:
-            user_id = int(payload.get("sub"))
-        except (TypeError, ValueError):
-            raise HTTPException(status_code=401, detail="Invalid token")
+        user_id, _ = _token_claims(credentials)
         user = db.query(User).filter(User.id == user_id).first()
         if not user:
             raise HTTPException(status_code=401, detail="User not found")
@@ -47,6 +58,28 @@ def get_current_user(
         raise HTTPException(status_code=401, detail="Authentication failed") from e
 
 
+def get_current_principal(
+    db: Session = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+) -> Principal:
+    """Like get_current_user, but returns the cached Principal (role, identity / POA status, owner profile id) instead
+    of the User row: no auth query while the principal is cached. For routes that only need who is calling."""
+    try:
+        user_id, role_claim = _token_claims(credentials)
+        principal = get_principal(db, user_id, role_claim=role_claim)
+        if principal is None:
+            raise HTTPException(status_code=401, detail="User not found")
+        return principal
+    except HTTPException:
+        raise
+    except (SQLAlchemyError, SQLOperationalError) as e:
+        raise HTTPException(status_code=503, detail="Service temporarily unavailable") from e
+    except Exception as e:
+        if _is_connection_error(e):
+            raise HTTPException(status_code=503, detail="Service temporarily unavailable") from e
+        raise HTTPException(status_code=401, detail="Authentication failed") from e
+
+
 def _is_connection_error(e: Exception) -> bool:
     """True if the exception is a DB/network connection failure (e.g. DNS, unreachable host)."""
     msg = (getattr(e, "message", "") or str(e)).lower()
@@ -122,38 +155,71 @@ def get_optional_current_user(
         return None
 
 
-def require_owner(current_user: User = Depends(get_current_user)) -> User:
-    if current_user.role != UserRole.owner:
+def _user_row(db: Session, principal: Principal) -> User:
+    """The User row behind an authorized principal, for routes that read or write more than id / role / email."""
+    try:
+        user = db.get(User, principal.id)
+    except (SQLAlchemyError, SQLOperationalError) as e:
+        raise HTTPException(status_code=503, detail="Service temporarily unavailable") from e
+    if not user:
+        raise HTTPException(status_code=401, detail="User not found")
+    return user
+
+
+def require_owner_principal(principal: Principal = Depends(get_current_principal)) -> Principal:
+    if principal.role != UserRole.owner:
         raise HTTPException(status_code=403, detail="Owner role required")
-    return current_user
+    return principal
 
 
-def require_owner_identity_verified(
-    current_user: User = Depends(require_owner),
+def require_owner(
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(require_owner_principal),
 ) -> User:
+    return _user_row(db, principal)
+
+
+def require_owner_identity_verified_principal(
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(require_owner_principal),
+) -> Principal:
     """Owner must have completed Stripe Identity verification (before POA and dashboard)."""
-    if not getattr(current_user, "identity_verified_at", None):
+    if not principal.identity_verified:
+        # A cached "not verified" is re-read before denying (verified on another worker).
+        try:
+            principal = get_principal(db, principal.id, fresh=True) or principal
+        except (SQLAlchemyError, SQLOperationalError) as e:
+            raise HTTPException(status_code=503, detail="Service temporarily unavailable") from e
+    if not principal.identity_verified:
         raise HTTPException(
             status_code=403,
             detail="Complete identity verification to continue. You cannot sign the owner authorization document or access the dashboard until your identity is verified.",
         )
-    return current_user
+    return principal
 
 
-def require_owner_onboarding_complete(
+def require_owner_identity_verified(
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_identity_verified),
+    principal: Principal = Depends(require_owner_identity_verified_principal),
 ) -> User:
+    return _user_row(db, principal)
+
+
+def require_owner_onboarding_complete_principal(
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(require_owner_identity_verified_principal),
+) -> Principal:
     """Owner must have completed identity verification and linked Master POA (required for dashboard and properties). Legacy owners may have poa_waived_at instead."""
     try:
-        poa = db.query(OwnerPOASignature).filter(OwnerPOASignature.used_by_user_id == current_user.id).first()
-        poa_waived = bool(getattr(current_user, "poa_waived_at", None))
-        if not poa and not poa_waived:
+        # A cached "not linked" is re-read before denying (just signed).
+        if not principal.poa_linked:
+            principal = get_principal(db, principal.id, fresh=True) or principal
+        if not principal.poa_linked:
             raise HTTPException(
                 status_code=403,
                 detail="Sign and link your owner authorization to complete onboarding. You cannot add properties or access the dashboard until it is linked.",
             )
-        return current_user
+        return principal
     except HTTPException:
         raise
     except (SQLAlchemyError, SQLOperationalError) as e:
@@ -164,6 +230,13 @@ def require_owner_onboarding_complete(
         raise HTTPException(status_code=503, detail="Service temporarily unavailable") from e
 
 
+def require_owner_onboarding_complete(
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(require_owner_onboarding_complete_principal),
+) -> User:
+    return _user_row(db, principal)
+
+
 def require_guest(current_user: User = Depends(get_current_user)) -> User:
     if current_user.role != UserRole.guest:
         raise HTTPException(status_code=403, detail="Guest role required")
@@ -201,11 +274,18 @@ def require_guest_or_tenant(current_user: User = Depends(get_current_user)) -> U
     return current_user
 
 
-def require_owner_or_manager(current_user: User = Depends(get_current_user)) -> User:
+def require_owner_or_manager_principal(principal: Principal = Depends(get_current_principal)) -> Principal:
     """Owner or Property Manager. Use with can_access_property for property-scoped actions."""
-    if current_user.role not in (UserRole.owner, UserRole.property_manager):
+    if principal.role not in (UserRole.owner, UserRole.property_manager):
         raise HTTPException(status_code=403, detail="Owner or property manager role required")
-    return current_user
+    return principal
+
+
+def require_owner_or_manager(
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(require_owner_or_manager_principal),
+) -> User:
+    return _user_row(db, principal)
 
 
 def require_admin(current_user: User = Depends(get_current_user)) -> User:
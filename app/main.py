@@ -1,4 +1,8 @@
 """DocuStay Demo – FastAPI application."""
+import time
+
+_IMPORT_STARTED = time.perf_counter()  # start of the import phase in the startup timing report
+
 import logging
 from pathlib import Path
 
@@ -53,9 +57,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-DB-Queries", "Server-Timing"],
 )
 logger.info("[startup] CORS middleware added")
 
+if settings.sql_profiling_enabled:
+    from app.services.sql_profiler import install_sql_profiling
+
+    install_sql_profiling(app)
+    logger.info("[startup] SQL profiling middleware added (X-DB-Queries, Server-Timing, /admin/perf)")
+
 app.include_router(auth.router)
 app.include_router(identity.router)
 app.include_router(owners.router)
@@ -71,10 +82,15 @@ app.include_router(public.router)
 app.include_router(admin.router)
 app.include_router(managers.router)
 logger.info("[startup] Routers registered (auth, identity, owners, guests, stays, region_rules, jle, dashboard, notifications, agreements, billing_webhook, public, admin, managers)")
+_IMPORT_MS = (time.perf_counter() - _IMPORT_STARTED) * 1000
 
 
 @app.on_event("startup")
 def startup():
+    from app.database import SessionLocal
+    from app.services.startup import StartupReport, record_startup, sync_schema_and_seed
+
+    report = StartupReport(import_ms=_IMPORT_MS)
     logger.info("[startup] ---------- Startup begin ----------")
     # Mailgun
     logger.info("[startup] Step 1: Mailgun / email config")
@@ -92,57 +108,92 @@ def startup():
         print("[Mailgun] Not configured - verification emails will be skipped; set MAILGUN_API_KEY and MAILGUN_DOMAIN in .env and restart")
         logger.info("[startup] Mailgun not configured (verification emails skipped)")
 
-    # Database
+    # Database: tables and reference data only when their fingerprints changed (see app.services.startup)
     logger.info("[startup] Step 2: Database (create tables, seed region rules)")
     try:
-        Base.metadata.create_all(bind=engine)
-        logger.info("[startup] Database tables created/verified")
-        from app.database import SessionLocal
-        from app.seed import seed_region_rules, seed_jurisdiction_sot, seed_admin_user
-        db = SessionLocal()
-        try:
-            seed_region_rules(db)
-            seed_jurisdiction_sot(db)
-            seed_admin_user(db)
-            logger.info("[startup] Region rules, jurisdiction SOT, and admin user seeded")
-        finally:
-            db.close()
+        outcome = sync_schema_and_seed(engine, SessionLocal, Base.metadata, report=report)
+        logger.info("[startup] Schema %s, seed data %s", outcome["schema"], outcome["seed"])
+        from app.services.jurisdiction_sot import warm_jurisdiction_cache
+        with report.step("jurisdiction_cache"):
+            db = SessionLocal()
+            try:
+                n = warm_jurisdiction_cache(db)
+            finally:
+                db.close()
+        logger.info("[startup] Jurisdiction cache warmed (%s jurisdictions)", n)
         logger.info("[startup] Step 2 done: database OK")
     except Exception as e:
         logger.warning("[startup] Database startup failed (tables/seed skipped). Check DATABASE_URL and network. Error: %s", e)
-
-    # Scheduler: (1) invite-expire job (hourly, or every minute when TEST_MODE=true), (2) DMS 2-min-after-accept when DMS_TEST_MODE=true
-    # Scheduler: (1) invite-expire job (hourly, or every minute when TEST_MODE=true), (2) Status Confirmation 2-min-after-checkin when DMS_TEST_MODE=true
-    # logger.info("[startup] Step 3: Background scheduler (invitation expire; DMS 2-min from accept_invite when test mode)")
-    logger.info("[startup] Step 3: Background scheduler (invitation expire; Status Confirmation 2-min from check-in when test mode)")
     try:
-        from apscheduler.schedulers.background import BackgroundScheduler
-        from app.services.invitation_cleanup import run_all_invitation_cleanup_jobs
-
-        scheduler = BackgroundScheduler()
-        # Guest / manager / transfer invitation expiry in one DB session (fewer pool checkouts on Supabase Session pooler).
-        if getattr(settings, "test_mode", False):
-            scheduler.add_job(run_all_invitation_cleanup_jobs, "cron", minute="*")  # every minute when test_mode
-            logger.info("[startup] Scheduler: invitation cleanup jobs added (every minute, test_mode)")
-        else:
-            scheduler.add_job(run_all_invitation_cleanup_jobs, "cron", minute=0)  # every hour at :00
-            logger.info("[startup] Scheduler: invitation cleanup jobs added (cron every hour at :00)")
-        if getattr(settings, "dms_test_mode", False):
-            from app.services.stay_timer import run_dms_test_mode_catchup_job
-            # every minute: turn DMS on for stays that checked in >2 min ago (legacy comment; same job as below)
-            scheduler.add_job(run_dms_test_mode_catchup_job, "cron", minute="*")  # every minute: turn stay reminders on for stays that checked in >2 min ago
-            # logger.info("[startup] Scheduler: DMS test-mode catchup job added (every minute)")
-            logger.info("[startup] Scheduler: Status Confirmation test-mode catchup job added (every minute)")
-        scheduler.start()
-        app.state.scheduler = scheduler
-        logger.info("[startup] Step 3 done: scheduler started")
+        from app.routers.owners import resume_orphaned_bulk_upload_jobs
+        with report.step("bulk_upload_resume"):
+            swept = resume_orphaned_bulk_upload_jobs()
+        logger.info("[startup] Orphaned bulk uploads: %s resumed, %s failed", swept["resumed"], swept["failed"])
+    except Exception as e:
+        logger.warning("[startup] Bulk upload resume sweep failed: %s", e)
+    try:
+        from app.services.email_dispatcher import start_email_dispatcher
+        with report.step("email_dispatcher"):
+            started = start_email_dispatcher() is not None
+        if started:
+            logger.info("[startup] Outbound email dispatcher started")
     except Exception as e:
-        logger.warning("[startup] Scheduler failed to start: %s", e)
-        app.state.scheduler = None
+        logger.warning("[startup] Email dispatcher failed to start (emails will be sent inline): %s", e)
+    try:
+        from app.services.verify_attempt_log import start_verify_attempt_logger
+        with report.step("verify_attempt_logger"):
+            started = start_verify_attempt_logger() is not None
+        if started:
+            logger.info("[startup] Buffered verify attempt logger started")
+    except Exception as e:
+        logger.warning("[startup] Verify attempt logger failed to start (attempts will be logged inline): %s", e)
+    try:
+        from app.services.property_state import start_property_state_refresher
+        with report.step("property_state_refresher"):
+            started = start_property_state_refresher() is not None
+        if started:
+            logger.info("[startup] Property state refresher started")
+    except Exception as e:
+        logger.warning("[startup] Property state refresher failed to start (snapshots refreshed inline): %s", e)
+
+    # Cron jobs (invitation expiry, Status Confirmation test-mode catchup, bulk upload sweep, property state reconcile)
+    # run on one elected leader across all processes; see app.services.scheduler. SCHEDULER_MODE=off leaves them to
+    # `python -m app.worker`.
+    logger.info("[startup] Step 3: Background scheduler (mode=%s)", settings.scheduler_mode)
+    app.state.scheduler = None
+    if (settings.scheduler_mode or "").strip().lower() == "embedded":
+        try:
+            from app.services.scheduler import start_scheduler
+
+            with report.step("scheduler"):
+                app.state.scheduler = start_scheduler()
+            logger.info("[startup] Step 3 done: scheduler started (cron jobs run while this process is the leader)")
+        except Exception as e:
+            logger.warning("[startup] Scheduler failed to start: %s", e)
+    else:
+        logger.info("[startup] Step 3 skipped: cron jobs run in the worker process (python -m app.worker)")
 
+    # One timing line per boot; also GET /admin/startup and the startup_runs table (per APP_RELEASE)
+    app.state.startup_report = record_startup(report, SessionLocal)
     logger.info("[startup] ---------- Startup complete ----------")
 
 
+@app.on_event("shutdown")
+def shutdown():
+    from app.services.scheduler import stop_scheduler
+    # Releases leadership so another process's scheduler takes over the cron jobs.
+    stop_scheduler()
+    from app.services.email_dispatcher import stop_email_dispatcher
+    # Persists anything still queued in memory so the next process delivers it.
+    stop_email_dispatcher()
+    from app.services.verify_attempt_log import stop_verify_attempt_logger
+    # Writes verify attempts still buffered in memory.
+    stop_verify_attempt_logger()
+    from app.services.property_state import stop_property_state_refresher
+    # Rewrites the snapshots of properties still queued.
+    stop_property_state_refresher()
+
+
 @app.get("/")
 def root():
     return {"app": settings.app_name, "status": "ok"}
@@ -163,10 +214,13 @@ def db_setup():
         Base.metadata.create_all(bind=engine)
         from app.database import SessionLocal
         from app.seed import seed_region_rules, seed_jurisdiction_sot
+        from app.services.jurisdiction_sot import invalidate_jurisdiction_cache, warm_jurisdiction_cache
         db = SessionLocal()
         try:
             seed_region_rules(db)
             seed_jurisdiction_sot(db)
+            invalidate_jurisdiction_cache()
+            warm_jurisdiction_cache(db)
         finally:
             db.close()
         return {"status": "ok", "message": "Tables created and region rules + jurisdiction SOT seeded."}
@@ -27,12 +27,19 @@ from app.models.manager_invitation import ManagerInvitation
 from app.models.property_transfer_invitation import PropertyTransferInvitation
 from app.models.dashboard_alert import DashboardAlert
 from app.models.notification_attempt import NotificationAttempt
-from app.models.bulk_upload_job import BulkUploadJob
+from app.models.bulk_upload_job import BulkUploadJob, BulkUploadJobGroup
 from app.models.guest_extension_request import GuestExtensionRequest
 from app.models.demo_account import DemoAccount
 from app.models.tenant_live_slug import TenantLiveSlug
 from app.models.guest_live_slug import GuestLiveSlug
 from app.models.owner_live_slug import OwnerLiveSlug
+from app.models.user_daily_task import UserDailyTask
+from app.models.user_alert_counter import UserAlertCounter
+from app.models.property_state_snapshot import PropertyStateSnapshot
+from app.models.job_run import JobRun
+from app.models.scheduler_lease import SchedulerLease
+from app.models.startup_fingerprint import StartupFingerprint
+from app.models.startup_run import StartupRun
 
 __all__ = [
     "User",
@@ -66,9 +73,17 @@ __all__ = [
     "DashboardAlert",
     "NotificationAttempt",
     "BulkUploadJob",
+    "BulkUploadJobGroup",
     "GuestExtensionRequest",
     "DemoAccount",
     "TenantLiveSlug",
     "GuestLiveSlug",
     "OwnerLiveSlug",
+    "UserDailyTask",
+    "UserAlertCounter",
+    "PropertyStateSnapshot",
+    "JobRun",
+    "SchedulerLease",
+    "StartupFingerprint",
+    "StartupRun",
 ]
@@ -1,6 +1,7 @@
 """Agreement signatures tied to invitation-based guest flows."""
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Text, LargeBinary
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Text, LargeBinary, or_
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import column_property, deferred, relationship
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -40,8 +41,19 @@ class AgreementSignature(Base):
 
     dropbox_sign_request_id = Column(String(64), nullable=True, index=True)
 
-    # Signed PDF stored in DB when document is signed (so we can serve without Dropbox)
-    signed_pdf_bytes = Column(LargeBinary, nullable=True)
+    # Signed PDF kept when document is signed (so we can serve without Dropbox): content-addressed in the blob store
+    # (app.services.blob_store) by SHA-256. Older rows may still hold the bytes inline until
+    # scripts/migrate_blobs_to_store.py runs; that column is deferred so loading a row never pulls the PDF.
+    signed_pdf_sha256 = Column(String(64), nullable=True)
+    signed_pdf_bytes = deferred(Column(LargeBinary, nullable=True))
+    signed_pdf_inline = column_property(signed_pdf_bytes.columns[0].isnot(None))
 
     used_by_user = relationship("User")
 
+    @hybrid_property
+    def has_signed_pdf(self) -> bool:
+        return self.signed_pdf_sha256 is not None or bool(self.signed_pdf_inline)
+
+    @has_signed_pdf.expression
+    def has_signed_pdf(cls):
+        return or_(cls.signed_pdf_sha256.isnot(None), cls.signed_pdf_bytes.isnot(None))
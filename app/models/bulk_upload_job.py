@@ -1,5 +1,5 @@
 """Async bulk upload job tracking."""
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -16,8 +16,33 @@ class BulkUploadJob(Base):
     processed_rows = Column(Integer, nullable=False, default=0)
     created = Column(Integer, nullable=False, default=0)
     updated = Column(Integer, nullable=False, default=0)
+    units_created = Column(Integer, nullable=False, default=0, server_default="0")
     failed_from_row = Column(Integer, nullable=True)
     failure_reason = Column(Text, nullable=True)
     error_message = Column(Text, nullable=True)
+    # Worker runs started (first run + resumes) and the last time a worker committed progress or beat; a "processing"
+    # job whose heartbeat goes stale was orphaned by a dead worker / restart and is resumed from its committed groups.
+    # attempts doubles as the lease token of the current run: progress is only written while it is unchanged.
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     completed_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class BulkUploadJobGroup(Base):
+    """Checkpoint: one property group (rows sharing a bulk-upload group key) of a job, committed in the same
+    transaction as the rows it wrote. group_key is the idempotency key: a resumed run skips groups recorded here,
+    and the unique constraint rejects a second commit of the same group."""
+
+    __tablename__ = "bulk_upload_job_groups"
+    __table_args__ = (UniqueConstraint("job_id", "group_key", name="uq_bulk_upload_job_groups_job_group"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("bulk_upload_jobs.id", ondelete="CASCADE"), nullable=False, index=True)
+    group_key = Column(String(64), nullable=False)  # sha256 hex of the normalized group key
+    first_row = Column(Integer, nullable=False)
+    row_count = Column(Integer, nullable=False, default=0)
+    created = Column(Integer, nullable=False, default=0)
+    updated = Column(Integer, nullable=False, default=0)
+    units_created = Column(Integer, nullable=False, default=0, server_default="0")
+    committed_at = Column(DateTime(timezone=True), server_default=func.now())
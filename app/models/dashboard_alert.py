@@ -1,6 +1,6 @@
 """In-platform dashboard alerts. Required for all status changes (nearing expiration, renewed, revoked, expired).
 Notification methods (email, SMS) are optional and customizable; dashboard alerts are always created."""
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from app.database import Base
@@ -8,6 +8,8 @@ from app.database import Base
 
 class DashboardAlert(Base):
     __tablename__ = "dashboard_alerts"
+    # Alert feed: one user's alerts newest first, paged by (created_at, id) keyset
+    __table_args__ = (Index("ix_dashboard_alerts_user_created_id", "user_id", "created_at", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
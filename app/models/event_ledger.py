@@ -3,7 +3,7 @@
 Every meaningful platform action is recorded here. All logs, audit trails, and activity views read from this ledger.
 Downstream display may add ``event_source``, ``business_meaning``, and ``trigger_description`` in ``meta`` at write time;
 readers infer ``event_source`` when absent (see ``app.services.event_ledger``)."""
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from app.database import Base
@@ -37,3 +37,8 @@ class EventLedger(Base):
     # Request context
     ip_address = Column(String(64), nullable=True)
     user_agent = Column(String(500), nullable=True)
+
+    # Lower-cased search document (action, display title, property address, meta values) written with the row by
+    # app.services.event_ledger.create_ledger_event. Derived data only; trigram-indexed on PostgreSQL
+    # (scripts/backfill_ledger_search_text.py creates the index and fills rows written before this column existed).
+    search_text = Column(Text, nullable=True)
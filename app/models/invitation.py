@@ -1,5 +1,5 @@
 """Invitation from owner to guest; links to Stay when guest accepts."""
-from sqlalchemy import Column, Integer, String, Date, ForeignKey, Enum as SQLEnum, DateTime
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Enum as SQLEnum, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -47,3 +47,8 @@ class Invitation(Base):
     owner = relationship("User", foreign_keys=[owner_id], backref="invitations_sent")
     invited_by = relationship("User", foreign_keys=[invited_by_user_id])
     property_ref = relationship("Property", backref="invitations")
+
+
+# Case-insensitive token lookup on the public verify portal (app.services.token_verification).
+# Existing databases: scripts/migrate_invitation_code_lookup_index.py
+Index("ix_invitations_invitation_code_lower", func.lower(Invitation.invitation_code))
@@ -0,0 +1,20 @@
+"""Scheduled job run history: one row per run of a cron job by the scheduler leader (app.services.scheduler)."""
+from __future__ import annotations
+
+from sqlalchemy import Column, DateTime, Integer, String, Text
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class JobRun(Base):
+    __tablename__ = "job_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_name = Column(String(64), nullable=False, index=True)
+    holder = Column(String(128), nullable=False)  # scheduler instance that ran it (host:pid:nonce)
+    status = Column(String(20), nullable=False, default="running")  # running | succeeded | failed
+    started_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    duration_ms = Column(Integer, nullable=True)
+    error = Column(Text, nullable=True)
@@ -1,19 +1,35 @@
-"""Log of notification delivery attempts (email, SMS, etc.) for alerts. Supports repeat attempts and auditing."""
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean
+"""Log of notification delivery attempts (email, SMS, etc.) for alerts. Supports repeat attempts and auditing.
+
+Also the persistent side of the outbound email queue (app.services.email_dispatcher): every email handed to the
+dispatcher gets a row (channel "email", dashboard_alert_id usually NULL) that tracks delivery status and retries.
+"""
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.sql import func
 from app.database import Base
 
 
 class NotificationAttempt(Base):
     __tablename__ = "notification_attempts"
+    __table_args__ = (Index("ix_notification_attempts_status_next_attempt", "status", "next_attempt_at"),)
 
     id = Column(Integer, primary_key=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     dashboard_alert_id = Column(
-        Integer, ForeignKey("dashboard_alerts.id", ondelete="CASCADE"), nullable=False, index=True
+        Integer, ForeignKey("dashboard_alerts.id", ondelete="CASCADE"), nullable=True, index=True
     )
     # email | sms | in_app (in_app is created when alert is created; email/sms when we send off-platform)
     channel = Column(String(32), nullable=False, index=True)
     success = Column(Boolean, nullable=False)
     error_message = Column(Text, nullable=True)
+
+    # Outbound email queue (NULL on alert-log rows): queued | sending | retry | sent | failed.
+    # next_attempt_at is when a queued/retry row is due, or the lease expiry while a worker is sending it.
+    status = Column(String(16), nullable=True)
+    recipient = Column(String(255), nullable=True)
+    subject = Column(String(500), nullable=True)
+    body_html = Column(Text, nullable=True)
+    body_text = Column(Text, nullable=True)
+    attempt_count = Column(Integer, nullable=False, default=0, server_default="0")
+    next_attempt_at = Column(DateTime(timezone=True), nullable=True)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
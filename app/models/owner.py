@@ -1,6 +1,7 @@
 """Module B1: Owner onboarding."""
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Enum as SQLEnum, DateTime, Text, LargeBinary, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Enum as SQLEnum, DateTime, Text, LargeBinary, Float, or_
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import column_property, deferred, relationship
 from sqlalchemy.sql import func
 from app.database import Base
 import enum
@@ -91,11 +92,14 @@ class Property(Base):
     # CR-1a: default ON for new rows (DO NOT REMOVE column; legacy off-path code preserved elsewhere).
     shield_mode_enabled = Column(Integer, nullable=False, default=1)
 
-    # Ownership verification proof (deed, tax bill, etc.) – stored in DB for property and user
+    # Ownership verification proof (deed, tax bill, etc.) – file content-addressed in the blob store
+    # (app.services.blob_store); legacy inline bytes are deferred so property queries never pull the file
     ownership_proof_type = Column(String(50), nullable=True)  # deed, tax_bill, utility_bill, mortgage_statement
     ownership_proof_filename = Column(String(255), nullable=True)
     ownership_proof_content_type = Column(String(100), nullable=True)
-    ownership_proof_bytes = Column(LargeBinary, nullable=True)
+    ownership_proof_sha256 = Column(String(64), nullable=True)
+    ownership_proof_bytes = deferred(Column(LargeBinary, nullable=True))
+    ownership_proof_inline = column_property(ownership_proof_bytes.columns[0].isnot(None))
     ownership_proof_uploaded_at = Column(DateTime(timezone=True), nullable=True)
 
     # Status: VACANT default for new properties; UNKNOWN only after Status Confirmation with no owner response; UNCONFIRMED = vacant monitoring deadline missed.
@@ -118,3 +122,11 @@ class Property(Base):
     vacant_monitoring_confirmed_at = Column(DateTime(timezone=True), nullable=True)
 
     owner_profile = relationship("OwnerProfile", back_populates="properties")
+
+    @hybrid_property
+    def has_ownership_proof(self) -> bool:
+        return self.ownership_proof_sha256 is not None or bool(self.ownership_proof_inline)
+
+    @has_ownership_proof.expression
+    def has_ownership_proof(cls):
+        return or_(cls.ownership_proof_sha256.isnot(None), cls.ownership_proof_bytes.isnot(None))
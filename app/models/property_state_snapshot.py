@@ -0,0 +1,51 @@
+"""Property state read model: one row per property (``unit_id`` NULL) and one per unit.
+
+Holds what the property list views used to recompute from stays, invitations, tenant assignments and resident modes
+on every request: display occupancy, unit / occupied / active-stay counts, Shield status and invitation pipeline
+counts. Rows are rewritten after each write they depend on and checked nightly by the reconciler
+(``app.services.property_state``); there is at most one row per (property, unit). Occupancy and invitation
+lifecycles depend on the calendar day, so a row is only current for ``computed_for``.
+"""
+from __future__ import annotations
+
+from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class PropertyStateSnapshot(Base):
+    __tablename__ = "property_state_snapshots"
+    __table_args__ = (
+        Index("ix_property_state_snapshots_property_unit", "property_id", "unit_id", unique=True),
+        # unit_id NULL is never equal to itself in the index above: one property row per property
+        Index(
+            "ix_property_state_snapshots_property_row",
+            "property_id",
+            unique=True,
+            postgresql_where=text("unit_id IS NULL"),
+            sqlite_where=text("unit_id IS NULL"),
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    property_id = Column(Integer, ForeignKey("properties.id", ondelete="CASCADE"), nullable=False, index=True)
+    unit_id = Column(Integer, ForeignKey("units.id", ondelete="CASCADE"), nullable=True)  # NULL: property row
+    computed_for = Column(Date, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    occupancy_status = Column(String(32), nullable=False)
+
+    # Property row only (0 / NULL on unit rows)
+    unit_count = Column(Integer, nullable=False, default=0)  # Unit rows; 0 for a single-unit property without any
+    occupied_unit_count = Column(Integer, nullable=False, default=0)
+    active_stay_count = Column(Integer, nullable=False, default=0)
+    shield_mode_enabled = Column(Boolean, nullable=False, default=False)  # effective_shield_mode_enabled
+    # Invitation pipeline counts (invitation_counts_dict) for the owner's property lane
+    invitation_pending_count = Column(Integer, nullable=False, default=0)
+    invitation_accepted_count = Column(Integer, nullable=False, default=0)
+    invitation_active_count = Column(Integer, nullable=False, default=0)
+    invitation_cancelled_count = Column(Integer, nullable=False, default=0)
+    # {inviter user id: [pending, accepted, active, cancelled]} for lanes scoped to one inviter (managers)
+    invitation_counts_by_inviter = Column(JSONB, nullable=True)
@@ -1,6 +1,7 @@
 """Utility providers and authority letters for properties (ZIP-code utility bucket)."""
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, LargeBinary
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, LargeBinary, or_
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import column_property, deferred, relationship
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from app.database import Base
@@ -42,5 +43,16 @@ class PropertyAuthorityLetter(Base):
     email_sent_at = Column(DateTime(timezone=True), nullable=True)
     dropbox_sign_request_id = Column(String(64), nullable=True, index=True)
     signed_at = Column(DateTime(timezone=True), nullable=True)
-    signed_pdf_bytes = Column(LargeBinary, nullable=True)
+    # Signed PDF: content-addressed in the blob store (app.services.blob_store); legacy inline bytes are deferred
+    signed_pdf_sha256 = Column(String(64), nullable=True)
+    signed_pdf_bytes = deferred(Column(LargeBinary, nullable=True))
+    signed_pdf_inline = column_property(signed_pdf_bytes.columns[0].isnot(None))
     signer_email = Column(String(255), nullable=True)
+
+    @hybrid_property
+    def has_signed_pdf(self) -> bool:
+        return self.signed_pdf_sha256 is not None or bool(self.signed_pdf_inline)
+
+    @has_signed_pdf.expression
+    def has_signed_pdf(cls):
+        return or_(cls.signed_pdf_sha256.isnot(None), cls.signed_pdf_bytes.isnot(None))
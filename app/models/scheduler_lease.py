@@ -0,0 +1,19 @@
+"""Scheduler leadership lease for databases without advisory locks (SQLite in dev).
+
+One row per lease name. The holder renews ``expires_at`` while it is alive; once it lapses any scheduler instance
+may take the lease over. PostgreSQL uses a session advisory lock instead (app.services.scheduler).
+"""
+from __future__ import annotations
+
+from sqlalchemy import Column, DateTime, String
+
+from app.database import Base
+
+
+class SchedulerLease(Base):
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String(64), primary_key=True)
+    holder = Column(String(128), nullable=False)
+    acquired_at = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,19 @@
+"""Schema / seed fingerprints recorded at startup (app.services.startup).
+
+One row per kind ("schema", "seed"). A process whose computed fingerprint matches the stored one skips
+``create_all`` or the reference-data seeding; the release that last applied each is kept for reference.
+"""
+from __future__ import annotations
+
+from sqlalchemy import Column, DateTime, String
+
+from app.database import Base
+
+
+class StartupFingerprint(Base):
+    __tablename__ = "startup_fingerprints"
+
+    name = Column(String(32), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
+    release = Column(String(64), nullable=True)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
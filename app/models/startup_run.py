@@ -0,0 +1,21 @@
+"""Per-boot startup timing report (app.services.startup), for tracking cold-start time across releases."""
+from __future__ import annotations
+
+from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.database import Base
+
+
+class StartupRun(Base):
+    __tablename__ = "startup_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    release = Column(String(64), nullable=True, index=True)
+    holder = Column(String(128), nullable=False)  # host:pid
+    started_at = Column(DateTime(timezone=True), nullable=False)
+    import_ms = Column(Integer, nullable=True)  # importing app.main (routers, models, SDKs)
+    startup_ms = Column(Integer, nullable=False)  # startup event: schema, seed, caches, background workers
+    schema_outcome = Column(String(16), nullable=True)  # applied | skipped | failed
+    seed_outcome = Column(String(16), nullable=True)
+    steps = Column(JSONB, nullable=False)  # [{"name", "ms", "outcome"}] in order
@@ -0,0 +1,20 @@
+"""Per-user unread dashboard alert counter, so the frontend's badge poll is one primary-key lookup.
+
+Maintained in the same transaction as the alert writes (``app.services.dashboard_alerts``): +1 when an alert is created,
+-n when alerts are marked read. The row is created lazily on the first count and recounted from ``dashboard_alerts``
+every ``dashboard_alert_unread_reconcile_seconds`` to absorb any drift (alerts removed by cascades, races on the
+first insert).
+"""
+from __future__ import annotations
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer
+
+from app.database import Base
+
+
+class UserAlertCounter(Base):
+    __tablename__ = "user_alert_counters"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    unread_count = Column(Integer, nullable=False, default=0)
+    reconciled_at = Column(DateTime(timezone=True), nullable=True)  # last full recount from dashboard_alerts
@@ -0,0 +1,22 @@
+"""Per-user daily task watermark: the calendar date a once-a-day task last ran for (e.g. Status Confirmation
+materialization after sign-in).
+
+Stored separately so normal auth/user schema is untouched (no migrations needed).
+"""
+from __future__ import annotations
+
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class UserDailyTask(Base):
+    __tablename__ = "user_daily_tasks"
+    __table_args__ = (UniqueConstraint("user_id", "task", name="uq_user_daily_tasks_user_task"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    task = Column(String(64), nullable=False)
+    last_run_for = Column(Date, nullable=True)  # calendar date the task last ran for (client's date when known)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, desc, cast, String
+from sqlalchemy import or_, desc
 
 from app.database import get_db
 from app.dependencies import require_admin
@@ -14,13 +14,30 @@ from app.models.audit_log import AuditLog
 from app.models.event_ledger import EventLedger
 from app.models.stay import Stay
 from app.models.invitation import Invitation
+from app.models.job_run import JobRun
+from app.models.startup_run import StartupRun
 from app.schemas.admin import (
     AdminUserView,
     AdminAuditLogEntry,
     AdminPropertyView,
     AdminStayView,
     AdminInvitationView,
+    AdminAgreementPdfCacheStats,
+    AdminJobRunView,
+    AdminJurisdictionCacheStats,
+    AdminLivePageCacheStats,
+    AdminPerfSummary,
+    AdminPrincipalCacheStats,
+    AdminPropertyStateStats,
+    AdminStartupSummary,
 )
+from app.services.jurisdiction_sot import get_jurisdiction_cache_stats
+from app.services.live_page_cache import get_live_page_cache_stats
+from app.services.principal_cache import get_principal_cache_stats
+from app.services.agreement_pdf_cache import get_agreement_pdf_cache_stats
+from app.services.property_state import get_property_state_stats
+from app.services.sql_profiler import get_sql_profile_stats
+from app.services.startup import get_startup_report
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -88,6 +105,7 @@ def admin_list_audit_logs(
         ledger_event_to_display,
         ledger_record_disclosure_lines,
         get_actor_email,
+        ledger_search_clause,
         _CATEGORY_TO_ACTION_TYPES,
         ACTION_PROPERTY_DELETED,
     )
@@ -108,10 +126,7 @@ def admin_list_audit_logs(
     if actor_user_id is not None:
         q = q.filter(EventLedger.actor_user_id == actor_user_id)
     if search and search.strip():
-        term = f"%{search.strip()}%"
-        q = q.filter(
-            (EventLedger.action_type.ilike(term)) | (cast(EventLedger.meta, String).ilike(term))
-        )
+        q = q.filter(ledger_search_clause(search))
     q = q.order_by(desc(EventLedger.created_at)).offset(offset).limit(limit)
     rows = q.all()
     ledger_ctx = build_ledger_display_resolution_context(db, rows)
@@ -286,6 +301,89 @@ def admin_list_states(
     return [r[0] for r in rows if r[0]]
 
 
+@router.get("/jurisdiction-cache", response_model=AdminJurisdictionCacheStats)
+def admin_jurisdiction_cache_stats(
+    current_user: User = Depends(require_admin),
+):
+    """Hit/miss counters for this worker's jurisdiction SOT cache."""
+    return AdminJurisdictionCacheStats(**get_jurisdiction_cache_stats())
+
+
+@router.get("/live-page-cache", response_model=AdminLivePageCacheStats)
+def admin_live_page_cache_stats(
+    current_user: User = Depends(require_admin),
+):
+    """Hit/miss counters for this worker's public live page cache."""
+    return AdminLivePageCacheStats(**get_live_page_cache_stats())
+
+
+@router.get("/principal-cache", response_model=AdminPrincipalCacheStats)
+def admin_principal_cache_stats(
+    current_user: User = Depends(require_admin),
+):
+    """Hit/miss counters for this worker's authenticated principal cache."""
+    return AdminPrincipalCacheStats(**get_principal_cache_stats())
+
+
+@router.get("/agreement-pdf-cache", response_model=AdminAgreementPdfCacheStats)
+def admin_agreement_pdf_cache_stats(
+    current_user: User = Depends(require_admin),
+):
+    """Hit rate and render timings for this worker's rendered agreement PDF cache."""
+    return AdminAgreementPdfCacheStats(**get_agreement_pdf_cache_stats())
+
+
+@router.get("/property-state", response_model=AdminPropertyStateStats)
+def admin_property_state_stats(
+    current_user: User = Depends(require_admin),
+):
+    """Property state snapshot hit rate for this worker and its last nightly reconcile (drift) report."""
+    return AdminPropertyStateStats(**get_property_state_stats())
+
+
+@router.get("/job-runs", response_model=list[AdminJobRunView])
+def admin_list_job_runs(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin),
+    job_name: str | None = Query(None, description="Filter by job, e.g. invitation_cleanup"),
+    status: str | None = Query(None, description="Filter by status: running, succeeded, failed"),
+    limit: int = Query(100, ge=1, le=500),
+):
+    """Most recent cron job runs (whichever process was the scheduler leader), newest first."""
+    q = db.query(JobRun)
+    if job_name and job_name.strip():
+        q = q.filter(JobRun.job_name == job_name.strip())
+    if status and status.strip():
+        q = q.filter(JobRun.status == status.strip().lower())
+    return q.order_by(JobRun.started_at.desc(), JobRun.id.desc()).limit(limit).all()
+
+
+@router.get("/startup", response_model=AdminStartupSummary)
+def admin_startup_report(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin),
+    release: str | None = Query(None, description="Only boots of this APP_RELEASE"),
+    limit: int = Query(50, ge=1, le=500),
+):
+    """Cold-start timings: this worker's startup report and recent boots (import time, per-step ms, whether the
+    schema and seed data were applied or skipped by fingerprint), newest first."""
+    q = db.query(StartupRun)
+    if release and release.strip():
+        q = q.filter(StartupRun.release == release.strip())
+    runs = q.order_by(StartupRun.started_at.desc(), StartupRun.id.desc()).limit(limit).all()
+    return AdminStartupSummary(current=get_startup_report(), runs=runs)
+
+
+@router.get("/perf", response_model=AdminPerfSummary)
+def admin_perf_summary(
+    limit: int = Query(20, ge=1, le=200),
+    current_user: User = Depends(require_admin),
+):
+    """Worst routes on this worker (mean duration, SQL statements, DB time, pool wait, N+1 flags, budget overruns)
+    and its recent slow-request log. Requires SQL_PROFILING_ENABLED."""
+    return AdminPerfSummary(**get_sql_profile_stats(limit))
+
+
 @router.get("/invitations", response_model=list[AdminInvitationView])
 def admin_list_invitations(
     db: Session = Depends(get_db),
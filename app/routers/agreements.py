@@ -33,6 +33,7 @@ from app.services.agreements import (
     agreement_content_to_pdf,
 )
 from app.services.audit_log import create_log, CATEGORY_GUEST_SIGNATURE, CATEGORY_STATUS_CHANGE, CATEGORY_FAILED_ATTEMPT
+from app.services.blob_store import blob_response, store_blob
 from app.services.invitation_kinds import TENANT_UNIT_LEASE_KINDS, is_property_invited_tenant_signup_kind
 from app.services.guest_stay_email_scope import guest_invite_inviter_user_for_email
 from app.services.event_ledger import create_ledger_event, ACTION_AGREEMENT_SIGNED, ACTION_MASTER_POA_SIGNED, ACTION_AGREEMENT_SIGN_FAILED
@@ -40,7 +41,8 @@ from app.services.notifications import send_email
 from app.services.dropbox_sign import send_signature_request, get_signed_pdf, get_embedded_sign_url
 from app.services.invitation_agreement_ledger import emit_invitation_agreement_signed_if_dropbox_complete
 from app.services.invitation_guest_completion import guest_invite_awaiting_account_after_sign
-from app.dependencies import require_owner, get_current_user
+from app.dependencies import require_owner_principal, get_current_user
+from app.services.principal_cache import Principal
 from app.models.demo_account import is_demo_user_id
 
 router = APIRouter(prefix="/agreements", tags=["agreements"])
@@ -77,7 +79,7 @@ def get_invitation_agreement(
             has_pending_dropbox = db.query(AgreementSignature).filter(
                 AgreementSignature.invitation_code == code,
                 AgreementSignature.dropbox_sign_request_id.isnot(None),
-                AgreementSignature.signed_pdf_bytes.is_(None)
+                ~AgreementSignature.has_signed_pdf
             ).first() is not None
             if not has_pending_dropbox:
                 raise HTTPException(status_code=400, detail="This invite has expired. Please contact your host to request a new one.")
@@ -116,12 +118,12 @@ def get_invitation_agreement(
                 signed_by = sig.typed_signature
                 signature_id = sig.id
                 # Only true when we have the actual signed PDF from Dropbox (not just "sent to Dropbox")
-                if sig.signed_pdf_bytes:
+                if sig.has_signed_pdf:
                     has_dropbox_signed_pdf = True
                 elif getattr(sig, "dropbox_sign_request_id", None):
                     pdf_bytes = get_signed_pdf(sig.dropbox_sign_request_id)
                     if pdf_bytes:
-                        sig.signed_pdf_bytes = pdf_bytes
+                        store_blob(sig, "signed_pdf", pdf_bytes)
                         emit_invitation_agreement_signed_if_dropbox_complete(db, sig)
                         db.commit()
                         has_dropbox_signed_pdf = True
@@ -280,7 +282,7 @@ def sign_invitation_agreement(
             has_pending_dropbox = db.query(AgreementSignature).filter(
                 AgreementSignature.invitation_code == code,
                 AgreementSignature.dropbox_sign_request_id.isnot(None),
-                AgreementSignature.signed_pdf_bytes.is_(None)
+                ~AgreementSignature.has_signed_pdf
             ).first() is not None
             if not has_pending_dropbox:
                 raise HTTPException(status_code=400, detail="This invite has expired. Please contact your host to request a new one.")
@@ -342,7 +344,7 @@ def sign_invitation_agreement(
 
     date_str = sig.signed_at.strftime("%Y-%m-%d") if sig.signed_at else ""
     content_with_sig = fill_guest_signature_in_content(doc.content, sig.typed_signature, date_str, sig.ip_address)
-    sig.signed_pdf_bytes = agreement_content_to_pdf(doc.title, content_with_sig)
+    store_blob(sig, "signed_pdf", agreement_content_to_pdf(doc.title, content_with_sig))
     db.commit()
 
     create_log(
@@ -546,16 +548,13 @@ def get_signed_agreement_pdf(
     if not sig:
         raise HTTPException(status_code=404, detail="Signed PDF not available")
 
-    if sig.signed_pdf_bytes:
-        return Response(
-            content=sig.signed_pdf_bytes,
-            media_type="application/pdf",
-            headers={"Content-Disposition": f'inline; filename="DocuStay-Signed-{sig.invitation_code}.pdf"'},
-        )
+    stored = blob_response(sig, "signed_pdf", media_type="application/pdf", filename=f'DocuStay-Signed-{sig.invitation_code}.pdf')
+    if stored is not None:
+        return stored
     if sig.dropbox_sign_request_id:
         pdf_bytes = get_signed_pdf(sig.dropbox_sign_request_id)
         if pdf_bytes:
-            sig.signed_pdf_bytes = pdf_bytes
+            store_blob(sig, "signed_pdf", pdf_bytes)
             emit_invitation_agreement_signed_if_dropbox_complete(db, sig)
             db.commit()
             return Response(
@@ -583,12 +582,12 @@ def get_signature_status(
     sig = db.query(AgreementSignature).filter(AgreementSignature.id == signature_id).first()
     if not sig:
         raise HTTPException(status_code=404, detail="Signature not found")
-    if sig.signed_pdf_bytes:
+    if sig.has_signed_pdf:
         return SignatureStatusResponse(completed=True)
     if getattr(sig, "dropbox_sign_request_id", None):
         pdf_bytes = get_signed_pdf(sig.dropbox_sign_request_id)
         if pdf_bytes:
-            sig.signed_pdf_bytes = pdf_bytes
+            store_blob(sig, "signed_pdf", pdf_bytes)
             emit_invitation_agreement_signed_if_dropbox_complete(db, sig)
             db.commit()
             return SignatureStatusResponse(completed=True)
@@ -786,7 +785,7 @@ def sign_owner_poa_with_dropbox(
 @router.get("/owner-poa/my-signature", response_model=OwnerPOASignatureResponse | None)
 def get_my_owner_poa_signature(
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner),
+    current_user: Principal = Depends(require_owner_principal),
 ):
     """Return the current owner's Master POA signature (for Settings)."""
     sig = (
@@ -818,7 +817,7 @@ def get_my_owner_poa_signature(
 def get_owner_poa_signed_pdf(
     signature_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner),
+    current_user: Principal = Depends(require_owner_principal),
 ):
     """Return the signed Master POA PDF: from DB if stored, else from Dropbox once signing is complete. Never returns our generated PDF as signed."""
     sig = db.query(OwnerPOASignature).filter(OwnerPOASignature.id == signature_id).first()
@@ -885,7 +884,7 @@ def get_authority_letter_by_token(
         property_name=prop.name if prop else None,
         already_signed=letter.signed_at is not None,
         signed_at=letter.signed_at,
-        has_dropbox_signed_pdf=bool(letter.dropbox_sign_request_id or letter.signed_pdf_bytes),
+        has_dropbox_signed_pdf=bool(letter.dropbox_sign_request_id or letter.has_signed_pdf),
     )
 
 
@@ -939,17 +938,14 @@ def get_authority_letter_signed_pdf(
     if not letter:
         raise HTTPException(status_code=404, detail="Authority letter not found")
 
-    if letter.signed_pdf_bytes:
-        return Response(
-            content=letter.signed_pdf_bytes,
-            media_type="application/pdf",
-            headers={"Content-Disposition": f'inline; filename="DocuStay-Authority-Letter-{letter.provider_name or "signed"}.pdf"'},
-        )
+    stored = blob_response(letter, "signed_pdf", media_type="application/pdf", filename=f'DocuStay-Authority-Letter-{letter.provider_name or "signed"}.pdf')
+    if stored is not None:
+        return stored
     if letter.dropbox_sign_request_id:
         pdf_bytes = get_signed_pdf(letter.dropbox_sign_request_id)
         if pdf_bytes:
             from datetime import datetime, timezone
-            letter.signed_pdf_bytes = pdf_bytes
+            store_blob(letter, "signed_pdf", pdf_bytes)
             letter.signed_at = datetime.now(timezone.utc)  # approximate; Dropbox doesn't give exact time in this flow
             db.commit()
             return Response(
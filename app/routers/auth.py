@@ -22,6 +22,7 @@ from app.models.owner import OwnerProfile, Property, OccupancyStatus
 from app.models.owner_poa_signature import OwnerPOASignature
 from app.models.pending_registration import PendingRegistration
 from app.services.audit_log import create_log, CATEGORY_STATUS_CHANGE, CATEGORY_GUEST_SIGNATURE, CATEGORY_FAILED_ATTEMPT
+from app.services.blob_store import store_blob
 from app.services.invitation_guest_completion import (
     guest_invite_awaiting_account_after_sign,
     guest_invitation_signing_started,
@@ -361,9 +362,10 @@ def _trigger_guest_approaching_end_notifications_after_auth(
 ) -> None:
     """After guest, tenant, owner, or property manager obtains a session, materialize notifications (idempotent; does not block auth on failure).
 
-    For owners and property managers, runs Status Confirmation for their properties only, using the client's
-    calendar day when provided so e.g. ``stay_end_date == today + 2 days`` (lease ends in two calendar days) can
-    generate the 48h-before in-app alert and email on sign-in, not only when the server cron runs.
+    For owners and property managers, queues Status Confirmation for their properties only (deferred, at most once
+    per user per calendar day), using the client's calendar day when provided so e.g. ``stay_end_date == today + 2
+    days`` (lease ends in two calendar days) can generate the 48h-before in-app alert and email on sign-in, not only
+    when the server cron runs. The sign-in response does not wait for it.
     """
     cal = client_calendar_date
     if cal is None and request is not None:
@@ -392,12 +394,12 @@ def _trigger_guest_approaching_end_notifications_after_auth(
             )
     if user.role in (UserRole.owner, UserRole.property_manager):
         try:
-            from app.services.stay_timer import run_status_confirmation_materialize_for_user
+            from app.services.stay_timer import defer_status_confirmation_materialize_for_user
 
-            run_status_confirmation_materialize_for_user(db, user, client_calendar_date=cal)
+            defer_status_confirmation_materialize_for_user(user, client_calendar_date=cal)
         except Exception:
             logger.exception(
-                "Status Confirmation materialization after auth failed (non-fatal); user_id=%s",
+                "Queueing Status Confirmation materialization after auth failed (non-fatal); user_id=%s",
                 user.id,
             )
 
@@ -498,9 +500,6 @@ def register(data: UserCreate, db: Session = Depends(get_db)):
             db.commit()
             print(f"[Auth] Removed {len(existing_pending)} existing pending owner(s) for {email} so signup can start fresh", flush=True)
 
-        # Reload config so UI flow uses same .env as script (avoid stale cache)
-        from app.services.notifications import _get_fresh_settings
-        _get_fresh_settings()
         if not _mailgun_configured():
             raise HTTPException(
                 status_code=503,
@@ -535,7 +534,7 @@ def register(data: UserCreate, db: Session = Depends(get_db)):
         print(f"[Auth] Owner signup: Mailgun configured={_log_mailgun_status} domain={get_settings().mailgun_domain or '(none)'}", flush=True)
         print(f"[Auth] Sending verification email to {email} (owner signup pending_id={pending.id})", flush=True)
         try:
-            # send_verification_email clears config cache and calls send_email -> _send_email_mailgun
+            # Queued on the outbound email dispatcher; a failed delivery is retried, and the user can resend the code.
             sent = send_verification_email(email, code)
         except Exception as e:
             print(f"[Auth] Verification email exception: {type(e).__name__}: {e}", flush=True)
@@ -2042,7 +2041,7 @@ def register_guest(request: Request, data: GuestRegister, db: Session = Depends(
             has_pending_dropbox = db.query(AgreementSignature).filter(
                 AgreementSignature.invitation_code == code,
                 AgreementSignature.dropbox_sign_request_id.isnot(None),
-                AgreementSignature.signed_pdf_bytes.is_(None)
+                ~AgreementSignature.has_signed_pdf
             ).first() is not None
             if not has_pending_dropbox and not guest_invitation_signing_started(db, code):
                 raise HTTPException(status_code=400, detail="This invite has expired. Please contact your host to request a new one.")
@@ -2503,11 +2502,11 @@ def accept_invite(
             has_pending_dropbox = db.query(AgreementSignature).filter(
                 AgreementSignature.invitation_code == code,
                 AgreementSignature.dropbox_sign_request_id.isnot(None),
-                AgreementSignature.signed_pdf_bytes.is_(None)
+                ~AgreementSignature.has_signed_pdf
             ).first() is not None
             has_completed_signature = db.query(AgreementSignature).filter(
                 AgreementSignature.invitation_code == code,
-                AgreementSignature.signed_pdf_bytes.isnot(None),
+                AgreementSignature.has_signed_pdf,
             ).first() is not None
             if not has_pending_dropbox and not has_completed_signature:
                 create_log(
@@ -2702,7 +2701,7 @@ def accept_invite(
                 doc.content, sig.typed_signature, date_str, sig.ip_address
             )
             try:
-                sig.signed_pdf_bytes = agreement_content_to_pdf(doc.title, content_with_sig)
+                store_blob(sig, "signed_pdf", agreement_content_to_pdf(doc.title, content_with_sig))
             except Exception:
                 logging.getLogger(__name__).warning(
                     "Demo accept-invite: agreement_content_to_pdf failed for invitation %s", code, exc_info=True
@@ -2775,10 +2774,10 @@ def accept_invite(
             )
             db.commit()
             raise HTTPException(status_code=400, detail="Agreement signature has already been used")
-        if getattr(sig, "dropbox_sign_request_id", None) and not getattr(sig, "signed_pdf_bytes", None):
+        if getattr(sig, "dropbox_sign_request_id", None) and not sig.has_signed_pdf:
             pdf_bytes = get_signed_pdf(sig.dropbox_sign_request_id)
             if pdf_bytes:
-                sig.signed_pdf_bytes = pdf_bytes
+                store_blob(sig, "signed_pdf", pdf_bytes)
                 emit_invitation_agreement_signed_if_dropbox_complete(
                     db,
                     sig,
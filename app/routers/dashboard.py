@@ -4,16 +4,16 @@ from typing import Any
 import logging
 import secrets
 import time
-from datetime import date, datetime, timezone, timedelta, time as dt_time
+from datetime import date, datetime, timezone, timedelta
 
 logger = logging.getLogger(__name__)
 
-from fastapi import APIRouter, Depends, HTTPException, Request, Body, Header
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, HTTPException, Request, Body, Header, Query
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, func, case
 from pydantic import BaseModel, Field, EmailStr, field_validator
-from app.database import get_db
+from app.database import SessionLocal, get_db
 from app.utils.client_calendar import (
     parse_client_calendar_date_header as _parse_guest_client_calendar_date_header,
     effective_today_for_invite_start,
@@ -59,7 +59,6 @@ def _owner_stay_state_fields(
 from app.models.property_transfer_invitation import PropertyTransferInvitation
 from app.models.guest_pending_invite import GuestPendingInvite
 from app.models.agreement_signature import AgreementSignature
-from app.models.region_rule import StayClassification, RiskLevel
 from app.schemas.dashboard import (
     OwnerStayView,
     OwnerInvitationView,
@@ -75,11 +74,14 @@ from app.schemas.dashboard import (
     BillingSyncSubscriptionResponse,
     PortfolioLinkResponse,
     DashboardAlertView,
+    DashboardAlertUnreadCount,
 )
-from app.services.jle import resolve_jurisdiction
 from app.services.jurisdiction_sot import get_jurisdiction_for_property
 from app.services.audit_log import create_log, CATEGORY_STATUS_CHANGE, CATEGORY_PRESENCE, CATEGORY_DEAD_MANS_SWITCH, CATEGORY_FAILED_ATTEMPT, CATEGORY_BILLING, CATEGORY_SHIELD_MODE
+from app.services.blob_store import blob_response, store_blob
+from app.services.principal_cache import Principal
 from app.services.event_ledger import (
+    ledger_search_clause,
     build_ledger_display_resolution_context,
     create_ledger_event,
     ledger_event_to_display,
@@ -167,9 +169,16 @@ from app.services.guest_stay_email_scope import (
     guest_stay_inviter_user_for_email,
     owner_email_and_manager_emails_for_guest_stay_dms,
 )
-from app.services.dashboard_alerts import create_alert_for_owner_and_managers, create_alert_for_user
-from app.schemas.jle import JLEInput
-from app.dependencies import get_current_user, require_owner, require_owner_onboarding_complete, require_guest, require_tenant, require_guest_or_tenant, require_owner_or_manager, require_property_manager, require_property_manager_identity_verified, get_context_mode
+from app.services.dashboard_alerts import (
+    ALERT_TYPES_BY_ROLE,
+    PROPERTY_TRANSFER_ALERT_TYPES,
+    adjust_unread_alert_count,
+    business_alert_scope_clause,
+    create_alert_for_owner_and_managers,
+    create_alert_for_user,
+    get_unread_alert_count,
+)
+from app.dependencies import get_current_principal, get_current_user, require_owner, require_owner_onboarding_complete, require_owner_onboarding_complete_principal, require_guest, require_tenant, require_guest_or_tenant, require_owner_or_manager, require_property_manager, require_property_manager_identity_verified, get_context_mode
 from app.models.audit_log import AuditLog
 from app.models.event_ledger import EventLedger
 from app.models.dashboard_alert import DashboardAlert
@@ -216,33 +225,44 @@ from app.services.permissions import (
     stay_in_owner_personal_guest_scope,
     invitation_in_manager_personal_guest_scope,
     stay_in_manager_personal_guest_scope,
+    personal_guest_scope_invitation_ids,
+    personal_guest_scope_stay_ids,
     user_owns_property_by_profile,
 )
 from app.services.privacy_lanes import (
     is_tenant_lane_invitation,
     is_tenant_lane_stay,
-    get_tenant_lane_invitation_ids,
-    get_tenant_lane_stay_ids,
     filter_property_lane_invitations_for_owner,
     filter_property_lane_stays_for_owner,
     filter_property_lane_invitations_for_manager,
     filter_property_lane_stays_for_manager,
-    filter_tenant_lane_from_ledger_rows,
-    filter_tenant_presence_from_owner_manager_ledger,
-    filter_manager_presence_on_tenant_leased_units,
+    tenant_lane_ledger_exclusion_clause,
+    tenant_lane_alert_exclusion_clause,
+    tenant_presence_ledger_exclusion_clause,
+    manager_leased_unit_presence_exclusion_clause,
     REDACTED_GUEST_AUTHORIZATION_LABEL,
     viewer_is_relationship_owner_for_stay,
     viewer_is_relationship_owner_for_invitation,
 )
 from app.services.display_names import label_for_stay, label_from_invitation, label_from_user_id
+from app.services.ledger_pagination import (
+    LEDGER_PAGE_MAX_LIMIT,
+    InvalidLedgerCursor,
+    decode_ledger_cursor,
+    fetch_ledger_page,
+    iter_ledger_batches,
+)
+from app.services.stay_view_assembler import (
+    build_stay_view_context,
+    invitation_row_view,
+    load_lane_maps,
+    stay_row_view,
+    unit_ids_by_property,
+)
 from app.services.occupancy import get_property_display_occupancy_status
 from app.services.occupancy import normalize_occupancy_status_for_display, get_unit_display_occupancy_status
+from app.services.sql_profiler import query_budget
 from app.config import get_settings
-from app.services.stay_timer import (
-    _status_confirmation_eligible_stay,
-    dms_test_mode_effective_end_utc,
-    dms_test_mode_unknown_deadline_utc,
-)
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
@@ -295,53 +315,6 @@ class TenantApproveExtensionBody(BaseModel):
     message: str | None = Field(None, max_length=1000)
 
 
-# Alert types each role is allowed to see (only role-relevant alerts are returned).
-_ALERT_TYPES_BY_ROLE = {
-    UserRole.owner: {
-        "overstay",
-        "nearing_expiration",
-        "dms_48h",
-        "dms_urgent",
-        "dms_executed",
-        "dms_reminder",
-        "tenant_lease_48h",
-        "tenant_lease_urgent",
-        "shield_on", "revoked", "renewed", "vacated", "holdover", "expired",
-        "invitation_expired", "invitation_accepted", "tenant_accepted",
-        "vacant_monitoring", "removal_initiated",
-        "property_transfer_completed",
-        "property_transfer_accepted",
-        "property_transfer_invited",
-        "property_transfer_invite_expired",
-    },
-    UserRole.property_manager: {
-        "overstay",
-        "nearing_expiration",
-        "dms_48h",
-        "dms_urgent",
-        "dms_executed",
-        "dms_reminder",
-        "tenant_lease_48h",
-        "tenant_lease_urgent",
-        "shield_on", "revoked", "renewed", "vacated", "holdover", "expired",
-        "invitation_expired", "invitation_accepted", "tenant_accepted",
-        "vacant_monitoring", "removal_initiated",
-        "property_transfer_completed",
-        "property_transfer_accepted",
-        "property_transfer_invited",
-        "property_transfer_invite_expired",
-    },
-    UserRole.guest: {"overstay", "nearing_expiration", "revoked", "expired", "removal_initiated"},
-    UserRole.tenant: {
-        "invitation_expired",
-        "invitation_accepted",
-        "guest_stay_ending",
-        "guest_extension_request",
-        "revoked",  # you revoked a guest stay you invited (tenant lane; not shown to owners/managers)
-    },
-    UserRole.admin: None,  # None = no filter, show all
-}
-
 # Owner/manager personal mode: only in-app alerts tied to a property-lane guest invitation or stay on
 # personal-mode units (not tenant lane). Excludes billing (no invitation/stay), shield, vacant monitoring,
 # tenant_accepted, and any alert with only a property_id.
@@ -366,148 +339,100 @@ _OWNER_PERSONAL_GUEST_ALERT_TYPES = frozenset(
     }
 )
 
-# Ownership-transfer alerts: show in personal mode too (account-level, not guest-lane).
-_PROPERTY_TRANSFER_ALERT_TYPES = frozenset(
-    {
-        "property_transfer_completed",
-        "property_transfer_accepted",
-        "property_transfer_invited",
-        "property_transfer_invite_expired",
-    }
-)
+def _personal_guest_alert_clause(unit_ids: set[int]):
+    """Owner/manager personal mode: property-lane guest invitation/stay alerts on these units (the caller excludes
+    tenant lane), plus ownership-transfer alerts."""
+    return or_(
+        DashboardAlert.alert_type.in_(sorted(PROPERTY_TRANSFER_ALERT_TYPES)),
+        and_(
+            DashboardAlert.alert_type.in_(sorted(_OWNER_PERSONAL_GUEST_ALERT_TYPES)),
+            or_(DashboardAlert.invitation_id.isnot(None), DashboardAlert.stay_id.isnot(None)),
+            or_(
+                DashboardAlert.invitation_id.is_(None),
+                DashboardAlert.invitation_id.in_(personal_guest_scope_invitation_ids(unit_ids)),
+            ),
+            or_(
+                DashboardAlert.stay_id.is_(None),
+                DashboardAlert.stay_id.in_(personal_guest_scope_stay_ids(unit_ids)),
+            ),
+        ),
+    )
 
 
-def _owner_alert_allowed_personal_guest_mode(
-    db: Session, alert: DashboardAlert, allowed_unit_ids: set[int]
-) -> bool:
-    if alert.alert_type not in _OWNER_PERSONAL_GUEST_ALERT_TYPES:
-        return False
-    inv_id = getattr(alert, "invitation_id", None)
-    stay_id = getattr(alert, "stay_id", None)
-    if not inv_id and not stay_id:
-        return False
-    if inv_id:
-        inv = db.query(Invitation).filter(Invitation.id == inv_id).first()
-        if not inv or is_tenant_lane_invitation(db, inv):
-            return False
-        if not invitation_in_owner_personal_guest_scope(db, inv, allowed_unit_ids):
-            return False
-    if stay_id:
-        stay = db.query(Stay).filter(Stay.id == stay_id).first()
-        if not stay or is_tenant_lane_stay(db, stay):
-            return False
-        if not stay_in_owner_personal_guest_scope(db, stay, allowed_unit_ids):
-            return False
-    return True
-
-
-def _manager_alert_allowed_personal_guest_mode(
-    db: Session, alert: DashboardAlert, manager_unit_ids: set[int]
-) -> bool:
-    if alert.alert_type not in _OWNER_PERSONAL_GUEST_ALERT_TYPES:
-        return False
-    inv_id = getattr(alert, "invitation_id", None)
-    stay_id = getattr(alert, "stay_id", None)
-    if not inv_id and not stay_id:
-        return False
-    if inv_id:
-        inv = db.query(Invitation).filter(Invitation.id == inv_id).first()
-        if not inv or is_tenant_lane_invitation(db, inv):
-            return False
-        if not invitation_in_manager_personal_guest_scope(db, inv, manager_unit_ids):
-            return False
-    if stay_id:
-        stay = db.query(Stay).filter(Stay.id == stay_id).first()
-        if not stay or is_tenant_lane_stay(db, stay):
-            return False
-        if not stay_in_manager_personal_guest_scope(db, stay, manager_unit_ids):
-            return False
-    return True
+def _alert_scope_clause(db: Session, user: User, context_mode: str):
+    """WHERE clause scoping an owner's / manager's alerts to the current mode; None when nothing is in scope."""
+    if context_mode == "business":
+        # Business: include alerts with no property_id (e.g. billing) or property_id in the business set
+        return business_alert_scope_clause(user.id, user.role)
+    # Personal mode: only property-lane guest invite/stay alerts on personal-mode units (see module constants).
+    if user.role == UserRole.owner:
+        units = owner_personal_guest_scope_unit_ids(db, user.id)
+    else:
+        units = set(get_manager_personal_mode_units(db, user.id))
+    if not units:
+        return None
+    return _personal_guest_alert_clause(units)
 
 
 @router.get("/alerts", response_model=list[DashboardAlertView])
 def list_alerts(
+    response: Response,
     unread_only: bool = False,
     limit: int = 100,
+    cursor: str | None = Query(None, description="X-Next-Cursor from the previous page"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
     context_mode: str = Depends(get_context_mode),
 ):
-    """List in-platform dashboard alerts for the current user. Only alerts relevant to the user's role are returned.
+    """List in-platform dashboard alerts for the current user, newest first. Only alerts relevant to the user's role are returned.
     Business mode (owner/manager): alerts for owned/assigned properties plus account-level (no property_id).
     Personal mode (owner): only property-lane guest invitation/stay alerts scoped to the owner's personal-mode units —
     no billing, no tenant_accepted, no shield/vacant monitoring, no property-only rows.
-    Personal mode (manager): same rule for on-site resident units. Tenant-lane notifications never show to owners/managers."""
+    Personal mode (manager): same rule for on-site resident units. Tenant-lane notifications never show to owners/managers.
+    All scoping runs in SQL before ``limit``; ``X-Next-Cursor`` is set when more alerts remain (pass it back as ``cursor``)."""
     q = db.query(DashboardAlert).filter(DashboardAlert.user_id == current_user.id)
     if unread_only:
         q = q.filter(DashboardAlert.read_at.is_(None))
-    allowed_types = _ALERT_TYPES_BY_ROLE.get(current_user.role)
+    allowed_types = ALERT_TYPES_BY_ROLE.get(current_user.role)
     if allowed_types is not None:
         q = q.filter(DashboardAlert.alert_type.in_(allowed_types))
-    q = q.order_by(DashboardAlert.created_at.desc()).limit(limit)
-    alerts = q.all()
 
     # Scope by context mode for owner and property_manager: business vs personal property set; exclude tenant-lane in both modes
     if current_user.role in (UserRole.owner, UserRole.property_manager):
-        if context_mode == "business":
-            if current_user.role == UserRole.owner:
-                profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == current_user.id).first()
-                allowed_property_ids = (
-                    [p.id for p in db.query(Property).filter(Property.owner_profile_id == profile.id, Property.deleted_at.is_(None)).all()]
-                    if profile is not None else []
-                )
-            else:
-                allowed_property_ids = [
-                    r[0] for r in db.query(PropertyManagerAssignment.property_id).filter(
-                        PropertyManagerAssignment.user_id == current_user.id,
-                    ).all()
-                ]
-            # Business: include alerts with no property_id (e.g. billing) or property_id in business set
-            allowed_property_ids_set = set(allowed_property_ids)
-            alerts = [a for a in alerts if a.property_id is None or a.property_id in allowed_property_ids_set]
-        else:
-            # Personal mode: only property-lane guest invite/stay alerts on personal-mode units (see module constants).
-            if current_user.role == UserRole.owner:
-                allowed_units = owner_personal_guest_scope_unit_ids(db, current_user.id)
-                if not allowed_units:
-                    alerts = []
-                else:
-                    alerts = [
-                        a
-                        for a in alerts
-                        if _owner_alert_allowed_personal_guest_mode(db, a, allowed_units)
-                        or (a.alert_type in _PROPERTY_TRANSFER_ALERT_TYPES)
-                    ]
-            else:
-                manager_units = set(get_manager_personal_mode_units(db, current_user.id))
-                if not manager_units:
-                    alerts = []
-                else:
-                    alerts = [
-                        a
-                        for a in alerts
-                        if _manager_alert_allowed_personal_guest_mode(db, a, manager_units)
-                        or (a.alert_type in _PROPERTY_TRANSFER_ALERT_TYPES)
-                    ]
-
+        scope = _alert_scope_clause(db, current_user, context_mode)
+        if scope is None:
+            return []
         # Exclude tenant-lane: owners/managers never see notifications about tenant-invited guests
-        inv_ids = [a.invitation_id for a in alerts if getattr(a, "invitation_id", None) is not None]
-        stay_ids = [a.stay_id for a in alerts if getattr(a, "stay_id", None) is not None]
-        tenant_inv_ids = get_tenant_lane_invitation_ids(db, inv_ids) if inv_ids else set()
-        tenant_stay_ids = get_tenant_lane_stay_ids(db, stay_ids) if stay_ids else set()
-        alerts = [
-            a for a in alerts
-            if getattr(a, "invitation_id", None) not in tenant_inv_ids and getattr(a, "stay_id", None) not in tenant_stay_ids
-        ]
+        q = q.filter(scope, tenant_lane_alert_exclusion_clause())
 
+    if limit <= 0:
+        return []
+    try:
+        alerts, next_cursor = fetch_ledger_page(q, limit=limit, cursor=cursor, model=DashboardAlert)
+    except InvalidLedgerCursor as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return [DashboardAlertView.model_validate(a) for a in alerts]
 
 
+@router.get("/alerts/unread-count", response_model=DashboardAlertUnreadCount)
+def unread_alert_count(
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """Unread alerts addressed to the current user, from a per-user counter kept with alert writes (badge polling).
+    Counts the unread alerts GET /dashboard/alerts shows in business or personal mode (role types, mode scope, no
+    tenant lane), so marking them read clears the badge. Authenticates from the principal
+    cache, so a poll is one counter read."""
+    return DashboardAlertUnreadCount(unread_count=get_unread_alert_count(db, current_user.id))
+
+
 @router.patch("/alerts/{alert_id}/read", response_model=DashboardAlertView)
 def mark_alert_read(
     alert_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """Mark a dashboard alert as read."""
     alert = db.query(DashboardAlert).filter(DashboardAlert.id == alert_id, DashboardAlert.user_id == current_user.id).first()
@@ -516,6 +441,7 @@ def mark_alert_read(
     if alert.read_at is None:
         alert.read_at = datetime.now(timezone.utc)
         db.add(alert)
+        adjust_unread_alert_count(db, current_user.id, [alert.id], -1)
         db.commit()
         db.refresh(alert)
     return DashboardAlertView.model_validate(alert)
@@ -534,7 +460,7 @@ def mark_occupancy_prompt_alerts_read(
     if not can_confirm_occupancy(db, current_user, stay):
         raise HTTPException(status_code=403, detail="You do not have permission to clear these alerts for this stay")
     now = datetime.now(timezone.utc)
-    marked = 0
+    marked_ids = []
     for alert in (
         db.query(DashboardAlert)
         .filter(
@@ -547,14 +473,15 @@ def mark_occupancy_prompt_alerts_read(
     ):
         alert.read_at = now
         db.add(alert)
-        marked += 1
+        marked_ids.append(alert.id)
+    adjust_unread_alert_count(db, current_user.id, marked_ids, -1)
     db.commit()
-    return {"status": "success", "marked_count": marked}
+    return {"status": "success", "marked_count": len(marked_ids)}
 
 
 def _mark_tenant_lease_occupancy_alerts_read(db: Session, user_id: int, tenant_assignment_id: int) -> int:
     now = datetime.now(timezone.utc)
-    marked = 0
+    marked_ids = []
     for alert in (
         db.query(DashboardAlert)
         .filter(
@@ -569,8 +496,9 @@ def _mark_tenant_lease_occupancy_alerts_read(db: Session, user_id: int, tenant_a
             continue
         alert.read_at = now
         db.add(alert)
-        marked += 1
-    return marked
+        marked_ids.append(alert.id)
+    adjust_unread_alert_count(db, user_id, marked_ids, -1)
+    return len(marked_ids)
 
 
 @router.get("/guest/pending-invites", response_model=list[GuestPendingInviteView])
@@ -617,19 +545,19 @@ def guest_pending_invites(
             )
             if sig:
                 if getattr(sig, "dropbox_sign_request_id", None):
-                    if not getattr(sig, "signed_pdf_bytes", None):
+                    if not sig.has_signed_pdf:
                         pdf_bytes = get_signed_pdf(sig.dropbox_sign_request_id)
                         if pdf_bytes:
-                            sig.signed_pdf_bytes = pdf_bytes
+                            store_blob(sig, "signed_pdf", pdf_bytes)
                             emit_invitation_agreement_signed_if_dropbox_complete(db, sig)
                             db.commit()
                             db.refresh(sig)
-                    if not getattr(sig, "signed_pdf_bytes", None):
+                    if not sig.has_signed_pdf:
                         needs_dropbox = True
                         pending_sig_id = sig.id
                     elif getattr(sig, "used_by_user_id", None) is None:
                         accept_now_sig_id = sig.id
-                elif getattr(sig, "signed_pdf_bytes", None) and getattr(sig, "used_by_user_id", None) is None:
+                elif sig.has_signed_pdf and getattr(sig, "used_by_user_id", None) is None:
                     accept_now_sig_id = sig.id
         out.append(
             GuestPendingInviteView(
@@ -797,18 +725,18 @@ def guest_add_pending_invite(
             )
             if sig:
                 if getattr(sig, "dropbox_sign_request_id", None):
-                    if not getattr(sig, "signed_pdf_bytes", None):
+                    if not sig.has_signed_pdf:
                         pdf_bytes = get_signed_pdf(sig.dropbox_sign_request_id)
                         if pdf_bytes:
-                            sig.signed_pdf_bytes = pdf_bytes
+                            store_blob(sig, "signed_pdf", pdf_bytes)
                             emit_invitation_agreement_signed_if_dropbox_complete(db, sig)
                             db.commit()
                             db.refresh(sig)
-                    if not getattr(sig, "signed_pdf_bytes", None):
+                    if not sig.has_signed_pdf:
                         needs_dropbox, pending_sig_id = True, sig.id
                     elif getattr(sig, "used_by_user_id", None) is None:
                         accept_now_sig_id = sig.id
-                elif getattr(sig, "signed_pdf_bytes", None) and getattr(sig, "used_by_user_id", None) is None:
+                elif sig.has_signed_pdf and getattr(sig, "used_by_user_id", None) is None:
                     accept_now_sig_id = sig.id
         unit_label_val = None
         if getattr(inv, "unit_id", None):
@@ -858,19 +786,19 @@ def guest_add_pending_invite(
         )
         if sig:
             if getattr(sig, "dropbox_sign_request_id", None):
-                if not getattr(sig, "signed_pdf_bytes", None):
+                if not sig.has_signed_pdf:
                     pdf_bytes = get_signed_pdf(sig.dropbox_sign_request_id)
                     if pdf_bytes:
-                        sig.signed_pdf_bytes = pdf_bytes
+                        store_blob(sig, "signed_pdf", pdf_bytes)
                         emit_invitation_agreement_signed_if_dropbox_complete(db, sig)
                         db.commit()
                         db.refresh(sig)
-                if not getattr(sig, "signed_pdf_bytes", None):
+                if not sig.has_signed_pdf:
                     needs_dropbox = True
                     pending_sig_id = sig.id
                 elif getattr(sig, "used_by_user_id", None) is None:
                     accept_now_sig_id = sig.id
-            elif getattr(sig, "signed_pdf_bytes", None) and getattr(sig, "used_by_user_id", None) is None:
+            elif sig.has_signed_pdf and getattr(sig, "used_by_user_id", None) is None:
                 accept_now_sig_id = sig.id
     return GuestPendingInviteView(
         invitation_code=inv.invitation_code,
@@ -890,7 +818,7 @@ def guest_add_pending_invite(
 @router.get("/owner/tenants")
 def owner_tenants(
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """List tenants (assigned + pending invitation) for the owner's properties. Business-mode safe."""
     from app.services.state_resolver import resolve_tenant_state
@@ -1027,7 +955,7 @@ def owner_tenants(
 @router.get("/owner/invitations", response_model=list[OwnerInvitationView])
 def owner_invitations(
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
     context_mode: str = Depends(get_context_mode),
 ):
     """Owner view: invitations with property name.
@@ -1076,7 +1004,7 @@ def _invitations_to_owner_views(
         has_pending_dropbox = db.query(AgreementSignature).filter(
             AgreementSignature.invitation_code == inv.invitation_code,
             AgreementSignature.dropbox_sign_request_id.isnot(None),
-            AgreementSignature.signed_pdf_bytes.is_(None)
+            ~AgreementSignature.has_signed_pdf
         ).first() is not None
 
         is_expired = (
@@ -1418,7 +1346,7 @@ def bulk_shield_mode(
 @router.get("/owner/stays", response_model=list[OwnerStayView])
 def owner_stays(
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
     context_mode: str = Depends(get_context_mode),
 ):
     """Owner view: guest stays. Business mode: returns [] (no guest data). Personal mode: property-lane stays only (owner/manager-invited; NEVER tenant-invited guest stays). Guest PII and invite codes are shown only when the owner is the relationship owner for that stay/invitation (typically the inviter)."""
@@ -1436,128 +1364,18 @@ def owner_stays(
             seen_ids.add(s.id)
             stays.append(s)
     stays = [s for s in stays if s.property_id in owned_prop_ids]
-    stays = filter_property_lane_stays_for_owner(db, stays, current_user.id)
+    invitations_by_id, users_by_id = load_lane_maps(db, stays)
+    units_by_prop = unit_ids_by_property(db, owned_prop_ids)
+    stays = filter_property_lane_stays_for_owner(
+        db, stays, current_user.id, invitations_by_id=invitations_by_id, users_by_id=users_by_id
+    )
     allowed_units = owner_personal_guest_scope_unit_ids(db, current_user.id)
-    stays = [s for s in stays if stay_in_owner_personal_guest_scope(db, s, allowed_units)]
-    out = []
-    for s in stays:
-        show_guest_pii = viewer_is_relationship_owner_for_stay(db, s, current_user.id)
-        guest_name = label_for_stay(db, s) if show_guest_pii else REDACTED_GUEST_AUTHORIZATION_LABEL
-
-        prop = db.query(Property).filter(Property.id == s.property_id).first()
-        property_name = (prop.name if prop else None) or (f"{prop.city}, {prop.state}" if prop else None) or "Property"
-
-        rule = db.query(RegionRule).filter(RegionRule.region_code == s.region_code).first()
-        jle = resolve_jurisdiction(
-            db,
-            JLEInput(
-                region_code=s.region_code,
-                stay_duration_days=s.intended_stay_duration_days,
-                owner_occupied=True,  # would come from property
-                property_type=None,
-                guest_has_permanent_address=True,
-            ),
-        )
-        max_days = rule.max_stay_days if rule else 0
-        classification = (jle.legal_classification if jle else None) or (rule.stay_classification_label if rule else None) or StayClassification.guest
-        risk = (jle.risk_level if jle else None) or (rule.risk_level if rule else None) or RiskLevel.low
-        statutes = (jle.applicable_statutes if jle else []) or ([rule.statute_reference] if rule and rule.statute_reference else [])
-
-        # Status confirmation: prod = deadline stay_end + 48h; test mode = effective simulated end + 5 min (see stay_timer)
-        checked_out = getattr(s, "checked_out_at", None) is not None
-        cancelled = getattr(s, "cancelled_at", None) is not None
-        conf_resp = getattr(s, "occupancy_confirmation_response", None)
-        dms_on = bool(getattr(s, "dead_mans_switch_enabled", 0))
-        now = datetime.now(timezone.utc)
-        _dms_test = bool(getattr(get_settings(), "dms_test_mode", False))
-        eff_test = (
-            dms_test_mode_effective_end_utc(s)
-            if _dms_test and _status_confirmation_eligible_stay(db, s)
-            else None
-        )
-        if eff_test is not None:
-            confirmation_deadline_at = dms_test_mode_unknown_deadline_utc(db, s)
-            needs_conf = (
-                not checked_out
-                and not cancelled
-                and dms_on
-                and conf_resp is None
-                and confirmation_deadline_at is not None
-                and now < confirmation_deadline_at
-            )
-        else:
-            confirmation_deadline_at = datetime.combine(
-                s.stay_end_date + timedelta(days=2), dt_time.min, tzinfo=timezone.utc
-            ) if s.stay_end_date else None
-            needs_conf = (
-                not checked_out and not cancelled
-                and dms_on
-                and conf_resp is None
-                and confirmation_deadline_at is not None
-                and now < confirmation_deadline_at
-                and s.stay_end_date <= (date.today() + timedelta(days=2))  # in prompt window (48h before or after)
-            )
-        prop_status = (
-            normalize_occupancy_status_for_display(
-                db,
-                prop.id,
-                getattr(s, "unit_id", None),
-                getattr(prop, "occupancy_status", None) or OccupancyStatus.vacant.value,
-            )
-            if prop
-            else OccupancyStatus.vacant.value
-        )
-        show_confirm_ui = needs_conf or (
-            prop_status in (OccupancyStatus.unconfirmed.value, OccupancyStatus.unknown.value)
-            and not checked_out
-            and not cancelled
-            and dms_on
-            and conf_resp is None
-            and (
-                (eff_test is not None and now >= eff_test)
-                or (eff_test is None and s.stay_end_date < date.today())
-            )
-        )
-
-        invite_id_val = None
-        token_state_val = None
-        inv_for_state: Invitation | None = None
-        if getattr(s, "invitation_id", None):
-            inv_for_state = db.query(Invitation).filter(Invitation.id == s.invitation_id).first()
-            if inv_for_state:
-                invite_id_val = inv_for_state.invitation_code if show_guest_pii else None
-                token_state_val = getattr(inv_for_state, "token_state", None) or "BURNED"
-        state_fields = _owner_stay_state_fields(db, s, inv_for_state)
-        out.append(
-            OwnerStayView(
-                stay_id=s.id,
-                property_id=s.property_id,
-                invite_id=invite_id_val,
-                token_state=token_state_val,
-                invitation_only=False,
-                guest_name=guest_name,
-                property_name=property_name,
-                stay_start_date=s.stay_start_date,
-                stay_end_date=s.stay_end_date,
-                region_code=s.region_code,
-                legal_classification=classification,
-                max_stay_allowed_days=max_days,
-                risk_indicator=risk,
-                applicable_laws=statutes,
-                revoked_at=getattr(s, "revoked_at", None),
-                checked_in_at=getattr(s, "checked_in_at", None),
-                checked_out_at=getattr(s, "checked_out_at", None),
-                cancelled_at=getattr(s, "cancelled_at", None),
-                usat_token_released_at=getattr(s, "usat_token_released_at", None),
-                dead_mans_switch_enabled=dms_on,
-                needs_occupancy_confirmation=needs_conf,
-                show_occupancy_confirmation_ui=show_confirm_ui,
-                confirmation_deadline_at=confirmation_deadline_at if show_confirm_ui else None,
-                occupancy_confirmation_response=conf_resp,
-                property_deleted_at=getattr(prop, "deleted_at", None) if prop else None,
-                **state_fields,
-            )
+    stays = [
+        s for s in stays
+        if stay_in_owner_personal_guest_scope(
+            db, s, allowed_units, invitations_by_id=invitations_by_id, unit_ids_by_property=units_by_prop
         )
+    ]
 
     # Include BURNED and EXPIRED invitations that have no Stay so they show in Stays section (CSV tenants, or invites where Stay was never created).
     # Exclude: (1) invitation_id already linked to a Stay, (2) status='accepted', (3) any Stay exists for same property + dates (covers old Stays created without invitation_id).
@@ -1570,74 +1388,55 @@ def owner_stays(
     )
     if invitation_ids_with_stay:
         q = q.filter(~Invitation.id.in_(invitation_ids_with_stay))
-    invs_no_stay = filter_property_lane_invitations_for_owner(db, q.all(), current_user.id)
-    invs_no_stay = [inv for inv in invs_no_stay if invitation_in_owner_personal_guest_scope(db, inv, allowed_units)]
+    invs_no_stay = q.all()
+    load_lane_maps(db, [], invs_no_stay, invitations_by_id=invitations_by_id, users_by_id=users_by_id)
+    inv_prop_ids = {inv.property_id for inv in invs_no_stay}
+    manager_pairs = (
+        {
+            (r[0], r[1])
+            for r in db.query(PropertyManagerAssignment.property_id, PropertyManagerAssignment.user_id)
+            .filter(PropertyManagerAssignment.property_id.in_(inv_prop_ids))
+            .all()
+        }
+        if inv_prop_ids
+        else set()
+    )
+    units_by_prop.update(unit_ids_by_property(db, inv_prop_ids - units_by_prop.keys()))
+    invs_no_stay = filter_property_lane_invitations_for_owner(
+        db, invs_no_stay, current_user.id, users_by_id=users_by_id, manager_assignment_pairs=manager_pairs
+    )
+    invs_no_stay = [
+        inv for inv in invs_no_stay
+        if invitation_in_owner_personal_guest_scope(db, inv, allowed_units, unit_ids_by_property=units_by_prop)
+        and (inv.property_id, inv.stay_start_date, inv.stay_end_date) not in stay_key
+    ]
+
+    ctx = build_stay_view_context(
+        db, stays, invs_no_stay, invitations_by_id=invitations_by_id, users_by_id=users_by_id
+    )
+    out = [
+        stay_row_view(
+            db,
+            ctx,
+            s,
+            show_guest_pii=viewer_is_relationship_owner_for_stay(
+                db, s, current_user.id, invitations_by_id=ctx.invitations_by_id
+            ),
+        )
+        for s in stays
+    ]
     profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == current_user.id).first()
     for inv in invs_no_stay:
-        if (inv.property_id, inv.stay_start_date, inv.stay_end_date) in stay_key:
-            continue
-        prop = db.query(Property).filter(Property.id == inv.property_id).first()
+        prop = ctx.properties_by_id.get(inv.property_id)
         if prop is None:
             continue
         if profile is None or prop.owner_profile_id != profile.id:
             continue  # ensure property belongs to this owner
-        property_name = (prop.name or "").strip() or (f"{getattr(prop, 'city', '')}, {getattr(prop, 'state', '')}".strip(", ")) or "Property"
-        region = (getattr(inv, "region_code", None) or "").strip() or (getattr(prop, "region_code", None) or "") or "US"
-        start = inv.stay_start_date
-        end = inv.stay_end_date
-        duration_days = (end - start).days if start and end else 0
-        rule = db.query(RegionRule).filter(RegionRule.region_code == region).first()
-        jle = resolve_jurisdiction(
-            db,
-            JLEInput(
-                region_code=region,
-                stay_duration_days=duration_days,
-                owner_occupied=True,
-                property_type=None,
-                guest_has_permanent_address=True,
-            ),
-        )
-        max_days = rule.max_stay_days if rule else 0
-        classification = (jle.legal_classification if jle else None) or (rule.stay_classification_label if rule else None) or StayClassification.guest
-        risk = (jle.risk_level if jle else None) or (rule.risk_level if rule else None) or RiskLevel.low
-        statutes = (jle.applicable_statutes if jle else []) or ([rule.statute_reference] if rule and rule.statute_reference else [])
-        token_state = (getattr(inv, "token_state", None) or "BURNED").upper()
-        is_expired = token_state == "EXPIRED"
-        # For EXPIRED (no Stay row), show as completed so past stays appear
-        checked_out_dt = datetime.combine(end, dt_time.min, tzinfo=timezone.utc) if is_expired and end else None
-        show_guest_pii = viewer_is_relationship_owner_for_invitation(inv, current_user.id)
-        inv_guest_name = label_from_invitation(db, inv) if show_guest_pii else REDACTED_GUEST_AUTHORIZATION_LABEL
-        state_fields_inv = _owner_stay_state_fields(db, None, inv)
-        out.append(
-            OwnerStayView(
-                stay_id=-inv.id,
-                property_id=inv.property_id,
-                invite_id=inv.invitation_code if show_guest_pii else None,
-                token_state=token_state,
-                invitation_only=True,
-                guest_name=inv_guest_name,
-                property_name=property_name,
-                stay_start_date=start,
-                stay_end_date=end,
-                region_code=region,
-                legal_classification=classification,
-                max_stay_allowed_days=max_days,
-                risk_indicator=risk,
-                applicable_laws=statutes,
-                revoked_at=None,
-                checked_in_at=None,
-                checked_out_at=checked_out_dt,
-                cancelled_at=None,
-                usat_token_released_at=None,
-                dead_mans_switch_enabled=bool(getattr(inv, "dead_mans_switch_enabled", 0)),
-                needs_occupancy_confirmation=False,
-                show_occupancy_confirmation_ui=False,
-                confirmation_deadline_at=None,
-                occupancy_confirmation_response=None,
-                property_deleted_at=getattr(prop, "deleted_at", None),
-                **state_fields_inv,
-            )
+        row = invitation_row_view(
+            db, ctx, inv, show_guest_pii=viewer_is_relationship_owner_for_invitation(inv, current_user.id)
         )
+        if row is not None:
+            out.append(row)
 
     return out
 
@@ -1678,95 +1477,14 @@ def manager_stays(
             seen_ids.add(s.id)
             stays.append(s)
     stays = filter_property_lane_stays_for_manager(db, stays, current_user.id)
-    stays = [s for s in stays if stay_in_manager_personal_guest_scope(db, s, mu)]
-    out = []
-    for s in stays:
-        show_guest_pii = viewer_is_relationship_owner_for_stay(db, s, current_user.id)
-        guest_name = label_for_stay(db, s) if show_guest_pii else REDACTED_GUEST_AUTHORIZATION_LABEL
-        prop = db.query(Property).filter(Property.id == s.property_id).first()
-        property_name = (prop.name if prop else None) or (f"{prop.city}, {prop.state}" if prop else None) or "Property"
-        rule = db.query(RegionRule).filter(RegionRule.region_code == s.region_code).first()
-        jle = resolve_jurisdiction(db, JLEInput(region_code=s.region_code, stay_duration_days=s.intended_stay_duration_days, owner_occupied=True, property_type=None, guest_has_permanent_address=True))
-        max_days = rule.max_stay_days if rule else 0
-        classification = (jle.legal_classification if jle else None) or (rule.stay_classification_label if rule else None) or StayClassification.guest
-        risk = (jle.risk_level if jle else None) or (rule.risk_level if rule else None) or RiskLevel.low
-        statutes = (jle.applicable_statutes if jle else []) or ([rule.statute_reference] if rule and rule.statute_reference else [])
-        checked_out = getattr(s, "checked_out_at", None) is not None
-        cancelled = getattr(s, "cancelled_at", None) is not None
-        conf_resp = getattr(s, "occupancy_confirmation_response", None)
-        dms_on = bool(getattr(s, "dead_mans_switch_enabled", 0))
-        now = datetime.now(timezone.utc)
-        _dms_test = bool(getattr(get_settings(), "dms_test_mode", False))
-        eff_test = (
-            dms_test_mode_effective_end_utc(s)
-            if _dms_test and _status_confirmation_eligible_stay(db, s)
-            else None
+    invitations_by_id, users_by_id = load_lane_maps(db, stays)
+    units_by_prop = unit_ids_by_property(db, {s.property_id for s in stays} | set(property_ids))
+    stays = [
+        s for s in stays
+        if stay_in_manager_personal_guest_scope(
+            db, s, mu, invitations_by_id=invitations_by_id, unit_ids_by_property=units_by_prop
         )
-        if eff_test is not None:
-            confirmation_deadline_at = dms_test_mode_unknown_deadline_utc(db, s)
-            needs_conf = (
-                not checked_out
-                and not cancelled
-                and dms_on
-                and conf_resp is None
-                and confirmation_deadline_at is not None
-                and now < confirmation_deadline_at
-            )
-        else:
-            confirmation_deadline_at = (
-                datetime.combine(s.stay_end_date + timedelta(days=2), dt_time.min, tzinfo=timezone.utc)
-                if s.stay_end_date
-                else None
-            )
-            needs_conf = (
-                not checked_out
-                and not cancelled
-                and dms_on
-                and conf_resp is None
-                and confirmation_deadline_at is not None
-                and now < confirmation_deadline_at
-                and s.stay_end_date <= (date.today() + timedelta(days=2))
-            )
-        prop_status = (
-            normalize_occupancy_status_for_display(
-                db,
-                prop.id,
-                getattr(s, "unit_id", None),
-                getattr(prop, "occupancy_status", None) or OccupancyStatus.vacant.value,
-            )
-            if prop
-            else OccupancyStatus.vacant.value
-        )
-        show_confirm_ui = needs_conf or (
-            prop_status in (OccupancyStatus.unconfirmed.value, OccupancyStatus.unknown.value)
-            and not checked_out
-            and not cancelled
-            and dms_on
-            and conf_resp is None
-            and (
-                (eff_test is not None and now >= eff_test)
-                or (eff_test is None and s.stay_end_date < date.today())
-            )
-        )
-        invite_id_val = None
-        token_state_val = None
-        inv_for_state: Invitation | None = None
-        if getattr(s, "invitation_id", None):
-            inv_for_state = db.query(Invitation).filter(Invitation.id == s.invitation_id).first()
-            if inv_for_state:
-                invite_id_val = inv_for_state.invitation_code if show_guest_pii else None
-                token_state_val = getattr(inv_for_state, "token_state", None) or "BURNED"
-        state_fields = _owner_stay_state_fields(db, s, inv_for_state)
-        out.append(OwnerStayView(
-            stay_id=s.id, property_id=s.property_id, invite_id=invite_id_val, token_state=token_state_val, invitation_only=False,
-            guest_name=guest_name, property_name=property_name, stay_start_date=s.stay_start_date, stay_end_date=s.stay_end_date,
-            region_code=s.region_code, legal_classification=classification, max_stay_allowed_days=max_days, risk_indicator=risk, applicable_laws=statutes,
-            revoked_at=getattr(s, "revoked_at", None), checked_in_at=getattr(s, "checked_in_at", None), checked_out_at=getattr(s, "checked_out_at", None), cancelled_at=getattr(s, "cancelled_at", None),
-            usat_token_released_at=getattr(s, "usat_token_released_at", None), dead_mans_switch_enabled=dms_on,
-            needs_occupancy_confirmation=needs_conf, show_occupancy_confirmation_ui=show_confirm_ui, confirmation_deadline_at=confirmation_deadline_at if show_confirm_ui else None, occupancy_confirmation_response=conf_resp,
-            property_deleted_at=getattr(prop, "deleted_at", None) if prop else None,
-            **state_fields,
-        ))
+    ]
     invitation_ids_with_stay = {s.invitation_id for s in stays if getattr(s, "invitation_id", None) is not None}
     stay_key = {(s.property_id, s.stay_start_date, s.stay_end_date) for s in stays}
     q = db.query(Invitation).filter(
@@ -1777,38 +1495,31 @@ def manager_stays(
     if invitation_ids_with_stay:
         q = q.filter(~Invitation.id.in_(invitation_ids_with_stay))
     invs_for_invitation_only = filter_property_lane_invitations_for_manager(db, q.all(), current_user.id)
-    invs_for_invitation_only = [inv for inv in invs_for_invitation_only if invitation_in_manager_personal_guest_scope(db, inv, mu)]
+    invs_for_invitation_only = [
+        inv for inv in invs_for_invitation_only
+        if invitation_in_manager_personal_guest_scope(db, inv, mu, unit_ids_by_property=units_by_prop)
+        and (inv.property_id, inv.stay_start_date, inv.stay_end_date) not in stay_key
+    ]
+    ctx = build_stay_view_context(
+        db, stays, invs_for_invitation_only, invitations_by_id=invitations_by_id, users_by_id=users_by_id
+    )
+    out = [
+        stay_row_view(
+            db,
+            ctx,
+            s,
+            show_guest_pii=viewer_is_relationship_owner_for_stay(
+                db, s, current_user.id, invitations_by_id=ctx.invitations_by_id
+            ),
+        )
+        for s in stays
+    ]
     for inv in invs_for_invitation_only:
-        if (inv.property_id, inv.stay_start_date, inv.stay_end_date) in stay_key:
-            continue
-        prop = db.query(Property).filter(Property.id == inv.property_id).first()
-        if not prop:
-            continue
-        property_name = (prop.name or "").strip() or (f"{getattr(prop, 'city', '')}, {getattr(prop, 'state', '')}".strip(", ")) or "Property"
-        region = (getattr(inv, "region_code", None) or "").strip() or (getattr(prop, "region_code", None) or "") or "US"
-        start, end = inv.stay_start_date, inv.stay_end_date
-        duration_days = (end - start).days if start and end else 0
-        rule = db.query(RegionRule).filter(RegionRule.region_code == region).first()
-        jle = resolve_jurisdiction(db, JLEInput(region_code=region, stay_duration_days=duration_days, owner_occupied=True, property_type=None, guest_has_permanent_address=True))
-        max_days = rule.max_stay_days if rule else 0
-        classification = (jle.legal_classification if jle else None) or (rule.stay_classification_label if rule else None) or StayClassification.guest
-        risk = (jle.risk_level if jle else None) or (rule.risk_level if rule else None) or RiskLevel.low
-        statutes = (jle.applicable_statutes if jle else []) or ([rule.statute_reference] if rule and rule.statute_reference else [])
-        token_state = (getattr(inv, "token_state", None) or "BURNED").upper()
-        is_expired = token_state == "EXPIRED"
-        checked_out_dt = datetime.combine(end, dt_time.min, tzinfo=timezone.utc) if is_expired and end else None
-        show_guest_pii = viewer_is_relationship_owner_for_invitation(inv, current_user.id)
-        inv_guest_name = label_from_invitation(db, inv) if show_guest_pii else REDACTED_GUEST_AUTHORIZATION_LABEL
-        state_fields_inv = _owner_stay_state_fields(db, None, inv)
-        out.append(OwnerStayView(
-            stay_id=-inv.id, property_id=inv.property_id, invite_id=inv.invitation_code if show_guest_pii else None, token_state=token_state, invitation_only=True,
-            guest_name=inv_guest_name, property_name=property_name, stay_start_date=start, stay_end_date=end,
-            region_code=region, legal_classification=classification, max_stay_allowed_days=max_days, risk_indicator=risk, applicable_laws=statutes,
-            revoked_at=None, checked_in_at=None, checked_out_at=checked_out_dt, cancelled_at=None, usat_token_released_at=None,
-            dead_mans_switch_enabled=bool(getattr(inv, "dead_mans_switch_enabled", 0)), needs_occupancy_confirmation=False, show_occupancy_confirmation_ui=False, confirmation_deadline_at=None, occupancy_confirmation_response=None,
-            property_deleted_at=getattr(prop, "deleted_at", None),
-            **state_fields_inv,
-        ))
+        row = invitation_row_view(
+            db, ctx, inv, show_guest_pii=viewer_is_relationship_owner_for_invitation(inv, current_user.id)
+        )
+        if row is not None:
+            out.append(row)
     return out
 
 
@@ -2038,7 +1749,7 @@ def initiate_removal(
     request: Request,
     stay_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Initiate formal removal for an overstayed guest. Owner cannot initiate removal for tenant-invited guest stays (tenant lane)."""
     stay = db.query(Stay).filter(Stay.id == stay_id).first()
@@ -3077,6 +2788,8 @@ def guest_stays(
 
 @router.get("/guest/logs", response_model=list[OwnerAuditLogEntry])
 def guest_logs(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_guest_or_tenant),
     from_ts: str | None = None,
@@ -3084,11 +2797,12 @@ def guest_logs(
     category: str | None = None,
     search: str | None = None,
     stay_id: int | None = None,
+    limit: int = Query(200, ge=1, le=LEDGER_PAGE_MAX_LIMIT),
+    cursor: str | None = None,
     x_client_calendar_date: str | None = Header(None, alias="X-Client-Calendar-Date"),
 ):
-    """Guest lane logs only: events for the guest's own stays. No property management or other users' data."""
-    from sqlalchemy import desc, cast, String
-
+    """Guest lane logs only: events for the guest's own stays. No property management or other users' data.
+    Paged by ``limit``/``cursor`` (see ``_ledger_log_response``)."""
     if current_user.role == UserRole.guest:
         _maybe_materialize_guest_approaching_end_ledger(
             db,
@@ -3099,9 +2813,9 @@ def guest_logs(
     stay_ids = [s.id for s in stays]
     inv_ids = _guest_invitation_ids_for_ledger(db, current_user) if current_user.role == UserRole.guest else set()
     if not stay_ids and not inv_ids:
-        return []
+        return _empty_ledger_log_response(request)
     if stay_id is not None and stay_id != 0 and stay_id not in stay_ids:
-        return []
+        return _empty_ledger_log_response(request)
     q = db.query(EventLedger).filter(EventLedger.action_type.in_(GUEST_ALLOWED_ACTIONS))
     scope = []
     if stay_ids:
@@ -3109,7 +2823,7 @@ def guest_logs(
     if inv_ids:
         scope.append(EventLedger.invitation_id.in_(list(inv_ids)))
     if not scope:
-        return []
+        return _empty_ledger_log_response(request)
     q = q.filter(or_(*scope))
     if stay_id is not None and stay_id != 0:
         q = q.filter(EventLedger.stay_id == stay_id)
@@ -3124,34 +2838,8 @@ def guest_logs(
         if action_types:
             q = q.filter(EventLedger.action_type.in_(action_types))
     if search and search.strip():
-        term = f"%{search.strip()}%"
-        q = q.filter((EventLedger.action_type.ilike(term)) | (cast(EventLedger.meta, String).ilike(term)))
-    rows = q.order_by(desc(EventLedger.created_at)).limit(200).all()
-    ledger_ctx = build_ledger_display_resolution_context(db, rows)
-    prop_ids = {r.property_id for r in rows if r.property_id}
-    props = {}
-    if prop_ids:
-        for p in db.query(Property).filter(Property.id.in_(prop_ids)).all():
-            props[p.id] = _format_property_address_for_log(p)
-    out = []
-    for r in rows:
-        cat, title, msg = ledger_event_to_display(r, db, resolution_context=ledger_ctx)
-        actor_email = get_actor_email(db, r.actor_user_id, resolution_context=ledger_ctx)
-        disc = ledger_record_disclosure_lines(r, display_title=title)
-        out.append(
-            OwnerAuditLogEntry(
-                id=r.id, property_id=r.property_id, stay_id=r.stay_id, invitation_id=r.invitation_id,
-                category=cat, title=title, message=msg,
-                actor_user_id=r.actor_user_id, actor_email=actor_email, ip_address=r.ip_address,
-                created_at=r.created_at if r.created_at else datetime.now(timezone.utc),
-                property_name=props.get(r.property_id) if r.property_id else None,
-                event_source=disc.get("event_source"),
-                business_meaning_on_record=disc.get("business_meaning_on_record"),
-                trigger_on_record=disc.get("trigger_on_record"),
-                state_change_on_record=disc.get("state_change_on_record"),
-            )
-        )
-    return out
+        q = q.filter(ledger_search_clause(search))
+    return _ledger_log_response(request, response, db, q, viewer_user_id=None, limit=limit, cursor=cursor)
 
 
 @router.post("/guest/stays/{stay_id}/check-in")
@@ -3371,7 +3059,7 @@ def _agreement_signature_pdf_file_response(db: Session, sig: AgreementSignature)
     if getattr(sig, "dropbox_sign_request_id", None):
         pdf_bytes = get_signed_pdf(sig.dropbox_sign_request_id)
         if pdf_bytes:
-            sig.signed_pdf_bytes = pdf_bytes
+            store_blob(sig, "signed_pdf", pdf_bytes)
             emit_invitation_agreement_signed_if_dropbox_complete(db, sig)
             db.commit()
             return Response(
@@ -3383,16 +3071,13 @@ def _agreement_signature_pdf_file_response(db: Session, sig: AgreementSignature)
             status_code=404,
             detail="Document not yet signed in Dropbox. Please complete signing in the link we sent you.",
         )
-    if sig.signed_pdf_bytes:
-        return Response(
-            content=sig.signed_pdf_bytes,
-            media_type="application/pdf",
-            headers={"Content-Disposition": f'inline; filename="DocuStay-Signed-{sig.invitation_code}.pdf"'},
-        )
+    stored = blob_response(sig, "signed_pdf", media_type="application/pdf", filename=f'DocuStay-Signed-{sig.invitation_code}.pdf')
+    if stored is not None:
+        return stored
     date_str = sig.signed_at.strftime("%Y-%m-%d") if sig.signed_at else ""
     content = fill_guest_signature_in_content(sig.document_content, sig.typed_signature, date_str, getattr(sig, "ip_address", None))
     pdf_bytes = agreement_content_to_pdf(sig.document_title, content)
-    sig.signed_pdf_bytes = pdf_bytes
+    store_blob(sig, "signed_pdf", pdf_bytes)
     db.commit()
     return Response(
         content=pdf_bytes,
@@ -5006,7 +4691,7 @@ def tenant_invitations(
         has_pending_dropbox = db.query(AgreementSignature).filter(
             AgreementSignature.invitation_code == inv.invitation_code,
             AgreementSignature.dropbox_sign_request_id.isnot(None),
-            AgreementSignature.signed_pdf_bytes.is_(None),
+            ~AgreementSignature.has_signed_pdf,
         ).first() is not None
         is_expired = (
             inv.status == "expired"
@@ -5121,121 +4806,32 @@ def tenant_guest_history(
         .filter(*guest_inv_filter)
         .all()
     )
-    out = []
-    for s in stays:
-        guest_name = label_for_stay(db, s)
-        prop = db.query(Property).filter(Property.id == s.property_id).first()
-        property_name = (prop.name if prop else None) or (f"{prop.city}, {prop.state}" if prop else None) or "Property"
-        rule = db.query(RegionRule).filter(RegionRule.region_code == s.region_code).first()
-        jle = resolve_jurisdiction(db, JLEInput(region_code=s.region_code, stay_duration_days=s.intended_stay_duration_days, owner_occupied=True, property_type=None, guest_has_permanent_address=True))
-        max_days = rule.max_stay_days if rule else 0
-        classification = (jle.legal_classification if jle else None) or (rule.stay_classification_label if rule else None) or StayClassification.guest
-        risk = (jle.risk_level if jle else None) or (rule.risk_level if rule else None) or RiskLevel.low
-        statutes = (jle.applicable_statutes if jle else []) or ([rule.statute_reference] if rule and rule.statute_reference else [])
-        dms_on = bool(getattr(s, "dead_mans_switch_enabled", 0))
-        confirmation_deadline_at = datetime.combine(s.stay_end_date + timedelta(days=2), dt_time.min, tzinfo=timezone.utc) if s.stay_end_date else None
-        conf_resp = getattr(s, "occupancy_confirmation_response", None)
-        # Property Status Confirmation is for PM/owner only — not tenant-invited guest stays
-        needs_conf = False
-        show_confirm_ui = False
-        invite_id_val = None
-        token_state_val = None
-        inv_for_stay = None
-        if getattr(s, "invitation_id", None):
-            inv_for_stay = db.query(Invitation).filter(Invitation.id == s.invitation_id).first()
-            if inv_for_stay:
-                invite_id_val = inv_for_stay.invitation_code
-                token_state_val = getattr(inv_for_stay, "token_state", None) or "BURNED"
-        unit_id_for_label = getattr(s, "unit_id", None) or (
-            getattr(inv_for_stay, "unit_id", None) if inv_for_stay else None
-        )
-        stay_unit_label = _unit_label_if_multi_unit(db, s.property_id, unit_id_for_label)
-        state_fields = _owner_stay_state_fields(db, s, inv_for_stay)
-        out.append(OwnerStayView(
-            stay_id=s.id, property_id=s.property_id, invite_id=invite_id_val, token_state=token_state_val, invitation_only=False,
-            guest_name=guest_name, property_name=property_name, unit_label=stay_unit_label, stay_start_date=s.stay_start_date, stay_end_date=s.stay_end_date,
-            region_code=s.region_code, legal_classification=classification, max_stay_allowed_days=max_days, risk_indicator=risk, applicable_laws=statutes,
-            revoked_at=getattr(s, "revoked_at", None), checked_in_at=getattr(s, "checked_in_at", None), checked_out_at=getattr(s, "checked_out_at", None), cancelled_at=getattr(s, "cancelled_at", None),
-            usat_token_released_at=getattr(s, "usat_token_released_at", None), dead_mans_switch_enabled=dms_on,
-            needs_occupancy_confirmation=needs_conf, show_occupancy_confirmation_ui=show_confirm_ui, confirmation_deadline_at=confirmation_deadline_at if show_confirm_ui else None, occupancy_confirmation_response=conf_resp,
-            property_deleted_at=getattr(prop, "deleted_at", None) if prop else None,
-            **state_fields,
-        ))
     invitation_ids_with_stay = {s.invitation_id for s in stays if getattr(s, "invitation_id", None) is not None}
     q = db.query(Invitation).filter(
-        Invitation.invited_by_user_id == current_user.id,
-        or_(Invitation.invitation_kind == "guest", Invitation.invitation_kind.is_(None)),
+        *guest_inv_filter,
         Invitation.token_state.in_(["BURNED", "EXPIRED"]),
     )
     if invitation_ids_with_stay:
         q = q.filter(~Invitation.id.in_(invitation_ids_with_stay))
-    for inv in q.all():
-        prop = db.query(Property).filter(Property.id == inv.property_id).first()
-        if not prop:
-            continue
-        property_name = (prop.name or "").strip() or (f"{getattr(prop, 'city', '')}, {getattr(prop, 'state', '')}".strip(", ")) or "Property"
-        region = (getattr(inv, "region_code", None) or "").strip() or (getattr(prop, "region_code", None) or "") or "US"
-        start, end = inv.stay_start_date, inv.stay_end_date
-        duration_days = (end - start).days if start and end else 0
-        rule = db.query(RegionRule).filter(RegionRule.region_code == region).first()
-        jle = resolve_jurisdiction(db, JLEInput(region_code=region, stay_duration_days=duration_days, owner_occupied=True, property_type=None, guest_has_permanent_address=True))
-        max_days = rule.max_stay_days if rule else 0
-        classification = (jle.legal_classification if jle else None) or (rule.stay_classification_label if rule else None) or StayClassification.guest
-        risk = (jle.risk_level if jle else None) or (rule.risk_level if rule else None) or RiskLevel.low
-        statutes = (jle.applicable_statutes if jle else []) or ([rule.statute_reference] if rule and rule.statute_reference else [])
-        token_state = (getattr(inv, "token_state", None) or "BURNED").upper()
-        is_expired = token_state == "EXPIRED"
-        checked_out_dt = datetime.combine(end, dt_time.min, tzinfo=timezone.utc) if is_expired and end else None
-        inv_only_label = _unit_label_if_multi_unit(db, inv.property_id, getattr(inv, "unit_id", None))
-        state_fields_inv = _owner_stay_state_fields(db, None, inv)
-        out.append(OwnerStayView(
-            stay_id=-inv.id, property_id=inv.property_id, invite_id=inv.invitation_code, token_state=token_state, invitation_only=True,
-            guest_name=label_from_invitation(db, inv), property_name=property_name, unit_label=inv_only_label, stay_start_date=start, stay_end_date=end,
-            region_code=region, legal_classification=classification, max_stay_allowed_days=max_days, risk_indicator=risk, applicable_laws=statutes,
-            revoked_at=None, checked_in_at=None, checked_out_at=checked_out_dt, cancelled_at=None, usat_token_released_at=None,
-            dead_mans_switch_enabled=bool(getattr(inv, "dead_mans_switch_enabled", 0)), needs_occupancy_confirmation=False, show_occupancy_confirmation_ui=False, confirmation_deadline_at=None, occupancy_confirmation_response=None,
-            property_deleted_at=getattr(prop, "deleted_at", None),
-            **state_fields_inv,
-        ))
+    invs_no_stay = q.all()
     # Cancelled invitations (tenant/owner cancelled before guest accepted): no Stay row — show in ended list
-    cancelled_invs = (
-        db.query(Invitation)
-        .filter(
-            Invitation.invited_by_user_id == current_user.id,
-            or_(Invitation.invitation_kind == "guest", Invitation.invitation_kind.is_(None)),
-            Invitation.status == "cancelled",
-        )
-        .all()
-    )
+    cancelled_invs = db.query(Invitation).filter(*guest_inv_filter, Invitation.status == "cancelled").all()
+    ctx = build_stay_view_context(db, stays, invs_no_stay + cancelled_invs)
+    # Property Status Confirmation is for PM/owner only — not tenant-invited guest stays
+    out = [
+        stay_row_view(db, ctx, s, show_guest_pii=True, status_confirmation=False, include_unit_label=True)
+        for s in stays
+    ]
+    for inv in invs_no_stay:
+        row = invitation_row_view(db, ctx, inv, show_guest_pii=True, include_unit_label=True)
+        if row is not None:
+            out.append(row)
     for inv in cancelled_invs:
-        if db.query(Stay).filter(Stay.invitation_id == inv.id).first():
-            continue
-        prop = db.query(Property).filter(Property.id == inv.property_id).first()
-        if not prop:
+        if inv.id in ctx.invitation_ids_with_stay:
             continue
-        property_name = (prop.name or "").strip() or (f"{getattr(prop, 'city', '')}, {getattr(prop, 'state', '')}".strip(", ")) or "Property"
-        region = (getattr(inv, "region_code", None) or "").strip() or (getattr(prop, "region_code", None) or "") or "US"
-        start, end = inv.stay_start_date, inv.stay_end_date
-        duration_days = (end - start).days if start and end else 0
-        rule = db.query(RegionRule).filter(RegionRule.region_code == region).first()
-        jle = resolve_jurisdiction(db, JLEInput(region_code=region, stay_duration_days=duration_days, owner_occupied=True, property_type=None, guest_has_permanent_address=True))
-        max_days = rule.max_stay_days if rule else 0
-        classification = (jle.legal_classification if jle else None) or (rule.stay_classification_label if rule else None) or StayClassification.guest
-        risk = (jle.risk_level if jle else None) or (rule.risk_level if rule else None) or RiskLevel.low
-        statutes = (jle.applicable_statutes if jle else []) or ([rule.statute_reference] if rule and rule.statute_reference else [])
-        ts = (getattr(inv, "token_state", None) or "REVOKED").upper()
-        cancelled_ts = inv.created_at if getattr(inv, "created_at", None) else datetime.now(timezone.utc)
-        cancelled_inv_label = _unit_label_if_multi_unit(db, inv.property_id, getattr(inv, "unit_id", None))
-        state_fields_cancel = _owner_stay_state_fields(db, None, inv)
-        out.append(OwnerStayView(
-            stay_id=-inv.id, property_id=inv.property_id, invite_id=inv.invitation_code, token_state=ts, invitation_only=True,
-            guest_name=label_from_invitation(db, inv), property_name=property_name, unit_label=cancelled_inv_label, stay_start_date=start, stay_end_date=end,
-            region_code=region, legal_classification=classification, max_stay_allowed_days=max_days, risk_indicator=risk, applicable_laws=statutes,
-            revoked_at=None, checked_in_at=None, checked_out_at=None, cancelled_at=cancelled_ts, usat_token_released_at=None,
-            dead_mans_switch_enabled=bool(getattr(inv, "dead_mans_switch_enabled", 0)), needs_occupancy_confirmation=False, show_occupancy_confirmation_ui=False, confirmation_deadline_at=None, occupancy_confirmation_response=None,
-            property_deleted_at=getattr(prop, "deleted_at", None),
-            **state_fields_cancel,
-        ))
+        row = invitation_row_view(db, ctx, inv, show_guest_pii=True, include_unit_label=True, cancelled=True)
+        if row is not None:
+            out.append(row)
     return out
 
 
@@ -5258,7 +4854,7 @@ def tenant_signed_documents(
             "document_title": sig.document_title or "Agreement",
             "signed_at": sig.signed_at.isoformat() if sig.signed_at else None,
             "signed_by": sig.guest_full_name,
-            "has_signed_pdf": sig.signed_pdf_bytes is not None,
+            "has_signed_pdf": sig.has_signed_pdf,
             "property_name": property_name,
             "stay_start_date": str(inv.stay_start_date) if inv else None,
             "stay_end_date": str(inv.stay_end_date) if inv else None,
@@ -5822,7 +5418,7 @@ def _stripe_invoice_visible_in_dashboard(inv: object) -> bool:
 @router.get("/owner/billing", response_model=BillingResponse)
 def owner_billing(
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """List Stripe invoices and payments for the current owner. Returns empty lists if Stripe is not configured or no customer yet.
     can_invite is False while billing onboarding is incomplete (e.g. subscription setup still in progress after first property add)."""
@@ -5984,7 +5580,7 @@ def owner_billing(
 @router.post("/owner/billing/sync-subscription", response_model=BillingSyncSubscriptionResponse)
 def sync_owner_billing_subscription(
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Reconcile Stripe subscription amount with active property count. Optional: opening the billing portal runs sync internally — avoid chaining both before redirect (doubles latency)."""
     if current_user.role == UserRole.property_manager:
@@ -6044,7 +5640,7 @@ def sync_owner_billing_subscription(
 @router.post("/owner/billing/portal-session", response_model=BillingPortalSessionResponse)
 def create_billing_portal_session(
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Create a Stripe Customer Billing Portal session. Redirect the user to the returned URL to pay invoices.
     After payment (including Klarna or other redirect methods), Stripe redirects back to our app (return_url).
@@ -6094,7 +5690,7 @@ def create_billing_portal_session(
 @router.get("/owner/personal-mode-units")
 def owner_personal_mode_units(
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Unit IDs where this owner has Personal Mode (lives as resident). Used for Mode Switcher."""
     unit_ids = get_owner_personal_mode_units(db, current_user.id)
@@ -6106,7 +5702,7 @@ def owner_personal_mode_units(
 def owner_property_personal_mode_unit(
     property_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Unit ID for this property when the owner has Personal Mode (on-site residence) for that property."""
     unit_ids = get_owner_personal_mode_units(db, current_user.id)
@@ -6131,7 +5727,7 @@ def manager_personal_mode_units(
 @router.get("/owner/portfolio-link", response_model=PortfolioLinkResponse)
 def owner_portfolio_link(
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Get or create the current owner's portfolio slug and URL. Used in Settings to view/copy portfolio link."""
     profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == current_user.id).first()
@@ -6163,26 +5759,143 @@ def _format_property_address_for_log(p: Property) -> str:
     return addr or p.name or f"{p.city}, {p.state}" or ""
 
 
+_NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _wants_ndjson(request: Request) -> bool:
+    return _NDJSON_MEDIA_TYPE in (request.headers.get("accept") or "")
+
+
+def _empty_ledger_log_response(request: Request):
+    """Empty log result in whichever representation the client asked for."""
+    if _wants_ndjson(request):
+        return Response(content=b"", media_type=_NDJSON_MEDIA_TYPE)
+    return []
+
+
+def _ledger_log_entries(
+    db: Session,
+    rows: list[EventLedger],
+    *,
+    viewer_user_id: int | None,
+    property_name_fallback=None,
+) -> list[OwnerAuditLogEntry]:
+    """Render EventLedger rows as log entries. ``property_name_fallback(row)`` names rows without a property_id."""
+    prop_ids = {r.property_id for r in rows if r.property_id}
+    props = {}
+    if prop_ids:
+        for p in db.query(Property).filter(Property.id.in_(prop_ids)).all():
+            props[p.id] = _format_property_address_for_log(p)
+
+    ledger_ctx = build_ledger_display_resolution_context(db, rows)
+    out = []
+    for r in rows:
+        cat, title, msg = ledger_event_to_display(
+            r, db, viewer_user_id=viewer_user_id, resolution_context=ledger_ctx
+        )
+        actor_email = get_actor_email(db, r.actor_user_id, resolution_context=ledger_ctx)
+        disc = ledger_record_disclosure_lines(r, display_title=title)
+        if r.property_id:
+            property_name = props.get(r.property_id)
+        else:
+            property_name = property_name_fallback(r) if property_name_fallback else None
+        out.append(
+            OwnerAuditLogEntry(
+                id=r.id,
+                property_id=r.property_id,
+                stay_id=r.stay_id,
+                invitation_id=r.invitation_id,
+                category=cat,
+                title=title,
+                message=msg,
+                actor_user_id=r.actor_user_id,
+                actor_email=actor_email,
+                ip_address=r.ip_address,
+                created_at=r.created_at if r.created_at else datetime.now(timezone.utc),
+                property_name=property_name,
+                event_source=disc.get("event_source"),
+                business_meaning_on_record=disc.get("business_meaning_on_record"),
+                trigger_on_record=disc.get("trigger_on_record"),
+                state_change_on_record=disc.get("state_change_on_record"),
+            )
+        )
+    return out
+
+
+def _ledger_log_response(
+    request: Request,
+    response: Response,
+    db: Session,
+    q,
+    *,
+    viewer_user_id: int | None,
+    limit: int | None,
+    cursor: str | None,
+    property_name_fallback=None,
+):
+    """Serve a filtered EventLedger query (no ORDER BY) newest first.
+
+    JSON: one keyset page of ``limit`` rows (all rows when ``limit`` is None); ``X-Next-Cursor`` is set when more
+    rows remain and is passed back as ``cursor`` for the next page.
+    NDJSON (``Accept: application/x-ndjson``): one entry per line for every row after ``cursor`` (capped at
+    ``limit``), fetched and rendered in bounded keyset batches so the first lines go out before the tail is read.
+    The stream reads through its own session: the request session (``get_db``) may already be closed or back in the
+    pool while the body is sent.
+    """
+    try:
+        if cursor:
+            decode_ledger_cursor(cursor)
+        if _wants_ndjson(request):
+            bind = db.get_bind()
+
+            def _lines():
+                stream_db = SessionLocal(bind=bind)
+                try:
+                    for rows in iter_ledger_batches(q.with_session(stream_db), cursor=cursor, max_rows=limit):
+                        for entry in _ledger_log_entries(
+                            stream_db, rows, viewer_user_id=viewer_user_id, property_name_fallback=property_name_fallback
+                        ):
+                            yield entry.model_dump_json() + "\n"
+                finally:
+                    stream_db.close()
+
+            return StreamingResponse(_lines(), media_type=_NDJSON_MEDIA_TYPE)
+        rows, next_cursor = fetch_ledger_page(q, limit=limit, cursor=cursor)
+    except InvalidLedgerCursor as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return _ledger_log_entries(
+        db, rows, viewer_user_id=viewer_user_id, property_name_fallback=property_name_fallback
+    )
+
+
 @router.get("/owner/logs", response_model=list[OwnerAuditLogEntry])
+@query_budget(15)
 def owner_logs(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
     context_mode: str = Depends(get_context_mode),
     from_ts: str | None = None,
     to_ts: str | None = None,
     category: str | None = None,
     search: str | None = None,
     property_id: int | None = None,
+    limit: int | None = Query(None, ge=1, le=LEDGER_PAGE_MAX_LIMIT),
+    cursor: str | None = None,
     x_client_calendar_date: str | None = Header(None, alias="X-Client-Calendar-Date"),
 ):
     """Business mode: full property/management lane for all owned properties (including soft-deleted) so timelines stay complete.
     Personal mode: when no property_id filter, only primary-residence properties; when property_id is set, any property the owner
-    owns (including inactive) so property detail history is not empty."""
-    from sqlalchemy import or_, desc, cast, String
+    owns (including inactive) so property detail history is not empty.
+    Paged by ``limit``/``cursor`` (see ``_ledger_log_response``); all rows when ``limit`` is omitted."""
+    from sqlalchemy import or_
 
     profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == current_user.id).first()
     if not profile:
-        return []
+        return _empty_ledger_log_response(request)
 
     is_personal = context_mode == "personal"
 
@@ -6200,7 +5913,7 @@ def owner_logs(
         ledger_property_ids = owned_all_property_ids
 
     if property_id is not None and property_id not in owned_all_property_ids:
-        return []
+        return _empty_ledger_log_response(request)
     # Property-scoped view: allow any owned property (including inactive / outside personal-mode subset) for read-only history
 
     from_dt = _parse_optional_utc(from_ts)
@@ -6209,7 +5922,7 @@ def owner_logs(
     billing_actions = _CATEGORY_TO_ACTION_TYPES.get("billing", [])
 
     if is_personal and not ledger_property_ids and property_id is None:
-        return []
+        return _empty_ledger_log_response(request)
 
     if property_id is not None:
         q = db.query(EventLedger).filter(EventLedger.property_id == property_id)
@@ -6244,63 +5957,32 @@ def owner_logs(
             allowed = [a for a in action_types if a in allowed_actions]
             q = q.filter(EventLedger.action_type.in_(allowed))
     if search and search.strip():
-        term = f"%{search.strip()}%"
-        q = q.filter(
-            (EventLedger.action_type.ilike(term)) | (cast(EventLedger.meta, String).ilike(term))
-        )
-    q = q.order_by(desc(EventLedger.created_at))
-    rows = q.all()
-    rows = filter_tenant_lane_from_ledger_rows(db, rows)
-    rows = filter_tenant_presence_from_owner_manager_ledger(db, rows)
-
-    prop_ids = {r.property_id for r in rows if r.property_id}
-    props = {}
-    if prop_ids:
-        for p in db.query(Property).filter(Property.id.in_(prop_ids)).all():
-            props[p.id] = _format_property_address_for_log(p)
+        q = q.filter(ledger_search_clause(search))
+    q = q.filter(tenant_lane_ledger_exclusion_clause(), tenant_presence_ledger_exclusion_clause())
 
     def _property_name(r) -> str | None:
-        if r.property_id:
-            return props.get(r.property_id)
         if r.action_type == ACTION_PROPERTY_DELETED and r.meta and isinstance(r.meta, dict):
             return r.meta.get("property_name")
         if r.action_type == ACTION_PROPERTY_TRANSFER_PRIOR_OWNER and r.meta and isinstance(r.meta, dict):
             return r.meta.get("property_address") or r.meta.get("property_name")
         return None
 
-    ledger_ctx = build_ledger_display_resolution_context(db, rows)
-    out = []
-    for r in rows:
-        cat, title, msg = ledger_event_to_display(
-            r, db, viewer_user_id=current_user.id, resolution_context=ledger_ctx
-        )
-        actor_email = get_actor_email(db, r.actor_user_id, resolution_context=ledger_ctx)
-        disc = ledger_record_disclosure_lines(r, display_title=title)
-        out.append(
-            OwnerAuditLogEntry(
-                id=r.id,
-                property_id=r.property_id,
-                stay_id=r.stay_id,
-                invitation_id=r.invitation_id,
-                category=cat,
-                title=title,
-                message=msg,
-                actor_user_id=r.actor_user_id,
-                actor_email=actor_email,
-                ip_address=r.ip_address,
-                created_at=r.created_at if r.created_at else datetime.now(timezone.utc),
-                property_name=_property_name(r),
-                event_source=disc.get("event_source"),
-                business_meaning_on_record=disc.get("business_meaning_on_record"),
-                trigger_on_record=disc.get("trigger_on_record"),
-                state_change_on_record=disc.get("state_change_on_record"),
-            )
-        )
-    return out
+    return _ledger_log_response(
+        request,
+        response,
+        db,
+        q,
+        viewer_user_id=current_user.id,
+        limit=limit,
+        cursor=cursor,
+        property_name_fallback=_property_name,
+    )
 
 
 @router.get("/manager/logs", response_model=list[OwnerAuditLogEntry])
 def manager_logs(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_property_manager_identity_verified),
     context_mode: str = Depends(get_context_mode),
@@ -6309,15 +5991,16 @@ def manager_logs(
     category: str | None = None,
     search: str | None = None,
     property_id: int | None = None,
+    limit: int | None = Query(None, ge=1, le=LEDGER_PAGE_MAX_LIMIT),
+    cursor: str | None = None,
     x_client_calendar_date: str | None = Header(None, alias="X-Client-Calendar-Date"),
 ):
     """Business mode: full management lane for assigned properties. Personal mode: guest-residence events only
-    for on-site resident properties (same ledger action set as owner Personal mode)."""
-    from sqlalchemy import desc, cast, String
-
+    for on-site resident properties (same ledger action set as owner Personal mode).
+    Paged by ``limit``/``cursor`` (see ``_ledger_log_response``); all rows when ``limit`` is omitted."""
     property_ids = _manager_property_ids(db, current_user.id)
     if not property_ids:
-        return []
+        return _empty_ledger_log_response(request)
     is_personal = context_mode == "personal"
     if is_personal:
         personal_ids = set(get_manager_personal_mode_property_ids(db, current_user.id))
@@ -6327,11 +6010,11 @@ def manager_logs(
         effective_ids = property_ids
         action_set = OWNER_BUSINESS_ACTIONS
     if not effective_ids:
-        return []
+        return _empty_ledger_log_response(request)
     if property_id is not None and property_id not in property_ids:
-        return []
+        return _empty_ledger_log_response(request)
     if property_id is not None and property_id not in effective_ids:
-        return []
+        return _empty_ledger_log_response(request)
     from_dt = _parse_optional_utc(from_ts)
     to_dt = _parse_optional_utc(to_ts)
     q = db.query(EventLedger).filter(EventLedger.property_id.in_(effective_ids))
@@ -6348,45 +6031,21 @@ def manager_logs(
             allowed = [a for a in action_types if a in action_set]
             q = q.filter(EventLedger.action_type.in_(allowed))
     if search and search.strip():
-        term = f"%{search.strip()}%"
-        q = q.filter((EventLedger.action_type.ilike(term)) | (cast(EventLedger.meta, String).ilike(term)))
-    rows = q.order_by(desc(EventLedger.created_at)).all()
-    rows = filter_tenant_lane_from_ledger_rows(db, rows)
-    rows = filter_tenant_presence_from_owner_manager_ledger(db, rows)
-    rows = filter_manager_presence_on_tenant_leased_units(db, rows)
-
-    prop_ids = {r.property_id for r in rows if r.property_id}
-    props = {}
-    if prop_ids:
-        for p in db.query(Property).filter(Property.id.in_(prop_ids)).all():
-            props[p.id] = _format_property_address_for_log(p)
-
-    ledger_ctx = build_ledger_display_resolution_context(db, rows)
-    out = []
-    for r in rows:
-        cat, title, msg = ledger_event_to_display(
-            r, db, viewer_user_id=current_user.id, resolution_context=ledger_ctx
-        )
-        actor_email = get_actor_email(db, r.actor_user_id, resolution_context=ledger_ctx)
-        disc = ledger_record_disclosure_lines(r, display_title=title)
-        out.append(
-            OwnerAuditLogEntry(
-                id=r.id, property_id=r.property_id, stay_id=r.stay_id, invitation_id=r.invitation_id,
-                category=cat, title=title, message=msg,
-                actor_user_id=r.actor_user_id, actor_email=actor_email, ip_address=r.ip_address,
-                created_at=r.created_at if r.created_at else datetime.now(timezone.utc),
-                property_name=props.get(r.property_id) if r.property_id else None,
-                event_source=disc.get("event_source"),
-                business_meaning_on_record=disc.get("business_meaning_on_record"),
-                trigger_on_record=disc.get("trigger_on_record"),
-                state_change_on_record=disc.get("state_change_on_record"),
-            )
-        )
-    return out
+        q = q.filter(ledger_search_clause(search))
+    q = q.filter(
+        tenant_lane_ledger_exclusion_clause(),
+        tenant_presence_ledger_exclusion_clause(),
+        manager_leased_unit_presence_exclusion_clause(),
+    )
+    return _ledger_log_response(
+        request, response, db, q, viewer_user_id=current_user.id, limit=limit, cursor=cursor
+    )
 
 
 @router.get("/tenant/logs", response_model=list[OwnerAuditLogEntry])
 def tenant_logs(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_tenant),
     from_ts: str | None = None,
@@ -6394,11 +6053,14 @@ def tenant_logs(
     category: str | None = None,
     search: str | None = None,
     property_id: int | None = None,
+    limit: int = Query(500, ge=1, le=LEDGER_PAGE_MAX_LIMIT),
+    cursor: str | None = None,
     x_client_calendar_date: str | None = Header(None, alias="X-Client-Calendar-Date"),
 ):
     """Tenant lane logs only: tenant's own actions, their guest invitations/stays, their presence.
-    Excludes billing, property management, shield mode, owner/manager-only Status Confirmation activity, and other tenants' data."""
-    from sqlalchemy import desc, cast, String, or_
+    Excludes billing, property management, shield mode, owner/manager-only Status Confirmation activity, and other tenants' data.
+    Paged by ``limit``/``cursor`` (see ``_ledger_log_response``)."""
+    from sqlalchemy import or_
 
     # Materialize tenant-invited guest threshold alerts on demand (idempotent; helps in no-cron environments).
     try:
@@ -6424,7 +6086,7 @@ def tenant_logs(
         if unit:
             tenant_property_id = unit.property_id
     if property_id is not None and tenant_property_id is not None and property_id != tenant_property_id:
-        return []
+        return _empty_ledger_log_response(request)
     invitation_ids = [r[0] for r in db.query(Invitation.id).filter(Invitation.invited_by_user_id == current_user.id).all()]
     stay_ids = [r[0] for r in db.query(Stay.id).filter(Stay.invitation_id.in_(invitation_ids)).all()] if invitation_ids else []
     conditions = [
@@ -6435,7 +6097,7 @@ def tenant_logs(
     if stay_ids:
         conditions.append(EventLedger.stay_id.in_(stay_ids))
     if not conditions:
-        return []
+        return _empty_ledger_log_response(request)
     from_dt = _parse_optional_utc(from_ts)
     to_dt = _parse_optional_utc(to_ts)
     q = db.query(EventLedger).filter(or_(*conditions))
@@ -6452,36 +6114,10 @@ def tenant_logs(
             allowed = [a for a in action_types if a in TENANT_ALLOWED_ACTIONS]
             q = q.filter(EventLedger.action_type.in_(allowed))
     if search and search.strip():
-        term = f"%{search.strip()}%"
-        q = q.filter((EventLedger.action_type.ilike(term)) | (cast(EventLedger.meta, String).ilike(term)))
-    rows = q.order_by(desc(EventLedger.created_at)).limit(500).all()
-    ledger_ctx = build_ledger_display_resolution_context(db, rows)
-    prop_ids = {r.property_id for r in rows if r.property_id}
-    props = {}
-    if prop_ids:
-        for p in db.query(Property).filter(Property.id.in_(prop_ids)).all():
-            props[p.id] = _format_property_address_for_log(p)
-    out = []
-    for r in rows:
-        cat, title, msg = ledger_event_to_display(
-            r, db, viewer_user_id=current_user.id, resolution_context=ledger_ctx
-        )
-        actor_email = get_actor_email(db, r.actor_user_id, resolution_context=ledger_ctx)
-        disc = ledger_record_disclosure_lines(r, display_title=title)
-        out.append(
-            OwnerAuditLogEntry(
-                id=r.id, property_id=r.property_id, stay_id=r.stay_id, invitation_id=r.invitation_id,
-                category=cat, title=title, message=msg,
-                actor_user_id=r.actor_user_id, actor_email=actor_email, ip_address=r.ip_address,
-                created_at=r.created_at if r.created_at else datetime.now(timezone.utc),
-                property_name=props.get(r.property_id) if r.property_id else None,
-                event_source=disc.get("event_source"),
-                business_meaning_on_record=disc.get("business_meaning_on_record"),
-                trigger_on_record=disc.get("trigger_on_record"),
-                state_change_on_record=disc.get("state_change_on_record"),
-            )
-        )
-    return out
+        q = q.filter(ledger_search_clause(search))
+    return _ledger_log_response(
+        request, response, db, q, viewer_user_id=current_user.id, limit=limit, cursor=cursor
+    )
 
 
 @router.get("/manager/billing", response_model=BillingResponse)
@@ -14,11 +14,9 @@ from app.models.property_manager_assignment import PropertyManagerAssignment
 from app.models.invitation import Invitation
 from app.models.tenant_assignment import TenantAssignment
 from app.services.occupancy import (
-    count_effectively_occupied_units,
-    get_property_display_occupancy_status,
-    get_unit_display_occupancy_status,
     get_units_occupancy_display,
     normalize_occupancy_status_for_display,
+    resolve_units_occupancy,
 )
 from app.models.guest import PurposeOfStay, RelationshipToOwner
 from app.dependencies import get_current_user, require_property_manager, require_property_manager_identity_verified, get_context_mode
@@ -30,6 +28,8 @@ from app.services.event_ledger import create_ledger_event, ACTION_TENANT_INVITED
 from app.services.invite_auto_email import auto_email_tenant_invitation_if_addressed
 from app.services.invitation_kinds import TENANT_COTENANT_INVITE_KIND, TENANT_INVITE_KIND, TENANT_UNIT_LEASE_KINDS
 from app.services.tenant_lease_window import assert_unit_available_for_new_tenant_invite_or_raise
+from app.services.property_state import get_property_states
+from app.services.sql_profiler import query_budget
 from app.services.shield_mode_policy import effective_shield_mode_enabled
 from app.models.audit_log import AuditLog
 
@@ -96,6 +96,7 @@ class UnitSummary(BaseModel):
 
 
 @router.get("/properties", response_model=list[PropertySummary])
+@query_budget(10)
 def list_assigned_properties(
     db: Session = Depends(get_db),
     current_user: User = Depends(require_property_manager_identity_verified),
@@ -120,40 +121,20 @@ def list_assigned_properties(
         if not property_ids:
             return []
     props = db.query(Property).filter(Property.id.in_(property_ids)).all()
-    from collections import defaultdict
-
-    from app.services.privacy_lanes import filter_property_lane_invitations_for_manager
-    from app.services.property_invitation_summary import invitation_counts_dict
-    from app.services.unit_display_order import query_units_for_property_ordered
-
-    mgr_inv_all = db.query(Invitation).filter(Invitation.property_id.in_(property_ids)).all()
-    invitations_by_property: dict[int, list[Invitation]] = defaultdict(list)
-    for inv in mgr_inv_all:
-        invitations_by_property[inv.property_id].append(inv)
+    # Occupancy, unit counts and the invitations this manager created come from the property state snapshot.
+    states = get_property_states(db, property_ids)
     out = []
     for p in props:
-        units = query_units_for_property_ordered(db, p.id).all()
-        unit_count = len(units) if units else 1  # single-unit: 1 implicit
+        state = states[p.id]
+        unit_count = state.unit_count or 1  # single-unit: 1 implicit
         occupied = (
-            count_effectively_occupied_units(db, units)
-            if units
+            state.occupied_unit_count
+            if state.unit_count
             else (1 if (p.occupancy_status or "").lower() == OccupancyStatus.occupied.value else 0)
         )
-        if units:
-            prop_status = get_property_display_occupancy_status(db, p, units)
-        else:
-            prop_status = (
-                OccupancyStatus.occupied.value
-                if occupied > 0
-                else normalize_occupancy_status_for_display(
-                    db, p.id, None, p.occupancy_status or OccupancyStatus.vacant.value
-                )
-            )
+        prop_status = state.occupancy_status
         address = ", ".join(filter(None, [p.street, p.city, p.state, p.zip_code or ""]))
-        mgr_lane = filter_property_lane_invitations_for_manager(
-            db, invitations_by_property.get(p.id, []), current_user.id
-        )
-        inv_counts = invitation_counts_dict(mgr_lane, db)
+        inv_counts = state.invitation_counts_dict(current_user.id)
         out.append(
             PropertySummary(
                 id=p.id,
@@ -199,22 +180,13 @@ def get_property(
 
     units = query_units_for_property_ordered(db, property_id).all()
     unit_count = len(units) if units else 1
+    occupancy = resolve_units_occupancy(db, units, property_ids=[prop.id])
     occupied = (
-        count_effectively_occupied_units(db, units)
+        occupancy.occupied_count(units)
         if units
         else (1 if (prop.occupancy_status or "").lower() == OccupancyStatus.occupied.value else 0)
     )
-    prop_status = (
-        get_property_display_occupancy_status(db, prop, units)
-        if units
-        else (
-            OccupancyStatus.occupied.value
-            if occupied > 0
-            else normalize_occupancy_status_for_display(
-                db, prop.id, None, prop.occupancy_status or OccupancyStatus.vacant.value
-            )
-        )
-    )
+    prop_status = occupancy.property_status(prop, units)
     address = ", ".join(filter(None, [prop.street, prop.city, prop.state, prop.zip_code or ""]))
     from app.services.privacy_lanes import filter_property_lane_invitations_for_manager
     from app.services.property_invitation_summary import invitation_counts_dict
@@ -431,6 +403,7 @@ def list_property_units(
 
         return None, None, None, None, None
 
+    occupancy = resolve_units_occupancy(db, units)
     summaries: list[UnitSummary] = []
     for u in units:
         tn, te, tls, tle, tcohort = tenant_lease_display_for_unit(u.id)
@@ -438,7 +411,7 @@ def list_property_units(
             UnitSummary(
                 id=u.id,
                 unit_label=u.unit_label,
-                occupancy_status=get_unit_display_occupancy_status(db, u),
+                occupancy_status=occupancy.unit_status(u.id),
                 is_primary_residence=bool(getattr(u, "is_primary_residence", 0)),
                 occupied_by=occupancy_display.get(u.id, {}).get("occupied_by") if context_mode == "personal" else None,
                 invite_id=occupancy_display.get(u.id, {}).get("invite_id") if context_mode == "personal" else None,
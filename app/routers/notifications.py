@@ -46,6 +46,11 @@ def send_test_email(body: TestEmailBody | None = Body(None)):
 
 @router.post("/run-stay-warnings")
 def trigger_stay_warnings(current_user=Depends(get_current_user)):
-    """Manually trigger the stay legal warning job (Module G). Sends emails for stays approaching limit."""
-    run_stay_notification_job()
-    return {"status": "ok", "message": "Stay warning job completed."}
+    """Manually trigger the stay legal warning job (Module G). Sends emails for stays approaching limit.
+    ``report`` has per-sub-job duration and row counts (null when NOTIFICATION_CRON_ENABLED is false)."""
+    report = run_stay_notification_job()
+    return {
+        "status": "ok",
+        "message": "Stay warning job completed.",
+        "report": report.as_dict() if report is not None else None,
+    }
@@ -1,14 +1,20 @@
 """Module B1: Owner onboarding."""
 import csv
+import hashlib
 import logging
 import io
 import secrets
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import date, datetime, timezone, timedelta
 from urllib.parse import unquote
 from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Request, UploadFile
 from fastapi.responses import Response
 from pydantic import BaseModel, Field, EmailStr, field_validator
 from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.utils.client_calendar import effective_today_for_invite_start
@@ -38,15 +44,24 @@ from app.schemas.owner import (
     VerifyAddressAndUtilitiesResponse,
     VerifyAddressRequest,
 )
-from app.dependencies import get_current_user, require_owner, require_owner_onboarding_complete, get_context_mode
+from app.dependencies import (
+    get_current_user,
+    require_owner_onboarding_complete,
+    require_owner_onboarding_complete_principal,
+    get_context_mode,
+)
+from app.services.principal_cache import Principal
 from app.models.stay import Stay
 from app.models.unit import Unit
 from app.models.guest import GuestProfile
 from app.models.resident_mode import ResidentMode, ResidentModeType
 from app.models.tenant_assignment import TenantAssignment
 from app.services.audit_log import create_log, CATEGORY_STATUS_CHANGE, CATEGORY_SHIELD_MODE
+from app.services.blob_store import blob_response, store_blob
 from app.services.event_ledger import (
     create_ledger_event,
+    create_ledger_events,
+    ledger_batch,
     ACTION_PROPERTY_CREATED,
     ACTION_BULK_UPLOAD_PROPERTY_CREATED,
     ACTION_BULK_UPLOAD_PROPERTY_UPDATED,
@@ -131,13 +146,12 @@ from app.services.manager_resident import (
 )
 from app.services.jle import validate_stay_duration_for_property, get_max_stay_days_for_property
 from app.services.occupancy import (
-    get_unit_display_occupancy_status,
-    get_property_display_occupancy_status,
     get_units_occupancy_display,
-    count_effectively_occupied_units,
+    resolve_units_occupancy,
     normalize_occupancy_status_for_display,
     clear_stored_unit_occupied_without_lease_or_stay,
 )
+from app.services.property_state import get_property_states
 
 router = APIRouter(prefix="/owners", tags=["owners"])
 
@@ -326,7 +340,7 @@ def _ledger_meta_bulk_csv_invitation(
 
 @router.get("/config", response_model=OwnerConfigResponse)
 def get_owner_config(
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Return owner-facing config (e.g. test provider email for development)."""
     settings = get_settings()
@@ -337,7 +351,7 @@ def get_owner_config(
 @router.get("/properties", response_model=list[PropertyResponse])
 def list_my_properties(
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
     context_mode: str = Depends(get_context_mode),
     inactive: bool = False,
 ):
@@ -363,30 +377,7 @@ def list_my_properties(
     db.commit()
     if not props:
         return []
-    prop_ids = [p.id for p in props]
-    from collections import defaultdict
-
-    from app.services.privacy_lanes import filter_property_lane_invitations_for_owner
-    from app.services.property_invitation_summary import invitation_counts_dict
-
-    all_prop_invitations = db.query(Invitation).filter(Invitation.property_id.in_(prop_ids)).all()
-    invitations_by_property: dict[int, list[Invitation]] = defaultdict(list)
-    for inv in all_prop_invitations:
-        invitations_by_property[inv.property_id].append(inv)
-    unit_count_rows = (
-        db.query(Unit.property_id, func.count(Unit.id).label("cnt"))
-        .filter(Unit.property_id.in_(prop_ids))
-        .group_by(Unit.property_id)
-        .all()
-    )
-    unit_count_map = {r.property_id: r.cnt for r in unit_count_rows}
-    # Load units once so we can compute effective occupancy + counts consistently for cards.
-    from app.services.unit_display_order import query_units_for_properties_ordered
-
-    units_by_property_id: dict[int, list[Unit]] = {pid: [] for pid in prop_ids}
-    all_units = query_units_for_properties_ordered(db, prop_ids).all()
-    for u in all_units:
-        units_by_property_id.setdefault(u.property_id, []).append(u)
+    states = get_property_states(db, [p.id for p in props])
     out = []
     for p in props:
         data = PropertyResponse.model_validate(p).model_dump()
@@ -395,18 +386,14 @@ def list_my_properties(
             property_id=p.id,
             owner_user_id=current_user.id,
         )
-        units = units_by_property_id.get(p.id, [])
-        data["unit_count"] = unit_count_map.get(p.id) or (len(units) if units else 1)
-        # Use effective occupancy for display (includes tenant assignments + on-site manager resident).
-        data["occupancy_status"] = get_property_display_occupancy_status(db, p, units)
-        occupied_units = count_effectively_occupied_units(db, units) if units else (1 if (data["occupancy_status"] or "").lower() == OccupancyStatus.occupied.value else 0)
-        total_units = int(data["unit_count"] or 1)
-        data["occupied_unit_count"] = occupied_units
-        data["vacant_unit_count"] = max(0, total_units - occupied_units)
-        lane_invs = filter_property_lane_invitations_for_owner(
-            db, invitations_by_property.get(p.id, []), current_user.id
-        )
-        data.update(invitation_counts_dict(lane_invs, db))
+        # Effective occupancy (tenant assignments, on-site manager resident, guest stays) and the owner-lane
+        # invitation counts come from the property state snapshot (app.services.property_state).
+        state = states[p.id]
+        data["unit_count"] = state.unit_count or 1
+        data["occupancy_status"] = state.occupancy_status
+        data["occupied_unit_count"] = state.occupied_unit_count
+        data["vacant_unit_count"] = max(0, data["unit_count"] - state.occupied_unit_count)
+        data.update(state.invitation_counts_dict())
         out.append(PropertyResponse(**data))
     return out
 
@@ -414,7 +401,7 @@ def list_my_properties(
 @router.post("/verify-address-and-utilities", response_model=VerifyAddressAndUtilitiesResponse)
 def verify_address_and_utilities(
     data: VerifyAddressRequest,
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Run Smarty address verification and utility lookup; return standardized address and providers by type (for add-property utilities step)."""
     street = (data.street_address or "").strip()
@@ -621,7 +608,7 @@ def _apply_smarty_address(prop: Property, street: str, city: str, state: str, zi
 
 
 def _run_utility_bucket_for_property(prop: Property, db: Session) -> None:
-    """Run Utility Bucket: Census → Rewiring America → Water CSV → FCC BDC CSV; save providers + authority letters."""
+    """Run Utility Bucket (Census, Rewiring America, water, FCC BDC legs, concurrently); save providers + authority letters."""
     zip_code = prop.smarty_zipcode or prop.zip_code
     lat = prop.smarty_latitude
     lon = prop.smarty_longitude
@@ -1648,18 +1635,739 @@ class BulkUploadJobStatusResponse(BaseModel):
     error_message: str | None = None
 
 
-def _process_bulk_upload_background(job_key: str, csv_text: str, user_id: int):
-    """Process bulk upload in a worker thread after the async POST returns (BackgroundTasks). Uses its own DB session."""
-    from app.database import SessionLocal
+@dataclass
+class _BulkCsvRow:
+    """One validated, normalized row of an async bulk-upload CSV."""
+
+    row_num: int
+    key: tuple[str, str, str, str, str]
+    street: str
+    city: str
+    state: str
+    zip_code: str
+    region_code: str
+    prop_name: str
+    address_as_name: str
+    unit_no: str | None
+    occupied_unit_raw: str | None
+    occupied: bool
+    shield_mode: bool
+    primary_residence: bool
+    tax_id: str | None
+    apn: str | None
+    treat_as_multi_unit: bool
+    tenant_name: str = ""
+    lease_start: date | None = None
+    lease_end: date | None = None
+    primary_tenant_email: str | None = None
+    co_tenants: list[tuple[str, str | None]] = field(default_factory=list)
+
+    @property
+    def has_tenant_invite(self) -> bool:
+        return bool(self.tenant_name and self.lease_start and self.lease_end)
+
+    @property
+    def preferred_unit_label(self) -> str:
+        return (self.occupied_unit_raw or self.unit_no or "").strip()
+
+    @property
+    def usat_token_state(self) -> str:
+        if self.has_tenant_invite:
+            return USAT_TOKEN_STAGED
+        return USAT_TOKEN_RELEASED if self.occupied else USAT_TOKEN_STAGED
+
+
+@dataclass
+class _BulkChunkResult:
+    rows: int = 0
+    created: int = 0
+    updated: int = 0
+    units_created: int = 0
+    # (created, updated, units_created) per group, in the order the groups were passed in
+    group_counts: list[tuple[int, int, int]] = field(default_factory=list)
+
+
+def _bulk_csv_prepare_rows(
+    db: Session, rows: list[dict], norm_to_orig: dict[str, str]
+) -> tuple[list[_BulkCsvRow], int | None, str | None]:
+    """Validate and normalize every async bulk-upload row before anything is written.
+
+    Returns (rows ahead of the first invalid row, failed_from_row, failure_reason). As before, rows ahead of a bad
+    row are still imported and nothing from the bad row onward is."""
+
+    def _get_cell(row, *keys):
+        for k in keys:
+            orig = norm_to_orig.get(k) or norm_to_orig.get(k.replace("_", ""))
+            if orig and row.get(orig) is not None:
+                v = str(row[orig]).strip()
+                if v:
+                    return v
+        return None
+
+    # Multi-unit groups (same addr+city+state+zip+name) are detected over the whole file.
+    group_counts: dict[tuple[str, str, str, str, str], int] = {}
+    for row in rows:
+        address = _get_cell(row, "address", "street_address", "street") or ""
+        city_val = _get_cell(row, "city") or ""
+        state_upper = (_get_cell(row, "state") or "").upper()[:50]
+        zip_code = _get_cell(row, "zip", "zip_code") or ""
+        address_as_name = f"{address.strip()}, {city_val.strip()}, {state_upper}".strip(", ")
+        prop_name = (_get_cell(row, "property_name", "name") or "").strip() or address_as_name
+        k = _bulk_property_group_key(
+            street=address, city=city_val, state=state_upper, zip_code=zip_code, property_name=prop_name
+        )
+        group_counts[k] = group_counts.get(k, 0) + 1
+
+    prepared: list[_BulkCsvRow] = []
+    for row_num, row in enumerate(rows, start=1):
+        street = (_get_cell(row, "address", "street_address", "street") or "").strip()
+        unit_no = _get_cell(row, "unit_no", "unit")
+        city_val = _get_cell(row, "city")
+        state_val = _get_cell(row, "state")
+        zip_code = _get_cell(row, "zip", "zip_code")
+        occupied_raw = _get_cell(row, "occupied")
+        tenant_name = (_get_cell(row, "tenant_name") or "").strip()
+        lease_start_str = _get_cell(row, "lease_start")
+        lease_end_str = _get_cell(row, "lease_end")
+        occupied_unit_raw = _get_cell(row, "occupied_unit", "unit_label")
+
+        if not street:
+            return prepared, row_num, "Missing required column: Address."
+        if not city_val:
+            return prepared, row_num, "Missing required column: City."
+        if not state_val:
+            return prepared, row_num, "Missing required column: State."
+        if not zip_code:
+            return prepared, row_num, "Missing required column: Zip."
+        if occupied_raw is None or not str(occupied_raw).strip():
+            return prepared, row_num, "Missing required column: Occupied (YES/NO)."
+        state_upper = state_val.upper()[:50]
+        if not _normalize_addr(city_val) or not _normalize_addr(street):
+            return prepared, row_num, "Address, city, and state cannot be blank after trimming."
+
+        address_as_name = f"{street}, {city_val.strip()}, {state_upper}".strip(", ")
+        prop_name = (_get_cell(row, "property_name", "name") or "").strip() or address_as_name
+        key = _bulk_property_group_key(
+            street=street, city=city_val, state=state_upper, zip_code=zip_code, property_name=prop_name
+        )
+        r = _BulkCsvRow(
+            row_num=row_num,
+            key=key,
+            street=street,
+            city=city_val.strip(),
+            state=state_upper,
+            zip_code=zip_code.strip(),
+            region_code=state_upper[:20],
+            prop_name=prop_name,
+            address_as_name=address_as_name,
+            unit_no=unit_no,
+            occupied_unit_raw=occupied_unit_raw,
+            occupied=_parse_bool_cell(occupied_raw),
+            shield_mode=_parse_bool_cell(_get_cell(row, "shield_mode", "shieldmode")),
+            primary_residence=_parse_bool_cell(
+                _get_cell(row, "is_primary_residence", "owner_occupied", "primary_residence")
+            ),
+            tax_id=(_get_cell(row, "tax_id") or "").strip() or None,
+            apn=(_get_cell(row, "apn", "parcel") or "").strip() or None,
+            treat_as_multi_unit=bool(
+                group_counts.get(key, 0) > 1 or (unit_no or "").strip() or (occupied_unit_raw or "").strip()
+            ),
+        )
+        if tenant_name or (lease_start_str or "").strip() or (lease_end_str or "").strip():
+            if not tenant_name:
+                return prepared, row_num, "Tenant Name is required when lease data is provided."
+            r.tenant_name = tenant_name
+            r.lease_start = _parse_date_cell(lease_start_str)
+            r.lease_end = _parse_date_cell(lease_end_str)
+            if not r.lease_start:
+                return prepared, row_num, "Lease Start is required when tenant lease data is provided (e.g. YYYY-MM-DD)."
+            if not r.lease_end:
+                return prepared, row_num, "Lease End is required when tenant lease data is provided (e.g. YYYY-MM-DD)."
+            if r.lease_end <= r.lease_start:
+                return prepared, row_num, "Lease End must be after Lease Start."
+            co_tenants, co_err = _bulk_csv_parse_co_tenants_for_row(row, norm_to_orig, tenant_name)
+            if co_err:
+                return prepared, row_num, co_err
+            email_err = _bulk_csv_validate_co_tenant_emails(db, co_tenants, row_num)
+            if email_err:
+                return prepared, row_num, email_err
+            r.co_tenants = co_tenants
+            primary_email = (_get_cell(row, "tenant_email", "email") or "").strip().lower()
+            if primary_email:
+                pe_err = validate_invite_email_role(db, primary_email, UserRole.tenant)
+                if pe_err:
+                    return prepared, row_num, f"Primary tenant (row {row_num}): {pe_err}"
+                r.primary_tenant_email = primary_email
+        prepared.append(r)
+    return prepared, None, None
+
+
+def _bulk_csv_chunk_groups(
+    prepared: list[_BulkCsvRow], chunk_rows: int
+) -> list[list[list[_BulkCsvRow]]]:
+    """Group rows by property (first-appearance order) and pack whole groups into chunks of about ``chunk_rows``.
+
+    A group is never split, so every row of one property is ingested by the same chunk, in CSV order."""
+    groups: dict[tuple[str, str, str, str, str], list[_BulkCsvRow]] = {}
+    for r in prepared:
+        groups.setdefault(r.key, []).append(r)
+    chunks: list[list[list[_BulkCsvRow]]] = []
+    current: list[list[_BulkCsvRow]] = []
+    n = 0
+    for group in groups.values():
+        if current and n + len(group) > chunk_rows:
+            chunks.append(current)
+            current, n = [], 0
+        current.append(group)
+        n += len(group)
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _bulk_upload_worker_count(bind, n_chunks: int) -> int:
+    """Concurrent chunk workers: bulk_upload_max_workers, at most half the engine's pool (the rest stays free for
+    HTTP requests). SQLite serializes writers anyway, so it always gets one."""
+    if n_chunks <= 1 or bind.dialect.name == "sqlite":
+        return 1
+    limit = max(1, int(get_settings().bulk_upload_max_workers))
+    pool = bind.pool
+    if callable(getattr(pool, "size", None)):
+        capacity = int(pool.size()) + max(0, int(getattr(pool, "_max_overflow", 0) or 0))
+        limit = min(limit, max(1, capacity // 2))
+    return max(1, min(limit, n_chunks))
+
+
+def _bulk_unique_property_tokens(db: Session, column, count: int, make) -> list[str | None]:
+    """``count`` fresh values from ``make()`` that are not yet used in ``column``, checked with one IN query per
+    round. Entries still colliding after 10 rounds are None (caller falls back to an id-suffixed value)."""
+    tokens: list[str | None] = [None] * count
+    pending = list(range(count))
+    taken: set[str] = set()
+    for _ in range(10):
+        if not pending:
+            break
+        candidates = {i: make() for i in pending}
+        used = {v for (v,) in db.query(column).filter(column.in_(set(candidates.values()))).all()}
+        pending = []
+        for i, tok in candidates.items():
+            if tok in used or tok in taken:
+                pending.append(i)
+            else:
+                tokens[i] = tok
+                taken.add(tok)
+    return tokens
+
+
+def _bulk_csv_property_updates(prop: Property, r: _BulkCsvRow) -> dict[str, object]:
+    """Fields a CSV row changes on an existing property (same comparisons as the sync bulk upload)."""
+    # Bulk upload always starts properties as vacant; occupancy moves only after explicit in-app acceptance flow.
+    new_occ_status = OccupancyStatus.vacant.value
+    shield = persisted_shield_row_int(csv_parsed_on=r.shield_mode)
+    updates: dict[str, object] = {}
+    if (prop.name or "").strip() != r.prop_name:
+        updates["name"] = r.prop_name
+    if r.street != (prop.street or "").strip():
+        updates["street"] = r.street
+    if r.city != (prop.city or "").strip():
+        updates["city"] = r.city
+    if r.state != (prop.state or "").strip():
+        updates["state"] = r.state
+    if r.zip_code and (prop.zip_code or "").strip() != r.zip_code:
+        updates["zip_code"] = r.zip_code
+    if prop.owner_occupied != r.primary_residence:
+        updates["owner_occupied"] = r.primary_residence
+    if prop.occupancy_status != new_occ_status:
+        updates["occupancy_status"] = new_occ_status
+    if shield != (prop.shield_mode_enabled or 0):
+        updates["shield_mode_enabled"] = shield
+    if (prop.tax_id or None) != r.tax_id:
+        updates["tax_id"] = r.tax_id
+    if (prop.apn or None) != r.apn:
+        updates["apn"] = r.apn
+    if (prop.usat_token_state or USAT_TOKEN_STAGED) != r.usat_token_state:
+        updates["usat_token_state"] = r.usat_token_state
+    return updates
+
+
+def _bulk_csv_unit_for_label(
+    prop: Property,
+    label: str,
+    label_map: dict[str, Unit],
+    unit_list: list[Unit],
+    new_units: list[Unit],
+    **unit_fields,
+) -> tuple[Unit, bool]:
+    """Unit labelled ``label`` on ``prop``, staging a new vacant one (inserted with the chunk) if missing."""
+    unit = label_map.get(label)
+    if unit is not None:
+        return unit, False
+    unit = Unit(property_id=prop.id, unit_label=label, occupancy_status=OccupancyStatus.vacant.value, **unit_fields)
+    label_map[label] = unit
+    unit_list.append(unit)
+    new_units.append(unit)
+    return unit, True
+
+
+def _bulk_upload_ingest_groups(
+    db: Session,
+    groups: list[list[_BulkCsvRow]],
+    *,
+    current_user: User,
+    profile_id: int,
+    existing_property_ids: dict[tuple[str, str, str, str, str], int],
+) -> tuple[_BulkChunkResult, list[tuple[Invitation, Property, str]]]:
+    """Write one chunk of property groups without committing.
+
+    New properties, units and invitations are each inserted with one flush for the whole chunk and the ledger
+    events with one multi-row insert. Returns the counters and the (invitation, property, tenant name) triples
+    whose invite emails are sent once the chunk is committed."""
+    result = _BulkChunkResult(rows=sum(len(g) for g in groups))
+    wanted_ids = [existing_property_ids[g[0].key] for g in groups if g[0].key in existing_property_ids]
+    props_by_id: dict[int, Property] = {}
+    units_by_property_id: dict[int, list[Unit]] = {}
+    if wanted_ids:
+        props_by_id = {p.id: p for p in db.query(Property).filter(Property.id.in_(wanted_ids)).all()}
+        for u in db.query(Unit).filter(Unit.property_id.in_(wanted_ids)).order_by(Unit.id).all():
+            units_by_property_id.setdefault(int(u.property_id), []).append(u)
+
+    # Stage 1: properties.
+    plan: list[tuple[list[_BulkCsvRow], Property, bool]] = []
+    new_props: list[Property] = []
+    for group in groups:
+        first = group[0]
+        prop = props_by_id.get(existing_property_ids.get(first.key))
+        if prop is None:
+            prop = Property(
+                owner_profile_id=profile_id,
+                name=first.prop_name,
+                street=first.street,
+                city=first.city,
+                state=first.state,
+                zip_code=first.zip_code or None,
+                region_code=first.region_code,
+                owner_occupied=first.primary_residence,
+                property_type=None,
+                # Bulk upload always starts properties as vacant; occupancy moves only after explicit in-app acceptance flow.
+                occupancy_status=OccupancyStatus.vacant.value,
+                shield_mode_enabled=persisted_shield_row_int(csv_parsed_on=first.shield_mode),
+                is_multi_unit=first.treat_as_multi_unit,
+                tax_id=first.tax_id,
+                apn=first.apn,
+                usat_token_state=first.usat_token_state,
+            )
+            new_props.append(prop)
+        plan.append((group, prop, prop.id is None))
+    if new_props:
+        slugs = _bulk_unique_property_tokens(
+            db,
+            Property.live_slug,
+            len(new_props),
+            lambda: secrets.token_urlsafe(12).replace("+", "-").replace("/", "_")[:24],
+        )
+        usat_tokens = _bulk_unique_property_tokens(
+            db, Property.usat_token, len(new_props), lambda: "USAT-" + secrets.token_hex(12).upper()
+        )
+        for prop, slug, usat in zip(new_props, slugs, usat_tokens):
+            prop.live_slug = slug
+            prop.usat_token = usat
+        db.add_all(new_props)
+        db.flush()
+        for prop in new_props:
+            if not prop.live_slug:
+                _ensure_property_live_slug(prop, db)
+            if not prop.usat_token:
+                prop.usat_token = "USAT-" + secrets.token_hex(8).upper() + "-" + str(prop.id)
+
+    # Stage 2: property rows (create / update events) and the units each row needs.
+    ledger_events: list[dict] = []
+    row_plans: list[tuple[_BulkCsvRow, Property, bool, Unit | None]] = []
+    new_units: list[Unit] = []
+    for group, prop, is_new in plan:
+        unit_list = units_by_property_id.setdefault(int(prop.id), [])
+        label_map = {str(u.unit_label): u for u in unit_list if u.unit_label}
+        created_before, updated_before, units_before = result.created, result.updated, result.units_created
+        for i, r in enumerate(group):
+            creating = is_new and i == 0
+            if creating:
+                result.created += 1
+                create_log(
+                    db,
+                    CATEGORY_STATUS_CHANGE,
+                    "Property registered (async CSV)",
+                    f"Owner registered property: {r.prop_name} (id={prop.id}). Occupancy status: {prop.occupancy_status} (initial).",
+                    property_id=prop.id,
+                    actor_user_id=current_user.id,
+                    actor_email=current_user.email,
+                    meta={"property_id": prop.id, "bulk_upload_row": r.row_num, "street": r.street, "city": r.city, "state": r.state},
+                )
+                ledger_events.append(
+                    dict(
+                        action_type=ACTION_BULK_UPLOAD_PROPERTY_CREATED,
+                        target_object_type="Property",
+                        target_object_id=prop.id,
+                        property_id=prop.id,
+                        actor_user_id=current_user.id,
+                        meta=_ledger_meta_bulk_property_created(
+                            property_name=r.prop_name,
+                            property_address=_csv_bulk_address_line(r.street, r.city, r.state, r.zip_code or None),
+                            csv_row=r.row_num,
+                            property_id=prop.id,
+                            occupancy_status=str(prop.occupancy_status),
+                        ),
+                    )
+                )
+            else:
+                updates = _bulk_csv_property_updates(prop, r)
+                for name, val in updates.items():
+                    setattr(prop, name, val)
+                if updates:
+                    result.updated += 1
+                    ledger_events.append(
+                        dict(
+                            action_type=ACTION_BULK_UPLOAD_PROPERTY_UPDATED,
+                            target_object_type="Property",
+                            target_object_id=prop.id,
+                            property_id=prop.id,
+                            actor_user_id=current_user.id,
+                            meta=_ledger_meta_bulk_property_updated(
+                                property_name=(prop.name or r.address_as_name or "").strip() or r.address_as_name,
+                                property_address=_csv_bulk_address_line(
+                                    (prop.street or "").strip(),
+                                    (prop.city or "").strip(),
+                                    (prop.state or "").strip(),
+                                    (prop.zip_code or "").strip() or None,
+                                ),
+                                csv_row=r.row_num,
+                                property_id=prop.id,
+                                fields_changed=list(updates.keys()),
+                            ),
+                        )
+                    )
+
+            inv_unit: Unit | None = None
+            if r.has_tenant_invite:
+                if r.treat_as_multi_unit:
+                    label = r.preferred_unit_label or _next_auto_unit_label(set(label_map.keys()))
+                    inv_unit, unit_created = _bulk_csv_unit_for_label(prop, label, label_map, unit_list, new_units)
+                    if unit_created:
+                        result.units_created += 1
+                    if not prop.is_multi_unit and len(label_map) > 1:
+                        prop.is_multi_unit = True
+                elif unit_list:
+                    inv_unit = unit_list[0]
+                else:
+                    inv_unit = Unit(property_id=prop.id, unit_label="1", occupancy_status=OccupancyStatus.vacant.value)
+                    unit_list.append(inv_unit)
+                    new_units.append(inv_unit)
+            # Every row in a multi-unit group ensures a Unit row (even vacant), so the UI shows the correct unit count.
+            if r.treat_as_multi_unit:
+                label = r.preferred_unit_label or _next_auto_unit_label(set(label_map.keys()))
+                _, unit_created = _bulk_csv_unit_for_label(
+                    prop, label, label_map, unit_list, new_units, is_primary_residence=0
+                )
+                if unit_created:
+                    result.units_created += 1
+                    if not prop.is_multi_unit and len(label_map) > 1:
+                        prop.is_multi_unit = True
+            row_plans.append((r, prop, creating, inv_unit))
+        result.group_counts.append(
+            (result.created - created_before, result.updated - updated_before, result.units_created - units_before)
+        )
+    if new_units:
+        db.add_all(new_units)
+        db.flush()
+
+    # Stage 3: tenant invitations (rows on existing properties skip an identical open invite).
+    open_invites: set[tuple] = set()
+    if props_by_id:
+        open_invites = {
+            tuple(row)
+            for row in db.query(
+                Invitation.property_id,
+                Invitation.unit_id,
+                Invitation.guest_name,
+                Invitation.stay_start_date,
+                Invitation.stay_end_date,
+            )
+            .filter(
+                Invitation.property_id.in_(list(props_by_id)),
+                Invitation.invitation_kind == TENANT_INVITE_KIND,
+                Invitation.status.in_(["pending", "ongoing", "accepted"]),
+            )
+            .all()
+        }
+    new_invites: list[tuple[_BulkCsvRow, Property, bool, Unit, Invitation]] = []
+    for r, prop, creating, inv_unit in row_plans:
+        if inv_unit is None:
+            continue
+        invite_key = (prop.id, inv_unit.id, r.tenant_name, r.lease_start, r.lease_end)
+        if not creating and invite_key in open_invites:
+            continue
+        open_invites.add(invite_key)
+        inv = Invitation(
+            invitation_code="INV-" + secrets.token_hex(4).upper(),
+            owner_id=current_user.id,
+            invited_by_user_id=current_user.id,
+            property_id=prop.id,
+            unit_id=inv_unit.id,
+            guest_name=r.tenant_name,
+            guest_email=r.primary_tenant_email,
+            stay_start_date=r.lease_start,
+            stay_end_date=r.lease_end,
+            purpose_of_stay=PurposeOfStay.other,
+            relationship_to_owner=RelationshipToOwner.other,
+            region_code=prop.region_code,
+            status="pending",
+            token_state="STAGED",
+            invitation_kind=TENANT_INVITE_KIND,
+            dead_mans_switch_enabled=1,
+            dead_mans_switch_alert_email=1,
+            dead_mans_switch_alert_sms=0,
+            dead_mans_switch_alert_dashboard=1,
+            dead_mans_switch_alert_phone=0,
+        )
+        new_invites.append((r, prop, creating, inv_unit, inv))
+    if new_invites:
+        db.add_all([inv for *_, inv in new_invites])
+        db.flush()
+
+    to_email: list[tuple[Invitation, Property, str]] = []
+    for r, prop, creating, inv_unit, inv in new_invites:
+        # CSV invites never force occupied (same rule as _mark_unit_occupied_after_csv_tenant_invite).
+        if (inv_unit.occupancy_status or "").lower() not in (
+            OccupancyStatus.vacant.value,
+            OccupancyStatus.unconfirmed.value,
+            OccupancyStatus.unknown.value,
+        ):
+            inv_unit.occupancy_status = OccupancyStatus.vacant.value
+        if creating:
+            prop_label = (prop.name or r.prop_name or "").strip() or r.prop_name
+            log_title = "Invitation created (async CSV occupied)"
+            log_message = (
+                f"Invite ID {inv.invitation_code} created (token_state=STAGED, pending record) for property {prop.id}, tenant {r.tenant_name}, lease {r.lease_start}–{r.lease_end}. Tenant can use invite link to sign up."
+            )
+        else:
+            prop_label = (prop.name or r.address_as_name or "").strip() or r.address_as_name
+            log_title = "Invitation created (async CSV occupied, update)"
+            log_message = (
+                f"Invite ID {inv.invitation_code} created (token_state=STAGED, pending record) for property {prop.id}, tenant {r.tenant_name}, lease {r.lease_start}–{r.lease_end}."
+            )
+        create_log(
+            db,
+            CATEGORY_STATUS_CHANGE,
+            log_title,
+            log_message,
+            property_id=prop.id,
+            invitation_id=inv.id,
+            actor_user_id=current_user.id,
+            actor_email=current_user.email,
+            meta={"invitation_code": inv.invitation_code, "token_state": "STAGED", "guest_name": r.tenant_name, "lease_start": str(r.lease_start), "lease_end": str(r.lease_end)},
+        )
+        ledger_events.append(
+            dict(
+                action_type=ACTION_INVITATION_CREATED_CSV,
+                target_object_type="Invitation",
+                target_object_id=inv.id,
+                property_id=prop.id,
+                unit_id=inv_unit.id,
+                invitation_id=inv.id,
+                actor_user_id=current_user.id,
+                meta=_ledger_meta_bulk_csv_invitation(
+                    property_name=prop_label,
+                    property_address=_csv_bulk_address_line(prop.street or "", prop.city or "", prop.state or "", prop.zip_code),
+                    unit_label=str(r.occupied_unit_raw).strip() if r.occupied_unit_raw else (inv_unit.unit_label or None),
+                    tenant_name=r.tenant_name,
+                    invitation_code=inv.invitation_code,
+                    lease_start=r.lease_start,
+                    lease_end=r.lease_end,
+                    csv_row=r.row_num,
+                ),
+            )
+        )
+        to_email.append((inv, prop, r.tenant_name))
+        _bulk_csv_append_co_tenant_invitations(
+            db,
+            prop=prop,
+            current_user=current_user,
+            inv_unit_id=int(inv_unit.id),
+            lease_start=r.lease_start,
+            lease_end=r.lease_end,
+            co_tenants=r.co_tenants,
+            row_num=r.row_num,
+            request=None,
+            occupied_unit_raw=r.occupied_unit_raw,
+            property_name_for_ledger=prop_label,
+        )
+
+    create_ledger_events(db, ledger_events)
+    return result, to_email
+
+
+def _bulk_upload_group_hash(key: tuple[str, str, str, str, str]) -> str:
+    """Idempotency key of a property group within a job (BulkUploadJobGroup.group_key)."""
+    return hashlib.sha256("\x1f".join(key).encode("utf-8")).hexdigest()
+
+
+def _bulk_upload_ingest_chunk(
+    session_factory,
+    groups: list[list[_BulkCsvRow]],
+    *,
+    job_id: int,
+    user_id: int,
+    profile_id: int,
+    existing_property_ids: dict[tuple[str, str, str, str, str], int],
+) -> _BulkChunkResult:
+    """Ingest one chunk in its own session with one commit, then send its tenant invite emails.
+
+    The chunk's BulkUploadJobGroup checkpoints are committed in the same transaction as its rows, so a group is
+    either fully imported and recorded or not at all. Chunks never share a property, so they can run concurrently.
+    Invite emails go out after the commit: a crash in between skips them rather than sending twice."""
+    from app.models.bulk_upload_job import BulkUploadJobGroup
+
+    db = session_factory()
+    try:
+        current_user = db.query(User).filter(User.id == user_id).first()
+        with ledger_batch(db):
+            result, to_email = _bulk_upload_ingest_groups(
+                db,
+                groups,
+                current_user=current_user,
+                profile_id=profile_id,
+                existing_property_ids=existing_property_ids,
+            )
+        group_keys = [_bulk_upload_group_hash(group[0].key) for group in groups]
+        for group_key, group, (g_created, g_updated, g_units) in zip(group_keys, groups, result.group_counts):
+            db.add(
+                BulkUploadJobGroup(
+                    job_id=job_id,
+                    group_key=group_key,
+                    first_row=group[0].row_num,
+                    row_count=len(group),
+                    created=g_created,
+                    updated=g_updated,
+                    units_created=g_units,
+                )
+            )
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            committed = {
+                k
+                for (k,) in db.query(BulkUploadJobGroup.group_key)
+                .filter(BulkUploadJobGroup.job_id == job_id, BulkUploadJobGroup.group_key.in_(group_keys))
+                .all()
+            }
+            if committed != set(group_keys):
+                # Not (only) a lost race: some groups of this chunk are recorded nowhere, so their rows are not in the
+                # database. Re-raise so the job is marked failed (and resumable) instead of reporting them as imported.
+                raise
+            # Another run already committed this chunk; keep its rows, drop ours.
+            logger.warning("[BulkUpload] job_id=%s chunk already committed by another run; skipped", job_id)
+            return _BulkChunkResult()
+        with ledger_batch(db):
+            for inv, prop, tenant_name in to_email:
+                auto_email_tenant_invitation_if_addressed(
+                    db,
+                    inv,
+                    prop,
+                    tenant_display_name=tenant_name,
+                    ip=None,
+                    ua=None,
+                    actor_user_id=current_user.id,
+                    actor_email=current_user.email,
+                )
+            if to_email:
+                db.commit()
+        return result
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+class _BulkUploadLeaseLost(Exception):
+    """The job was taken over by another run (sweep or resume endpoint) while this one was still working."""
+
+
+def _bulk_upload_job_progress(db: Session, job_id: int, lease: int, **values) -> bool:
+    """Write ``values`` to the job only while this run still holds it (``attempts`` unchanged since its claim).
+
+    Returns False when another run has claimed the job since; that run owns the progress columns from then on."""
     from app.models.bulk_upload_job import BulkUploadJob
+
+    written = (
+        db.query(BulkUploadJob)
+        .filter(BulkUploadJob.id == job_id, func.coalesce(BulkUploadJob.attempts, 0) == lease)
+        .update({getattr(BulkUploadJob, k): v for k, v in values.items()}, synchronize_session=False)
+    )
+    db.commit()
+    return written == 1
+
+
+@contextmanager
+def _bulk_upload_heartbeat(session_factory, bind, job_id: int, lease: int):
+    """Refresh the job's heartbeat_at every bulk_upload_heartbeat_seconds from a side thread while the body runs, so
+    a chunk slower than bulk_upload_stale_after_seconds (geocoding, a very large group) is not swept as orphaned.
+    Skipped on SQLite: writers serialize there, so the beat would only wait behind the chunk being ingested."""
+    interval = get_settings().bulk_upload_heartbeat_seconds
+    if interval <= 0 or bind.dialect.name == "sqlite":
+        yield
+        return
+    stop = threading.Event()
+
+    def _beat() -> None:
+        while not stop.wait(interval):
+            db = session_factory()
+            try:
+                if not _bulk_upload_job_progress(db, job_id, lease, heartbeat_at=datetime.now(timezone.utc)):
+                    return
+            except Exception as e:
+                db.rollback()
+                logger.warning("[BulkUpload] job_id=%s heartbeat failed: %s", job_id, e)
+            finally:
+                db.close()
+
+    beat = threading.Thread(target=_beat, name=f"bulk-upload-heartbeat-{job_id}", daemon=True)
+    beat.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        beat.join(timeout=5)
+
+
+def _process_bulk_upload_background(
+    job_key: str, csv_text: str, user_id: int, *, session_factory=None, lease: int | None = None
+):
+    """Process bulk upload in a worker thread after the async POST returns (BackgroundTasks).
+
+    Staged pipeline: every row is validated and normalized up front, rows are grouped into properties, and the
+    groups are ingested in chunks (own session, one commit each) that run concurrently within the DB pool limits.
+    Job progress (processed_rows / created / updated / units_created / heartbeat_at) is committed once per chunk,
+    and heartbeat_at is also refreshed while a chunk runs.
+
+    ``lease`` is the job's ``attempts`` value this run was claimed with (read from the job when not given). Every
+    progress write is a compare-and-set on it, so if a sweep takes the job over anyway this run stops at its next
+    write instead of racing the new run's counters.
+
+    Resumable: groups already checkpointed in BulkUploadJobGroup by an earlier run of the same job are skipped and
+    their counts carried over, so a resumed job (sweep or resume endpoint) never imports a row twice."""
+    from app.database import SessionLocal
+    from app.models.bulk_upload_job import BulkUploadJob, BulkUploadJobGroup
     from datetime import datetime, timezone as tz
 
-    db = SessionLocal()
+    session_factory = session_factory or SessionLocal
+    db = session_factory()
     try:
         job = db.query(BulkUploadJob).filter(BulkUploadJob.job_key == job_key).first()
         if not job:
             logger.warning("[BulkUpload] worker: job not found job_key=%s", job_key)
             return
+        if lease is None:
+            lease = job.attempts or 0
         logger.info("[BulkUpload] worker started job_key=%s user_id=%s total_rows=%s", job_key, user_id, job.total_rows or 0)
         current_user = db.query(User).filter(User.id == user_id).first()
         if not current_user:
@@ -1687,22 +2395,39 @@ def _process_bulk_upload_background(job_key: str, csv_text: str, user_id: int):
             db.commit()
             return
 
-        job.total_rows = len(rows)
-        job.processed_rows = 0
-        db.commit()
+        prepared, failed_from_row, failure_reason = _bulk_csv_prepare_rows(db, rows, norm_to_orig)
+        done = db.query(BulkUploadJobGroup).filter(BulkUploadJobGroup.job_id == job.id).all()
+        if done:
+            done_keys = {g.group_key for g in done}
+            hashes: dict[tuple[str, str, str, str, str], str] = {}
+            prepared = [
+                r for r in prepared if hashes.setdefault(r.key, _bulk_upload_group_hash(r.key)) not in done_keys
+            ]
+            logger.info("[BulkUpload] job_key=%s resuming: %s groups already committed", job_key, len(done))
+        processed = sum(g.row_count or 0 for g in done)
+        created = sum(g.created or 0 for g in done)
+        updated = sum(g.updated or 0 for g in done)
+        units_created = sum(g.units_created or 0 for g in done)
+        if not _bulk_upload_job_progress(
+            db,
+            job.id,
+            lease,
+            total_rows=len(rows),
+            processed_rows=processed,
+            created=created,
+            updated=updated,
+            units_created=units_created,
+            heartbeat_at=datetime.now(tz.utc),
+        ):
+            raise _BulkUploadLeaseLost()
 
-        created = 0
-        updated = 0
-        units_created = 0
-        failed_from_row = None
-        failure_reason = None
-        existing_props = (
-            db.query(Property)
+        existing_property_ids: dict[tuple[str, str, str, str, str], int] = {}
+        for p in (
+            db.query(Property.id, Property.street, Property.city, Property.state, Property.zip_code, Property.name)
             .filter(Property.owner_profile_id == profile.id, Property.deleted_at.is_(None))
+            .order_by(Property.id)
             .all()
-        )
-        existing_props_by_key: dict[tuple[str, str, str, str, str], Property] = {}
-        for p in existing_props:
+        ):
             k = _bulk_property_group_key(
                 street=(p.street or ""),
                 city=(p.city or ""),
@@ -1710,590 +2435,87 @@ def _process_bulk_upload_background(job_key: str, csv_text: str, user_id: int):
                 zip_code=(p.zip_code or None),
                 property_name=(p.name or ""),
             )
-            if k not in existing_props_by_key:
-                existing_props_by_key[k] = p
-
-        def _get_cell(row, *keys):
-            for k in keys:
-                orig = norm_to_orig.get(k) or norm_to_orig.get(k.replace("_", ""))
-                if orig and row.get(orig) is not None:
-                    v = str(row[orig]).strip()
-                    if v:
-                        return v
-            return None
-
-        # Pre-scan rows to detect multi-unit groups (same addr+city+state+zip+name).
-        group_counts: dict[tuple[str, str, str, str, str], int] = {}
-        for row in rows:
-            address = _get_cell(row, "address", "street_address", "street") or ""
-            city_val = _get_cell(row, "city") or ""
-            state_val = _get_cell(row, "state") or ""
-            zip_code = _get_cell(row, "zip", "zip_code") or ""
-            property_name_raw = _get_cell(row, "property_name", "name")
-            state_upper = (state_val or "").upper()[:50]
-            base_street = (address or "").strip()
-            address_as_name = f"{base_street.strip()}, {city_val.strip()}, {state_upper}".strip(", ")
-            prop_name = (property_name_raw or "").strip() or address_as_name
-            k = _bulk_property_group_key(
-                street=base_street,
-                city=city_val,
-                state=state_upper,
-                zip_code=zip_code,
-                property_name=prop_name,
-            )
-            group_counts[k] = int(group_counts.get(k, 0)) + 1
-
-        units_by_property_id: dict[int, dict[str, int]] = {}
-
-        for idx, row in enumerate(rows, start=1):
-            row_num = idx
-            primary_csv_tenant_email: str | None = None
-            co_tenants: list[tuple[str, str | None]] = []
-            logger.info("[BulkUpload] processing CSV row %s/%s job_key=%s", idx, len(rows), job_key)
-            address = _get_cell(row, "address", "street_address", "street")
-            unit_no = _get_cell(row, "unit_no", "unit")
-            city_val = _get_cell(row, "city")
-            state_val = _get_cell(row, "state")
-            zip_code = _get_cell(row, "zip", "zip_code")
-            occupied_raw = _get_cell(row, "occupied")
-            tenant_name = _get_cell(row, "tenant_name")
-            lease_start_str = _get_cell(row, "lease_start")
-            lease_end_str = _get_cell(row, "lease_end")
-            shield_mode_raw = _get_cell(row, "shield_mode", "shieldmode")
-            primary_residence_raw = _get_cell(row, "is_primary_residence", "owner_occupied", "primary_residence")
-            tax_id_raw = _get_cell(row, "tax_id")
-            apn_raw = _get_cell(row, "apn", "parcel")
-            property_name_raw = _get_cell(row, "property_name", "name")
-            occupied_unit_raw = _get_cell(row, "occupied_unit", "unit_label")
-
-            street = (address or "").strip()
-            if not street:
-                failed_from_row = row_num
-                failure_reason = "Missing required column: Address."
-                break
-            if not city_val:
-                failed_from_row = row_num
-                failure_reason = "Missing required column: City."
-                break
-            if not state_val:
-                failed_from_row = row_num
-                failure_reason = "Missing required column: State."
-                break
-            if not zip_code:
-                failed_from_row = row_num
-                failure_reason = "Missing required column: Zip."
-                break
-            if occupied_raw is None or not str(occupied_raw).strip():
-                failed_from_row = row_num
-                failure_reason = "Missing required column: Occupied (YES/NO)."
-                break
-
-            state_upper = state_val.upper()[:50]
-            city_norm = _normalize_addr(city_val)
-            street_norm = _normalize_addr(street)
-            if not city_norm or not street_norm:
-                failed_from_row = row_num
-                failure_reason = "Address, city, and state cannot be blank after trimming."
-                break
-
-            occupied = _parse_bool_cell(occupied_raw)
-            shield_mode = _parse_bool_cell(shield_mode_raw)
-            primary_residence = _parse_bool_cell(primary_residence_raw)
-            region_code = state_upper.upper()[:20]
-            address_as_name = f"{street.strip()}, {city_val.strip()}, {state_upper}".strip(", ")
-            prop_name = (property_name_raw or "").strip() or address_as_name
+            existing_property_ids.setdefault(k, p.id)
+
+        chunks = _bulk_csv_chunk_groups(prepared, max(1, int(get_settings().bulk_upload_chunk_rows)))
+        workers = _bulk_upload_worker_count(db.get_bind(), len(chunks))
+        logger.info(
+            "[BulkUpload] job_key=%s validated rows=%s/%s chunks=%s workers=%s",
+            job_key,
+            len(prepared),
+            len(rows),
+            len(chunks),
+            workers,
+        )
 
-            key = _bulk_property_group_key(
-                street=street,
-                city=city_val,
-                state=state_upper,
-                zip_code=zip_code,
-                property_name=prop_name,
+        def _ingest(groups: list[list[_BulkCsvRow]]) -> _BulkChunkResult:
+            return _bulk_upload_ingest_chunk(
+                session_factory,
+                groups,
+                job_id=job.id,
+                user_id=current_user.id,
+                profile_id=profile.id,
+                existing_property_ids=existing_property_ids,
             )
-            treat_as_multi_unit = bool(group_counts.get(key, 0) > 1 or (unit_no or "").strip() or (occupied_unit_raw or "").strip())
-
-            lease_start = None
-            lease_end = None
-            has_tenant_lease_data = bool(
-                (tenant_name or "").strip()
-                or (lease_start_str or "").strip()
-                or (lease_end_str or "").strip()
+
+        def _record(res: _BulkChunkResult) -> None:
+            nonlocal processed, created, updated, units_created
+            processed += res.rows
+            created += res.created
+            updated += res.updated
+            units_created += res.units_created
+            if not _bulk_upload_job_progress(
+                db,
+                job.id,
+                lease,
+                processed_rows=processed,
+                created=created,
+                updated=updated,
+                units_created=units_created,
+                heartbeat_at=datetime.now(tz.utc),
+            ):
+                raise _BulkUploadLeaseLost()
+            logger.info(
+                "[BulkUpload] job_key=%s chunk done rows=%s processed=%s/%s",
+                job_key,
+                res.rows,
+                processed,
+                len(rows),
             )
-            if has_tenant_lease_data:
-                if not (tenant_name or "").strip():
-                    failed_from_row = row_num
-                    failure_reason = "Tenant Name is required when lease data is provided."
-                    break
-                lease_start = _parse_date_cell(lease_start_str)
-                lease_end = _parse_date_cell(lease_end_str)
-                if not lease_start:
-                    failed_from_row = row_num
-                    failure_reason = "Lease Start is required when tenant lease data is provided (e.g. YYYY-MM-DD)."
-                    break
-                if not lease_end:
-                    failed_from_row = row_num
-                    failure_reason = "Lease End is required when tenant lease data is provided (e.g. YYYY-MM-DD)."
-                    break
-                if lease_end <= lease_start:
-                    failed_from_row = row_num
-                    failure_reason = "Lease End must be after Lease Start."
-                    break
-                co_tenants, co_err = _bulk_csv_parse_co_tenants_for_row(row, norm_to_orig, (tenant_name or "").strip())
-                if co_err:
-                    failed_from_row = row_num
-                    failure_reason = co_err
-                    break
-                email_err = _bulk_csv_validate_co_tenant_emails(db, co_tenants, row_num)
-                if email_err:
-                    failed_from_row = row_num
-                    failure_reason = email_err
-                    break
-                _pte_raw_a = _get_cell(row, "tenant_email", "email")
-                if (_pte_raw_a or "").strip():
-                    primary_csv_tenant_email = (_pte_raw_a or "").strip().lower()
-                    pe_a = validate_invite_email_role(db, primary_csv_tenant_email, UserRole.tenant)
-                    if pe_a:
-                        failed_from_row = row_num
-                        failure_reason = f"Primary tenant (row {row_num}): {pe_a}"
-                        break
-
-            existing_match = existing_props_by_key.get(key)
-
-            if existing_match is None:
-                owner_occ = primary_residence
-                has_pending_tenant_invite = bool((tenant_name or "").strip() and lease_start and lease_end)
-                # Bulk upload always starts properties as vacant; occupancy moves only after explicit in-app acceptance flow.
-                occ_status = OccupancyStatus.vacant.value
-                prop = Property(
-                    owner_profile_id=profile.id,
-                    name=prop_name,
-                    street=street.strip(),
-                    city=city_val.strip(),
-                    state=state_upper,
-                    zip_code=zip_code.strip() if zip_code else None,
-                    region_code=region_code,
-                    owner_occupied=owner_occ,
-                    property_type=None,
-                    occupancy_status=occ_status,
-                    shield_mode_enabled=persisted_shield_row_int(csv_parsed_on=shield_mode),
-                    is_multi_unit=treat_as_multi_unit,
-                )
-                prop.tax_id = (tax_id_raw or "").strip() or None
-                prop.apn = (apn_raw or "").strip() or None
-                db.add(prop)
-                db.flush()
-                _ensure_property_live_slug(prop, db)
-                for _ in range(10):
-                    token = "USAT-" + secrets.token_hex(12).upper()
-                    if db.query(Property).filter(Property.usat_token == token).first() is None:
-                        prop.usat_token = token
-                        break
-                else:
-                    prop.usat_token = "USAT-" + secrets.token_hex(8).upper() + "-" + str(prop.id)
-                prop.usat_token_state = (
-                    USAT_TOKEN_STAGED
-                    if has_pending_tenant_invite
-                    else (USAT_TOKEN_RELEASED if occupied else USAT_TOKEN_STAGED)
-                )
-                created += 1
 
-                create_log(
-                    db,
-                    CATEGORY_STATUS_CHANGE,
-                    "Property registered (async CSV)",
-                    f"Owner registered property: {prop_name} (id={prop.id}). Occupancy status: {prop.occupancy_status} (initial).",
-                    property_id=prop.id,
-                    actor_user_id=current_user.id,
-                    actor_email=current_user.email,
-                    meta={"property_id": prop.id, "bulk_upload_row": row_num, "street": street.strip(), "city": city_val.strip(), "state": state_upper},
-                )
-                _addr_line_a = _csv_bulk_address_line(street.strip(), city_val.strip(), state_upper, zip_code.strip() if zip_code else None)
-                create_ledger_event(
-                    db,
-                    ACTION_BULK_UPLOAD_PROPERTY_CREATED,
-                    target_object_type="Property",
-                    target_object_id=prop.id,
-                    property_id=prop.id,
-                    actor_user_id=current_user.id,
-                    meta=_ledger_meta_bulk_property_created(
-                        property_name=prop_name,
-                        property_address=_addr_line_a,
-                        csv_row=row_num,
-                        property_id=prop.id,
-                        occupancy_status=str(occ_status) if occ_status else None,
-                    ),
-                )
-                if (tenant_name or "").strip() and lease_start and lease_end:
-                    inv_code = "INV-" + secrets.token_hex(4).upper()
-                    inv_unit_id: int | None = None
-                    if treat_as_multi_unit:
-                        if prop.id not in units_by_property_id:
-                            unit_rows = db.query(Unit).filter(Unit.property_id == prop.id).all()
-                            units_by_property_id[prop.id] = {str(u.unit_label): int(u.id) for u in unit_rows if u.unit_label}
-                        label_map = units_by_property_id[prop.id]
-                        preferred_label = (occupied_unit_raw or unit_no or "").strip()
-                        unit_label = preferred_label if preferred_label else _next_auto_unit_label(set(label_map.keys()))
-                        if unit_label not in label_map:
-                            u = Unit(property_id=prop.id, unit_label=unit_label, occupancy_status=OccupancyStatus.vacant.value)
-                            db.add(u)
-                            db.flush()
-                            label_map[unit_label] = int(u.id)
-                            units_created += 1
-                        inv_unit_id = label_map[unit_label]
-                        if not prop.is_multi_unit and len(label_map) > 1:
-                            prop.is_multi_unit = True
-                    else:
-                        existing_units = db.query(Unit).filter(Unit.property_id == prop.id).all()
-                        if existing_units:
-                            inv_unit_id = existing_units[0].id
-                        else:
-                            auto_unit = Unit(property_id=prop.id, unit_label="1", occupancy_status=OccupancyStatus.vacant.value)
-                            db.add(auto_unit)
-                            db.flush()
-                            inv_unit_id = auto_unit.id
-                    inv = Invitation(
-                        invitation_code=inv_code,
-                        owner_id=current_user.id,
-                        invited_by_user_id=current_user.id,
-                        property_id=prop.id,
-                        unit_id=inv_unit_id,
-                        guest_name=(tenant_name or "").strip(),
-                        guest_email=primary_csv_tenant_email,
-                        stay_start_date=lease_start,
-                        stay_end_date=lease_end,
-                        purpose_of_stay=PurposeOfStay.other,
-                        relationship_to_owner=RelationshipToOwner.other,
-                        region_code=prop.region_code,
-                        status="pending",
-                        token_state="STAGED",
-                        invitation_kind=TENANT_INVITE_KIND,
-                        dead_mans_switch_enabled=1,
-                        dead_mans_switch_alert_email=1,
-                        dead_mans_switch_alert_sms=0,
-                        dead_mans_switch_alert_dashboard=1,
-                        dead_mans_switch_alert_phone=0,
-                    )
-                    db.add(inv)
-                    db.flush()
-                    _mark_unit_occupied_after_csv_tenant_invite(db, inv_unit_id)
-                    create_log(
-                        db,
-                        CATEGORY_STATUS_CHANGE,
-                        "Invitation created (async CSV occupied)",
-                        f"Invite ID {inv_code} created (token_state=STAGED, pending record) for property {prop.id}, tenant {tenant_name}, lease {lease_start}\u2013{lease_end}. Tenant can use invite link to sign up.",
-                        property_id=prop.id,
-                        invitation_id=inv.id,
-                        actor_user_id=current_user.id,
-                        actor_email=current_user.email,
-                        meta={"invitation_code": inv_code, "token_state": "STAGED", "guest_name": (tenant_name or "").strip(), "lease_start": str(lease_start), "lease_end": str(lease_end)},
-                    )
-                    _ul_a = str(occupied_unit_raw).strip() if occupied_unit_raw else None
-                    if not _ul_a and inv_unit_id:
-                        _ur_a = db.query(Unit).filter(Unit.id == inv_unit_id).first()
-                        _ul_a = (_ur_a.unit_label if _ur_a else None) or None
-                    _inv_addr_a = _csv_bulk_address_line(prop.street or "", prop.city or "", prop.state or "", prop.zip_code)
-                    create_ledger_event(
-                        db,
-                        ACTION_INVITATION_CREATED_CSV,
-                        target_object_type="Invitation",
-                        target_object_id=inv.id,
-                        property_id=prop.id,
-                        unit_id=inv_unit_id,
-                        invitation_id=inv.id,
-                        actor_user_id=current_user.id,
-                        meta=_ledger_meta_bulk_csv_invitation(
-                            property_name=(prop.name or prop_name or "").strip() or prop_name,
-                            property_address=_inv_addr_a,
-                            unit_label=_ul_a,
-                            tenant_name=(tenant_name or "").strip(),
-                            invitation_code=inv_code,
-                            lease_start=lease_start,
-                            lease_end=lease_end,
-                            csv_row=row_num,
-                        ),
-                    )
-                    auto_email_tenant_invitation_if_addressed(
-                        db,
-                        inv,
-                        prop,
-                        tenant_display_name=(tenant_name or "").strip(),
-                        ip=None,
-                        ua=None,
-                        actor_user_id=current_user.id,
-                        actor_email=current_user.email,
-                    )
-                    if inv_unit_id is not None:
-                        _bulk_csv_append_co_tenant_invitations(
-                            db,
-                            prop=prop,
-                            current_user=current_user,
-                            inv_unit_id=int(inv_unit_id),
-                            lease_start=lease_start,
-                            lease_end=lease_end,
-                            co_tenants=co_tenants,
-                            row_num=row_num,
-                            request=None,
-                            occupied_unit_raw=occupied_unit_raw,
-                            property_name_for_ledger=(prop.name or prop_name or "").strip() or prop_name,
-                        )
-                db.commit()
-                db.refresh(prop)
-                existing_props.append(prop)
-                existing_props_by_key[key] = prop
-                existing_match = prop
+        with _bulk_upload_heartbeat(session_factory, db.get_bind(), job.id, lease):
+            if workers <= 1:
+                for groups in chunks:
+                    _record(_ingest(groups))
             else:
-                # Update existing property fields (same logic as sync bulk upload)
-                owner_occ = primary_residence
-                has_pending_tenant_invite = bool((tenant_name or "").strip() and lease_start and lease_end)
-                # Bulk upload always starts properties as vacant; occupancy moves only after explicit in-app acceptance flow.
-                new_occ_status = OccupancyStatus.vacant.value
-                updates: dict[str, object] = {}
-                if (existing_match.name or "").strip() != prop_name:
-                    updates["name"] = prop_name
-                if street.strip() != (existing_match.street or "").strip():
-                    updates["street"] = street.strip()
-                if city_val.strip() != (existing_match.city or "").strip():
-                    updates["city"] = city_val.strip()
-                if state_upper != (existing_match.state or "").strip():
-                    updates["state"] = state_upper
-                if zip_code and (existing_match.zip_code or "").strip() != zip_code.strip():
-                    updates["zip_code"] = zip_code.strip()
-                if existing_match.owner_occupied != owner_occ:
-                    updates["owner_occupied"] = owner_occ
-                if existing_match.occupancy_status != new_occ_status:
-                    updates["occupancy_status"] = new_occ_status
-                if persisted_shield_row_int(csv_parsed_on=shield_mode) != (existing_match.shield_mode_enabled or 0):
-                    updates["shield_mode_enabled"] = persisted_shield_row_int(csv_parsed_on=shield_mode)
-                tax_id_val = (tax_id_raw or "").strip() or None
-                apn_val = (apn_raw or "").strip() or None
-                if (existing_match.tax_id or None) != tax_id_val:
-                    updates["tax_id"] = tax_id_val
-                if (existing_match.apn or None) != apn_val:
-                    updates["apn"] = apn_val
-                new_token_state = (
-                    USAT_TOKEN_STAGED
-                    if has_pending_tenant_invite
-                    else (USAT_TOKEN_RELEASED if occupied else USAT_TOKEN_STAGED)
-                )
-                if (existing_match.usat_token_state or USAT_TOKEN_STAGED) != new_token_state:
-                    existing_match.usat_token_state = new_token_state
-                    updates["usat_token_state"] = new_token_state
-
-                for key, val in updates.items():
-                    if key == "name":
-                        existing_match.name = val
-                    elif key == "street":
-                        existing_match.street = val
-                    elif key == "city":
-                        existing_match.city = val
-                    elif key == "state":
-                        existing_match.state = val
-                    elif key == "zip_code":
-                        existing_match.zip_code = val
-                    elif key == "owner_occupied":
-                        existing_match.owner_occupied = val
-                    elif key == "occupancy_status":
-                        existing_match.occupancy_status = val
-                    elif key == "shield_mode_enabled":
-                        existing_match.shield_mode_enabled = val
-                    elif key == "tax_id":
-                        existing_match.tax_id = val
-                    elif key == "apn":
-                        existing_match.apn = val
-                if updates:
-                    updated += 1
-                    _em_addr = _csv_bulk_address_line(
-                        (existing_match.street or "").strip(),
-                        (existing_match.city or "").strip(),
-                        (existing_match.state or "").strip(),
-                        (existing_match.zip_code or "").strip() or None,
-                    )
-                    create_ledger_event(
-                        db,
-                        ACTION_BULK_UPLOAD_PROPERTY_UPDATED,
-                        target_object_type="Property",
-                        target_object_id=existing_match.id,
-                        property_id=existing_match.id,
-                        actor_user_id=current_user.id,
-                        meta=_ledger_meta_bulk_property_updated(
-                            property_name=(existing_match.name or address_as_name or "").strip() or address_as_name,
-                            property_address=_em_addr,
-                            csv_row=row_num,
-                            property_id=existing_match.id,
-                            fields_changed=list(updates.keys()),
-                        ),
-                    )
-
-                # Create invitation for occupied tenant on update (with duplicate check)
-                if (tenant_name or "").strip() and lease_start and lease_end:
-                    inv_code = "INV-" + secrets.token_hex(4).upper()
-                    inv_unit_id_upd: int | None = None
-                    if treat_as_multi_unit:
-                        if existing_match.id not in units_by_property_id:
-                            unit_rows = db.query(Unit).filter(Unit.property_id == existing_match.id).all()
-                            units_by_property_id[existing_match.id] = {str(u.unit_label): int(u.id) for u in unit_rows if u.unit_label}
-                        label_map = units_by_property_id[existing_match.id]
-                        preferred_label = (occupied_unit_raw or unit_no or "").strip()
-                        unit_label = preferred_label if preferred_label else _next_auto_unit_label(set(label_map.keys()))
-                        if unit_label not in label_map:
-                            u = Unit(property_id=existing_match.id, unit_label=unit_label, occupancy_status=OccupancyStatus.vacant.value)
-                            db.add(u)
-                            db.flush()
-                            label_map[unit_label] = int(u.id)
-                            units_created += 1
-                        inv_unit_id_upd = label_map[unit_label]
-                        if not existing_match.is_multi_unit and len(label_map) > 1:
-                            existing_match.is_multi_unit = True
-                            db.commit()
-                    else:
-                        existing_units = db.query(Unit).filter(Unit.property_id == existing_match.id).all()
-                        if existing_units:
-                            inv_unit_id_upd = existing_units[0].id
-                        else:
-                            auto_unit = Unit(property_id=existing_match.id, unit_label="1", occupancy_status=OccupancyStatus.vacant.value)
-                            db.add(auto_unit)
-                            db.flush()
-                            inv_unit_id_upd = auto_unit.id
-                    inv_dup_q_a = (
-                        db.query(Invitation)
-                        .filter(
-                            Invitation.property_id == existing_match.id,
-                            Invitation.guest_name == (tenant_name or "").strip(),
-                            Invitation.stay_start_date == lease_start,
-                            Invitation.stay_end_date == lease_end,
-                            Invitation.invitation_kind == TENANT_INVITE_KIND,
-                            Invitation.status.in_(["pending", "ongoing", "accepted"]),
-                        )
-                    )
-                    if inv_unit_id_upd is not None:
-                        inv_dup_q_a = inv_dup_q_a.filter(Invitation.unit_id == inv_unit_id_upd)
-                    existing_inv = inv_dup_q_a.first()
-                    if not existing_inv:
-                        inv = Invitation(
-                            invitation_code=inv_code,
-                            owner_id=current_user.id,
-                            invited_by_user_id=current_user.id,
-                            property_id=existing_match.id,
-                            unit_id=inv_unit_id_upd,
-                            guest_name=(tenant_name or "").strip(),
-                            guest_email=primary_csv_tenant_email,
-                            stay_start_date=lease_start,
-                            stay_end_date=lease_end,
-                            purpose_of_stay=PurposeOfStay.other,
-                            relationship_to_owner=RelationshipToOwner.other,
-                            region_code=existing_match.region_code,
-                            status="pending",
-                            token_state="STAGED",
-                            invitation_kind=TENANT_INVITE_KIND,
-                            dead_mans_switch_enabled=1,
-                            dead_mans_switch_alert_email=1,
-                            dead_mans_switch_alert_sms=0,
-                            dead_mans_switch_alert_dashboard=1,
-                            dead_mans_switch_alert_phone=0,
-                        )
-                        db.add(inv)
-                        db.flush()
-                        _mark_unit_occupied_after_csv_tenant_invite(db, inv_unit_id_upd)
-                        create_log(
-                            db,
-                            CATEGORY_STATUS_CHANGE,
-                            "Invitation created (async CSV occupied, update)",
-                            f"Invite ID {inv_code} created (token_state=STAGED, pending record) for property {existing_match.id}, tenant {tenant_name}, lease {lease_start}\u2013{lease_end}.",
-                            property_id=existing_match.id,
-                            invitation_id=inv.id,
-                            actor_user_id=current_user.id,
-                            actor_email=current_user.email,
-                            meta={"invitation_code": inv_code, "token_state": "STAGED", "guest_name": (tenant_name or "").strip(), "lease_start": str(lease_start), "lease_end": str(lease_end)},
-                        )
-                        _ul_au = str(occupied_unit_raw).strip() if occupied_unit_raw else None
-                        if not _ul_au and inv_unit_id_upd:
-                            _ur_au = db.query(Unit).filter(Unit.id == inv_unit_id_upd).first()
-                            _ul_au = (_ur_au.unit_label if _ur_au else None) or None
-                        _inv_addr_au = _csv_bulk_address_line(
-                            existing_match.street or "", existing_match.city or "", existing_match.state or "", existing_match.zip_code
-                        )
-                        create_ledger_event(
-                            db,
-                            ACTION_INVITATION_CREATED_CSV,
-                            target_object_type="Invitation",
-                            target_object_id=inv.id,
-                            property_id=existing_match.id,
-                            unit_id=inv_unit_id_upd,
-                            invitation_id=inv.id,
-                            actor_user_id=current_user.id,
-                            meta=_ledger_meta_bulk_csv_invitation(
-                                property_name=(existing_match.name or address_as_name or "").strip() or address_as_name,
-                                property_address=_inv_addr_au,
-                                unit_label=_ul_au,
-                                tenant_name=(tenant_name or "").strip(),
-                                invitation_code=inv_code,
-                                lease_start=lease_start,
-                                lease_end=lease_end,
-                                csv_row=row_num,
-                            ),
-                        )
-                        auto_email_tenant_invitation_if_addressed(
-                            db,
-                            inv,
-                            existing_match,
-                            tenant_display_name=(tenant_name or "").strip(),
-                            ip=None,
-                            ua=None,
-                            actor_user_id=current_user.id,
-                            actor_email=current_user.email,
-                        )
-                        if inv_unit_id_upd is not None:
-                            _bulk_csv_append_co_tenant_invitations(
-                                db,
-                                prop=existing_match,
-                                current_user=current_user,
-                                inv_unit_id=int(inv_unit_id_upd),
-                                lease_start=lease_start,
-                                lease_end=lease_end,
-                                co_tenants=co_tenants,
-                                row_num=row_num,
-                                request=None,
-                                occupied_unit_raw=occupied_unit_raw,
-                                property_name_for_ledger=(existing_match.name or address_as_name or "").strip() or address_as_name,
-                            )
-                db.commit()
-
-            # Ensure every row in a multi-unit group creates/ensures a Unit row (even vacant),
-            # so the UI shows the correct unit count.
-            if existing_match is not None and treat_as_multi_unit:
-                if existing_match.id not in units_by_property_id:
-                    unit_rows = db.query(Unit).filter(Unit.property_id == existing_match.id).all()
-                    units_by_property_id[existing_match.id] = {str(u.unit_label): int(u.id) for u in unit_rows if u.unit_label}
-                label_map = units_by_property_id[existing_match.id]
-                preferred_label = (occupied_unit_raw or unit_no or "").strip()
-                unit_label = preferred_label if preferred_label else _next_auto_unit_label(set(label_map.keys()))
-                if unit_label not in label_map:
-                    u = Unit(
-                        property_id=existing_match.id,
-                        unit_label=unit_label,
-                        occupancy_status=OccupancyStatus.vacant.value,
-                        is_primary_residence=0,
-                    )
-                    db.add(u)
-                    db.flush()
-                    label_map[unit_label] = int(u.id)
-                    units_created += 1
-                    if not existing_match.is_multi_unit and len(label_map) > 1:
-                        existing_match.is_multi_unit = True
-                    db.commit()
-
-            job.processed_rows = idx
-            job.created = created
-            job.updated = updated
-            db.commit()
-
-        job.status = "completed"
-        job.created = created
-        job.updated = updated
-        job.failed_from_row = failed_from_row
-        job.failure_reason = failure_reason
-        job.completed_at = datetime.now(tz.utc)
-        db.commit()
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulk-upload") as pool:
+                    futures = [pool.submit(_ingest, groups) for groups in chunks]
+                    try:
+                        for fut in as_completed(futures):
+                            _record(fut.result())
+                    except BaseException:
+                        for fut in futures:
+                            fut.cancel()
+                        raise
+
+        if not _bulk_upload_job_progress(
+            db,
+            job.id,
+            lease,
+            status="completed",
+            failed_from_row=failed_from_row,
+            failure_reason=failure_reason,
+            completed_at=datetime.now(tz.utc),
+        ):
+            raise _BulkUploadLeaseLost()
+        logger.info(
+            "[BulkUpload] job_key=%s completed created=%s updated=%s units_created=%s failed_from_row=%s",
+            job_key,
+            created,
+            updated,
+            units_created,
+            failed_from_row,
+        )
 
         # Trigger billing (subscription + sync) — matches the sync bulk upload path
         if created >= 1 or updated >= 1:
@@ -2336,14 +2558,23 @@ def _process_bulk_upload_background(job_key: str, csv_text: str, user_id: int):
                 import traceback
                 print(f"[AsyncBulkUpload] Billing post-processing FAILED: {e}\n{traceback.format_exc()}", flush=True)
 
+    except _BulkUploadLeaseLost:
+        db.rollback()
+        logger.warning("[BulkUpload] job_key=%s taken over by another run (lease %s); this run stops", job_key, lease)
     except Exception as e:
         try:
+            db.rollback()
             job = db.query(BulkUploadJob).filter(BulkUploadJob.job_key == job_key).first()
             if job:
-                job.status = "failed"
-                job.error_message = str(e)[:500]
-                job.completed_at = datetime.now(tz.utc)
-                db.commit()
+                # A run that has lost the job must not fail the run that took it over.
+                _bulk_upload_job_progress(
+                    db,
+                    job.id,
+                    (job.attempts or 0) if lease is None else lease,
+                    status="failed",
+                    error_message=str(e)[:500],
+                    completed_at=datetime.now(tz.utc),
+                )
         except Exception:
             pass
     finally:
@@ -2356,7 +2587,7 @@ def bulk_upload_properties_async(
     background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Accept CSV for bulk upload and process asynchronously. Returns a job_id to poll for status."""
     from app.models.bulk_upload_job import BulkUploadJob
@@ -2390,6 +2621,8 @@ def bulk_upload_properties_async(
         csv_content=text,
         total_rows=len(rows),
         processed_rows=0,
+        attempts=1,
+        heartbeat_at=datetime.now(timezone.utc),
     )
     db.add(job)
     db.commit()
@@ -2400,7 +2633,7 @@ def bulk_upload_properties_async(
         len(rows),
         current_user.id,
     )
-    background_tasks.add_task(_process_bulk_upload_background, job_key, text, current_user.id)
+    background_tasks.add_task(_process_bulk_upload_background, job_key, text, current_user.id, lease=1)
 
     return BulkUploadJobResponse(job_id=job_key, total_rows=len(rows))
 
@@ -2409,7 +2642,7 @@ def bulk_upload_properties_async(
 def get_bulk_upload_status(
     job_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Poll for async bulk upload job status."""
     from app.models.bulk_upload_job import BulkUploadJob
@@ -2427,19 +2660,136 @@ def get_bulk_upload_status(
         processed_rows=job.processed_rows or 0,
         created=job.created,
         updated=job.updated,
-        # We don't persist units_created in DB (no migration); approximate as processed rows.
-        units_created=job.processed_rows or 0,
+        units_created=job.units_created or 0,
         failed_from_row=job.failed_from_row,
         failure_reason=job.failure_reason,
         error_message=job.error_message,
     )
 
 
+def _bulk_upload_job_is_stale(job, now: datetime) -> bool:
+    """True when a "processing" job has committed no progress for bulk_upload_stale_after_seconds (worker gone)."""
+    last = job.heartbeat_at or job.created_at
+    if last is None:
+        return True
+    if last.tzinfo is None:
+        last = last.replace(tzinfo=timezone.utc)
+    return (now - last).total_seconds() >= get_settings().bulk_upload_stale_after_seconds
+
+
+def _claim_bulk_upload_job(db: Session, job) -> int | None:
+    """Take over ``job`` for a new worker run. Compare-and-set on ``attempts``, so when several processes sweep
+    (or a sweep races the resume endpoint) only one of them starts a run.
+
+    Returns the new run's lease (the new ``attempts`` value), or None when another process claimed the job first."""
+    from app.models.bulk_upload_job import BulkUploadJob
+
+    seen = job.attempts or 0
+    claimed = (
+        db.query(BulkUploadJob)
+        .filter(BulkUploadJob.id == job.id, func.coalesce(BulkUploadJob.attempts, 0) == seen)
+        .update(
+            {
+                BulkUploadJob.attempts: seen + 1,
+                BulkUploadJob.status: "processing",
+                BulkUploadJob.heartbeat_at: datetime.now(timezone.utc),
+                BulkUploadJob.error_message: None,
+                BulkUploadJob.completed_at: None,
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return seen + 1 if claimed == 1 else None
+
+
+def resume_orphaned_bulk_upload_jobs(*, session_factory=None, run_inline: bool = False) -> dict[str, int]:
+    """Sweep async bulk upload jobs left in "processing" by a dead worker or a restart (stale heartbeat).
+
+    Each orphan is resumed from its committed groups in a new worker thread, or marked failed once it has used
+    bulk_upload_max_attempts runs (the owner can still resume it from the status screen). Runs at startup and
+    periodically from the scheduler. ``run_inline`` runs resumed jobs in the calling thread (scripts / tests)."""
+    from app.database import get_background_job_session
+    from app.models.bulk_upload_job import BulkUploadJob
+
+    settings = get_settings()
+    now = datetime.now(timezone.utc)
+    resumed: list[tuple[str, str, int, int]] = []
+    failed = 0
+    db = session_factory() if session_factory else get_background_job_session()
+    try:
+        for job in db.query(BulkUploadJob).filter(BulkUploadJob.status == "processing").all():
+            if not _bulk_upload_job_is_stale(job, now):
+                continue
+            if (job.attempts or 0) >= settings.bulk_upload_max_attempts or not job.csv_content:
+                job.status = "failed"
+                job.error_message = (
+                    f"Import was interrupted {job.attempts or 0} times and stopped. "
+                    "Rows already imported are kept; resume the upload to continue."
+                )
+                job.completed_at = now
+                db.commit()
+                failed += 1
+                logger.warning("[BulkUpload] sweep: job_key=%s failed after %s attempts", job.job_key, job.attempts)
+                continue
+            lease = _claim_bulk_upload_job(db, job)
+            if lease is not None:
+                resumed.append((job.job_key, job.csv_content, job.user_id, lease))
+    finally:
+        db.close()
+
+    for job_key, csv_text, user_id, lease in resumed:
+        logger.info("[BulkUpload] sweep: resuming orphaned job_key=%s", job_key)
+        if run_inline:
+            _process_bulk_upload_background(job_key, csv_text, user_id, session_factory=session_factory, lease=lease)
+        else:
+            threading.Thread(
+                target=_process_bulk_upload_background,
+                args=(job_key, csv_text, user_id),
+                kwargs={"lease": lease},
+                name=f"bulk-upload-resume-{job_key[:8]}",
+                daemon=True,
+            ).start()
+    return {"resumed": len(resumed), "failed": failed}
+
+
+@router.post("/properties/bulk-upload-resume/{job_id}", response_model=BulkUploadJobResponse)
+def resume_bulk_upload(
+    job_id: str,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
+):
+    """Resume an interrupted async bulk upload from its last committed property group (no re-upload; rows already
+    imported are not imported again)."""
+    from app.models.bulk_upload_job import BulkUploadJob
+
+    job = db.query(BulkUploadJob).filter(
+        BulkUploadJob.job_key == job_id,
+        BulkUploadJob.user_id == current_user.id,
+    ).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status == "completed":
+        raise HTTPException(status_code=409, detail="This upload already completed.")
+    if job.status == "processing" and not _bulk_upload_job_is_stale(job, datetime.now(timezone.utc)):
+        raise HTTPException(status_code=409, detail="This upload is still processing.")
+    lease = _claim_bulk_upload_job(db, job)
+    if lease is None:
+        raise HTTPException(status_code=409, detail="This upload is already being resumed.")
+
+    logger.info("[BulkUpload] resume requested job_key=%s user_id=%s", job.job_key, current_user.id)
+    background_tasks.add_task(
+        _process_bulk_upload_background, job.job_key, job.csv_content, current_user.id, lease=lease
+    )
+    return BulkUploadJobResponse(job_id=job.job_key, total_rows=job.total_rows or 0)
+
+
 @router.get("/properties/{property_id}", response_model=PropertyResponse)
 def get_property(
     property_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     print(f"[PropertyFlow] get_property: property_id={property_id}")
     profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == current_user.id).first()
@@ -2468,8 +2818,9 @@ def get_property(
     from app.services.unit_display_order import query_units_for_property_ordered
 
     units = query_units_for_property_ordered(db, property_id).all()
-    payload["occupancy_status"] = get_property_display_occupancy_status(db, prop, units)
-    occupied_units = count_effectively_occupied_units(db, units) if units else (1 if (payload["occupancy_status"] or "").lower() == OccupancyStatus.occupied.value else 0)
+    occupancy = resolve_units_occupancy(db, units, property_ids=[prop.id])
+    payload["occupancy_status"] = occupancy.property_status(prop, units)
+    occupied_units = occupancy.occupied_count(units) if units else (1 if (payload["occupancy_status"] or "").lower() == OccupancyStatus.occupied.value else 0)
     total_units = len(units) if units else (1 if not getattr(prop, "is_multi_unit", False) else 0)
     payload["unit_count"] = total_units or payload.get("unit_count") or 1
     payload["occupied_unit_count"] = occupied_units
@@ -2509,7 +2860,7 @@ class UnitSummary(BaseModel):
 def list_property_units(
     property_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
     context_mode: str = Depends(get_context_mode),
 ):
     """List units for an owner's property. Business mode: no guest names (occupied_by, invite_id) for privacy."""
@@ -2552,11 +2903,15 @@ def list_property_units(
         )
     else:
         occupancy_display = {}
+    unit_statuses = get_property_states(db, [prop.id])[prop.id].unit_statuses
+    if any(u.id not in unit_statuses for u in units):  # unit added by a write whose refresh has not landed yet
+        occupancy = resolve_units_occupancy(db, units)
+        unit_statuses = {u.id: occupancy.unit_status(u.id) for u in units}
     return [
         UnitSummary(
             id=u.id,
             unit_label=u.unit_label,
-            occupancy_status=get_unit_display_occupancy_status(db, u),
+            occupancy_status=unit_statuses[u.id],
             is_primary_residence=bool(getattr(u, "is_primary_residence", 0)),
             occupied_by=occupancy_display.get(u.id, {}).get("occupied_by") if context_mode == "personal" else None,
             invite_id=occupancy_display.get(u.id, {}).get("invite_id") if context_mode == "personal" else None,
@@ -2699,7 +3054,7 @@ def invite_property_transfer(
     data: InvitePropertyTransferRequest,
     request: Request,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Current owner generates a link so another person (invited email) can accept ownership after owner onboarding."""
     profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == current_user.id).first()
@@ -2977,7 +3332,7 @@ class AssignedManagerItem(BaseModel):
 def list_assigned_managers(
     property_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """List property managers assigned to this property. Owner only."""
     profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == current_user.id).first()
@@ -3170,7 +3525,7 @@ def remove_manager_resident_mode(
 def get_property_utilities(
     property_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Return utility providers and authority letters for the property (Utility Bucket)."""
     print(f"[PropertyFlow] get_property_utilities: property_id={property_id}")
@@ -3232,7 +3587,7 @@ def get_property_utilities(
                 letter_content=l.letter_content,
                 email_sent_at=getattr(l, "email_sent_at", None),
                 signed_at=getattr(l, "signed_at", None),
-                has_signed_pdf=bool(getattr(l, "signed_pdf_bytes", None)),
+                has_signed_pdf=l.has_signed_pdf,
             )
             for l in letters
         ],
@@ -3249,7 +3604,7 @@ def set_property_utilities(
     body: SetPropertyUtilitiesRequest,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Save owner-selected utility providers and generate authority letters. Pending (custom) providers are stored for later detail fetch."""
     print(f"[PropertyFlow] set_property_utilities: property_id={property_id}, selected={len(body.selected or [])}, pending={len(body.pending or [])}")
@@ -3404,7 +3759,7 @@ def set_property_utilities(
                 letter_content=l.letter_content,
                 email_sent_at=getattr(l, "email_sent_at", None),
                 signed_at=getattr(l, "signed_at", None),
-                has_signed_pdf=bool(getattr(l, "signed_pdf_bytes", None)),
+                has_signed_pdf=l.has_signed_pdf,
             )
             for l in letters
         ],
@@ -3434,7 +3789,7 @@ def lookup_provider_contacts(
     background_tasks: BackgroundTasks,
     body: ProviderContactsLookupRequest | None = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """
     Start a background job to find contact emails for this property's providers (electric/gas/internet)
@@ -3464,7 +3819,7 @@ def lookup_provider_contacts(
 def email_authority_letters_to_providers(
     property_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """
     Send authority letter email to each provider that has contact_email (one email per letter with sign link).
@@ -3512,7 +3867,7 @@ def get_authority_letter_signed_pdf_owner(
     property_id: int,
     letter_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Return the signed PDF for an authority letter (owner only). Fetches from Dropbox if not yet in DB."""
     profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == current_user.id).first()
@@ -3530,17 +3885,14 @@ def get_authority_letter_signed_pdf_owner(
     ).first()
     if not letter:
         raise HTTPException(status_code=404, detail="Authority letter not found")
-    if letter.signed_pdf_bytes:
-        return Response(
-            content=letter.signed_pdf_bytes,
-            media_type="application/pdf",
-            headers={"Content-Disposition": f'inline; filename="DocuStay-Authority-Letter-{letter.provider_name or "signed"}.pdf"'},
-        )
+    stored = blob_response(letter, "signed_pdf", media_type="application/pdf", filename=f'DocuStay-Authority-Letter-{letter.provider_name or "signed"}.pdf')
+    if stored is not None:
+        return stored
     if letter.dropbox_sign_request_id:
         pdf_bytes = get_signed_pdf(letter.dropbox_sign_request_id)
         if pdf_bytes:
             from datetime import datetime, timezone
-            letter.signed_pdf_bytes = pdf_bytes
+            store_blob(letter, "signed_pdf", pdf_bytes)
             letter.signed_at = letter.signed_at or datetime.now(timezone.utc)
             db.commit()
             return Response(
@@ -3563,7 +3915,7 @@ def upload_ownership_proof(
     proof_type: str = Form("deed"),
     proof_file: UploadFile = File(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Store ownership verification document (deed, tax bill, etc.) for the property."""
     profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == current_user.id).first()
@@ -3594,7 +3946,7 @@ def upload_ownership_proof(
     prop.ownership_proof_type = proof_type
     prop.ownership_proof_filename = filename
     prop.ownership_proof_content_type = content_type
-    prop.ownership_proof_bytes = contents
+    store_blob(prop, "ownership_proof", contents)
     prop.ownership_proof_uploaded_at = now
     create_log(
         db,
@@ -3626,7 +3978,7 @@ def upload_ownership_proof(
 def get_ownership_proof(
     property_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Return the ownership proof file for viewing/download. For properties without proof, returns 404 (no exception—frontend shows friendly message)."""
     profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == current_user.id).first()
@@ -3638,15 +3990,12 @@ def get_ownership_proof(
     ).first()
     if not prop:
         raise HTTPException(status_code=404, detail="Property not found")
-    if not prop.ownership_proof_bytes:
-        raise HTTPException(status_code=404, detail="No ownership proof uploaded for this property.")
     content_type = prop.ownership_proof_content_type or "application/octet-stream"
     filename = prop.ownership_proof_filename or "proof"
-    return Response(
-        content=bytes(prop.ownership_proof_bytes),
-        media_type=content_type,
-        headers={"Content-Disposition": f'inline; filename="{filename}"'},
-    )
+    resp = blob_response(prop, "ownership_proof", media_type=content_type, filename=filename)
+    if resp is None:
+        raise HTTPException(status_code=404, detail="No ownership proof uploaded for this property.")
+    return resp
 
 
 def _get_owner_property(property_id: int, profile: OwnerProfile, db: Session) -> Property | None:
@@ -3695,8 +4044,9 @@ def _reconcile_property_occupancy_after_mutation(db: Session, prop: Property) ->
     """Align Property.occupancy_status with effective unit occupancy (clears stale ``occupied`` rows)."""
     clear_stored_unit_occupied_without_lease_or_stay(db, prop.id)
     units = db.query(Unit).filter(Unit.property_id == prop.id).all()
-    occ_count = count_effectively_occupied_units(db, units) if units else 0
-    eff = get_property_display_occupancy_status(db, prop, units)
+    occupancy = resolve_units_occupancy(db, units, property_ids=[prop.id])
+    occ_count = occupancy.occupied_count(units)
+    eff = occupancy.property_status(prop, units)
     if occ_count == 0 and (eff or "").lower() == OccupancyStatus.occupied.value:
         eff = normalize_occupancy_status_for_display(db, prop.id, None, OccupancyStatus.vacant.value)
     prop.occupancy_status = eff
@@ -3774,7 +4124,7 @@ def update_property(
     property_id: int,
     data: PropertyUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
     context_mode: str = Depends(get_context_mode),
 ):
     profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == current_user.id).first()
@@ -4025,7 +4375,7 @@ def delete_property(
     request: Request,
     property_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Soft-delete property: set deleted_at so it is hidden from dashboard and invite list; can be reactivated.
     Allowed even when a guest stay or tenant lease is still on file — stays, assignments, and ledger rows are not removed.
@@ -4079,7 +4429,7 @@ def reactivate_property(
     request: Request,
     property_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Reactivate an inactive (soft-deleted) property so it appears in dashboard and invite list again."""
     profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == current_user.id).first()
@@ -4401,7 +4751,7 @@ def owner_create_tenant_lease_extension(
     request: Request,
     data: TenantLeaseExtensionRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Offer a lease extension: pending invitation only; tenant accepts while logged in. Same TenantAssignment row (no DB FK)."""
     profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == current_user.id).first()
@@ -4548,7 +4898,7 @@ def owner_invite_tenant_by_property(
     request: Request,
     data: InviteTenantRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Create a tenant invitation for a single-unit property (no Unit rows). Creates invitation with unit_id=null."""
     profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == current_user.id).first()
@@ -4682,7 +5032,7 @@ def owner_invite_tenant(
     request: Request,
     data: InviteTenantRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Create an invitation for a tenant to register. Owner must own the property that contains the unit."""
     unit = db.query(Unit).filter(Unit.id == unit_id).first()
@@ -4798,7 +5148,7 @@ def owner_send_tenant_invite_email(
     request: Request,
     body: SendTenantInviteEmailBody,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_owner_onboarding_complete),
+    current_user: Principal = Depends(require_owner_onboarding_complete_principal),
 ):
     """Email an existing tenant invitation link (e.g. from CSV bulk upload). Saves the tenant email on the invitation."""
     inv = db.query(Invitation).filter(Invitation.id == invitation_id).first()
@@ -4925,7 +5275,7 @@ def get_invitation_details(
                 .filter(
                     AgreementSignature.invitation_code == code,
                     AgreementSignature.dropbox_sign_request_id.isnot(None),
-                    AgreementSignature.signed_pdf_bytes.is_(None),
+                    ~AgreementSignature.has_signed_pdf,
                 )
                 .first()
                 is not None
@@ -1,13 +1,18 @@
 """Public API (no auth): live property page by slug – evidence view; verify portal."""
+import hashlib
+from dataclasses import dataclass
 from datetime import date, datetime, timezone
+from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import Response
 from sqlalchemy.orm import Session
 from sqlalchemy import func, or_
 
+from app.config import get_settings
 from app.database import get_db
-from app.dependencies import get_optional_current_user
+from app.dependencies import get_optional_current_user, require_owner_or_manager_principal
+from app.services.principal_cache import Principal
 from app.models.owner import Property, OwnerProfile, OccupancyStatus
 from app.models.unit import Unit
 from app.models.user import User, UserRole
@@ -20,6 +25,7 @@ from app.models.owner_poa_signature import OwnerPOASignature
 from app.models.agreement_signature import AgreementSignature
 from app.models.property_manager_assignment import PropertyManagerAssignment
 from app.services.agreements import agreement_content_to_pdf, fill_guest_signature_in_content, poa_content_with_signature
+from app.services.blob_store import blob_response, store_blob
 from app.services.invitation_kinds import (
     is_property_invited_tenant_signup_kind,
     normalize_invitation_kind,
@@ -28,7 +34,7 @@ from app.services.invitation_kinds import (
 from app.services.tenant_lease_cohort import map_assignment_id_to_cohort_key
 from app.services.dropbox_sign import get_signed_pdf
 from app.services.invitation_agreement_ledger import emit_invitation_agreement_signed_if_dropbox_complete
-from app.services.audit_log import create_log, CATEGORY_VERIFY_ATTEMPT, CATEGORY_FAILED_ATTEMPT
+from app.services.audit_log import CATEGORY_VERIFY_ATTEMPT, CATEGORY_FAILED_ATTEMPT
 from app.services.event_ledger import (
     ACTION_AWAY_ACTIVATED,
     ACTION_AWAY_ENDED,
@@ -36,6 +42,7 @@ from app.services.event_ledger import (
     TENANT_LIVE_PAGE_EXCLUDED_OWNER_ACTIONS,
     build_ledger_display_resolution_context,
     create_ledger_event,
+    create_ledger_events,
     ledger_event_to_display,
     ledger_record_disclosure_lines,
     _scrub_emails_for_timeline_display,
@@ -43,16 +50,21 @@ from app.services.event_ledger import (
     ACTION_VERIFY_ATTEMPT_FAILED,
 )
 from app.services.property_live_ledger import merged_public_property_ledger_rows
+from app.services.token_verification import find_invitation_by_token, find_invitations_by_tokens, normalize_token_id
+from app.services.verify_attempt_log import VerifyAttempt, log_verify_attempt
+from app.services.permissions import get_authz_context
+from app.services.rate_limit import consume as consume_rate_limit
+from app.services.live_page_cache import get_cached, live_page_ledger_mark, live_page_version, put_cached
+from app.services.sql_profiler import query_budget
 from app.services.owner_live_slug import resolve_owner_live_slug_row
 from app.services.tenant_live_slug import resolve_tenant_live_slug_row
 from app.services.guest_live_slug import resolve_guest_live_slug_row
 from app.services.ledger_actor_attribution import audit_actor_attribution
 from app.services.shield_mode_policy import effective_shield_mode_enabled
 from app.services.occupancy import (
-    get_property_display_occupancy_status,
-    get_unit_display_occupancy_status,
+    OccupancySnapshot,
     normalize_occupancy_status_for_display,
-    count_effectively_occupied_units,
+    resolve_units_occupancy,
 )
 from app.services.display_names import (
     label_for_stay,
@@ -86,6 +98,9 @@ from app.schemas.public import (
     PortfolioPropertyItem,
     VerifyRequest,
     VerifyResponse,
+    VerifyBatchRequest,
+    VerifyBatchResult,
+    VerifyBatchResponse,
     VerifyAssignedTenant,
     VerifyGuestAuthorization,
 )
@@ -293,7 +308,7 @@ def _signed_agreement_offer_for_stay(db: Session, slug: str, stay: Stay) -> tupl
     sig = _agreement_signature_for_stay(db, stay)
     if not sig:
         return False, None
-    if not (getattr(sig, "signed_pdf_bytes", None) or getattr(sig, "dropbox_sign_request_id", None)):
+    if not (sig.has_signed_pdf or getattr(sig, "dropbox_sign_request_id", None)):
         return False, None
     return True, f"/public/live/{slug}/signed-agreement?stay_id={stay.id}"
 
@@ -311,7 +326,7 @@ def _verify_signed_agreement_offer_for_invite_code(db: Session, invitation_code:
     )
     if not sig:
         return False, None
-    if not (getattr(sig, "signed_pdf_bytes", None) or getattr(sig, "dropbox_sign_request_id", None)):
+    if not (sig.has_signed_pdf or getattr(sig, "dropbox_sign_request_id", None)):
         return False, None
     return True, f"/public/verify/{code}/signed-agreement"
 
@@ -586,11 +601,18 @@ def _live_tenant_summary_for_logged_in_tenant(
     return out, assignee_s, period_s
 
 
-def _live_occupying_tenants_for_property(db: Session, property_id: int, today: date) -> list[LiveTenantAssignmentInfo]:
+def _live_occupying_tenants_for_property(
+    db: Session,
+    property_id: int,
+    today: date,
+    *,
+    occupancy: OccupancySnapshot | None = None,
+) -> list[LiveTenantAssignmentInfo]:
     """
     Tenant lease rows for live page tenant sections:
     - active/in-window assignments (occupying) per get_units_occupancy_display priority
     - accepted/future assignments (start_date > today) so upcoming accepted leases are visible
+    ``occupancy`` (already resolved for this property's units) avoids resolving occupancy sources again.
     """
     from app.services.occupancy import get_units_occupancy_sources
     from app.services.unit_display_order import query_units_for_property_ordered
@@ -599,7 +621,10 @@ def _live_occupying_tenants_for_property(db: Session, property_id: int, today: d
     unit_rows = query_units_for_property_ordered(db, property_id).all()
     if unit_rows:
         unit_ids = [u.id for u in unit_rows]
-        sources = get_units_occupancy_sources(db, unit_ids, guest_detail_unit_ids=None)
+        if occupancy is not None and all(uid in occupancy.units for uid in unit_ids):
+            sources = {uid: occupancy.occupancy_source(uid) for uid in unit_ids}
+        else:
+            sources = get_units_occupancy_sources(db, unit_ids, guest_detail_unit_ids=None)
         units_by_id = {u.id: u for u in unit_rows}
         out: list[LiveTenantAssignmentInfo] = []
         live_tas = (
@@ -683,7 +708,7 @@ def _response_signed_agreement_pdf(db: Session, sig: AgreementSignature) -> Resp
     if getattr(sig, "dropbox_sign_request_id", None):
         pdf_bytes = get_signed_pdf(sig.dropbox_sign_request_id)
         if pdf_bytes:
-            sig.signed_pdf_bytes = pdf_bytes
+            store_blob(sig, "signed_pdf", pdf_bytes)
             emit_invitation_agreement_signed_if_dropbox_complete(db, sig)
             db.commit()
             return Response(
@@ -695,18 +720,15 @@ def _response_signed_agreement_pdf(db: Session, sig: AgreementSignature) -> Resp
             status_code=404,
             detail="Document not yet signed. Please complete signing in the link we sent you.",
         )
-    if sig.signed_pdf_bytes:
-        return Response(
-            content=sig.signed_pdf_bytes,
-            media_type="application/pdf",
-            headers={"Content-Disposition": f'inline; filename="DocuStay-Signed-{sig.invitation_code}.pdf"'},
-        )
+    stored = blob_response(sig, "signed_pdf", media_type="application/pdf", filename=f'DocuStay-Signed-{sig.invitation_code}.pdf')
+    if stored is not None:
+        return stored
     date_str = sig.signed_at.strftime("%Y-%m-%d") if sig.signed_at else ""
     content = fill_guest_signature_in_content(
         sig.document_content, sig.typed_signature, date_str, getattr(sig, "ip_address", None)
     )
     pdf_bytes = agreement_content_to_pdf(sig.document_title, content)
-    sig.signed_pdf_bytes = pdf_bytes
+    store_blob(sig, "signed_pdf", pdf_bytes)
     db.commit()
     return Response(
         content=pdf_bytes,
@@ -715,15 +737,166 @@ def _response_signed_agreement_pdf(db: Session, sig: AgreementSignature) -> Resp
     )
 
 
+@dataclass(frozen=True)
+class _LiveUnit:
+    """Detached unit row for the cached live page base (id / label are all the page reads)."""
+
+    id: int
+    property_id: int
+    unit_label: str | None
+
+
+@dataclass(frozen=True)
+class _LivePropertyBase:
+    """Viewer-independent part of the live page; shared between requests through app.services.live_page_cache."""
+
+    owner_info: LiveOwnerInfo
+    property_managers: tuple[LivePropertyManagerInfo, ...]
+    units: tuple[_LiveUnit, ...]
+    occupancy: OccupancySnapshot
+    unit_statuses: tuple[LiveUnitOccupancyStatus, ...]
+    jurisdiction_wrap: JurisdictionWrap | None
+    poa_signed_at: datetime | None
+    poa_signature_id: int | None
+    poa_typed_signature: str | None
+    tenant_assignments: tuple[LiveTenantAssignmentInfo, ...]
+
+
+def _live_property_base(
+    db: Session, prop: Property, *, today: date, ledger_mark: int | None
+) -> _LivePropertyBase | None:
+    """Owner / manager cards, units and occupancy, jurisdiction wrap, POA and public tenant rows for ``prop``.
+    None when the owner profile is missing."""
+    key = ("base", prop.id)
+    cached = get_cached(key, prop.id, day=today, ledger_mark=ledger_mark)
+    if cached is not None:
+        return cached
+    version = live_page_version(prop.id)
+    profile = db.query(OwnerProfile).filter(OwnerProfile.id == prop.owner_profile_id).first()
+    if not profile:
+        return None
+    owner_user = db.query(User).filter(User.id == profile.user_id).first()
+    owner_name = (owner_user.full_name if owner_user else None) or None
+    _raw_email = (getattr(owner_user, "email", None) or "") if owner_user else ""
+    owner_email = str(_raw_email).strip()
+    owner_phone = getattr(owner_user, "phone", None) if owner_user else None
+    owner_info = LiveOwnerInfo(full_name=owner_name, email=owner_email, phone=owner_phone)
+
+    mgr_assignments = db.query(PropertyManagerAssignment).filter(PropertyManagerAssignment.property_id == prop.id).all()
+    mgr_user_ids = [a.user_id for a in mgr_assignments]
+    mgr_users = (
+        db.query(User)
+        .filter(User.id.in_(mgr_user_ids), User.role == UserRole.property_manager)
+        .all()
+        if mgr_user_ids
+        else []
+    )
+    property_managers = tuple(
+        LivePropertyManagerInfo(
+            full_name=(u.full_name or "").strip() or None,
+            email=(u.email or "").strip(),
+        )
+        for u in mgr_users
+        if (u.email or "").strip()
+    )
+
+    from app.services.unit_display_order import query_units_for_property_ordered
+
+    unit_rows = query_units_for_property_ordered(db, prop.id).all()
+    occupancy = resolve_units_occupancy(db, unit_rows, today, property_ids=[prop.id])
+    unit_statuses = tuple(
+        LiveUnitOccupancyStatus(
+            unit_label=(u.unit_label or "").strip() or "—",
+            occupancy_status=occupancy.unit_status(u.id),
+        )
+        for u in unit_rows
+    )
+
+    # Jurisdictional wrap: applicable law for this property (zip → region → statutes)
+    jurisdiction_wrap = None
+    from app.services.jurisdiction_sot import get_jurisdiction_for_property
+    jinfo = get_jurisdiction_for_property(db, prop.zip_code, prop.region_code)
+    if jinfo:
+        jurisdiction_wrap = JurisdictionWrap(
+            state_name=jinfo.name,
+            applicable_statutes=[
+                JurisdictionStatuteView(citation=s.citation, plain_english=s.plain_english)
+                for s in jinfo.statutes
+            ],
+            removal_guest_text=jinfo.removal_guest_text,
+            removal_tenant_text=jinfo.removal_tenant_text,
+            agreement_type=jinfo.agreement_type,
+        )
+
+    # POA for Authority layer
+    poa_signed_at: datetime | None = None
+    poa_signature_id: int | None = None
+    poa_typed_signature: str | None = None
+    if profile.user_id:
+        poa_sig = (
+            db.query(OwnerPOASignature)
+            .filter(OwnerPOASignature.used_by_user_id == profile.user_id)
+            .first()
+        )
+        if poa_sig:
+            poa_signed_at = poa_sig.signed_at
+            poa_signature_id = poa_sig.id
+            poa_typed_signature = (poa_sig.typed_signature or "").strip() or None
+
+    base = _LivePropertyBase(
+        owner_info=owner_info,
+        property_managers=property_managers,
+        units=tuple(_LiveUnit(id=u.id, property_id=u.property_id, unit_label=u.unit_label) for u in unit_rows),
+        occupancy=occupancy,
+        unit_statuses=unit_statuses,
+        jurisdiction_wrap=jurisdiction_wrap,
+        poa_signed_at=poa_signed_at,
+        poa_signature_id=poa_signature_id,
+        poa_typed_signature=poa_typed_signature,
+        tenant_assignments=tuple(_live_occupying_tenants_for_property(db, prop.id, today, occupancy=occupancy)),
+    )
+    put_cached(key, prop.id, base, version=version, day=today, ledger_mark=ledger_mark)
+    return base
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """``If-None-Match`` (weak comparison, as RFC 9110 specifies for this header) against ``etag``."""
+    raw = request.headers.get("if-none-match")
+    if not raw:
+        return False
+    if raw.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(t.strip().removeprefix("W/") == bare for t in raw.split(","))
+
+
+def _live_page_response(request: Request, etag: str, body: bytes, *, shared: bool) -> Response:
+    headers = {
+        "ETag": etag,
+        # Revalidate every time (the page is evidence); anonymous property links may sit in shared caches.
+        "Cache-Control": "public, no-cache" if shared else "private, no-cache",
+        "Vary": "Authorization",
+    }
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get("/live/{slug}", response_model=LivePropertyPagePayload)
+@query_budget(150)
 def get_live_property_page(
     slug: str,
+    request: Request,
     db: Session = Depends(get_db),
     viewer: User | None = Depends(get_optional_current_user),
 ):
     """
     Public live property page by unique slug. Optional Bearer token: when the viewer is a tenant
     assigned to this property, the tenant summary card shows their assignment(s) instead of public occupancy.
+
+    Responses carry a strong ETag; a matching ``If-None-Match`` gets 304. Anonymous property links are served from
+    the live page cache until a write to the property invalidates them; tenant / guest links and signed-in viewers
+    reuse the cached viewer-independent base and build only their scoped parts.
     """
     if not slug or not slug.strip():
         raise HTTPException(status_code=404, detail="Not found")
@@ -731,6 +904,45 @@ def get_live_property_page(
     prop, tenant_slug_user_id, guest_slug_user_id, guest_slug_unit_id = _resolve_live_slug_context(db, slug)
     if not prop:
         raise HTTPException(status_code=404, detail="Property not found")
+    today = date.today()
+    ledger_mark = live_page_ledger_mark(db, prop.id)
+    shared = viewer is None and tenant_slug_user_id is None and guest_slug_user_id is None
+    key = ("page", slug)
+    if shared:
+        hit = get_cached(key, prop.id, day=today, ledger_mark=ledger_mark)
+        if hit is not None:
+            return _live_page_response(request, *hit, shared=True)
+    version = live_page_version(prop.id)
+    payload = _build_live_property_page(
+        db,
+        slug,
+        prop,
+        viewer,
+        tenant_slug_user_id,
+        guest_slug_user_id,
+        guest_slug_unit_id,
+        today=today,
+        ledger_mark=ledger_mark,
+    )
+    body = payload.model_dump_json().encode()
+    etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    if shared:
+        put_cached(key, prop.id, (etag, body), version=version, day=today, ledger_mark=ledger_mark)
+    return _live_page_response(request, etag, body, shared=shared)
+
+
+def _build_live_property_page(
+    db: Session,
+    slug: str,
+    prop: Property,
+    viewer: User | None,
+    tenant_slug_user_id: int | None,
+    guest_slug_user_id: int | None,
+    guest_slug_unit_id: int | None,
+    *,
+    today: date,
+    ledger_mark: int | None,
+) -> LivePropertyPagePayload:
     link_audience = "tenant" if tenant_slug_user_id else ("guest" if guest_slug_user_id else "property")
     effective_viewer = viewer
     tenant_slug_email_lower = ""
@@ -746,51 +958,22 @@ def get_live_property_page(
             effective_viewer = guest_slug_user
             guest_slug_user_email_lower = (guest_slug_user.email or "").strip().lower()
 
-    profile = db.query(OwnerProfile).filter(OwnerProfile.id == prop.owner_profile_id).first()
-    if not profile:
+    base = _live_property_base(db, prop, today=today, ledger_mark=ledger_mark)
+    if base is None:
         raise HTTPException(status_code=404, detail="Property not found")
-    owner_user = db.query(User).filter(User.id == profile.user_id).first()
-    owner_name = (owner_user.full_name if owner_user else None) or None
-    _raw_email = (getattr(owner_user, "email", None) or "") if owner_user else ""
-    owner_email = str(_raw_email).strip()
-    owner_phone = getattr(owner_user, "phone", None) if owner_user else None
-    owner_info = LiveOwnerInfo(full_name=owner_name, email=owner_email, phone=owner_phone)
-
-    mgr_assignments = db.query(PropertyManagerAssignment).filter(PropertyManagerAssignment.property_id == prop.id).all()
-    mgr_user_ids = [a.user_id for a in mgr_assignments]
-    mgr_users = (
-        db.query(User)
-        .filter(User.id.in_(mgr_user_ids), User.role == UserRole.property_manager)
-        .all()
-        if mgr_user_ids
-        else []
-    )
-    property_managers = [
-        LivePropertyManagerInfo(
-            full_name=(u.full_name or "").strip() or None,
-            email=(u.email or "").strip(),
-        )
-        for u in mgr_users
-        if (u.email or "").strip()
-    ]
+    owner_info = base.owner_info
+    property_managers = list(base.property_managers)
 
     token_state = getattr(prop, "usat_token_state", None) or "staged"
-    from app.services.unit_display_order import query_units_for_property_ordered
-
-    units_for_live = query_units_for_property_ordered(db, prop.id).all()
-    unit_statuses_for_live = [
-        LiveUnitOccupancyStatus(
-            unit_label=(u.unit_label or "").strip() or "—",
-            occupancy_status=get_unit_display_occupancy_status(db, u),
-        )
-        for u in units_for_live
-    ]
-    display_occupancy = get_property_display_occupancy_status(db, prop, units_for_live)
+    units_for_live = list(base.units)
+    live_occupancy = base.occupancy
+    unit_statuses_for_live = list(base.unit_statuses)
+    display_occupancy = live_occupancy.property_status(prop, units_for_live)
     owner_occ_flag = bool(getattr(prop, "owner_occupied", False))
     is_multi = bool(getattr(prop, "is_multi_unit", False))
     occ_lower = (display_occupancy or "").lower()
     occupied_units = (
-        count_effectively_occupied_units(db, units_for_live)
+        live_occupancy.occupied_count(units_for_live)
         if units_for_live
         else (1 if occ_lower == OccupancyStatus.occupied.value else 0)
     )
@@ -841,38 +1024,11 @@ def get_live_property_page(
         **inv_count_fields,
     )
 
-    # Jurisdictional wrap: applicable law for this property (zip → region → statutes)
-    jurisdiction_wrap = None
-    from app.services.jurisdiction_sot import get_jurisdiction_for_property
-    jinfo = get_jurisdiction_for_property(db, prop.zip_code, prop.region_code)
-    if jinfo:
-        jurisdiction_wrap = JurisdictionWrap(
-            state_name=jinfo.name,
-            applicable_statutes=[
-                JurisdictionStatuteView(citation=s.citation, plain_english=s.plain_english)
-                for s in jinfo.statutes
-            ],
-            removal_guest_text=jinfo.removal_guest_text,
-            removal_tenant_text=jinfo.removal_tenant_text,
-            agreement_type=jinfo.agreement_type,
-        )
-
-    # POA for Authority layer
-    poa_signed_at: datetime | None = None
-    poa_signature_id: int | None = None
-    poa_typed_signature: str | None = None
-    if profile and profile.user_id:
-        poa_sig = (
-            db.query(OwnerPOASignature)
-            .filter(OwnerPOASignature.used_by_user_id == profile.user_id)
-            .first()
-        )
-        if poa_sig:
-            poa_signed_at = poa_sig.signed_at
-            poa_signature_id = poa_sig.id
-            poa_typed_signature = (poa_sig.typed_signature or "").strip() or None
+    jurisdiction_wrap = base.jurisdiction_wrap
+    poa_signed_at = base.poa_signed_at
+    poa_signature_id = base.poa_signature_id
+    poa_typed_signature = base.poa_typed_signature
 
-    today = date.today()
     allowed_tenant_live_units: list[str] = []
     if tenant_slug_user_id is not None:
         allowed_tenant_live_units = _allowed_unit_labels_active_or_accepted_for_tenant(
@@ -1068,7 +1224,7 @@ def get_live_property_page(
     if guest_slug_user_id is not None:
         scoped_unit_labels = list(allowed_guest_live_units)
 
-    current_tenant_assignments = _live_occupying_tenants_for_property(db, prop.id, today)
+    current_tenant_assignments = list(base.tenant_assignments)
     tenant_summary_assignee, tenant_summary_assignment_period = _tenant_summary_strip(current_tenant_assignments)
     if personalized is not None:
         current_tenant_assignments, tenant_summary_assignee, tenant_summary_assignment_period = personalized
@@ -1290,7 +1446,7 @@ def _build_verify_record(
     )
     signed_agreement_available = False
     signed_agreement_url = None
-    if sig and (sig.signed_pdf_bytes or getattr(sig, "dropbox_sign_request_id", None)):
+    if sig and (sig.has_signed_pdf or getattr(sig, "dropbox_sign_request_id", None)):
         signed_agreement_available = True
         signed_agreement_url = f"/public/verify/{token_id}/signed-agreement"
 
@@ -1427,6 +1583,134 @@ def _build_verify_record(
     )
 
 
+@dataclass(frozen=True)
+class _VerifyOutcome:
+    """Result of checking a resolved token: validity, user-facing reason and the audit row to record."""
+
+    valid: bool
+    reason: str
+    attempt: VerifyAttempt
+
+
+def _property_full_address(prop: Property) -> str:
+    prop_parts = [prop.street, prop.city, prop.state, (prop.zip_code or "").strip()]
+    return ", ".join(p for p in prop_parts if p)
+
+
+def _verify_address_matches(prop: Property, property_address: str) -> bool:
+    """Submitted address matches the property (normalized); either may contain the other (e.g. extra lines)."""
+    norm_prop = _normalize_address(_property_full_address(prop))
+    norm_submitted = _normalize_address(property_address)
+    if norm_prop == norm_submitted:
+        return True
+    return norm_prop in norm_submitted or norm_submitted in norm_prop
+
+
+def _verify_outcome(
+    db: Session,
+    inv: Invitation,
+    prop: Property,
+    stay: Stay | None,
+    *,
+    today: date,
+    ip_address: str | None,
+    user_agent: str | None,
+) -> _VerifyOutcome:
+    """Authorization check for a token whose invitation and property resolved (steps 4-5 of POST /public/verify)."""
+    scope = {"property_id": prop.id, "invitation_id": inv.id, "ip_address": ip_address, "user_agent": user_agent}
+    resolved_inv_status = resolve_invitation_display_status(inv, today=today, db=db)
+    if resolved_inv_status not in ("accepted", "active"):
+        if resolved_inv_status == "cancelled":
+            reason_msg = "Status: CANCELLED — Assignment or invitation was cancelled."
+        elif resolved_inv_status == "expired":
+            reason_msg = "Status: EXPIRED — Invitation or stay has ended."
+        elif resolved_inv_status == "accepted":
+            reason_msg = "Status: ACCEPTED — Invitation accepted; active stay window has not started."
+        else:
+            reason_msg = "Status: PENDING — Invitation not yet accepted."
+        return _VerifyOutcome(False, reason_msg, VerifyAttempt(
+            CATEGORY_VERIFY_ATTEMPT,
+            "Verify attempt – invitation not active",
+            f"Invitation resolved status={resolved_inv_status}",
+            meta={"result": "invalid", "reason": "invitation_not_active", "resolved_status": resolved_inv_status},
+            **scope,
+        ))
+
+    if not stay:
+        inv_kind = (getattr(inv, "invitation_kind", None) or "").strip().lower()
+        if inv_kind == "tenant":
+            ta = db.query(TenantAssignment).filter(TenantAssignment.unit_id == inv.unit_id).first()
+            if ta:
+                ta_start = getattr(ta, "start_date", None) or inv.stay_start_date
+                ta_end = getattr(ta, "end_date", None) or inv.stay_end_date
+                ta_active = ta_start and ta_end and ta_start <= today and ta_end >= today if ta_start and ta_end else bool(ta_start and ta_start <= today)
+                return _VerifyOutcome(
+                    bool(ta_active),
+                    "" if ta_active else "Status: Tenant assignment exists but dates are outside the current period.",
+                    VerifyAttempt(
+                        CATEGORY_VERIFY_ATTEMPT,
+                        "Verify attempt – tenant assignment" + (" (active)" if ta_active else ""),
+                        f"Tenant assignment found for unit {inv.unit_id}",
+                        meta={"result": "valid" if ta_active else "invalid", "reason": "tenant_assignment"},
+                        **scope,
+                    ),
+                )
+        return _VerifyOutcome(False, "Status: PENDING — Agreement signed; stay record not yet created.", VerifyAttempt(
+            CATEGORY_VERIFY_ATTEMPT,
+            "Verify attempt – no stay",
+            "No stay linked to this invitation",
+            meta={"result": "invalid", "reason": "no_stay"},
+            **scope,
+        ))
+
+    for ended, title, message, reason_code, reason_msg in (
+        (getattr(stay, "revoked_at", None) is not None, "Verify attempt – stay revoked", "Stay has been revoked",
+         "stay_revoked", "Status: REVOKED — Authorization was revoked."),
+        (getattr(stay, "checked_out_at", None) is not None, "Verify attempt – guest checked out",
+         "Guest has checked out", "stay_checked_out", "Status: COMPLETED — Guest checked out."),
+        (getattr(stay, "cancelled_at", None) is not None, "Verify attempt – stay cancelled", "Stay was cancelled",
+         "stay_cancelled", "Status: CANCELLED — Stay was cancelled."),
+        (stay.stay_end_date < today, "Verify attempt – stay ended", "Stay end date has passed",
+         "stay_ended", "Status: EXPIRED — Stay end date has passed."),
+    ):
+        if ended:
+            return _VerifyOutcome(False, reason_msg, VerifyAttempt(
+                CATEGORY_VERIFY_ATTEMPT, title, message, stay_id=stay.id,
+                meta={"result": "invalid", "reason": reason_code}, **scope,
+            ))
+
+    return _VerifyOutcome(True, "", VerifyAttempt(
+        CATEGORY_VERIFY_ATTEMPT,
+        "Verify attempt – valid",
+        "Token and address match; active authorization confirmed.",
+        stay_id=stay.id,
+        meta={"result": "valid", "reason": "valid"},
+        **scope,
+    ))
+
+
+def _verify_valid_ledger_event(
+    stay: Stay,
+    prop: Property,
+    inv: Invitation,
+    ip_address: str | None,
+    user_agent: str | None,
+    **meta: Any,
+) -> dict[str, Any]:
+    """``create_ledger_event(s)`` arguments for a valid guest-stay verification."""
+    return {
+        "action_type": ACTION_VERIFY_ATTEMPT_VALID,
+        "target_object_type": "Stay",
+        "target_object_id": stay.id,
+        "property_id": prop.id,
+        "stay_id": stay.id,
+        "invitation_id": inv.id,
+        "meta": {"result": "valid", "reason": "valid", **meta},
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+    }
+
+
 @router.post("/verify", response_model=VerifyResponse)
 def post_verify(
     body: VerifyRequest,
@@ -1435,7 +1719,8 @@ def post_verify(
 ):
     """
     Public verify: check if token (Invitation ID) has an active authorization. Property address is optional;
-    when provided it must match the property associated with the token. No auth. Every attempt is logged.
+    when provided it must match the property associated with the token. No auth. Every attempt is logged
+    (through the buffered verify attempt logger when it is running).
     """
     now = datetime.now(timezone.utc)
     token_id = (body.token_id or "").strip()
@@ -1444,39 +1729,33 @@ def post_verify(
     user_agent = request.headers.get("user-agent")
 
     if not token_id:
-        create_log(
-            db,
+        if not log_verify_attempt(db, VerifyAttempt(
             CATEGORY_FAILED_ATTEMPT,
             "Verify attempt – missing token",
             "token_id empty",
             ip_address=ip_address,
             user_agent=user_agent,
             meta={"result": "invalid", "reason": "missing_input"},
-        )
-        db.commit()
+        )):
+            db.commit()
         return VerifyResponse(
             valid=False,
             reason="Token ID is required.",
             generated_at=now,
         )
 
-    # 1. Look up invitation by token_id (invitation_code), case-insensitive
-    inv = (
-        db.query(Invitation)
-        .filter(func.lower(Invitation.invitation_code) == token_id.lower())
-        .first()
-    )
+    # 1. Look up invitation by token_id (invitation code), case-insensitive (indexed; repeated misses are cached)
+    inv = find_invitation_by_token(db, token_id)
     if not inv:
-        create_log(
-            db,
+        if not log_verify_attempt(db, VerifyAttempt(
             CATEGORY_FAILED_ATTEMPT,
             "Verify attempt – no match",
             f"Token not found: {token_id[:20]}…",
             ip_address=ip_address,
             user_agent=user_agent,
             meta={"result": "invalid", "reason": "token_not_found", "token_id_prefix": token_id[:32]},
-        )
-        db.commit()
+        )):
+            db.commit()
         return VerifyResponse(
             valid=False,
             reason="Token not found.",
@@ -1486,8 +1765,7 @@ def post_verify(
     # 2. Resolve property
     prop = db.query(Property).filter(Property.id == inv.property_id, Property.deleted_at.is_(None)).first()
     if not prop:
-        create_log(
-            db,
+        if not log_verify_attempt(db, VerifyAttempt(
             CATEGORY_FAILED_ATTEMPT,
             "Verify attempt – property not found",
             f"Property missing for invitation {inv.id}",
@@ -1496,8 +1774,8 @@ def post_verify(
             ip_address=ip_address,
             user_agent=user_agent,
             meta={"result": "invalid", "reason": "property_not_found"},
-        )
-        db.commit()
+        )):
+            db.commit()
         return VerifyResponse(
             valid=False,
             reason="Property not found.",
@@ -1505,247 +1783,174 @@ def post_verify(
         )
 
     # 3. Match address when provided (normalized)
-    prop_parts = [prop.street, prop.city, prop.state, (prop.zip_code or "").strip()]
-    prop_full = ", ".join(p for p in prop_parts if p)
-    if property_address:
-        norm_prop = _normalize_address(prop_full)
-        norm_submitted = _normalize_address(property_address)
-        if norm_prop != norm_submitted:
-            # Allow submitted to contain property address (e.g. extra lines) or vice versa
-            if norm_prop not in norm_submitted and norm_submitted not in norm_prop:
-                create_log(
-                    db,
-                    CATEGORY_FAILED_ATTEMPT,
-                    "Identity Conflict",
-                    "Address does not match property for this token.",
-                    property_id=prop.id,
-                    invitation_id=inv.id,
-                    ip_address=ip_address,
-                    user_agent=user_agent,
-                    meta={
-                        "result": "invalid",
-                        "reason": "address_mismatch",
-                        "token_id_prefix": token_id[:32],
-                    },
-                )
-                db.commit()
-                return VerifyResponse(
-                    valid=False,
-                    reason="Address does not match the property for this token.",
-                    generated_at=now,
-                )
-
-    # 4. Stay and validity
-    stay = db.query(Stay).filter(Stay.invitation_id == inv.id).first()
-    today = date.today()
-    token_state = getattr(inv, "token_state", None) or "STAGED"
-    resolved_inv_status = resolve_invitation_display_status(inv, today=today, db=db)
-
-    # Determine validity and reason
-    valid = False
-    reason = ""
-    if resolved_inv_status not in ("accepted", "active"):
-        create_log(
-            db,
-            CATEGORY_VERIFY_ATTEMPT,
-            "Verify attempt – invitation not active",
-            f"Invitation resolved status={resolved_inv_status}",
-            property_id=prop.id,
-            invitation_id=inv.id,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            meta={"result": "invalid", "reason": "invitation_not_active", "resolved_status": resolved_inv_status},
-        )
-        db.commit()
-        if resolved_inv_status == "cancelled":
-            reason_msg = "Status: CANCELLED — Assignment or invitation was cancelled."
-        elif resolved_inv_status == "expired":
-            reason_msg = "Status: EXPIRED — Invitation or stay has ended."
-        elif resolved_inv_status == "accepted":
-            reason_msg = "Status: ACCEPTED — Invitation accepted; active stay window has not started."
-        else:
-            reason_msg = "Status: PENDING — Invitation not yet accepted."
-        return _build_verify_record(
-            db, inv, prop, stay,
-            valid=False,
-            reason=reason_msg,
-            token_id=token_id,
-            now=now,
-        )
-
-    if not stay:
-        inv_kind = (getattr(inv, "invitation_kind", None) or "").strip().lower()
-        if inv_kind == "tenant":
-            ta = db.query(TenantAssignment).filter(TenantAssignment.unit_id == inv.unit_id).first()
-            if ta:
-                tenant = db.query(User).filter(User.id == ta.user_id).first()
-                tenant_name = (tenant.full_name if tenant else None) or (tenant.email if tenant else "Tenant")
-                ta_start = getattr(ta, "start_date", None) or inv.stay_start_date
-                ta_end = getattr(ta, "end_date", None) or inv.stay_end_date
-                ta_active = ta_start and ta_end and ta_start <= today and ta_end >= today if ta_start and ta_end else bool(ta_start and ta_start <= today)
-                create_log(
-                    db,
-                    CATEGORY_VERIFY_ATTEMPT,
-                    "Verify attempt – tenant assignment" + (" (active)" if ta_active else ""),
-                    f"Tenant assignment found for unit {inv.unit_id}",
-                    property_id=prop.id,
-                    invitation_id=inv.id,
-                    ip_address=ip_address,
-                    user_agent=user_agent,
-                    meta={"result": "valid" if ta_active else "invalid", "reason": "tenant_assignment"},
-                )
-                db.commit()
-                return _build_verify_record(
-                    db, inv, prop, None,
-                    valid=ta_active,
-                    reason="" if ta_active else "Status: Tenant assignment exists but dates are outside the current period.",
-                    token_id=token_id,
-                    now=now,
-                )
-        create_log(
-            db,
-            CATEGORY_VERIFY_ATTEMPT,
-            "Verify attempt – no stay",
-            "No stay linked to this invitation",
-            property_id=prop.id,
-            invitation_id=inv.id,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            meta={"result": "invalid", "reason": "no_stay"},
-        )
-        db.commit()
-        return _build_verify_record(
-            db, inv, prop, None,
-            valid=False,
-            reason="Status: PENDING — Agreement signed; stay record not yet created.",
-            token_id=token_id,
-            now=now,
-        )
-
-    if getattr(stay, "revoked_at", None) is not None:
-        create_log(
-            db,
-            CATEGORY_VERIFY_ATTEMPT,
-            "Verify attempt – stay revoked",
-            "Stay has been revoked",
-            property_id=prop.id,
-            stay_id=stay.id,
-            invitation_id=inv.id,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            meta={"result": "invalid", "reason": "stay_revoked"},
-        )
-        db.commit()
-        return _build_verify_record(
-            db, inv, prop, stay,
-            valid=False,
-            reason="Status: REVOKED — Authorization was revoked.",
-            token_id=token_id,
-            now=now,
-        )
-
-    if getattr(stay, "checked_out_at", None) is not None:
-        create_log(
-            db,
-            CATEGORY_VERIFY_ATTEMPT,
-            "Verify attempt – guest checked out",
-            "Guest has checked out",
-            property_id=prop.id,
-            stay_id=stay.id,
-            invitation_id=inv.id,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            meta={"result": "invalid", "reason": "stay_checked_out"},
-        )
-        db.commit()
-        return _build_verify_record(
-            db, inv, prop, stay,
-            valid=False,
-            reason="Status: COMPLETED — Guest checked out.",
-            token_id=token_id,
-            now=now,
-        )
-
-    if getattr(stay, "cancelled_at", None) is not None:
-        create_log(
-            db,
-            CATEGORY_VERIFY_ATTEMPT,
-            "Verify attempt – stay cancelled",
-            "Stay was cancelled",
+    if property_address and not _verify_address_matches(prop, property_address):
+        if not log_verify_attempt(db, VerifyAttempt(
+            CATEGORY_FAILED_ATTEMPT,
+            "Identity Conflict",
+            "Address does not match property for this token.",
             property_id=prop.id,
-            stay_id=stay.id,
             invitation_id=inv.id,
             ip_address=ip_address,
             user_agent=user_agent,
-            meta={"result": "invalid", "reason": "stay_cancelled"},
-        )
-        db.commit()
-        return _build_verify_record(
-            db, inv, prop, stay,
+            meta={
+                "result": "invalid",
+                "reason": "address_mismatch",
+                "token_id_prefix": token_id[:32],
+            },
+        )):
+            db.commit()
+        return VerifyResponse(
             valid=False,
-            reason="Status: CANCELLED — Stay was cancelled.",
-            token_id=token_id,
-            now=now,
+            reason="Address does not match the property for this token.",
+            generated_at=now,
         )
 
-    if stay.stay_end_date < today:
-        create_log(
-            db,
-            CATEGORY_VERIFY_ATTEMPT,
-            "Verify attempt – stay ended",
-            "Stay end date has passed",
-            property_id=prop.id,
-            stay_id=stay.id,
-            invitation_id=inv.id,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            meta={"result": "invalid", "reason": "stay_ended"},
-        )
+    # 4. Stay and validity; 5. valid guest stays are also written to the event ledger
+    stay = db.query(Stay).filter(Stay.invitation_id == inv.id).first()
+    outcome = _verify_outcome(db, inv, prop, stay, today=date.today(), ip_address=ip_address, user_agent=user_agent)
+    buffered = log_verify_attempt(db, outcome.attempt)
+    if outcome.valid and stay is not None:
+        ev = _verify_valid_ledger_event(stay, prop, inv, ip_address, user_agent)
+        create_ledger_event(db, ev.pop("action_type"), **ev)
+        buffered = False
+    if not buffered:
         db.commit()
-        return _build_verify_record(
-            db, inv, prop, stay,
-            valid=False,
-            reason="Status: EXPIRED — Stay end date has passed.",
-            token_id=token_id,
-            now=now,
-        )
-
-    # 5. Valid: log success and build response
-    create_log(
-        db,
-        CATEGORY_VERIFY_ATTEMPT,
-        "Verify attempt – valid",
-        "Token and address match; active authorization confirmed.",
-        property_id=prop.id,
-        stay_id=stay.id,
-        invitation_id=inv.id,
-        ip_address=ip_address,
-        user_agent=user_agent,
-        meta={"result": "valid", "reason": "valid"},
-    )
-    create_ledger_event(
-        db,
-        ACTION_VERIFY_ATTEMPT_VALID,
-        target_object_type="Stay",
-        target_object_id=stay.id,
-        property_id=prop.id,
-        stay_id=stay.id,
-        invitation_id=inv.id,
-        meta={"result": "valid", "reason": "valid"},
-        ip_address=ip_address,
-        user_agent=user_agent,
-    )
-    db.commit()
 
     return _build_verify_record(
         db, inv, prop, stay,
-        valid=True,
-        reason="",
+        valid=outcome.valid,
+        reason=outcome.reason,
         token_id=token_id,
         now=now,
     )
 
 
+@router.post("/verify/batch", response_model=VerifyBatchResponse)
+def post_verify_batch(
+    body: VerifyBatchRequest,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_owner_or_manager_principal),
+):
+    """
+    Batch verify for property managers and partner integrations: the POST /public/verify check for many tokens in
+    one call (at most ``verify_batch_max_tokens``). Owner or manager login required; only tokens for the caller's
+    properties (owned, or assigned to the manager) are resolved, any other token is reported as not found, and each
+    caller may check at most ``verify_batch_rate_limit_tokens`` tokens per ``verify_batch_rate_limit_window_seconds``
+    (429 with Retry-After beyond that). Invitations, properties and stays are loaded with one query each; results are
+    compact (no audit timeline or history) and line up with ``items``. Each token is logged like a single verify
+    attempt, and valid guest stays are written to the event ledger in one insert.
+    """
+    settings = get_settings()
+    max_tokens = settings.verify_batch_max_tokens
+    if len(body.items) > max_tokens:
+        raise HTTPException(status_code=400, detail=f"At most {max_tokens} tokens per batch.")
+    retry_after = consume_rate_limit(
+        ("verify_batch", current_user.id),
+        len(body.items),
+        limit=settings.verify_batch_rate_limit_tokens,
+        window_seconds=settings.verify_batch_rate_limit_window_seconds,
+    )
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many tokens verified recently. Try again later.",
+            headers={"Retry-After": str(retry_after)},
+        )
+    authz = get_authz_context(db, current_user.id)
+    scope = authz.owned_property_ids if current_user.role == UserRole.owner else authz.managed_property_ids
+    now = datetime.now(timezone.utc)
+    today = date.today()
+    ip_address = request.client.host if request.client else None
+    user_agent = request.headers.get("user-agent")
+
+    invs = find_invitations_by_tokens(db, (item.token_id for item in body.items))
+    out_of_scope = {code for code, inv in invs.items() if inv.property_id not in scope}
+    invs = {code: inv for code, inv in invs.items() if code not in out_of_scope}
+    prop_ids = {inv.property_id for inv in invs.values()}
+    props = (
+        {p.id: p for p in db.query(Property).filter(Property.id.in_(prop_ids), Property.deleted_at.is_(None)).all()}
+        if prop_ids
+        else {}
+    )
+    stays: dict[int, Stay] = {}
+    if invs:
+        inv_ids = [inv.id for inv in invs.values()]
+        for s in db.query(Stay).filter(Stay.invitation_id.in_(inv_ids)).order_by(Stay.id).all():
+            stays.setdefault(s.invitation_id, s)
+
+    results: list[VerifyBatchResult] = []
+    ledger_events: list[dict[str, Any]] = []
+    needs_commit = False
+    for item in body.items:
+        token_id = (item.token_id or "").strip()
+        property_address = (item.property_address or "").strip()
+        code = normalize_token_id(token_id) if token_id else None
+        inv = invs.get(code) if code else None
+        prop = props.get(inv.property_id) if inv else None
+        attempt: VerifyAttempt
+        if not token_id:
+            result = VerifyBatchResult(token_id=token_id, valid=False, reason="Token ID is required.")
+            attempt = VerifyAttempt(
+                CATEGORY_FAILED_ATTEMPT, "Verify attempt – missing token", "token_id empty",
+                ip_address=ip_address, user_agent=user_agent, meta={"result": "invalid", "reason": "missing_input"},
+            )
+        elif inv is None:
+            result = VerifyBatchResult(token_id=token_id, valid=False, reason="Token not found.")
+            attempt = VerifyAttempt(
+                CATEGORY_FAILED_ATTEMPT, "Verify attempt – no match", f"Token not found: {token_id[:20]}…",
+                ip_address=ip_address, user_agent=user_agent,
+                meta={
+                    "result": "invalid",
+                    "reason": "token_out_of_scope" if code in out_of_scope else "token_not_found",
+                    "token_id_prefix": token_id[:32],
+                    "caller_user_id": current_user.id,
+                },
+            )
+        elif prop is None:
+            result = VerifyBatchResult(token_id=token_id, valid=False, reason="Property not found.")
+            attempt = VerifyAttempt(
+                CATEGORY_FAILED_ATTEMPT, "Verify attempt – property not found",
+                f"Property missing for invitation {inv.id}", property_id=inv.property_id, invitation_id=inv.id,
+                ip_address=ip_address, user_agent=user_agent, meta={"result": "invalid", "reason": "property_not_found"},
+            )
+        elif property_address and not _verify_address_matches(prop, property_address):
+            result = VerifyBatchResult(
+                token_id=token_id, valid=False, reason="Address does not match the property for this token."
+            )
+            attempt = VerifyAttempt(
+                CATEGORY_FAILED_ATTEMPT, "Identity Conflict", "Address does not match property for this token.",
+                property_id=prop.id, invitation_id=inv.id, ip_address=ip_address, user_agent=user_agent,
+                meta={"result": "invalid", "reason": "address_mismatch", "token_id_prefix": token_id[:32]},
+            )
+        else:
+            stay = stays.get(inv.id)
+            outcome = _verify_outcome(db, inv, prop, stay, today=today, ip_address=ip_address, user_agent=user_agent)
+            attempt = outcome.attempt
+            inv_kind = (getattr(inv, "invitation_kind", None) or "").strip().lower()
+            result = VerifyBatchResult(
+                token_id=token_id,
+                valid=outcome.valid,
+                reason=outcome.reason,
+                status=resolve_verify_primary_guest_stay_status(inv, stay, today=today, db=db),
+                property_address=_property_full_address(prop),
+                stay_start_date=stay.stay_start_date if stay else inv.stay_start_date,
+                stay_end_date=stay.stay_end_date if stay else inv.stay_end_date,
+                verification_subject="tenant_invite" if inv_kind == "tenant" else "guest_stay",
+            )
+            if outcome.valid and stay is not None:
+                ledger_events.append(_verify_valid_ledger_event(stay, prop, inv, ip_address, user_agent, batch=True))
+        results.append(result)
+        if not log_verify_attempt(db, attempt):
+            needs_commit = True
+    if ledger_events:
+        create_ledger_events(db, ledger_events)
+        needs_commit = True
+    if needs_commit:
+        db.commit()
+    return VerifyBatchResponse(results=results, generated_at=now)
+
+
 @router.get("/verify/{token}/signed-agreement")
 def get_verify_signed_agreement_pdf(
     token: str,
@@ -1888,11 +2093,20 @@ def get_portfolio_page(slug: str, db: Session = Depends(get_db)):
         .order_by(Property.created_at.asc())
         .all()
     )
+    multi_unit_ids = [p.id for p in properties if getattr(p, "is_multi_unit", False)]
+    unit_counts: dict[int, int] = {}
+    if multi_unit_ids:
+        unit_counts = dict(
+            db.query(Unit.property_id, func.count(Unit.id))
+            .filter(Unit.property_id.in_(multi_unit_ids))
+            .group_by(Unit.property_id)
+            .all()
+        )
     property_items = []
     for p in properties:
         unit_count = None
         if getattr(p, "is_multi_unit", False):
-            unit_count = db.query(Unit).filter(Unit.property_id == p.id).count() or 0
+            unit_count = unit_counts.get(p.id, 0)
         property_items.append(
             PortfolioPropertyItem(
                 id=p.id,
@@ -92,3 +92,161 @@ class AdminInvitationView(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class AdminJurisdictionCacheStats(BaseModel):
+    """Process-local jurisdiction SOT cache counters (per worker)."""
+    version: int
+    warm: bool
+    jurisdictions: int
+    zip_mappings: int
+    loaded_at: str | None
+    hits: int
+    misses: int
+
+
+class AdminLivePageCacheStats(BaseModel):
+    """Process-local public live page cache counters (per worker)."""
+    entries: int
+    hits: int
+    misses: int
+    invalidations: int
+
+
+class AdminPrincipalCacheStats(BaseModel):
+    """Process-local authenticated principal cache counters (per worker)."""
+    entries: int
+    hits: int
+    misses: int
+    invalidations: int
+
+
+class AdminAgreementPdfCacheStats(BaseModel):
+    """Process-local rendered agreement PDF cache counters and render timings (per worker)."""
+    entries: int
+    bytes: int
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    hit_rate: float
+    renders: int
+    render_ms_avg: float
+    render_ms_max: float
+    disk_enabled: bool
+
+
+class AdminPropertyStateReconcileReport(BaseModel):
+    """Last nightly property state reconcile run by this worker."""
+    started_at: datetime
+    finished_at: datetime | None = None
+    computed_for: date
+    properties: int
+    missing: int
+    stale: int
+    drifted: int
+    orphaned_rows: int
+    drifted_property_ids: list[int]
+
+
+class AdminPropertyStateStats(BaseModel):
+    """Property state snapshot reads vs live computes, refreshes and queued refreshes (per worker) and the last
+    reconcile."""
+    snapshot_reads: int
+    live_computes: int
+    snapshot_hit_rate: float
+    refreshed_properties: int
+    queued_refreshes: int = 0
+    last_reconcile: AdminPropertyStateReconcileReport | None = None
+
+
+class AdminJobRunView(BaseModel):
+    """One cron job run recorded by the scheduler leader."""
+    id: int
+    job_name: str
+    holder: str
+    status: str
+    started_at: datetime
+    finished_at: datetime | None = None
+    duration_ms: int | None = None
+    error: str | None = None
+
+    class Config:
+        from_attributes = True
+
+class AdminPerfRoute(BaseModel):
+    """Per-route request timings and SQL counts collected by the profiling middleware (per worker)."""
+    route: str
+    requests: int
+    avg_ms: float
+    max_ms: float
+    avg_queries: float
+    max_queries: int
+    avg_db_ms: float
+    avg_pool_wait_ms: float
+    max_pool_wait_ms: float
+    slow_requests: int
+    n_plus_one_requests: int
+    budget: int | None = None
+    budget_overruns: int
+
+
+class AdminPerfRepeatedStatement(BaseModel):
+    count: int
+    statement: str
+
+
+class AdminPerfSlowRequest(BaseModel):
+    """One request that was slow, repeated a statement past the N+1 threshold, or went over its query budget."""
+    at: datetime
+    route: str
+    status: int
+    duration_ms: float
+    queries: int
+    db_ms: float
+    pool_wait_ms: float
+    budget: int | None = None
+    repeated_statements: list[AdminPerfRepeatedStatement]
+
+
+class AdminPerfSummary(BaseModel):
+    """Worst routes by mean duration and the recent slow-request log. Empty unless SQL profiling is enabled."""
+    enabled: bool
+    routes: list[AdminPerfRoute]
+    slow_requests: list[AdminPerfSlowRequest]
+
+
+class AdminStartupStep(BaseModel):
+    name: str
+    ms: float
+    outcome: str  # ok | applied | skipped | failed
+
+
+class AdminStartupRunView(BaseModel):
+    """One process boot: import time of app.main and the timed startup steps (schema / seed applied or skipped)."""
+    id: int
+    release: str | None = None
+    holder: str
+    started_at: datetime
+    import_ms: int | None = None
+    startup_ms: int
+    schema_outcome: str | None = None
+    seed_outcome: str | None = None
+    steps: list[AdminStartupStep]
+
+    class Config:
+        from_attributes = True
+
+
+class AdminStartupReport(BaseModel):
+    """This worker's own startup timing report."""
+    release: str | None = None
+    started_at: datetime
+    import_ms: float | None = None
+    startup_ms: float | None = None
+    steps: list[AdminStartupStep]
+
+
+class AdminStartupSummary(BaseModel):
+    """This worker's startup report plus the most recent boots across processes (optionally for one release)."""
+    current: AdminStartupReport | None = None
+    runs: list[AdminStartupRunView]
@@ -243,4 +243,9 @@ class DashboardAlertView(BaseModel):
     meta: dict | None = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class DashboardAlertUnreadCount(BaseModel):
+    """Unread in-platform alerts addressed to the current user (badge polling)."""
+    unread_count: int
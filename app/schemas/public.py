@@ -217,6 +217,29 @@ class VerifyRequest(BaseModel):
     phone: str | None = None  # Optional; logged only
 
 
+class VerifyBatchRequest(BaseModel):
+    """Request for POST /public/verify/batch: many tokens (each with its optional address) in one call."""
+    items: list[VerifyRequest]
+
+
+class VerifyBatchResult(BaseModel):
+    """Compact per-token result of POST /public/verify/batch (same validity and reason as POST /public/verify)."""
+    token_id: str
+    valid: bool
+    reason: str | None = None
+    status: str | None = None  # PENDING | ACTIVE | REVOKED | EXPIRED | CANCELLED | COMPLETED
+    property_address: str | None = None
+    stay_start_date: date | None = None
+    stay_end_date: date | None = None
+    verification_subject: str | None = None  # tenant_invite | guest_stay
+
+
+class VerifyBatchResponse(BaseModel):
+    """Response for POST /public/verify/batch; ``results`` line up with the request ``items``."""
+    results: list[VerifyBatchResult]
+    generated_at: datetime
+
+
 class VerifyAssignedTenant(BaseModel):
     """Tenant assigned to a unit (name only on verify; presence is not public)."""
     name: str
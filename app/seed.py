@@ -433,6 +433,9 @@ def seed_jurisdiction_sot(db: Session) -> None:
         db.add(JurisdictionZipMapping(zip_code=zip_code, region_code=region_code))
 
     db.commit()
+    # Tables were rewritten: drop the process-wide SOT cache so the next lookup reloads from DB.
+    from app.services.jurisdiction_sot import invalidate_jurisdiction_cache
+    invalidate_jurisdiction_cache()
 
 
 def seed_admin_user(db: Session) -> None:
@@ -0,0 +1,189 @@
+"""
+Process-wide cache of rendered agreement PDFs (app.services.agreements.agreement_content_to_pdf).
+
+Rendering runs the reportlab platypus layout (100ms+ for a full agreement), and the same documents are downloaded
+over and over: unsigned invitation agreements, demo / static docs, signed copies regenerated from stored content.
+The input is deterministic, so the rendered bytes are cached under a key derived from the title and the SHA-256 of
+the content (the same digest agreements store as ``document_hash``):
+
+- memory: LRU bounded by ``agreement_pdf_cache_max_entries`` and ``agreement_pdf_cache_max_bytes`` (per worker);
+- disk (optional): ``agreement_pdf_cache_dir``, shared by every worker pointed at it and kept across restarts; the
+  least recently used files beyond ``agreement_pdf_cache_disk_max_entries`` are pruned.
+
+Bump ``_RENDER_VERSION`` whenever the layout in ``agreement_content_to_pdf`` changes so old renders are not served.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+_RENDER_VERSION = 1
+
+_lock = threading.Lock()
+_entries: OrderedDict[str, bytes] = OrderedDict()
+_bytes = 0
+_memory_hits = 0
+_disk_hits = 0
+_misses = 0
+_renders = 0
+_render_seconds = 0.0
+_render_seconds_max = 0.0
+
+
+def _settings():
+    from app.config import get_settings
+
+    return get_settings()
+
+
+def _project_root() -> Path:
+    return Path(__file__).resolve().parents[2]
+
+
+def pdf_cache_key(title: str, content_hash: str) -> str:
+    """Cache key for a rendered document: title + SHA-256 of its content (+ renderer version)."""
+    return hashlib.sha256(f"v{_RENDER_VERSION}\0{title}\0{content_hash}".encode("utf-8")).hexdigest()
+
+
+def _disk_dir() -> Path | None:
+    p = (_settings().agreement_pdf_cache_dir or "").strip()
+    if not p:
+        return None
+    return Path(p) if os.path.isabs(p) else _project_root() / p
+
+
+def _remember(key: str, pdf: bytes) -> None:
+    """Insert into the memory LRU (caller holds ``_lock``)."""
+    global _bytes
+    settings = _settings()
+    max_entries = settings.agreement_pdf_cache_max_entries
+    max_bytes = settings.agreement_pdf_cache_max_bytes
+    if max_entries <= 0 or len(pdf) > max_bytes:
+        return
+    old = _entries.pop(key, None)
+    if old is not None:
+        _bytes -= len(old)
+    _entries[key] = pdf
+    _bytes += len(pdf)
+    while _entries and (len(_entries) > max_entries or _bytes > max_bytes):
+        _, evicted = _entries.popitem(last=False)
+        _bytes -= len(evicted)
+
+
+def _disk_get(directory: Path, key: str) -> bytes | None:
+    path = directory / f"{key}.pdf"
+    try:
+        pdf = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError:
+        logger.warning("Agreement PDF cache: could not read %s", path, exc_info=True)
+        return None
+    try:
+        os.utime(path)  # LRU order for pruning
+    except OSError:
+        pass
+    return pdf
+
+
+def _disk_put(directory: Path, key: str, pdf: bytes) -> None:
+    tmp = None
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(pdf)
+        os.replace(tmp, directory / f"{key}.pdf")
+        tmp = None
+        _disk_prune(directory)
+    except OSError:
+        logger.warning("Agreement PDF cache: could not write to %s", directory, exc_info=True)
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+def _disk_prune(directory: Path) -> None:
+    limit = _settings().agreement_pdf_cache_disk_max_entries
+    files = list(directory.glob("*.pdf"))
+    if limit <= 0 or len(files) <= limit:
+        return
+    by_age = sorted(files, key=lambda p: p.stat().st_mtime)
+    for path in by_age[: len(files) - limit]:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def get_or_render_pdf(title: str, content_hash: str, render: Callable[[], bytes]) -> bytes:
+    """Rendered PDF for (title, content hash): from memory, then disk, else ``render()`` (and cache the result)."""
+    global _memory_hits, _disk_hits, _misses, _renders, _render_seconds, _render_seconds_max
+    key = pdf_cache_key(title, content_hash)
+    with _lock:
+        pdf = _entries.get(key)
+        if pdf is not None:
+            _entries.move_to_end(key)
+            _memory_hits += 1
+            return pdf
+
+    directory = _disk_dir()
+    if directory is not None:
+        pdf = _disk_get(directory, key)
+        if pdf is not None:
+            with _lock:
+                _disk_hits += 1
+                _remember(key, pdf)
+            return pdf
+
+    started = time.perf_counter()
+    pdf = render()
+    elapsed = time.perf_counter() - started
+    with _lock:
+        _misses += 1
+        _renders += 1
+        _render_seconds += elapsed
+        _render_seconds_max = max(_render_seconds_max, elapsed)
+        _remember(key, pdf)
+    if directory is not None:
+        _disk_put(directory, key, pdf)
+    return pdf
+
+
+def clear_agreement_pdf_cache() -> None:
+    """Drop this worker's memory entries and counters (the disk cache is left alone)."""
+    global _bytes, _memory_hits, _disk_hits, _misses, _renders, _render_seconds, _render_seconds_max
+    with _lock:
+        _entries.clear()
+        _bytes = 0
+        _memory_hits = _disk_hits = _misses = _renders = 0
+        _render_seconds = _render_seconds_max = 0.0
+
+
+def get_agreement_pdf_cache_stats() -> dict[str, Any]:
+    """Hit rate, size and render timings of this worker's agreement PDF cache."""
+    with _lock:
+        lookups = _memory_hits + _disk_hits + _misses
+        return {
+            "entries": len(_entries),
+            "bytes": _bytes,
+            "memory_hits": _memory_hits,
+            "disk_hits": _disk_hits,
+            "misses": _misses,
+            "hit_rate": round((_memory_hits + _disk_hits) / lookups, 4) if lookups else 0.0,
+            "renders": _renders,
+            "render_ms_avg": round(_render_seconds * 1000 / _renders, 2) if _renders else 0.0,
+            "render_ms_max": round(_render_seconds_max * 1000, 2),
+            "disk_enabled": _disk_dir() is not None,
+        }
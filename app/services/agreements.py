@@ -12,6 +12,7 @@ from app.models.invitation import Invitation
 from app.models.owner import Property
 from app.models.unit import Unit
 from app.models.user import User
+from app.services.agreement_pdf_cache import get_or_render_pdf
 from app.services.jurisdiction_sot import JurisdictionInfo, get_jurisdiction_for_property
 from app.services.invitation_guest_completion import guest_invite_awaiting_account_after_sign
 from app.services.invitation_kinds import is_property_invited_tenant_signup_kind
@@ -586,6 +587,12 @@ def _content_to_reportlab_paragraph(line: str, body_style) -> "Paragraph":
 
 
 def agreement_content_to_pdf(title: str, content: str) -> bytes:
+    """PDF of an agreement's title and content. Rendered once per (title, content hash); repeats are served from
+    app.services.agreement_pdf_cache."""
+    return get_or_render_pdf(title, _sha256_hex(content), lambda: _render_agreement_pdf(title, content))
+
+
+def _render_agreement_pdf(title: str, content: str) -> bytes:
     """Generate a PDF from agreement title and content using reportlab. Content wraps to page width and is justified. Supports **bold** in content."""
     from io import BytesIO
     from reportlab.lib.pagesizes import letter
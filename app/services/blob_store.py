@@ -0,0 +1,141 @@
+"""
+Content-addressed blob store for large binary documents (signed agreement / authority letter PDFs, ownership proofs).
+
+Blobs live on the local filesystem under ``blob_store_path`` (default ``data/blobs`` under the project root; point it
+at a shared volume when several hosts serve the API), named by the SHA-256 of their content: ``ab/cd/abcd…``. The
+database row keeps only the digest (``<field>_sha256``), so loading the row never pulls the document. Writes are
+atomic (temp file + rename) and idempotent: storing the same bytes twice yields the same digest and one file.
+
+Rows written before the store existed may still hold the bytes inline in the (deferred) ``<field>_bytes`` column;
+the helpers below read either, and ``scripts/migrate_blobs_to_store.py`` moves them out of the database.
+Downloads are served with ``FileResponse`` (streamed from disk, HTTP Range supported).
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+from fastapi.responses import FileResponse, Response
+
+logger = logging.getLogger(__name__)
+
+
+def _project_root() -> Path:
+    return Path(__file__).resolve().parents[2]
+
+
+class BlobStore:
+    def __init__(self, root: str | os.PathLike[str]):
+        self.root = Path(root)
+
+    def path(self, digest: str) -> Path:
+        d = digest.lower()
+        if len(d) != 64 or any(c not in "0123456789abcdef" for c in d):
+            raise ValueError(f"not a SHA-256 digest: {digest!r}")
+        return self.root / d[:2] / d[2:4] / d
+
+    def exists(self, digest: str) -> bool:
+        return self.path(digest).is_file()
+
+    def put(self, data: bytes) -> str:
+        """Store ``data``; returns its SHA-256 hex digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        target = self.path(digest)
+        if target.is_file():
+            return digest
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, target)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        return self.path(digest).read_bytes()
+
+
+_store: BlobStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_blob_store() -> BlobStore:
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                from app.config import get_settings
+
+                p = (get_settings().blob_store_path or "").strip()
+                if not p:
+                    root = _project_root() / "data" / "blobs"
+                elif os.path.isabs(p):
+                    root = Path(p)
+                else:
+                    root = _project_root() / p
+                _store = BlobStore(root)
+    return _store
+
+
+# --- Model helpers. ``field`` names a blob attribute group on a model: ``<field>_sha256`` (digest column),
+# ``<field>_bytes`` (deferred legacy inline column) and ``<field>_inline`` (SQL flag: legacy bytes present). ---
+
+
+def store_blob(obj: Any, field: str, data: bytes) -> str:
+    """Put ``data`` in the blob store and point ``obj.<field>_sha256`` at it (clearing any legacy inline bytes)."""
+    digest = get_blob_store().put(data)
+    setattr(obj, f"{field}_sha256", digest)
+    setattr(obj, f"{field}_bytes", None)
+    return digest
+
+
+def read_blob(obj: Any, field: str) -> bytes | None:
+    """The blob's bytes (from the store, or the legacy inline column), or None when there is none."""
+    digest = getattr(obj, f"{field}_sha256", None)
+    if digest:
+        try:
+            return get_blob_store().get(digest)
+        except FileNotFoundError:
+            logger.error("Blob %s referenced by %s.%s_sha256 is missing from the store", digest, type(obj).__name__, field)
+            return None
+    if getattr(obj, f"{field}_inline", False):
+        data = getattr(obj, f"{field}_bytes", None)
+        return bytes(data) if data is not None else None
+    return None
+
+
+def blob_response(
+    obj: Any,
+    field: str,
+    *,
+    media_type: str,
+    filename: str,
+    disposition: str = "inline",
+) -> Response | None:
+    """Download response for the blob: streamed ``FileResponse`` (Range requests supported) from the store, or the
+    legacy inline bytes until the row is migrated. None when there is no blob."""
+    headers = {"Content-Disposition": f'{disposition}; filename="{filename}"'}
+    digest = getattr(obj, f"{field}_sha256", None)
+    if digest:
+        path = get_blob_store().path(digest)
+        if not path.is_file():
+            logger.error("Blob %s referenced by %s.%s_sha256 is missing from the store", digest, type(obj).__name__, field)
+            return None
+        return FileResponse(path, media_type=media_type, headers=headers)
+    data = read_blob(obj, field)
+    if data is None:
+        return None
+    return Response(content=data, media_type=media_type, headers=headers)
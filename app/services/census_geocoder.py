@@ -12,7 +12,7 @@ import logging
 from dataclasses import dataclass
 from typing import Any
 
-import httpx
+from app.services.http_client import shared_http_client
 
 _CENSUS_COORDINATES_URL = "https://geocoding.geo.census.gov/geocoder/geographies/coordinates"
 
@@ -42,10 +42,9 @@ def lat_lng_to_geography(lat: float, lon: float) -> CensusGeography | None:
     }
     print(f"[CensusGeocoder] Calling Census API: {_CENSUS_COORDINATES_URL} with x={lon}, y={lat}")
     try:
-        with httpx.Client(timeout=15.0) as client:
-            r = client.get(_CENSUS_COORDINATES_URL, params=params)
-            r.raise_for_status()
-            data: dict[str, Any] = r.json()
+        r = shared_http_client().get(_CENSUS_COORDINATES_URL, params=params, timeout=15.0)
+        r.raise_for_status()
+        data: dict[str, Any] = r.json()
     except Exception as e:
         print(f"[CensusGeocoder] API call failed: {e}")
         logger.warning("Census geocoder request failed: %s", e)
@@ -6,16 +6,122 @@ exhaustion when ``pool_size`` is small and ``max_overflow`` is 0, e.g. Supabase
 """
 import logging
 from datetime import datetime, timezone
+from typing import Iterable
+
+from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.models.dashboard_alert import DashboardAlert
 from app.models.notification_attempt import NotificationAttempt
-from app.models.user import User
-from app.models.owner import Property
+from app.models.user_alert_counter import UserAlertCounter
+from app.models.user import User, UserRole
+from app.models.owner import OwnerProfile, Property
 from app.models.property_manager_assignment import PropertyManagerAssignment
+from app.services.privacy_lanes import tenant_lane_alert_exclusion_clause
 from app.services.property_scope import property_is_managed_by_docustay
 
 
+# Alert types each role is allowed to see (only role-relevant alerts are returned).
+ALERT_TYPES_BY_ROLE = {
+    UserRole.owner: {
+        "overstay",
+        "nearing_expiration",
+        "dms_48h",
+        "dms_urgent",
+        "dms_executed",
+        "dms_reminder",
+        "tenant_lease_48h",
+        "tenant_lease_urgent",
+        "shield_on", "revoked", "renewed", "vacated", "holdover", "expired",
+        "invitation_expired", "invitation_accepted", "tenant_accepted",
+        "vacant_monitoring", "removal_initiated",
+        "property_transfer_completed",
+        "property_transfer_accepted",
+        "property_transfer_invited",
+        "property_transfer_invite_expired",
+    },
+    UserRole.property_manager: {
+        "overstay",
+        "nearing_expiration",
+        "dms_48h",
+        "dms_urgent",
+        "dms_executed",
+        "dms_reminder",
+        "tenant_lease_48h",
+        "tenant_lease_urgent",
+        "shield_on", "revoked", "renewed", "vacated", "holdover", "expired",
+        "invitation_expired", "invitation_accepted", "tenant_accepted",
+        "vacant_monitoring", "removal_initiated",
+        "property_transfer_completed",
+        "property_transfer_accepted",
+        "property_transfer_invited",
+        "property_transfer_invite_expired",
+    },
+    UserRole.guest: {"overstay", "nearing_expiration", "revoked", "expired", "removal_initiated"},
+    UserRole.tenant: {
+        "invitation_expired",
+        "invitation_accepted",
+        "guest_stay_ending",
+        "guest_extension_request",
+        "revoked",  # you revoked a guest stay you invited (tenant lane; not shown to owners/managers)
+    },
+    UserRole.admin: None,  # None = no filter, show all
+}
+
+# Ownership-transfer alerts: show in personal mode too (account-level, not guest-lane).
+PROPERTY_TRANSFER_ALERT_TYPES = frozenset(
+    {
+        "property_transfer_completed",
+        "property_transfer_accepted",
+        "property_transfer_invited",
+        "property_transfer_invite_expired",
+    }
+)
+
+
+def business_alert_scope_clause(user_id: int, role: UserRole):
+    """Owner / manager business mode: alerts with no property_id (e.g. billing) or on an owned (active) / assigned
+    property."""
+    if role == UserRole.owner:
+        allowed_property_ids = (
+            select(Property.id)
+            .join(OwnerProfile, OwnerProfile.id == Property.owner_profile_id)
+            .where(OwnerProfile.user_id == user_id, Property.deleted_at.is_(None))
+        )
+    else:
+        allowed_property_ids = select(PropertyManagerAssignment.property_id).where(
+            PropertyManagerAssignment.user_id == user_id
+        )
+    return or_(DashboardAlert.property_id.is_(None), DashboardAlert.property_id.in_(allowed_property_ids))
+
+
+def visible_alert_clause(user_id: int, role: UserRole):
+    """WHERE clause for the user's alerts that GET /dashboard/alerts shows in at least one mode: the role's alert
+    types and, for owners / managers, no tenant lane and the business scope. Personal mode only narrows business
+    mode (guest alerts on personal-mode units of owned / assigned properties), except for ownership-transfer alerts."""
+    clauses = [DashboardAlert.user_id == user_id]
+    allowed_types = ALERT_TYPES_BY_ROLE.get(role)
+    if allowed_types is not None:
+        clauses.append(DashboardAlert.alert_type.in_(sorted(allowed_types)))
+    if role in (UserRole.owner, UserRole.property_manager):
+        clauses.append(tenant_lane_alert_exclusion_clause())
+        clauses.append(
+            or_(
+                business_alert_scope_clause(user_id, role),
+                DashboardAlert.alert_type.in_(sorted(PROPERTY_TRANSFER_ALERT_TYPES)),
+            )
+        )
+    return and_(*clauses)
+
+
+def _user_role(db: Session, user_id: int) -> UserRole | None:
+    from app.services.principal_cache import get_principal
+
+    principal = get_principal(db, user_id)
+    return principal.role if principal is not None else None
+
+
 def create_dashboard_alert(
     db: Session,
     user_id: int,
@@ -44,9 +150,77 @@ def create_dashboard_alert(
     db.add(alert)
     db.flush()  # get alert.id
     log_notification_attempt(db, alert.id, "in_app", success=True)
+    adjust_unread_alert_count(db, user_id, [alert.id], 1)
     return alert
 
 
+def adjust_unread_alert_count(db: Session, user_id: int, alert_ids: Iterable[int], sign: int) -> None:
+    """Add (``sign`` 1: new unread alerts) or subtract (-1: alerts just marked read) the alerts among ``alert_ids``
+    the user can see (``visible_alert_clause``) to their unread counter, in one UPDATE on the caller's session (caller
+    commits). A no-op until the counter row exists: the first ``get_unread_alert_count`` creates it from a count."""
+    ids = sorted({int(i) for i in alert_ids if i is not None})
+    if not ids or not sign:
+        return
+    role = _user_role(db, user_id)
+    if role is None:
+        return
+    visible = (
+        select(func.count(DashboardAlert.id))
+        .where(DashboardAlert.id.in_(ids), visible_alert_clause(user_id, role))
+        .scalar_subquery()
+    )
+    new_count = UserAlertCounter.unread_count + sign * visible
+    db.query(UserAlertCounter).filter(UserAlertCounter.user_id == user_id).update(
+        {UserAlertCounter.unread_count: case((new_count > 0, new_count), else_=0)},
+        synchronize_session=False,
+    )
+
+
+def reconcile_unread_alert_count(db: Session, user_id: int) -> int:
+    """Recount the user's visible unread alerts from ``dashboard_alerts`` and store the counter (commits)."""
+    role = _user_role(db, user_id)
+    count = (
+        db.query(func.count(DashboardAlert.id))
+        .filter(visible_alert_clause(user_id, role), DashboardAlert.read_at.is_(None))
+        .scalar()
+        if role is not None
+        else 0
+    ) or 0
+    now = datetime.now(timezone.utc)
+    updated = db.query(UserAlertCounter).filter(UserAlertCounter.user_id == user_id).update(
+        {UserAlertCounter.unread_count: count, UserAlertCounter.reconciled_at: now},
+        synchronize_session=False,
+    )
+    if not updated:
+        db.add(UserAlertCounter(user_id=user_id, unread_count=count, reconciled_at=now))
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()  # a concurrent request created the row first; it carries the same count
+    return count
+
+
+def get_unread_alert_count(db: Session, user_id: int) -> int:
+    """Unread dashboard alerts the user can see in GET /dashboard/alerts (any mode): one primary-key lookup, with a
+    full recount when the counter is missing or older than ``dashboard_alert_unread_reconcile_seconds`` (which also
+    absorbs visibility changes, e.g. a property deleted or a manager unassigned)."""
+    from app.config import get_settings
+
+    row = (
+        db.query(UserAlertCounter.unread_count, UserAlertCounter.reconciled_at)
+        .filter(UserAlertCounter.user_id == user_id)
+        .first()
+    )
+    if row is not None and row.reconciled_at is not None:
+        reconciled_at = row.reconciled_at
+        if reconciled_at.tzinfo is None:
+            reconciled_at = reconciled_at.replace(tzinfo=timezone.utc)
+        age = (datetime.now(timezone.utc) - reconciled_at).total_seconds()
+        if age < get_settings().dashboard_alert_unread_reconcile_seconds:
+            return row.unread_count
+    return reconcile_unread_alert_count(db, user_id)
+
+
 def _add_alerts_for_user_ids_on_session(
     db: Session,
     user_ids: list[int],
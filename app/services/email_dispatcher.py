@@ -0,0 +1,381 @@
+"""Outbound email dispatcher: send_email enqueues, a background thread delivers.
+
+In the API process send_email() persists the message as a NotificationAttempt row (channel "email"), leased to this
+process for SENDING_LEASE, and puts the row id on a bounded in-process queue; it returns once the row is committed,
+so an accepted message survives a crash or kill (the DB sweep of any process sends it when the lease runs out). One
+daemon worker drains the queue: each pass claims the rows it took, groups identical messages (same subject and body,
+e.g. one notice fanned out to every manager) into one provider call, and records the outcome on each row. Transient
+failures (network errors, 429, 5xx) are retried with exponential backoff from the persisted rows, so retries survive
+a restart; other failures, and retries exhausted, are marked failed. When the queue is full, or the dispatcher stops
+with ids still queued, the rows are released as "queued" (due now) and the worker's DB sweep sends them.
+
+Bodies carry live password-reset links and verification codes, so a row keeps subject and body only while it may
+still be sent: they are cleared once it is sent or failed, and the daily purge deletes those rows after
+EMAIL_ATTEMPT_RETENTION_DAYS.
+
+Only app.main starts the dispatcher. Scripts, CLI jobs and tests never do, so send_email keeps sending inline there.
+"""
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.notification_attempt import NotificationAttempt
+from app.services import notifications
+from app.services.notifications import EmailSendResult
+
+logger = logging.getLogger(__name__)
+
+# A row enqueued in, or taken by, a worker is leased for this long; if the process dies before or while sending it,
+# the sweep picks it up afterwards.
+SENDING_LEASE = timedelta(minutes=5)
+MAX_RETRY_DELAY = timedelta(hours=1)
+# Rows in these statuses are never sent again: their subject and body are cleared, and the purge deletes them.
+TERMINAL_STATUSES = ("sent", "failed")
+
+
+@dataclass(frozen=True)
+class OutboundEmail:
+    to_email: str
+    subject: str
+    html: str
+    text: str | None = None
+
+
+def retry_delay(attempt_count: int, base_seconds: int) -> timedelta:
+    """Backoff before the next try after attempt_count failed attempts: base, 2*base, 4*base, ... capped at an hour."""
+    return min(timedelta(seconds=base_seconds * 2 ** max(attempt_count - 1, 0)), MAX_RETRY_DELAY)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _default_session_factory() -> Session:
+    from app.database import get_background_job_session
+
+    return get_background_job_session()
+
+
+class EmailDispatcher:
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], Session] | None = None,
+        deliver: Callable[..., EmailSendResult] | None = None,
+        batch_limit: Callable[[], int] | None = None,
+    ):
+        s = get_settings()
+        self._session_factory = session_factory or _default_session_factory
+        self._deliver = deliver or notifications.deliver_email_batch
+        self._batch_limit = batch_limit or notifications.email_batch_limit
+        self._batch_size = max(1, s.email_batch_size)
+        self._max_attempts = max(1, s.email_max_attempts)
+        self._retry_base_seconds = s.email_retry_base_seconds
+        self._poll_seconds = s.email_poll_seconds
+        # (row id, lease expiry written at enqueue) of persisted messages waiting for this worker
+        self._queue: queue.Queue[tuple[int, datetime]] = queue.Queue(maxsize=max(1, s.email_queue_maxsize))
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="email-dispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the worker; rows still queued in memory are released so the next sweep (any process) sends them."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+        leftover = self._take(block=False)
+        while leftover:
+            self._release(leftover)
+            leftover = self._take(block=False)
+
+    def enqueue(self, message: OutboundEmail) -> bool:
+        """Persist ``message`` and queue it for the worker. True once its row is committed; False if it could not be
+        stored (nothing will send it)."""
+        lease = _now() + SENDING_LEASE
+        db = self._session_factory()
+        try:
+            (row,) = self._rows([message], "sending", lease)
+            db.add(row)
+            db.commit()
+            item = (row.id, lease)
+        except Exception:
+            db.rollback()
+            logger.exception("[Email] Could not persist message to=%s", message.to_email)
+            return False
+        finally:
+            db.close()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            logger.warning("[Email] Dispatch queue full (%s); leaving to=%s to the DB sweep", self._queue.maxsize, message.to_email)
+            try:
+                self._release([item])
+            except Exception:
+                # Still persisted: the sweep sends it once the lease runs out.
+                logger.exception("[Email] Could not release overflow row id=%s", item[0])
+        return True
+
+    def _take(self, block: bool) -> list[tuple[int, datetime]]:
+        """Up to batch_size queued row ids; when block, wait briefly for the first one."""
+        items: list[tuple[int, datetime]] = []
+        try:
+            items.append(self._queue.get(timeout=1.0) if block else self._queue.get_nowait())
+        except queue.Empty:
+            return items
+        while len(items) < self._batch_size:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def _run(self) -> None:
+        next_sweep = 0.0
+        while not self._stop.is_set():
+            try:
+                batch = self._take(block=True)
+                if batch:
+                    self.send_queued(batch)
+                if time.monotonic() >= next_sweep:
+                    self.send_due()
+                    next_sweep = time.monotonic() + self._poll_seconds
+            except Exception:
+                logger.exception("[Email] Dispatcher pass failed")
+
+    def _rows(self, messages: list[OutboundEmail], status: str, next_attempt_at: datetime) -> list[NotificationAttempt]:
+        return [
+            NotificationAttempt(
+                channel="email",
+                success=False,
+                status=status,
+                recipient=m.to_email,
+                subject=m.subject,
+                body_html=m.html,
+                body_text=m.text,
+                attempt_count=0,
+                next_attempt_at=next_attempt_at,
+            )
+            for m in messages
+        ]
+
+    @staticmethod
+    def _claim(db: Session, row_id: int, status: str, due: datetime, values: dict) -> bool:
+        """Conditional update of one row: with several API processes, each row is claimed by exactly one of them."""
+        return bool(
+            db.query(NotificationAttempt)
+            .filter(
+                NotificationAttempt.id == row_id,
+                NotificationAttempt.status == status,
+                NotificationAttempt.next_attempt_at == due,
+            )
+            .update(values, synchronize_session=False)
+        )
+
+    def _release(self, items: list[tuple[int, datetime]]) -> None:
+        """Hand enqueued rows this worker will not send back to the sweep: queued, due now."""
+        db = self._session_factory()
+        try:
+            for row_id, lease in items:
+                self._claim(db, row_id, "sending", lease, {"status": "queued", "next_attempt_at": _now()})
+            db.commit()
+        finally:
+            db.close()
+
+    def send_queued(self, items: list[tuple[int, datetime]]) -> int:
+        """Deliver rows persisted by enqueue(), skipping any a sweep took over after their lease ran out."""
+        now = _now()
+        db = self._session_factory()
+        try:
+            claimed = [
+                row_id
+                for row_id, lease in items
+                if self._claim(db, row_id, "sending", lease, {"next_attempt_at": now + SENDING_LEASE})
+            ]
+            db.commit()
+            if not claimed:
+                return 0
+            rows = db.query(NotificationAttempt).filter(NotificationAttempt.id.in_(claimed)).order_by(NotificationAttempt.id).all()
+            self._deliver_rows(db, rows)
+            return len(rows)
+        finally:
+            db.close()
+
+    def dispatch(self, messages: list[OutboundEmail]) -> None:
+        """Persist messages (leased to this worker) and deliver them."""
+        db = self._session_factory()
+        try:
+            rows = self._rows(messages, "sending", _now() + SENDING_LEASE)
+            db.add_all(rows)
+            db.commit()
+            self._deliver_rows(db, rows)
+        finally:
+            db.close()
+
+    def send_due(self) -> int:
+        """Claim and deliver due rows: retries whose backoff elapsed, overflow rows, and expired leases. Returns the count."""
+        now = _now()
+        db = self._session_factory()
+        try:
+            candidates = (
+                db.query(NotificationAttempt.id, NotificationAttempt.status, NotificationAttempt.next_attempt_at)
+                .filter(
+                    NotificationAttempt.status.in_(("queued", "retry", "sending")),
+                    NotificationAttempt.next_attempt_at <= now,
+                )
+                .order_by(NotificationAttempt.next_attempt_at, NotificationAttempt.id)
+                .limit(self._batch_size)
+                .all()
+            )
+            claimed = [
+                row_id
+                for row_id, status, due in candidates
+                if self._claim(db, row_id, status, due, {"status": "sending", "next_attempt_at": now + SENDING_LEASE})
+            ]
+            db.commit()
+            if not claimed:
+                return 0
+            rows = db.query(NotificationAttempt).filter(NotificationAttempt.id.in_(claimed)).order_by(NotificationAttempt.id).all()
+            self._deliver_rows(db, rows)
+            return len(rows)
+        finally:
+            db.close()
+
+    def _deliver_rows(self, db: Session, rows: list[NotificationAttempt]) -> None:
+        limit = max(1, self._batch_limit())
+        groups: dict[tuple[str, str, str], list[NotificationAttempt]] = {}
+        for row in rows:
+            groups.setdefault((row.subject or "", row.body_html or "", row.body_text or ""), []).append(row)
+        for (subject, html, text), group in groups.items():
+            # A batch never repeats an address, so a duplicate message to the same person is still sent twice.
+            chunks: list[list[NotificationAttempt]] = []
+            for row in group:
+                chunk = next(
+                    (
+                        c
+                        for c in chunks
+                        if len(c) < limit and all(r.recipient.lower() != row.recipient.lower() for r in c)
+                    ),
+                    None,
+                )
+                if chunk is None:
+                    chunks.append([row])
+                else:
+                    chunk.append(row)
+            for chunk in chunks:
+                try:
+                    result = self._deliver([r.recipient for r in chunk], subject, html, text or None)
+                except Exception as e:
+                    result = EmailSendResult(False, retryable=True, error=f"{type(e).__name__}: {e}")
+                self._record(chunk, result)
+            # Commit per message group so a crash mid-pass does not resend groups already delivered.
+            db.commit()
+
+    def _record(self, rows: list[NotificationAttempt], result: EmailSendResult) -> None:
+        now = _now()
+        for row in rows:
+            row.attempt_count = (row.attempt_count or 0) + 1
+            if result.ok:
+                row.status, row.success, row.sent_at = "sent", True, now
+                row.next_attempt_at, row.error_message = None, None
+            elif result.retryable and row.attempt_count < self._max_attempts:
+                row.status = "retry"
+                row.next_attempt_at = now + retry_delay(row.attempt_count, self._retry_base_seconds)
+                row.error_message = result.error
+            else:
+                row.status, row.next_attempt_at, row.error_message = "failed", None, result.error
+            if row.status in TERMINAL_STATUSES:
+                row.subject, row.body_html, row.body_text = None, None, None
+        if not result.ok:
+            logger.warning(
+                "[Email] Delivery failed for %s recipient(s) (attempt %s, %s): %s",
+                len(rows),
+                rows[0].attempt_count,
+                "will retry" if rows[0].status == "retry" else "giving up",
+                result.error,
+            )
+
+
+_dispatcher: EmailDispatcher | None = None
+_dispatcher_lock = threading.Lock()
+
+
+def start_email_dispatcher() -> EmailDispatcher | None:
+    """Start the process-wide dispatcher (idempotent). None when disabled by EMAIL_DISPATCHER_ENABLED=false."""
+    global _dispatcher
+    if not get_settings().email_dispatcher_enabled:
+        return None
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = EmailDispatcher()
+        _dispatcher.start()
+        return _dispatcher
+
+
+def stop_email_dispatcher() -> None:
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is not None:
+            _dispatcher.stop()
+            _dispatcher = None
+
+
+def enqueue_email(to_email: str, subject: str, html: str, text: str | None = None) -> bool | None:
+    """Queue an email on the running dispatcher. None when there is no running dispatcher or no provider configured
+    (the caller then sends inline); otherwise whether the message was accepted."""
+    dispatcher = _dispatcher
+    if dispatcher is None or not dispatcher.running or not notifications.email_provider_configured():
+        return None
+    return dispatcher.enqueue(OutboundEmail(to_email, subject, html, text))
+
+
+def purge_notification_attempts(db: Session, *, now: datetime | None = None) -> dict[str, int]:
+    """Delete email rows that were sent or failed more than email_attempt_retention_days ago, and clear the subject and
+    body of any younger terminal row that still has them (rows recorded before bodies were cleared). Alert-log rows
+    (status NULL) are left alone. Commits; returns the counts."""
+    now = now or _now()
+    terminal = db.query(NotificationAttempt).filter(
+        NotificationAttempt.channel == "email", NotificationAttempt.status.in_(TERMINAL_STATUSES)
+    )
+    cutoff = now - timedelta(days=max(0, get_settings().email_attempt_retention_days))
+    deleted = terminal.filter(NotificationAttempt.created_at < cutoff).delete(synchronize_session=False)
+    scrubbed = terminal.filter(
+        (NotificationAttempt.subject.isnot(None))
+        | (NotificationAttempt.body_html.isnot(None))
+        | (NotificationAttempt.body_text.isnot(None))
+    ).update(
+        {"subject": None, "body_html": None, "body_text": None},
+        synchronize_session=False,
+    )
+    db.commit()
+    return {"deleted": deleted, "scrubbed": scrubbed}
+
+
+def run_notification_attempt_purge_job() -> None:
+    """Daily: purge old sent/failed email rows (see purge_notification_attempts)."""
+    db = _default_session_factory()
+    try:
+        counts = purge_notification_attempts(db)
+        logger.info("[Email] Notification attempt purge: deleted=%d scrubbed=%d", counts["deleted"], counts["scrubbed"])
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
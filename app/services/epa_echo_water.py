@@ -7,18 +7,31 @@ to fetch water system rows. Returns same shape as water_lookup CSV path for drop
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
-import httpx
+from app.services.http_client import shared_http_client
 
 logger = logging.getLogger(__name__)
 
 _ECHO_BASE = "https://echodata.epa.gov/echo"
 _TIMEOUT = 45.0  # ECHO server can be slow; CSV fallback used on timeout
 _MAX_PAGES = 3  # cap pages per lookup to avoid huge responses
+_MIN_TIMEOUT = 1.0  # below this much time left before the caller's deadline, no further ECHO call is made
 
 
-def _get_systems(state: str, county: str | None = None, city: str | None = None) -> dict | None:
+def _timeout(deadline: float | None) -> float | None:
+    """HTTP timeout for the next call: _TIMEOUT, capped by the time left before ``deadline`` (time.monotonic()).
+    None when too little time is left to make the call."""
+    if deadline is None:
+        return _TIMEOUT
+    left = deadline - time.monotonic()
+    return min(_TIMEOUT, left) if left >= _MIN_TIMEOUT else None
+
+
+def _get_systems(
+    state: str, county: str | None = None, city: str | None = None, *, timeout: float = _TIMEOUT
+) -> dict | None:
     """Call get_systems; returns JSON with QueryID and QueryRows."""
     params: dict[str, str] = {"p_st": state.strip().upper()[:2], "output": "JSON"}
     if county and str(county).strip():
@@ -27,8 +40,7 @@ def _get_systems(state: str, county: str | None = None, city: str | None = None)
         params["p_city"] = str(city).strip()
     url = f"{_ECHO_BASE}/sdw_rest_services.get_systems"
     try:
-        with httpx.Client(timeout=_TIMEOUT) as client:
-            r = client.get(url, params=params)
+        r = shared_http_client().get(url, params=params, timeout=timeout)
         r.raise_for_status()
         return r.json()
     except Exception as e:
@@ -36,12 +48,11 @@ def _get_systems(state: str, county: str | None = None, city: str | None = None)
         return None
 
 
-def _get_qid(qid: str, pageno: int = 1) -> dict | None:
+def _get_qid(qid: str, pageno: int = 1, *, timeout: float = _TIMEOUT) -> dict | None:
     """Fetch one page of water system results by QID."""
     url = f"{_ECHO_BASE}/sdw_rest_services.get_qid"
     try:
-        with httpx.Client(timeout=_TIMEOUT) as client:
-            r = client.get(url, params={"qid": qid, "pageno": pageno, "output": "JSON"})
+        r = shared_http_client().get(url, params={"qid": qid, "pageno": pageno, "output": "JSON"}, timeout=timeout)
         r.raise_for_status()
         return r.json()
     except Exception as e:
@@ -53,13 +64,19 @@ def lookup_water_providers_echo(
     state_abbreviation: str,
     county_name: str | None = None,
     city: str | None = None,
+    deadline: float | None = None,
 ) -> list[dict[str, Any]]:
     """
     Look up water systems via EPA ECHO API by state and optionally county/city.
     Returns list of dicts with: name, contact_phone, contact_city, contact_state, raw.
     ECHO does not provide phone in the API; contact_phone will be None.
+    With ``deadline`` (time.monotonic()), each call's timeout is capped by the time left and no call starts past it;
+    the systems fetched so far are returned.
     """
-    data = _get_systems(state_abbreviation, county=county_name, city=city)
+    timeout = _timeout(deadline)
+    if timeout is None:
+        return []
+    data = _get_systems(state_abbreviation, county=county_name, city=city, timeout=timeout)
     if not data:
         return []
     res = data.get("Results") or {}
@@ -76,7 +93,10 @@ def lookup_water_providers_echo(
     out: list[dict[str, Any]] = []
     seen: set[str] = set()
     for pageno in range(1, _MAX_PAGES + 1):
-        page = _get_qid(str(qid), pageno=pageno)
+        timeout = _timeout(deadline)
+        if timeout is None:
+            break
+        page = _get_qid(str(qid), pageno=pageno, timeout=timeout)
         if not page:
             break
         results = page.get("Results") or page
@@ -19,12 +19,13 @@ from __future__ import annotations
 import enum
 import json
 import re
+from contextlib import contextmanager
 from datetime import date, datetime, timezone
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
-from sqlalchemy import func
+from sqlalchemy import String, and_, cast, event, func, or_
 from sqlalchemy.orm import Session
 
 from app.models.event_ledger import EventLedger
@@ -34,6 +35,7 @@ _ACTION_TYPE_LEN = 64
 _TARGET_OBJECT_TYPE_LEN = 64
 _IP_LEN = 64
 _USER_AGENT_LEN = 500
+_SEARCH_TEXT_MAX_LEN = 4000
 
 # Action types (canonical event names)
 ACTION_PROPERTY_CREATED = "PropertyCreated"
@@ -922,10 +924,77 @@ def ledger_event_to_display(
     return (cat, title, msg)
 
 
-def create_ledger_event(
-    db: Session,
+def _collect_search_values(v: Any, out: list[str]) -> None:
+    if v is None or isinstance(v, bool):
+        return
+    if isinstance(v, dict):
+        for x in v.values():
+            _collect_search_values(x, out)
+    elif isinstance(v, (list, tuple)):
+        for x in v:
+            _collect_search_values(x, out)
+    else:
+        text = str(v).strip()
+        if text:
+            out.append(text)
+
+
+def ledger_search_document(
+    action_type: str,
+    meta: dict[str, Any] | None,
+    *,
+    property_address: str | None = None,
+) -> str:
+    """Lower-cased text searched by the log ``search`` filter: action type, display title, property address and
+    every scalar meta value (guest names/emails, property name, messages, ...)."""
+    parts: list[str] = [action_type or ""]
+    display = _ACTION_DISPLAY.get(action_type or "")
+    if display:
+        parts.append(display[1])
+    if property_address:
+        parts.append(property_address)
+    _collect_search_values(meta, parts)
+    return " ".join(p for p in parts if p).lower()[:_SEARCH_TEXT_MAX_LEN]
+
+
+def property_search_addresses(db: Session, property_ids: Sequence[int]) -> dict[int, str]:
+    """property_id -> address/name string indexed into ``EventLedger.search_text``."""
+    from app.models.owner import Property
+
+    ids = {pid for pid in property_ids if pid is not None}
+    if not ids:
+        return {}
+    rows = (
+        db.query(Property.id, Property.name, Property.street, Property.city, Property.state, Property.zip_code)
+        .filter(Property.id.in_(ids))
+        .all()
+    )
+    return {r.id: _property_search_address(r) for r in rows}
+
+
+def _property_search_address(row: Any) -> str:
+    return " ".join(x for x in (row.name, row.street, row.city, row.state, row.zip_code) if x)
+
+
+def ledger_search_clause(search: str):
+    """WHERE clause for the log ``search`` filter (substring match, case-insensitive).
+
+    Matches ``search_text`` (served by the trigram index on PostgreSQL). Rows written before the column existed
+    and not yet backfilled fall back to the old action_type / meta-as-text match."""
+    term = f"%{search.strip().lower()}%"
+    return or_(
+        EventLedger.search_text.like(term),
+        and_(
+            EventLedger.search_text.is_(None),
+            or_(EventLedger.action_type.ilike(term), cast(EventLedger.meta, String).ilike(term)),
+        ),
+    )
+
+
+def _ledger_entry(
     action_type: str,
     *,
+    property_address: str | None,
     target_object_type: str | None = None,
     target_object_id: int | None = None,
     property_id: int | None = None,
@@ -941,15 +1010,8 @@ def create_ledger_event(
     event_source: str | None = None,
     business_meaning: str | None = None,
     trigger_description: str | None = None,
-) -> EventLedger | None:
-    """Append one immutable ledger event. All timestamps are UTC (server_default).
-    Returns None when the property is inactive (soft-deleted)."""
-    from app.services.property_scope import suppress_new_audit_for_inactive_property
-
-    if suppress_new_audit_for_inactive_property(
-        db, property_id=property_id, stay_id=stay_id, invitation_id=invitation_id
-    ):
-        return None
+) -> EventLedger:
+    """Build (not add) one ledger row: column truncation, meta sanitization and the search document."""
     action = (action_type or "")[:_ACTION_TYPE_LEN].strip() or "Unknown"
     target_type = (target_object_type or "")[:_TARGET_OBJECT_TYPE_LEN].strip() or None
     ip = (ip_address[: _IP_LEN] if ip_address else None) or None
@@ -964,8 +1026,9 @@ def create_ledger_event(
     safe_meta = safe_meta or None
     safe_prev = _sanitize_meta(previous_value)
     safe_new = _sanitize_meta(new_value)
+    search_text = ledger_search_document(action, safe_meta, property_address=property_address)
 
-    entry = EventLedger(
+    return EventLedger(
         action_type=action,
         target_object_type=target_type,
         target_object_id=target_object_id,
@@ -979,7 +1042,210 @@ def create_ledger_event(
         meta=safe_meta,
         ip_address=ip,
         user_agent=ua,
+        search_text=search_text,
+    )
+
+
+class LedgerBatch:
+    """Ledger events queued on one session by :func:`ledger_batch`, plus the per-property lookups that
+    :func:`create_ledger_event` would otherwise repeat for every event (managed status, search address,
+    stay / invitation -> property)."""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.pending: list[EventLedger] = []
+        self._properties: dict[int, tuple[bool, str | None]] = {}  # property_id -> (managed, search address)
+        self._scope_property_ids: dict[tuple[str, int], int | None] = {}
+
+    def load_properties(self, property_ids: Iterable[int | None]) -> None:
+        """Resolve managed status and search address of many properties with one query."""
+        from app.models.owner import Property
+
+        ids = {int(pid) for pid in property_ids if pid is not None} - self._properties.keys()
+        if not ids:
+            return
+        rows = (
+            self.db.query(
+                Property.id,
+                Property.deleted_at,
+                Property.name,
+                Property.street,
+                Property.city,
+                Property.state,
+                Property.zip_code,
+            )
+            .filter(Property.id.in_(ids))
+            .all()
+        )
+        for pid in ids:
+            self._properties[pid] = (False, None)  # missing property: not managed
+        for r in rows:
+            self._properties[r.id] = (r.deleted_at is None, _property_search_address(r))
+
+    def _scope_property_id(
+        self, *, property_id: int | None, stay_id: int | None, invitation_id: int | None
+    ) -> int | None:
+        """Cached :func:`~app.services.property_scope.resolved_property_id_for_audit`."""
+        from app.services.property_scope import resolved_property_id_for_audit
+
+        if property_id is not None:
+            return property_id
+        if stay_id is not None:
+            key = ("stay", stay_id)
+        elif invitation_id is not None:
+            key = ("invitation", invitation_id)
+        else:
+            return None
+        if key not in self._scope_property_ids:
+            self._scope_property_ids[key] = resolved_property_id_for_audit(
+                self.db, property_id=None, stay_id=stay_id, invitation_id=invitation_id
+            )
+        return self._scope_property_ids[key]
+
+    def suppressed(self, *, property_id: int | None, stay_id: int | None, invitation_id: int | None) -> bool:
+        """Same rule as :func:`~app.services.property_scope.suppress_new_audit_for_inactive_property`."""
+        pid = self._scope_property_id(property_id=property_id, stay_id=stay_id, invitation_id=invitation_id)
+        if pid is None:
+            return False
+        self.load_properties([pid])
+        return not self._properties[pid][0]
+
+    def property_address(self, property_id: int | None) -> str | None:
+        if property_id is None:
+            return None
+        self.load_properties([property_id])
+        return self._properties[property_id][1]
+
+    def add(self, entry: EventLedger) -> None:
+        if not self.pending:
+            self.db.connection()  # queued rows belong to the current transaction (begun here if needed)
+        self.pending.append(entry)
+
+    def write(self) -> None:
+        """Insert the queued events (one multi-row INSERT) into the current transaction."""
+        entries, self.pending = self.pending, []
+        if entries:
+            self.db.add_all(entries)
+            self.db.flush()
+
+
+_LEDGER_BATCH_KEY = "event_ledger_batch"
+
+
+@contextmanager
+def ledger_batch(db: Session) -> Iterator[LedgerBatch]:
+    """Queue every :func:`create_ledger_event` on ``db`` inside the block and insert them together.
+
+    For jobs that write many events (bulk upload, invitation cleanup, stay timer): the managed-property check and
+    the search-document address are resolved once per property for the whole batch, and the rows go in with one
+    multi-row INSERT when the block ends or when the session commits, whichever comes first. Rows, sanitization
+    and the inactive-property rule are those of the single-event path; only the flush is deferred, so an event's
+    ``id`` is not set until it is written. Managed status is cached for the batch, so a property soft-deleted inside
+    the block still gets the events queued after it. Nested calls join the outer batch."""
+    outer = db.info.get(_LEDGER_BATCH_KEY)
+    if outer is not None:
+        yield outer
+        return
+    batch = LedgerBatch(db)
+    db.info[_LEDGER_BATCH_KEY] = batch
+    try:
+        yield batch
+        batch.write()
+    finally:
+        db.info.pop(_LEDGER_BATCH_KEY, None)
+        if batch.pending:
+            # Block raised: leave the events in the session, as the single-event path would have.
+            db.add_all(batch.pending)
+
+
+def flush_ledger_batch(db: Session) -> None:
+    """Write the events queued by an open :func:`ledger_batch` on ``db`` now (no-op without one)."""
+    batch = db.info.get(_LEDGER_BATCH_KEY)
+    if batch is not None:
+        batch.write()
+
+
+@event.listens_for(Session, "before_commit")
+def _write_ledger_batch_on_commit(session: Session) -> None:
+    flush_ledger_batch(session)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_ledger_batch_on_rollback(session: Session) -> None:
+    batch = session.info.get(_LEDGER_BATCH_KEY)
+    if batch is not None:
+        batch.pending.clear()
+
+
+def create_ledger_event(
+    db: Session,
+    action_type: str,
+    *,
+    target_object_type: str | None = None,
+    target_object_id: int | None = None,
+    property_id: int | None = None,
+    unit_id: int | None = None,
+    stay_id: int | None = None,
+    invitation_id: int | None = None,
+    actor_user_id: int | None = None,
+    previous_value: dict[str, Any] | None = None,
+    new_value: dict[str, Any] | None = None,
+    meta: dict[str, Any] | None = None,
+    ip_address: str | None = None,
+    user_agent: str | None = None,
+    event_source: str | None = None,
+    business_meaning: str | None = None,
+    trigger_description: str | None = None,
+) -> EventLedger | None:
+    """Append one immutable ledger event. All timestamps are UTC (server_default).
+    Returns None when the property is inactive (soft-deleted). Inside :func:`ledger_batch` the event is queued
+    and inserted with the rest of the batch."""
+    batch: LedgerBatch | None = db.info.get(_LEDGER_BATCH_KEY)
+    # Outside a batch a one-off LedgerBatch does the lookups, so the managed-property check and the search address
+    # still come from the same single Property query.
+    lookup = batch if batch is not None else LedgerBatch(db)
+    if lookup.suppressed(property_id=property_id, stay_id=stay_id, invitation_id=invitation_id):
+        return None
+    property_address = lookup.property_address(property_id)
+    entry = _ledger_entry(
+        action_type,
+        property_address=property_address,
+        target_object_type=target_object_type,
+        target_object_id=target_object_id,
+        property_id=property_id,
+        unit_id=unit_id,
+        stay_id=stay_id,
+        invitation_id=invitation_id,
+        actor_user_id=actor_user_id,
+        previous_value=previous_value,
+        new_value=new_value,
+        meta=meta,
+        ip_address=ip_address,
+        user_agent=user_agent,
+        event_source=event_source,
+        business_meaning=business_meaning,
+        trigger_description=trigger_description,
     )
+    if batch is not None:
+        batch.add(entry)
+        return entry
     db.add(entry)
     db.flush()
     return entry
+
+
+def create_ledger_events(db: Session, events: Sequence[dict[str, Any]]) -> list[EventLedger | None]:
+    """Append many ledger events with one multi-row INSERT (bulk imports).
+
+    Each item holds ``action_type`` plus the keyword arguments of :func:`create_ledger_event`; sanitization and
+    the inactive-property rule are the same. Runs the events through a :func:`ledger_batch` (joining the caller's
+    if one is open) and writes them before returning. Results line up with ``events`` (None where suppressed)."""
+    with ledger_batch(db) as batch:
+        batch.load_properties(ev.get("property_id") for ev in events)
+        out: list[EventLedger | None] = []
+        for ev in events:
+            fields = dict(ev)
+            action_type = fields.pop("action_type")
+            out.append(create_ledger_event(db, action_type, **fields))
+        batch.write()
+    return out
@@ -0,0 +1,31 @@
+"""
+Process-wide pooled HTTP client for outbound data APIs (Census geocoder, EPA ECHO, Rewiring America).
+
+One keep-alive connection pool instead of a new httpx.Client (and TLS handshake) per request. httpx.Client is
+thread-safe, so the concurrent Utility Bucket legs share it. Callers pass their own per-request timeout. httpx is
+imported on first use so it stays off the API's import path.
+"""
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def shared_http_client() -> httpx.Client:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                import httpx
+
+                _client = httpx.Client(
+                    timeout=15.0,
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0),
+                )
+    return _client
@@ -29,7 +29,7 @@ def emit_invitation_agreement_signed_if_dropbox_complete(
     """
     if not getattr(sig, "dropbox_sign_request_id", None):
         return False
-    if not getattr(sig, "signed_pdf_bytes", None):
+    if not sig.has_signed_pdf:
         return False
     existing = (
         db.query(EventLedger)
@@ -13,6 +13,7 @@ from app.config import get_settings
 from app.services.audit_log import create_log, CATEGORY_STATUS_CHANGE
 from app.services.event_ledger import (
     create_ledger_event,
+    ledger_batch,
     ACTION_INVITATION_EXPIRED,
     ACTION_MANAGER_INVITATION_EXPIRED,
     ACTION_PROPERTY_TRANSFER_INVITATION_EXPIRED,
@@ -43,10 +44,10 @@ def _run_guest_invitation_cleanup_on_session(db: Session) -> None:
 
     pending_dropbox_codes = select(AgreementSignature.invitation_code).where(
         AgreementSignature.dropbox_sign_request_id.isnot(None),
-        AgreementSignature.signed_pdf_bytes.is_(None),
+        ~AgreementSignature.has_signed_pdf,
     )
     signed_guest_codes = select(AgreementSignature.invitation_code).where(
-        AgreementSignature.signed_pdf_bytes.isnot(None),
+        AgreementSignature.has_signed_pdf,
     )
 
     invs = (
@@ -218,9 +219,10 @@ def run_all_invitation_cleanup_jobs() -> None:
     logger.info("Invitation cleanup jobs: started (single DB session)")
     db: Session = get_background_job_session()
     try:
-        _run_guest_invitation_cleanup_on_session(db)
-        _run_manager_invitation_cleanup_on_session(db)
-        _run_property_transfer_invitation_cleanup_on_session(db)
+        with ledger_batch(db):
+            _run_guest_invitation_cleanup_on_session(db)
+            _run_manager_invitation_cleanup_on_session(db)
+            _run_property_transfer_invitation_cleanup_on_session(db)
     except Exception as e:
         logger.exception("Invitation cleanup jobs: failed: %s", e)
     finally:
@@ -238,7 +240,8 @@ def run_invitation_cleanup_job() -> None:
     logger.info("Invitation cleanup job: started")
     db: Session = get_background_job_session()
     try:
-        _run_guest_invitation_cleanup_on_session(db)
+        with ledger_batch(db):
+            _run_guest_invitation_cleanup_on_session(db)
     except Exception as e:
         logger.exception("Invitation cleanup job: failed: %s", e)
     finally:
@@ -251,7 +254,8 @@ def run_manager_invitation_cleanup_job() -> None:
     logger.info("Manager invitation cleanup job: started")
     db: Session = get_background_job_session()
     try:
-        _run_manager_invitation_cleanup_on_session(db)
+        with ledger_batch(db):
+            _run_manager_invitation_cleanup_on_session(db)
     except Exception as e:
         logger.exception("Manager invitation cleanup job: failed: %s", e)
     finally:
@@ -264,7 +268,8 @@ def run_property_transfer_invitation_cleanup_job() -> None:
     logger.info("Property transfer invitation cleanup job: started")
     db: Session = get_background_job_session()
     try:
-        _run_property_transfer_invitation_cleanup_on_session(db)
+        with ledger_batch(db):
+            _run_property_transfer_invitation_cleanup_on_session(db)
     except Exception as e:
         logger.exception("Property transfer invitation cleanup job: failed: %s", e)
     finally:
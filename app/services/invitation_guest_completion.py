@@ -44,7 +44,7 @@ def guest_invitation_signing_started(db: Session, invitation_code: str) -> bool:
         .filter(
             AgreementSignature.invitation_code == code,
             or_(
-                AgreementSignature.signed_pdf_bytes.isnot(None),
+                AgreementSignature.has_signed_pdf,
                 AgreementSignature.dropbox_sign_request_id.isnot(None),
             ),
         )
@@ -1,14 +1,25 @@
-"""Jurisdiction SOT service: deterministic lookup by zip or region_code from DB."""
+"""Jurisdiction SOT service: deterministic lookup by zip or region_code from DB.
+
+The SOT (50 states + statutes + zip mappings) is seeded by app.seed and effectively static, so lookups are
+served from a process-wide cache loaded in three queries. The cache is warmed at startup and invalidated
+whenever seed_jurisdiction_sot or /db-setup rewrites the tables; each invalidation bumps a version so a warm
+that raced with a rewrite never publishes stale rows.
+"""
 from __future__ import annotations
 
+import logging
+import threading
 from dataclasses import dataclass
-from typing import List
+from datetime import datetime, timezone
+from typing import Any, List
 
 from sqlalchemy.orm import Session
 
 from app.models.jurisdiction import Jurisdiction, JurisdictionStatute, JurisdictionZipMapping
 from app.models.region_rule import RiskLevel, StayClassification
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class StatuteInfo:
@@ -49,11 +60,135 @@ def _normalize_zip(zip_code: str | None) -> str | None:
     return s
 
 
+def _build_jurisdiction_info(jur: Jurisdiction, statute_rows: list[JurisdictionStatute]) -> JurisdictionInfo:
+    statutes = [
+        StatuteInfo(citation=s.citation, plain_english=s.plain_english)
+        for s in statute_rows
+    ]
+    return JurisdictionInfo(
+        region_code=jur.region_code,
+        state_code=jur.state_code,
+        name=jur.name,
+        jurisdiction_group=getattr(jur, "jurisdiction_group", None),
+        legal_threshold_days=getattr(jur, "legal_threshold_days", None),
+        platform_renewal_cycle_days=getattr(jur, "platform_renewal_cycle_days", None) or jur.max_stay_days,
+        reminder_days_before=getattr(jur, "reminder_days_before", None) or jur.warning_days or 3,
+        max_stay_days=jur.max_stay_days,
+        tenancy_threshold_days=jur.tenancy_threshold_days,
+        warning_days=jur.warning_days,
+        agreement_type=jur.agreement_type,
+        section_3_clause=getattr(jur, "section_3_clause", None),
+        removal_guest_text=jur.removal_guest_text,
+        removal_tenant_text=jur.removal_tenant_text,
+        statutes=statutes,
+        risk_level=jur.risk_level,
+        stay_classification=jur.stay_classification_label,
+        allow_extended_if_owner_occupied=jur.allow_extended_if_owner_occupied,
+    )
+
+
+# --- Process-wide SOT cache (JurisdictionInfo instances are shared; callers must treat them as read-only) ---
+_cache_lock = threading.Lock()
+_cache_version = 0
+_cache_by_region: dict[str, JurisdictionInfo] | None = None
+_cache_zip_to_region: dict[str, str] = {}
+_cache_loaded_at: datetime | None = None
+_cache_hits = 0
+_cache_misses = 0
+
+
+def warm_jurisdiction_cache(db: Session) -> int:
+    """Load every jurisdiction, statute and zip mapping into the process cache. Returns jurisdictions cached.
+
+    An empty jurisdictions table is not cached (the SOT may not be seeded yet); lookups fall through to the DB.
+    """
+    global _cache_by_region, _cache_zip_to_region, _cache_loaded_at
+    with _cache_lock:
+        version = _cache_version
+    jurisdictions = db.query(Jurisdiction).all()
+    if not jurisdictions:
+        return 0
+    statutes_by_region: dict[str, list[JurisdictionStatute]] = {}
+    for st in (
+        db.query(JurisdictionStatute)
+        .filter(JurisdictionStatute.use_in_authority_package == True)
+        .order_by(JurisdictionStatute.sort_order, JurisdictionStatute.id)
+        .all()
+    ):
+        statutes_by_region.setdefault((st.region_code or "").upper(), []).append(st)
+    by_region = {
+        (jur.region_code or "").upper(): _build_jurisdiction_info(jur, statutes_by_region.get((jur.region_code or "").upper(), []))
+        for jur in jurisdictions
+    }
+    zip_to_region: dict[str, str] = {}
+    for m in db.query(JurisdictionZipMapping).order_by(JurisdictionZipMapping.id).all():
+        # First mapping wins, matching the .first() semantics of the uncached lookup.
+        zip_to_region.setdefault(m.zip_code, (m.region_code or "").upper())
+    with _cache_lock:
+        if version != _cache_version:
+            # Tables were rewritten while loading; leave the cache cold so the next lookup reloads.
+            return 0
+        _cache_by_region = by_region
+        _cache_zip_to_region = zip_to_region
+        _cache_loaded_at = datetime.now(timezone.utc)
+    logger.info("Jurisdiction cache warmed: %s jurisdictions, %s zip mappings (version %s)", len(by_region), len(zip_to_region), version)
+    return len(by_region)
+
+
+def invalidate_jurisdiction_cache() -> None:
+    """Drop the cached SOT (call after seeding or any write to the jurisdiction tables)."""
+    global _cache_version, _cache_by_region, _cache_zip_to_region, _cache_loaded_at
+    with _cache_lock:
+        _cache_version += 1
+        _cache_by_region = None
+        _cache_zip_to_region = {}
+        _cache_loaded_at = None
+
+
+def get_jurisdiction_cache_stats() -> dict[str, Any]:
+    """Hit/miss counters and size of the process-wide jurisdiction cache."""
+    with _cache_lock:
+        by_region = _cache_by_region
+        return {
+            "version": _cache_version,
+            "warm": by_region is not None,
+            "jurisdictions": len(by_region) if by_region is not None else 0,
+            "zip_mappings": len(_cache_zip_to_region),
+            "loaded_at": _cache_loaded_at.isoformat() if _cache_loaded_at else None,
+            "hits": _cache_hits,
+            "misses": _cache_misses,
+        }
+
+
+def _cached_sot(db: Session) -> tuple[dict[str, JurisdictionInfo], dict[str, str]] | None:
+    """Return (by_region, zip_to_region) from the cache, warming it on first use. None when the SOT is empty."""
+    global _cache_hits, _cache_misses
+    by_region, zip_to_region = _cache_by_region, _cache_zip_to_region
+    if by_region is not None:
+        _cache_hits += 1
+        return by_region, zip_to_region
+    _cache_misses += 1
+    try:
+        warm_jurisdiction_cache(db)
+    except Exception as e:
+        logger.warning("Jurisdiction cache warm failed; falling back to direct lookup: %s", e)
+        return None
+    by_region, zip_to_region = _cache_by_region, _cache_zip_to_region
+    if by_region is None:
+        return None
+    return by_region, zip_to_region
+
+
 def get_jurisdiction_for_zip(db: Session, zip_code: str | None) -> JurisdictionInfo | None:
     """Look up jurisdiction by 5-digit zip. Returns None if zip not in mapping or jurisdiction missing."""
     normalized = _normalize_zip(zip_code)
     if not normalized:
         return None
+    cached = _cached_sot(db)
+    if cached is not None:
+        by_region, zip_to_region = cached
+        rc = zip_to_region.get(normalized)
+        return by_region.get(rc) if rc else None
     mapping = db.query(JurisdictionZipMapping).filter(
         JurisdictionZipMapping.zip_code == normalized
     ).first()
@@ -67,6 +202,9 @@ def get_jurisdiction_for_region(db: Session, region_code: str | None) -> Jurisdi
     if not region_code or not str(region_code).strip():
         return None
     rc = str(region_code).strip().upper()
+    cached = _cached_sot(db)
+    if cached is not None:
+        return cached[0].get(rc)
     jur = db.query(Jurisdiction).filter(Jurisdiction.region_code == rc).first()
     if not jur:
         return None
@@ -79,30 +217,7 @@ def get_jurisdiction_for_region(db: Session, region_code: str | None) -> Jurisdi
         .order_by(JurisdictionStatute.sort_order, JurisdictionStatute.id)
         .all()
     )
-    statutes = [
-        StatuteInfo(citation=s.citation, plain_english=s.plain_english)
-        for s in statute_rows
-    ]
-    return JurisdictionInfo(
-        region_code=jur.region_code,
-        state_code=jur.state_code,
-        name=jur.name,
-        jurisdiction_group=getattr(jur, "jurisdiction_group", None),
-        legal_threshold_days=getattr(jur, "legal_threshold_days", None),
-        platform_renewal_cycle_days=getattr(jur, "platform_renewal_cycle_days", None) or jur.max_stay_days,
-        reminder_days_before=getattr(jur, "reminder_days_before", None) or jur.warning_days or 3,
-        max_stay_days=jur.max_stay_days,
-        tenancy_threshold_days=jur.tenancy_threshold_days,
-        warning_days=jur.warning_days,
-        agreement_type=jur.agreement_type,
-        section_3_clause=getattr(jur, "section_3_clause", None),
-        removal_guest_text=jur.removal_guest_text,
-        removal_tenant_text=jur.removal_tenant_text,
-        statutes=statutes,
-        risk_level=jur.risk_level,
-        stay_classification=jur.stay_classification_label,
-        allow_extended_if_owner_occupied=jur.allow_extended_if_owner_occupied,
-    )
+    return _build_jurisdiction_info(jur, statute_rows)
 
 
 def get_jurisdiction_for_property(db: Session, zip_code: str | None, region_code: str | None) -> JurisdictionInfo | None:
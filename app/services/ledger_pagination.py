@@ -0,0 +1,112 @@
+"""Keyset pagination over the event ledger, newest first.
+
+Log endpoints order by ``(created_at DESC, id DESC)`` and page with an opaque cursor that encodes the last row's
+``(created_at, id)``. Unlike OFFSET, every page costs one index range scan regardless of how deep the reader is, and
+rows appended while a reader is paging never shift later pages.
+
+The helpers take an optional ``model`` so other newest-first feeds with ``created_at`` / ``id`` columns (dashboard
+alerts) page the same way.
+"""
+from __future__ import annotations
+
+import base64
+import binascii
+from collections.abc import Iterator
+from datetime import datetime, timezone
+
+from sqlalchemy import and_, desc, or_
+from sqlalchemy.orm import Query
+
+from app.models.event_ledger import EventLedger
+
+LEDGER_PAGE_MAX_LIMIT = 500
+LEDGER_STREAM_BATCH_SIZE = 200
+
+
+class InvalidLedgerCursor(ValueError):
+    """Raised when a client-supplied ledger cursor cannot be decoded."""
+
+
+def encode_ledger_cursor(row) -> str:
+    """Opaque cursor pointing just past ``row`` in newest-first order."""
+    created_at = row.created_at
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    raw = f"{created_at.isoformat()}|{row.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_ledger_cursor(cursor: str) -> tuple[datetime, int]:
+    """Inverse of ``encode_ledger_cursor``. Raises InvalidLedgerCursor on malformed input."""
+    try:
+        padded = cursor.strip() + "=" * (-len(cursor.strip()) % 4)
+        ts_raw, id_raw = base64.urlsafe_b64decode(padded.encode()).decode().rsplit("|", 1)
+        created_at = datetime.fromisoformat(ts_raw)
+        row_id = int(id_raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidLedgerCursor("Invalid cursor") from e
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return created_at, row_id
+
+
+def order_ledger_newest_first(q: Query, model=EventLedger) -> Query:
+    """Stable newest-first order; ``id`` breaks ties between rows written in the same instant."""
+    return q.order_by(desc(model.created_at), desc(model.id))
+
+
+def _after_cursor(q: Query, position: tuple[datetime, int], model=EventLedger) -> Query:
+    created_at, row_id = position
+    return q.filter(
+        or_(
+            model.created_at < created_at,
+            and_(model.created_at == created_at, model.id < row_id),
+        )
+    )
+
+
+def fetch_ledger_page(
+    q: Query,
+    *,
+    limit: int | None,
+    cursor: str | None = None,
+    model=EventLedger,
+) -> tuple[list, str | None]:
+    """Return ``(rows, next_cursor)`` for one page of a ``model`` query (filters applied, no ORDER BY yet).
+
+    ``limit=None`` returns every remaining row and no cursor. ``next_cursor`` is None on the last page."""
+    if cursor:
+        q = _after_cursor(q, decode_ledger_cursor(cursor), model)
+    q = order_ledger_newest_first(q, model)
+    if limit is None:
+        return q.all(), None
+    rows = q.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_ledger_cursor(rows[-1])
+
+
+def iter_ledger_batches(
+    q: Query,
+    *,
+    cursor: str | None = None,
+    max_rows: int | None = None,
+    batch_size: int = LEDGER_STREAM_BATCH_SIZE,
+) -> Iterator[list[EventLedger]]:
+    """Yield successive newest-first batches of an EventLedger query, walking the keyset until exhausted
+    (or ``max_rows`` rows have been produced). Each batch is a separate bounded query."""
+    position = decode_ledger_cursor(cursor) if cursor else None
+    remaining = max_rows
+    while remaining is None or remaining > 0:
+        size = batch_size if remaining is None else min(batch_size, remaining)
+        page_q = _after_cursor(q, position) if position else q
+        rows = order_ledger_newest_first(page_q).limit(size).all()
+        if not rows:
+            return
+        yield rows
+        if len(rows) < size:
+            return
+        position = (rows[-1].created_at, rows[-1].id)
+        if remaining is not None:
+            remaining -= len(rows)
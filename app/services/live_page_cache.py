@@ -0,0 +1,202 @@
+"""
+Process-wide cache for GET /public/live/{slug} (the public live property page).
+
+Live links are shared publicly (QR codes on doors), so bursts of anonymous hits on one property are common. Two
+layers are cached per property:
+
+- ``base``: the viewer-independent pieces (owner / manager cards, units and their resolved occupancy, jurisdiction
+  wrap, POA, public tenant rows). Tenant, guest and signed-in viewers build their scoped page on top of it.
+- ``page``: the fully rendered anonymous payload for a property link, with its strong ETag, so repeat hits and
+  ``If-None-Match`` revalidations do no page work at all.
+
+Entries are invalidated when a session commits a write to a row scoped to the property (ledger event, stay, unit,
+tenant / manager assignment, invitation, property). Other workers cannot see this process's invalidations, so an
+entry is also dropped when the property's newest ledger id (one indexed query per hit) no longer matches, and after
+``live_page_cache_ttl_seconds`` as a backstop for writes that bypass the ORM (bulk UPDATEs) or carry no ledger row.
+Cached values are shared between requests; callers must treat them as read-only.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Hashable, Iterable
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from app.models.event_ledger import EventLedger
+from app.models.invitation import Invitation
+from app.models.owner import Property
+from app.models.property_manager_assignment import PropertyManagerAssignment
+from app.models.stay import Stay
+from app.models.tenant_assignment import TenantAssignment
+from app.models.unit import Unit
+
+
+@dataclass
+class _Entry:
+    property_id: int
+    version: int
+    day: date
+    ledger_mark: int | None
+    stored_at: float
+    value: Any
+
+
+_lock = threading.Lock()
+_versions: dict[int, int] = {}
+_entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+_hits = 0
+_misses = 0
+_invalidations = 0
+
+
+def _settings():
+    from app.config import get_settings
+
+    return get_settings()
+
+
+def live_page_version(property_id: int) -> int:
+    """Current invalidation version of ``property_id``; capture it before building a value to ``put``."""
+    with _lock:
+        return _versions.get(property_id, 0)
+
+
+def live_page_ledger_mark(db: Session, property_id: int) -> int | None:
+    """Newest ledger id on the property: lets a worker notice writes committed by other processes."""
+    return db.query(func.max(EventLedger.id)).filter(EventLedger.property_id == property_id).scalar()
+
+
+def get_cached(key: Hashable, property_id: int, *, day: date, ledger_mark: int | None) -> Any | None:
+    """Cached value for ``key`` if it is still current for ``property_id``, else None."""
+    global _hits, _misses
+    ttl = _settings().live_page_cache_ttl_seconds
+    with _lock:
+        entry = _entries.get(key)
+        if (
+            entry is None
+            or ttl <= 0
+            or entry.property_id != property_id
+            or entry.version != _versions.get(property_id, 0)
+            or entry.day != day
+            or entry.ledger_mark != ledger_mark
+            or time.monotonic() - entry.stored_at > ttl
+        ):
+            if entry is not None:
+                del _entries[key]
+            _misses += 1
+            return None
+        _entries.move_to_end(key)
+        _hits += 1
+        return entry.value
+
+
+def put_cached(
+    key: Hashable,
+    property_id: int,
+    value: Any,
+    *,
+    version: int,
+    day: date,
+    ledger_mark: int | None,
+) -> None:
+    """Store ``value`` unless the property was invalidated since ``version`` was read (the value may be stale)."""
+    settings = _settings()
+    if settings.live_page_cache_ttl_seconds <= 0:
+        return
+    with _lock:
+        if version != _versions.get(property_id, 0):
+            return
+        _entries[key] = _Entry(property_id, version, day, ledger_mark, time.monotonic(), value)
+        _entries.move_to_end(key)
+        while len(_entries) > max(1, settings.live_page_cache_max_entries):
+            _entries.popitem(last=False)
+
+
+def invalidate_live_page(property_ids: Iterable[int]) -> None:
+    """Drop every cached layer of these properties (this process only)."""
+    global _invalidations
+    ids = {int(p) for p in property_ids if p is not None}
+    if not ids:
+        return
+    with _lock:
+        for pid in ids:
+            _versions[pid] = _versions.get(pid, 0) + 1
+        for key in [k for k, e in _entries.items() if e.property_id in ids]:
+            del _entries[key]
+        _invalidations += len(ids)
+
+
+def clear_live_page_cache() -> None:
+    global _hits, _misses, _invalidations
+    with _lock:
+        _entries.clear()
+        _versions.clear()
+        _hits = _misses = _invalidations = 0
+
+
+def get_live_page_cache_stats() -> dict[str, Any]:
+    """Hit/miss counters and size of this worker's live page cache."""
+    with _lock:
+        return {
+            "entries": len(_entries),
+            "hits": _hits,
+            "misses": _misses,
+            "invalidations": _invalidations,
+        }
+
+
+# --- Invalidation: property ids touched by a flush are collected per session and applied on commit. Ids left over
+# from a rolled-back flush are applied with the next commit, which only costs an extra rebuild. ---
+
+_SESSION_INFO_KEY = "live_page_dirty_property_ids"
+_PROPERTY_SCOPED = (EventLedger, Stay, Unit, Invitation, PropertyManagerAssignment)
+
+
+def _touched_property_ids(session: Session) -> set[int]:
+    property_ids: set[int] = set()
+    unit_ids: set[int] = set()
+    stay_ids: set[int] = set()
+    invitation_ids: set[int] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Property):
+            if obj.id is not None:
+                property_ids.add(obj.id)
+        elif isinstance(obj, TenantAssignment):
+            if obj.unit_id is not None:
+                unit_ids.add(obj.unit_id)
+        elif isinstance(obj, _PROPERTY_SCOPED):
+            if obj.property_id is not None:
+                property_ids.add(obj.property_id)
+            elif isinstance(obj, EventLedger):
+                # Ledger rows may be scoped only through their stay / invitation / unit.
+                if obj.stay_id is not None:
+                    stay_ids.add(obj.stay_id)
+                elif obj.invitation_id is not None:
+                    invitation_ids.add(obj.invitation_id)
+                elif obj.unit_id is not None:
+                    unit_ids.add(obj.unit_id)
+    if unit_ids or stay_ids or invitation_ids:
+        conn = session.connection()
+        for model, ids in ((Unit, unit_ids), (Stay, stay_ids), (Invitation, invitation_ids)):
+            if ids:
+                property_ids.update(
+                    pid for (pid,) in conn.execute(select(model.property_id).where(model.id.in_(ids))) if pid
+                )
+    return property_ids
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_touched_properties(session: Session, flush_context) -> None:
+    touched = _touched_property_ids(session)
+    if touched:
+        session.info.setdefault(_SESSION_INFO_KEY, set()).update(touched)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    invalidate_live_page(session.info.pop(_SESSION_INFO_KEY, ()))
@@ -1,5 +1,9 @@
 """Module H: Notification service (Mailgun/SendGrid email, optional SMS)."""
 import html
+import json
+import logging
+import threading
+from dataclasses import dataclass
 
 from app.config import get_settings
 from app.services.notification_templates import (
@@ -8,6 +12,8 @@ from app.services.notification_templates import (
     wrap_email_body,
 )
 
+logger = logging.getLogger(__name__)
+
 
 def _property_page_url(property_id: int, for_manager: bool = False) -> str:
     """Build frontend URL to property detail page. Owners: #property/{id}. Managers: #manager-dashboard/property/{id}."""
@@ -48,14 +54,16 @@ def _verify_record_url(invite_code: str, property_address: str | None = None) ->
         return url
     return base
 
-# Clear settings cache so we use latest .env when sending (fixes server vs script using different config)
-def _get_fresh_settings():
-    get_settings.cache_clear()
-    return get_settings()
-
-
 def send_email(to_email: str, subject: str, html_content: str, text_content: str | None = None) -> bool:
-    """Send email via Mailgun (preferred) or SendGrid. From address is always the app config (MAILGUN_FROM_EMAIL / sendgrid_from_email), never the owner or any user. Returns True if sent (or skipped when unconfigured)."""
+    """Send email via Mailgun (preferred) or SendGrid. From address is always the app config (MAILGUN_FROM_EMAIL / sendgrid_from_email), never the owner or any user.
+    In the API process the message is handed to the outbound dispatcher (app.services.email_dispatcher) and True means
+    accepted for delivery; delivery, batching and retries happen off the request thread. Elsewhere (scripts, CLI jobs,
+    dispatcher disabled) it is sent inline and True means sent. False when no provider is configured."""
+    from app.services.email_dispatcher import enqueue_email
+
+    queued = enqueue_email(to_email, subject, html_content, text_content)
+    if queued is not None:
+        return queued
     return send_email_with_attachment(to_email, subject, html_content, text_content=text_content)
 
 
@@ -66,25 +74,133 @@ def send_email_with_attachment(
     text_content: str | None = None,
     attachment: tuple[str, bytes] | None = None,
 ) -> bool:
-    """Send email via Mailgun or SendGrid. attachment is (filename, bytes) e.g. ('letter.pdf', pdf_bytes). Returns True if sent."""
+    """Send email via Mailgun or SendGrid, inline. attachment is (filename, bytes) e.g. ('letter.pdf', pdf_bytes). Returns True if sent."""
     settings = get_settings()
     has_key = bool(settings.mailgun_api_key)
     has_domain = bool(settings.mailgun_domain)
     if has_key and has_domain:
-        print(f"[Email] Calling Mailgun API: to={to_email} subject={subject} domain={settings.mailgun_domain}", flush=True)
         return _send_email_mailgun(to_email, subject, html_content, text_content=text_content, settings=settings, attachment=attachment)
     if settings.sendgrid_api_key:
         return _send_email_sendgrid(to_email, subject, html_content, text_content=text_content, settings=settings, attachment=attachment)
-    print(
-        f"[Email] NOT SENT: to={to_email} subject={subject}. MAILGUN_API_KEY={'set' if has_key else 'MISSING'} MAILGUN_DOMAIN={'set' if has_domain else 'MISSING'}. "
-        "Set both in .env and restart the server.",
-        flush=True,
+    logger.warning(
+        "[Email] NOT SENT: to=%s subject=%s. MAILGUN_API_KEY=%s MAILGUN_DOMAIN=%s. Set both in .env and restart the server.",
+        to_email,
+        subject,
+        "set" if has_key else "MISSING",
+        "set" if has_domain else "MISSING",
     )
     return False
 
 
 MAILGUN_US_BASE = "https://api.mailgun.net"
 MAILGUN_EU_BASE = "https://api.eu.mailgun.net"
+# Mailgun accepts up to 1,000 "to" addresses per call when recipient-variables is set.
+MAILGUN_BATCH_MAX = 1000
+
+
+@dataclass(frozen=True)
+class EmailSendResult:
+    """Outcome of one provider call. retryable: transient failure (network, 429, 5xx) worth sending again later."""
+
+    ok: bool
+    retryable: bool = False
+    error: str | None = None
+
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def _email_http_client():
+    """Process-wide keep-alive HTTP client for the Mailgun API, so consecutive sends reuse the TLS connection."""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                import httpx
+
+                _http_client = httpx.Client(
+                    timeout=15.0,
+                    limits=httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=60.0),
+                )
+    return _http_client
+
+
+def email_provider_configured(settings=None) -> bool:
+    s = settings or get_settings()
+    return bool((s.mailgun_api_key and s.mailgun_domain) or s.sendgrid_api_key)
+
+
+def email_batch_limit(settings=None) -> int:
+    """Recipients one provider call may carry: Mailgun batch sending, SendGrid one at a time, 0 when unconfigured."""
+    s = settings or get_settings()
+    if s.mailgun_api_key and s.mailgun_domain:
+        return MAILGUN_BATCH_MAX
+    return 1 if s.sendgrid_api_key else 0
+
+
+def deliver_email_batch(
+    recipients: list[str], subject: str, html_content: str, text_content: str | None = None
+) -> EmailSendResult:
+    """Send one message to every recipient (each gets their own copy). Used by the outbound dispatcher;
+    callers keep len(recipients) within email_batch_limit()."""
+    settings = get_settings()
+    if settings.mailgun_api_key and settings.mailgun_domain:
+        return _mailgun_send(settings, recipients, subject, html_content, text_content)
+    if settings.sendgrid_api_key and len(recipients) == 1:
+        ok = _send_email_sendgrid(recipients[0], subject, html_content, text_content=text_content, settings=settings)
+        return EmailSendResult(ok, retryable=not ok, error=None if ok else "SendGrid send failed")
+    return EmailSendResult(False, error="No email provider configured for this batch")
+
+
+def _mailgun_send(
+    settings,
+    recipients: list[str],
+    subject: str,
+    html_content: str,
+    text_content: str | None = None,
+    files: dict | None = None,
+) -> EmailSendResult:
+    base = (settings.mailgun_base_url or MAILGUN_US_BASE).strip().rstrip("/")
+    domain = (settings.mailgun_domain or "").strip().lower()
+    from_addr = (settings.mailgun_from_email or "").strip()
+    from_domain = from_addr.split("@")[-1].lower() if "@" in from_addr else ""
+    if domain and from_domain != domain:
+        # Must match the sending domain for delivery (startup logs a warning about the mismatch).
+        from_addr = f"noreply@{domain}"
+    data = {
+        "from": f"{settings.mailgun_from_name} <{from_addr}>",
+        "to": list(recipients),
+        "subject": subject,
+        "text": text_content or "",
+        "html": html_content or "",
+    }
+    if len(recipients) > 1:
+        # Batch send: Mailgun delivers a separate copy per "to" address, so recipients never see each other.
+        data["recipient-variables"] = json.dumps({r: {} for r in recipients})
+    auth = ("api", settings.mailgun_api_key)
+    try:
+        client = _email_http_client()
+        r = client.post(f"{base}/v3/{domain}/messages", auth=auth, data=data, files=files)
+        if r.status_code == 401 and base == MAILGUN_US_BASE:
+            logger.info("[Mailgun] 401 with US endpoint; retrying with EU endpoint")
+            r = client.post(f"{MAILGUN_EU_BASE}/v3/{domain}/messages", auth=auth, data=data, files=files)
+    except Exception as e:
+        logger.warning("[Mailgun] Exception: to=%s error=%s: %s", ",".join(recipients), type(e).__name__, e)
+        return EmailSendResult(False, retryable=True, error=f"{type(e).__name__}: {e}")
+    if 200 <= r.status_code < 300:
+        try:
+            msg_id = (r.json() or {}).get("id", "")
+        except Exception:
+            msg_id = ""
+        logger.info("[Mailgun] Sent: recipients=%s id=%s", len(recipients), msg_id)
+        return EmailSendResult(True)
+    logger.warning("[Mailgun] API failed: status=%s to=%s body=%s", r.status_code, ",".join(recipients), r.text[:500])
+    return EmailSendResult(
+        False,
+        retryable=r.status_code == 429 or r.status_code >= 500,
+        error=f"Mailgun {r.status_code}: {r.text[:500]}",
+    )
 
 
 def _send_email_mailgun(
@@ -94,65 +210,14 @@ def _send_email_mailgun(
     text_content: str | None = None,
     settings=None,
     attachment: tuple[str, bytes] | None = None,
-):
+) -> bool:
     if settings is None:
         settings = get_settings()
-    try:
-        import httpx
-
-        base = (settings.mailgun_base_url or MAILGUN_US_BASE).strip().rstrip("/")
-        domain = (settings.mailgun_domain or "").strip().lower()
-        from_addr = (settings.mailgun_from_email or "").strip()
-        from_domain = from_addr.split("@")[-1].lower() if "@" in from_addr else ""
-        if domain and from_domain != domain:
-            from_addr = f"noreply@{domain}"
-            print(f"[Mailgun] Using from={from_addr} (must match domain {domain} for delivery)", flush=True)
-        from_email = f"{settings.mailgun_from_name} <{from_addr}>"
-        url = f"{base}/v3/{domain}/messages"
-        data = {
-            "from": from_email,
-            "to": to_email,
-            "subject": subject,
-            "text": text_content or "",
-            "html": html_content or "",
-        }
-        files = None
-        if attachment:
-            filename, payload = attachment
-            files = {"attachment": (filename, payload, "application/pdf")}
-        with httpx.Client(timeout=15.0) as client:
-            r = client.post(url, auth=("api", settings.mailgun_api_key), data=data, files=files)
-            ok = 200 <= r.status_code < 300
-            if ok:
-                try:
-                    msg_id = (r.json() or {}).get("id", "")
-                except Exception:
-                    msg_id = ""
-                print(
-                    f"[Mailgun] API success: to={to_email} status={r.status_code} id={msg_id}",
-                    flush=True,
-                )
-                print(
-                    "[Mailgun] If you do not receive the email: (1) Check spam/junk. "
-                    "(2) If using a Mailgun SANDBOX domain, add this address in Dashboard > Sending > Authorized recipients.",
-                    flush=True,
-                )
-                return True
-            if r.status_code == 401 and base == MAILGUN_US_BASE:
-                print("[Mailgun] 401 with US endpoint. Retrying with EU endpoint...", flush=True)
-                url_eu = f"{MAILGUN_EU_BASE}/v3/{domain}/messages"
-                r2 = client.post(url_eu, auth=("api", settings.mailgun_api_key), data=data, files=files)
-                if 200 <= r2.status_code < 300:
-                    print(f"[Mailgun] API success (EU): to={to_email}. If email not received, check spam or add recipient in Mailgun sandbox.", flush=True)
-                    return True
-                print(f"[Mailgun] EU request failed: status={r2.status_code} body={r2.text}", flush=True)
-                return False
-            err_body = r.text
-            print(f"[Mailgun] API failed: status={r.status_code} to={to_email} body={err_body[:500]}", flush=True)
-            return False
-    except Exception as e:
-        print(f"[Mailgun] Exception: to={to_email} error={type(e).__name__}: {e}", flush=True)
-        return False
+    files = None
+    if attachment:
+        filename, payload = attachment
+        files = {"attachment": (filename, payload, "application/pdf")}
+    return _mailgun_send(settings, [to_email], subject, html_content, text_content, files=files).ok
 
 
 def _send_email_sendgrid(
@@ -194,13 +259,8 @@ def _send_email_sendgrid(
 
 
 def send_verification_email(to_email: str, code: str) -> bool:
-    """Send 6-digit verification code email for signup. Uses same Mailgun path as test-email (send_email -> _send_email_mailgun)."""
-    # Use fresh settings so UI flow sees same .env as script (avoids stale cache when server started before .env had Mailgun)
-    _get_fresh_settings()
-    s = get_settings()
-    domain = (s.mailgun_domain or "").strip() or "(none)"
-    from_addr = (getattr(s, "mailgun_from_email", None) or "").strip() or "(none)"
-    print(f"[Verification] Sending code to {to_email} domain={domain} from={from_addr} code_len={len(code) if code else 0}", flush=True)
+    """Send 6-digit verification code email for signup (through send_email, like every other notification)."""
+    logger.info("[Verification] Sending code to %s", to_email)
     subject = "[DocuStay] Your verification code"
     text_content = f"Your DocuStay verification code is: {code}. It expires in 10 minutes."
     html_content = f"""
@@ -209,11 +269,7 @@ def send_verification_email(to_email: str, code: str) -> bool:
     <p>This code expires in 10 minutes. If you did not request this, you can ignore this email.</p>
     <p>— DocuStay</p>
     """
-    print(f"[Verification] Calling send_email (Mailgun if configured) for {to_email}", flush=True)
-    ok = send_email(to_email, subject, html_content, text_content=text_content)
-    if ok:
-        print(f"[Verification] Sent successfully to {to_email}. If not received, check spam and Mailgun sandbox (add recipient in dashboard).", flush=True)
-    return ok
+    return send_email(to_email, subject, html_content, text_content=text_content)
 
 
 def send_password_reset_email(to_email: str, reset_link: str, role: str) -> bool:
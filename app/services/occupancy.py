@@ -7,7 +7,12 @@ Units are considered effectively "occupied" when:
 
 This ensures both owner and manager see the same status for units where
 a property manager is assigned as on-site resident.
+
+List/summary views resolve many units at once with ``resolve_units_occupancy``, which answers every unit's
+status, occupancy sources and the property rollups from a fixed number of grouped queries.
 """
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
 from datetime import date
 
 from sqlalchemy import func, or_
@@ -99,21 +104,57 @@ def has_legitimate_occupancy_unknown(db: Session, property_id: int, unit_id: int
     return q.first() is not None
 
 
+def legitimate_occupancy_unknown_keys(db: Session, property_ids: list[int] | set[int]) -> set[tuple[int, int | None]]:
+    """
+    Bulk form of ``has_legitimate_occupancy_unknown``: (property_id, unit_id) for every stay with an unanswered
+    Status Confirmation on these properties. Pass the result as ``unknown_keys`` to
+    ``normalize_occupancy_status_for_display`` to avoid one query per row.
+    """
+    if not property_ids:
+        return set()
+    rows = (
+        db.query(Stay.property_id, Stay.unit_id)
+        .filter(
+            Stay.property_id.in_(list(property_ids)),
+            Stay.dead_mans_switch_triggered_at.isnot(None),
+            Stay.checked_out_at.is_(None),
+            Stay.cancelled_at.is_(None),
+            Stay.occupancy_confirmation_response.is_(None),
+        )
+        .distinct()
+        .all()
+    )
+    return {(pid, uid) for pid, uid in rows}
+
+
+def _legitimate_unknown_in_keys(keys: set[tuple[int, int | None]], property_id: int, unit_id: int | None) -> bool:
+    if unit_id is not None and unit_id > 0:
+        return (property_id, unit_id) in keys
+    return any(pid == property_id for pid, _ in keys)
+
+
 def normalize_occupancy_status_for_display(
     db: Session,
     property_id: int,
     unit_id: int | None,
     stored: str | None,
+    *,
+    unknown_keys: set[tuple[int, int | None]] | None = None,
 ) -> str:
     """
     Vacant if unset or if "unknown" is stale (no Status Confirmation prompt). Keep unknown only when tied to
     an unanswered stay-end confirmation; keep unconfirmed/occupied/vacant as stored.
+    ``unknown_keys`` (from ``legitimate_occupancy_unknown_keys``) answers the unknown check without a query.
     """
     raw = (stored or "").strip().lower()
     if not raw:
         return _VACANT
     if raw == OccupancyStatus.unknown.value:
-        if has_legitimate_occupancy_unknown(db, property_id, unit_id):
+        if unknown_keys is not None:
+            legit = _legitimate_unknown_in_keys(unknown_keys, property_id, unit_id)
+        else:
+            legit = has_legitimate_occupancy_unknown(db, property_id, unit_id)
+        if legit:
             return OccupancyStatus.unknown.value
         return _VACANT
     return raw
@@ -179,6 +220,152 @@ def clear_stored_unit_occupied_without_lease_or_stay(db: Session, property_id: i
         u.occupancy_status = OccupancyStatus.vacant.value
 
 
+# Occupancy sources, in get_units_occupancy_display priority order (stored "occupied" has no occupier).
+SOURCE_GUEST_STAY = "guest_stay"
+SOURCE_MANAGER_RESIDENT = "manager_resident"
+SOURCE_TENANT_ASSIGNMENT = "tenant_assignment"
+SOURCE_STORED_OCCUPIED = "stored_occupied"
+_OCCUPIER_SOURCE_PRIORITY = (SOURCE_GUEST_STAY, SOURCE_MANAGER_RESIDENT, SOURCE_TENANT_ASSIGNMENT)
+
+
+@dataclass(frozen=True)
+class UnitOccupancy:
+    unit_id: int
+    property_id: int
+    status: str  # same value as get_unit_display_occupancy_status
+    sources: frozenset[str]  # SOURCE_* reasons the unit counts as occupied; empty when it does not
+
+    @property
+    def effectively_occupied(self) -> bool:
+        return bool(self.sources)
+
+
+@dataclass
+class OccupancySnapshot:
+    """Result of ``resolve_units_occupancy``: per-unit occupancy plus what is needed for property rollups."""
+
+    today: date
+    units: dict[int, UnitOccupancy] = field(default_factory=dict)
+    property_ids: set[int] = field(default_factory=set)
+    unknown_keys: set[tuple[int, int | None]] = field(default_factory=set)
+
+    def unit_status(self, unit_id: int) -> str:
+        return self.units[unit_id].status
+
+    def occupied_count(self, units: Iterable[Unit | int]) -> int:
+        """``count_effectively_occupied_units`` over resolved units."""
+        return sum(1 for u in units if self.units[_unit_id(u)].effectively_occupied)
+
+    def property_status(self, prop, units: Iterable[Unit | int]) -> str:
+        """``get_property_display_occupancy_status`` for ``prop`` given its (resolved) units."""
+        if prop.id not in self.property_ids:
+            raise KeyError(f"property {prop.id} was not included in resolve_units_occupancy")
+        if self.occupied_count(units) > 0:
+            return OccupancyStatus.occupied.value
+        return normalize_occupancy_status_for_display(
+            None, prop.id, None, prop.occupancy_status or _VACANT, unknown_keys=self.unknown_keys
+        )
+
+    def occupancy_source(self, unit_id: int, *, guest_detail_unit_ids: set[int] | None = None) -> str:
+        """Tier supplying display occupancy (``get_units_occupancy_sources`` semantics): guest_stay |
+        manager_resident | tenant_assignment | none."""
+        sources = self.units[unit_id].sources
+        for src in _OCCUPIER_SOURCE_PRIORITY:
+            if src not in sources:
+                continue
+            if src == SOURCE_GUEST_STAY and guest_detail_unit_ids is not None and unit_id not in guest_detail_unit_ids:
+                continue
+            return src
+        return "none"
+
+
+def _unit_id(u: Unit | int) -> int:
+    return u if isinstance(u, int) else u.id
+
+
+def resolve_units_occupancy(
+    db: Session,
+    units: Sequence[Unit],
+    today: date | None = None,
+    *,
+    property_ids: Iterable[int] = (),
+) -> OccupancySnapshot:
+    """
+    Bulk occupancy for ``units`` as of ``today`` (default: server date) in four grouped queries, regardless of
+    unit count: active leases, manager on-site residents, checked-in guest stays and unanswered Status
+    Confirmations. ``property_ids`` adds properties (e.g. ones without Unit rows) whose rollup will be asked for;
+    the units' own properties are always included.
+    """
+    today = today or date.today()
+    snapshot = OccupancySnapshot(today=today)
+    snapshot.property_ids = {u.property_id for u in units} | set(property_ids)
+    unit_ids = list({u.id for u in units})
+    leased: set[int] = set()
+    resident: set[int] = set()
+    checked_in: set[int] = set()
+    if unit_ids:
+        leased = {
+            r[0]
+            for r in db.query(TenantAssignment.unit_id)
+            .filter(
+                TenantAssignment.unit_id.in_(unit_ids),
+                TenantAssignment.start_date.isnot(None),
+                TenantAssignment.start_date <= today,
+                or_(TenantAssignment.end_date.is_(None), TenantAssignment.end_date >= today),
+            )
+            .distinct()
+            .all()
+        }
+        resident = {
+            r[0]
+            for r in db.query(ResidentMode.unit_id)
+            .filter(ResidentMode.unit_id.in_(unit_ids), ResidentMode.mode == ResidentModeType.manager_personal)
+            .distinct()
+            .all()
+        }
+        checked_in = {
+            r[0]
+            for r in db.query(Stay.unit_id)
+            .filter(
+                Stay.unit_id.in_(unit_ids),
+                Stay.checked_in_at.isnot(None),
+                Stay.checked_out_at.is_(None),
+                Stay.cancelled_at.is_(None),
+            )
+            .distinct()
+            .all()
+        }
+    snapshot.unknown_keys = legitimate_occupancy_unknown_keys(db, snapshot.property_ids)
+
+    for u in units:
+        sources = set()
+        if (u.occupancy_status or "").lower() == OccupancyStatus.occupied.value:
+            sources.add(SOURCE_STORED_OCCUPIED)
+        if u.id in leased:
+            sources.add(SOURCE_TENANT_ASSIGNMENT)
+        if u.id in resident:
+            sources.add(SOURCE_MANAGER_RESIDENT)
+        if u.id in checked_in:
+            sources.add(SOURCE_GUEST_STAY)
+        if sources:
+            status = OccupancyStatus.occupied.value
+        else:
+            status = normalize_occupancy_status_for_display(
+                None, u.property_id, u.id, u.occupancy_status or _VACANT, unknown_keys=snapshot.unknown_keys
+            )
+        snapshot.units[u.id] = UnitOccupancy(
+            unit_id=u.id, property_id=u.property_id, status=status, sources=frozenset(sources)
+        )
+    return snapshot
+
+
+def resolve_unit_ids_occupancy(db: Session, unit_ids: Iterable[int], today: date | None = None) -> OccupancySnapshot:
+    """``resolve_units_occupancy`` for unit ids (loads the Unit rows in one query)."""
+    ids = list(set(unit_ids))
+    units = db.query(Unit).filter(Unit.id.in_(ids)).all() if ids else []
+    return resolve_units_occupancy(db, units, today)
+
+
 def is_unit_effectively_occupied(db: Session, unit: Unit) -> bool:
     """True if the unit is occupied (stored status) or has an on-site resident (ResidentMode)."""
     if (unit.occupancy_status or "").lower() == OccupancyStatus.occupied.value:
@@ -203,19 +390,19 @@ def get_unit_display_occupancy_status(db: Session, unit: Unit) -> str:
 
 def count_effectively_occupied_units(db: Session, units: list[Unit]) -> int:
     """Count how many units are effectively occupied (stored or on-site resident)."""
-    return sum(1 for u in units if is_unit_effectively_occupied(db, u))
+    if not units:
+        return 0
+    return resolve_units_occupancy(db, units).occupied_count(units)
 
 
 def get_property_display_occupancy_status(
     db: Session, prop, units: list[Unit]
 ) -> str:
-    """Return property-level occupancy status for display (occupied if any unit is effectively occupied)."""
+    """Return property-level occupancy status for display (occupied if any unit is effectively occupied).
+    Callers that also need unit statuses or counts should use ``resolve_units_occupancy`` once instead."""
     if not units:
         return normalize_occupancy_status_for_display(db, prop.id, None, prop.occupancy_status or _VACANT)
-    occupied_count = count_effectively_occupied_units(db, units)
-    if occupied_count > 0:
-        return OccupancyStatus.occupied.value
-    return normalize_occupancy_status_for_display(db, prop.id, None, prop.occupancy_status or _VACANT)
+    return resolve_units_occupancy(db, units, property_ids=[prop.id]).property_status(prop, units)
 
 
 def get_units_occupancy_display(
@@ -376,59 +563,8 @@ def get_units_occupancy_sources(
     """
     if not unit_ids:
         return {}
-    today = date.today()
-    out = {uid: "none" for uid in unit_ids}
-
-    stays = (
-        db.query(Stay)
-        .filter(
-            Stay.unit_id.in_(unit_ids),
-            Stay.checked_in_at.isnot(None),
-            Stay.checked_out_at.is_(None),
-            Stay.cancelled_at.is_(None),
-        )
-        .all()
-    )
-    for s in stays:
-        if s.unit_id not in out:
-            continue
-        if guest_detail_unit_ids is not None and s.unit_id not in guest_detail_unit_ids:
-            continue
-        out[s.unit_id] = "guest_stay"
-
-    still_empty = [uid for uid in unit_ids if out[uid] == "none"]
-    if still_empty:
-        modes = (
-            db.query(ResidentMode)
-            .filter(
-                ResidentMode.unit_id.in_(still_empty),
-                ResidentMode.mode == ResidentModeType.manager_personal,
-            )
-            .all()
-        )
-        for m in modes:
-            if m.unit_id not in out or out[m.unit_id] != "none":
-                continue
-            out[m.unit_id] = "manager_resident"
-
-    still_empty = [uid for uid in unit_ids if out[uid] == "none"]
-    if still_empty:
-        assignments = (
-            db.query(TenantAssignment)
-            .filter(
-                TenantAssignment.unit_id.in_(still_empty),
-                TenantAssignment.start_date.isnot(None),
-                TenantAssignment.start_date <= today,
-                or_(
-                    TenantAssignment.end_date.is_(None),
-                    TenantAssignment.end_date >= today,
-                ),
-            )
-            .all()
-        )
-        for a in assignments:
-            if a.unit_id not in out or out[a.unit_id] != "none":
-                continue
-            out[a.unit_id] = "tenant_assignment"
-
-    return out
+    snapshot = resolve_unit_ids_occupancy(db, unit_ids)
+    return {
+        uid: snapshot.occupancy_source(uid, guest_detail_unit_ids=guest_detail_unit_ids) if uid in snapshot.units else "none"
+        for uid in unit_ids
+    }
@@ -14,9 +14,14 @@ Permission structure: User + Property/Unit + Role + Mode + Action
 Personal vs Business Mode: Users can switch modes, but privacy rules still apply.
 Switching to personal mode does NOT unlock tenant-private information.
 Unit resident presence (SET_PRESENCE) is allowed only for users with a tenant assignment on that unit.
+
+The helpers answer from an AuthzContext: the user's owned properties, managed properties, personal-mode units and
+tenant units, each loaded on first use with one query and kept on the DB session (one per request) until the session
+commits, rolls back or flushes a change to any of those rows. Handlers that check several rows per request therefore
+query the scope once instead of per call.
 """
 from enum import Enum
-from sqlalchemy import func, or_
+from sqlalchemy import and_, event, func, or_, select
 from sqlalchemy.orm import Session
 from app.models.user import User, UserRole
 from app.models.owner import OwnerProfile, Property, OccupancyStatus
@@ -44,6 +49,149 @@ class Action(str, Enum):
     INVITE_TENANT = "invite_tenant"
 
 
+class AuthzContext:
+    """Authorization scope of one user within one DB session. Each set is loaded lazily, in one query, on first use.
+
+    Obtain with ``get_authz_context(db, user_id)``; the returned collections are shared, so treat them as read-only.
+    """
+
+    def __init__(self, db: Session, user_id: int):
+        self.db = db
+        self.user_id = user_id
+        self._owner_loaded = False
+        self._owner_profile_id: int | None = None
+        self._owned: dict[int, tuple[bool, bool]] = {}  # property id -> (active i.e. not deleted, owner_occupied)
+        self._managed_property_ids: set[int] | None = None
+        self._manager_units: dict[int, int] | None = None  # manager personal-mode unit id -> property id
+        self._tenant_units: dict[int, int] | None = None  # assigned unit id -> property id
+        self._owner_personal_units: list[int] | None = None
+        self._unit_property: dict[int, int | None] = {}
+
+    def _load_owner(self) -> None:
+        if self._owner_loaded:
+            return
+        rows = self.db.execute(
+            select(OwnerProfile.id, Property.id, Property.deleted_at.is_(None), Property.owner_occupied)
+            .outerjoin(Property, Property.owner_profile_id == OwnerProfile.id)
+            .where(OwnerProfile.user_id == self.user_id)
+        ).all()
+        self._owner_profile_id = rows[0][0] if rows else None
+        self._owned = {pid: (bool(active), bool(occupied)) for _, pid, active, occupied in rows if pid is not None}
+        self._owner_loaded = True
+
+    @property
+    def owner_profile_id(self) -> int | None:
+        self._load_owner()
+        return self._owner_profile_id
+
+    def owns_property(self, property_id: int, *, include_deleted: bool = False) -> bool:
+        """Property is on the user's owner profile (soft-deleted ones only with ``include_deleted``)."""
+        self._load_owner()
+        state = self._owned.get(property_id)
+        return state is not None and (include_deleted or state[0])
+
+    def owner_occupied(self, property_id: int) -> bool:
+        self._load_owner()
+        state = self._owned.get(property_id)
+        return state is not None and state[1]
+
+    @property
+    def owned_property_ids(self) -> set[int]:
+        """Every property on the owner profile, soft-deleted included."""
+        self._load_owner()
+        return set(self._owned)
+
+    @property
+    def owner_personal_property_ids(self) -> list[int]:
+        """Active owner_occupied properties (owner personal mode)."""
+        self._load_owner()
+        return [pid for pid, (active, occupied) in self._owned.items() if active and occupied]
+
+    @property
+    def managed_property_ids(self) -> set[int]:
+        if self._managed_property_ids is None:
+            self._managed_property_ids = set(
+                self.db.scalars(
+                    select(PropertyManagerAssignment.property_id).where(PropertyManagerAssignment.user_id == self.user_id)
+                )
+            )
+        return self._managed_property_ids
+
+    @property
+    def manager_personal_units(self) -> dict[int, int]:
+        """Units where the user has manager Personal Mode (lives on-site) -> their property id."""
+        if self._manager_units is None:
+            self._manager_units = dict(
+                self.db.execute(
+                    select(ResidentMode.unit_id, Unit.property_id)
+                    .join(Unit, Unit.id == ResidentMode.unit_id)
+                    .where(ResidentMode.user_id == self.user_id, ResidentMode.mode == ResidentModeType.manager_personal)
+                ).all()
+            )
+        return self._manager_units
+
+    @property
+    def tenant_units(self) -> dict[int, int]:
+        """Units the user has a tenant assignment on -> their property id."""
+        if self._tenant_units is None:
+            self._tenant_units = dict(
+                self.db.execute(
+                    select(TenantAssignment.unit_id, Unit.property_id)
+                    .join(Unit, Unit.id == TenantAssignment.unit_id)
+                    .where(TenantAssignment.user_id == self.user_id)
+                ).all()
+            )
+        return self._tenant_units
+
+    @property
+    def owner_personal_units(self) -> list[int]:
+        """See ``get_owner_personal_mode_units``."""
+        if self._owner_personal_units is None:
+            self._owner_personal_units = _load_owner_personal_mode_units(self.db, self.owner_personal_property_ids)
+        return self._owner_personal_units
+
+    def unit_property_id(self, unit_id: int) -> int | None:
+        """Property of ``unit_id`` (None if the unit does not exist); memoized per unit."""
+        if unit_id not in self._unit_property:
+            known = {**(self._tenant_units or {}), **(self._manager_units or {})}
+            if unit_id in known:
+                self._unit_property[unit_id] = known[unit_id]
+            else:
+                self._unit_property[unit_id] = self.db.scalar(select(Unit.property_id).where(Unit.id == unit_id))
+        return self._unit_property[unit_id]
+
+
+_AUTHZ_INFO_KEY = "authz_contexts"
+
+
+def get_authz_context(db: Session, user_id: int) -> AuthzContext:
+    """The AuthzContext of ``user_id`` for this session (request), created on first use."""
+    contexts = db.info.setdefault(_AUTHZ_INFO_KEY, {})
+    ctx = contexts.get(user_id)
+    if ctx is None:
+        ctx = contexts[user_id] = AuthzContext(db, user_id)
+    return ctx
+
+
+# Rows that make up an AuthzContext: a flush touching any of them, or the end of the transaction, drops the session's
+# contexts so the next check reloads them.
+_AUTHZ_SCOPED = (OwnerProfile, Property, Unit, PropertyManagerAssignment, TenantAssignment, ResidentMode)
+
+
+@event.listens_for(Session, "after_flush")
+def _drop_authz_contexts_on_scope_write(session: Session, flush_context) -> None:
+    if _AUTHZ_INFO_KEY in session.info and any(
+        isinstance(obj, _AUTHZ_SCOPED) for obj in (*session.new, *session.dirty, *session.deleted)
+    ):
+        session.info.pop(_AUTHZ_INFO_KEY, None)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _drop_authz_contexts(session: Session) -> None:
+    session.info.pop(_AUTHZ_INFO_KEY, None)
+
+
 def can_perform_action(
     db: Session,
     user: User,
@@ -53,22 +201,20 @@ def can_perform_action(
     mode: str = "business",
 ) -> bool:
     """Evaluate User + Property/Unit + Role + Mode + Action. Returns True if allowed."""
+    ctx = get_authz_context(db, user.id)
     if action == Action.VIEW_BILLING:
         if user.role == UserRole.owner:
-            return db.query(OwnerProfile).filter(OwnerProfile.user_id == user.id).first() is not None
+            return ctx.owner_profile_id is not None
         if user.role == UserRole.property_manager:
             if property_id is None:
                 return False
-            return db.query(PropertyManagerAssignment).filter(
-                PropertyManagerAssignment.property_id == property_id,
-                PropertyManagerAssignment.user_id == user.id,
-            ).first() is not None
+            return property_id in ctx.managed_property_ids
         return False
 
     if action == Action.MODIFY_BILLING:
         if user.role != UserRole.owner:
             return False
-        return db.query(OwnerProfile).filter(OwnerProfile.user_id == user.id).first() is not None
+        return ctx.owner_profile_id is not None
 
     if action == Action.INVITE_GUEST:
         if unit_id is None:
@@ -81,10 +227,7 @@ def can_perform_action(
         # Tenant lane only: assigned tenant on this unit (not owner/manager personal residence).
         if user.role != UserRole.tenant:
             return False
-        return db.query(TenantAssignment).filter(
-            TenantAssignment.unit_id == unit_id,
-            TenantAssignment.user_id == user.id,
-        ).first() is not None
+        return unit_id in ctx.tenant_units
 
     if action == Action.VIEW_LOGS:
         if property_id is None:
@@ -112,86 +255,48 @@ def can_perform_action(
 
 def can_access_property(db: Session, user: User, property_id: int, mode: str = "business") -> bool:
     """True if user can access this property in the given mode."""
+    ctx = get_authz_context(db, user.id)
     if user.role == UserRole.owner:
-        profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == user.id).first()
-        if not profile:
-            return False
-        prop = db.query(Property).filter(
-            Property.id == property_id,
-            Property.owner_profile_id == profile.id,
-            Property.deleted_at.is_(None),
-        ).first()
-        if prop is None:
+        if not ctx.owns_property(property_id):
             return False
         # Personal mode: only properties owner has marked as primary (owner_occupied)
         if mode == "personal":
-            return bool(prop.owner_occupied)
+            return ctx.owner_occupied(property_id)
         return True
     if user.role == UserRole.property_manager:
         # Business: only properties assigned to this manager. Personal: only properties they are assigned to live on (ResidentMode).
         if mode == "business":
-            return db.query(PropertyManagerAssignment).filter(
-                PropertyManagerAssignment.property_id == property_id,
-                PropertyManagerAssignment.user_id == user.id,
-            ).first() is not None
+            return property_id in ctx.managed_property_ids
         if mode == "personal":
-            unit_ids = [r[0] for r in db.query(Unit.id).filter(Unit.property_id == property_id).all()]
-            if not unit_ids:
-                return False
-            return db.query(ResidentMode).filter(
-                ResidentMode.unit_id.in_(unit_ids),
-                ResidentMode.user_id == user.id,
-                ResidentMode.mode == ResidentModeType.manager_personal,
-            ).first() is not None
+            return property_id in ctx.manager_personal_units.values()
     if user.role == UserRole.tenant:
         # Tenant can only access property via their assigned unit
-        ta = db.query(TenantAssignment).join(Unit).filter(
-            TenantAssignment.user_id == user.id,
-            Unit.property_id == property_id,
-        ).first()
-        return ta is not None
+        return property_id in ctx.tenant_units.values()
     return False
 
 
 def can_access_unit(db: Session, user: User, unit_id: int, mode: str = "business") -> bool:
     """True if user can access this unit in the given mode."""
-    unit = db.query(Unit).filter(Unit.id == unit_id).first()
-    if not unit:
+    ctx = get_authz_context(db, user.id)
+    property_id = ctx.unit_property_id(unit_id)
+    if property_id is None:
         return False
     if user.role == UserRole.owner:
-        profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == user.id).first()
-        if not profile:
-            return False
-        prop = db.query(Property).filter(
-            Property.id == unit.property_id,
-            Property.owner_profile_id == profile.id,
-        ).first()
-        if prop is None:
+        if not ctx.owns_property(property_id, include_deleted=True):
             return False
         # Personal mode: only units the owner personally occupies (primary residence), not rented units.
         if mode == "personal":
-            if not prop.owner_occupied:
+            if not ctx.owner_occupied(property_id):
                 return False
-            allowed = set(get_owner_personal_mode_units(db, user.id))
-            return unit.id in allowed
+            return unit_id in ctx.owner_personal_units
         return True
     if user.role == UserRole.property_manager:
         if mode == "business":
-            return db.query(PropertyManagerAssignment).filter(
-                PropertyManagerAssignment.property_id == unit.property_id,
-                PropertyManagerAssignment.user_id == user.id,
-            ).first() is not None
+            return property_id in ctx.managed_property_ids
         if mode == "personal":
-            return db.query(ResidentMode).filter(
-                ResidentMode.unit_id == unit_id,
-                ResidentMode.user_id == user.id,
-                ResidentMode.mode == ResidentModeType.manager_personal,
-            ).first() is not None
+            return unit_id in ctx.manager_personal_units
     if user.role == UserRole.tenant:
-        return db.query(TenantAssignment).filter(
-            TenantAssignment.unit_id == unit_id,
-            TenantAssignment.user_id == user.id,
-        ).first() is not None
+        return unit_id in ctx.tenant_units
     return False
 
 
@@ -204,11 +309,8 @@ def can_modify_billing(db: Session, user: User, owner_profile_id: int) -> bool:
     """True only for owners who own this profile. Property managers cannot modify billing."""
     if user.role != UserRole.owner:
         return False
-    profile = db.query(OwnerProfile).filter(
-        OwnerProfile.id == owner_profile_id,
-        OwnerProfile.user_id == user.id,
-    ).first()
-    return profile is not None
+    ctx = get_authz_context(db, user.id)
+    return ctx.owner_profile_id is not None and ctx.owner_profile_id == owner_profile_id
 
 
 def can_assign_property_manager(db: Session, user: User, property_id: int) -> bool:
@@ -221,39 +323,16 @@ def can_confirm_occupancy(db: Session, user: User, stay) -> bool:
     if user.role == UserRole.owner:
         return user_owns_property_by_profile(db, user.id, stay.property_id)
     if user.role == UserRole.property_manager:
-        return db.query(PropertyManagerAssignment).filter(
-            PropertyManagerAssignment.property_id == stay.property_id,
-            PropertyManagerAssignment.user_id == user.id,
-        ).first() is not None
+        return stay.property_id in get_authz_context(db, user.id).managed_property_ids
     return False
 
 
 def can_confirm_occupancy_for_property(db: Session, user: User, property_id: int) -> bool:
     """Owner of the property or a manager assigned to it (business portfolio)."""
     if user.role == UserRole.owner:
-        profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == user.id).first()
-        if not profile:
-            return False
-        return (
-            db.query(Property)
-            .filter(
-                Property.id == property_id,
-                Property.owner_profile_id == profile.id,
-                Property.deleted_at.is_(None),
-            )
-            .first()
-            is not None
-        )
+        return get_authz_context(db, user.id).owns_property(property_id)
     if user.role == UserRole.property_manager:
-        return (
-            db.query(PropertyManagerAssignment)
-            .filter(
-                PropertyManagerAssignment.property_id == property_id,
-                PropertyManagerAssignment.user_id == user.id,
-            )
-            .first()
-            is not None
-        )
+        return property_id in get_authz_context(db, user.id).managed_property_ids
     return False
 
 
@@ -278,10 +357,7 @@ def can_view_audit_logs(db: Session, user: User, property_id: int) -> bool:
     if user.role == UserRole.owner:
         return can_access_property(db, user, property_id, "business")
     if user.role == UserRole.property_manager:
-        return db.query(PropertyManagerAssignment).filter(
-            PropertyManagerAssignment.property_id == property_id,
-            PropertyManagerAssignment.user_id == user.id,
-        ).first() is not None
+        return property_id in get_authz_context(db, user.id).managed_property_ids
     return False
 
 
@@ -291,24 +367,25 @@ def get_owner_personal_mode_units(db: Session, user_id: int) -> list[int]:
     Only `owner_occupied` properties are considered. On multi-unit properties, only unit(s) marked
     `is_primary_residence` are included — not units rented to tenants. Single-unit properties use the
     sole Unit row."""
-    unit_ids: list[int] = []
-    profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == user_id).first()
-    if not profile:
-        return []
+    return list(get_authz_context(db, user_id).owner_personal_units)
 
-    primary_props = (
-        db.query(Property)
-        .filter(
-            Property.owner_profile_id == profile.id,
-            Property.deleted_at.is_(None),
-            Property.owner_occupied == True,
-        )
-        .all()
-    )
-    from app.services.unit_display_order import query_units_for_property_ordered
 
-    for prop in primary_props:
-        units = query_units_for_property_ordered(db, prop.id).all()
+def _load_owner_personal_mode_units(db: Session, property_ids: list[int]) -> list[int]:
+    """Units the owner lives in on these owner_occupied properties (one query; see get_owner_personal_mode_units).
+    A single-unit property without a Unit row gets its unit created here."""
+    if not property_ids:
+        return []
+    from app.services.unit_display_order import query_units_for_properties_ordered
+
+    units_by_property: dict[int, list[Unit]] = {}
+    for u in query_units_for_properties_ordered(db, property_ids).all():
+        units_by_property.setdefault(u.property_id, []).append(u)
+    unitless = [pid for pid in property_ids if pid not in units_by_property]
+    props = {p.id: p for p in db.query(Property).filter(Property.id.in_(unitless)).all()} if unitless else {}
+    unit_ids: list[int] = []
+    for pid in property_ids:
+        units = units_by_property.get(pid)
+        prop = props.get(pid)
         if units:
             if len(units) == 1:
                 unit_ids.append(units[0].id)
@@ -316,7 +393,7 @@ def get_owner_personal_mode_units(db: Session, user_id: int) -> list[int]:
                 primaries = [u for u in units if int(getattr(u, "is_primary_residence", 0) or 0) == 1]
                 for u in primaries:
                     unit_ids.append(u.id)
-        elif not prop.is_multi_unit:
+        elif prop is not None and not prop.is_multi_unit:
             u = Unit(
                 property_id=prop.id,
                 unit_label="1",
@@ -331,23 +408,12 @@ def get_owner_personal_mode_units(db: Session, user_id: int) -> list[int]:
 
 def owner_profile_property_ids(db: Session, user_id: int) -> set[int]:
     """Property IDs this user owns via ``OwnerProfile`` (portfolio scope; not ``Stay.owner_id``)."""
-    profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == user_id).first()
-    if not profile:
-        return set()
-    return {r[0] for r in db.query(Property.id).filter(Property.owner_profile_id == profile.id).all()}
+    return get_authz_context(db, user_id).owned_property_ids
 
 
 def user_owns_property_by_profile(db: Session, user_id: int, property_id: int) -> bool:
     """True if ``property_id`` is on this user's owner profile (current record owner in DocuStay)."""
-    profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == user_id).first()
-    if not profile:
-        return False
-    return (
-        db.query(Property.id)
-        .filter(Property.id == property_id, Property.owner_profile_id == profile.id)
-        .first()
-        is not None
-    )
+    return get_authz_context(db, user_id).owns_property(property_id, include_deleted=True)
 
 
 def owner_personal_guest_scope_unit_ids(db: Session, user_id: int) -> set[int]:
@@ -355,92 +421,149 @@ def owner_personal_guest_scope_unit_ids(db: Session, user_id: int) -> set[int]:
     return set(get_owner_personal_mode_units(db, user_id))
 
 
-def invitation_in_owner_personal_guest_scope(db: Session, inv: Invitation, allowed_unit_ids: set[int]) -> bool:
+def _property_unit_ids(
+    db: Session,
+    property_id: int,
+    unit_ids_by_property: dict[int, list[int]] | None = None,
+) -> list[int]:
+    if unit_ids_by_property is not None:
+        return unit_ids_by_property.get(property_id, [])
+    return [r[0] for r in db.query(Unit.id).filter(Unit.property_id == property_id).all()]
+
+
+def invitation_in_owner_personal_guest_scope(
+    db: Session,
+    inv: Invitation,
+    allowed_unit_ids: set[int],
+    *,
+    unit_ids_by_property: dict[int, list[int]] | None = None,
+) -> bool:
     """True if this invitation's guest activity may be shown to the owner in personal mode."""
     if inv.unit_id is not None:
         return inv.unit_id in allowed_unit_ids
-    rows = db.query(Unit.id).filter(Unit.property_id == inv.property_id).all()
-    ids = [r[0] for r in rows]
+    ids = _property_unit_ids(db, inv.property_id, unit_ids_by_property)
     if len(ids) == 1 and ids[0] in allowed_unit_ids:
         return True
     return False
 
 
-def stay_in_owner_personal_guest_scope(db: Session, stay: Stay, allowed_unit_ids: set[int]) -> bool:
+def stay_in_owner_personal_guest_scope(
+    db: Session,
+    stay: Stay,
+    allowed_unit_ids: set[int],
+    *,
+    invitations_by_id: dict[int, Invitation] | None = None,
+    unit_ids_by_property: dict[int, list[int]] | None = None,
+) -> bool:
     """True if this stay's guest activity may be shown to the owner in personal mode."""
     if stay.unit_id is not None:
         return stay.unit_id in allowed_unit_ids
     if stay.invitation_id:
-        inv = db.query(Invitation).filter(Invitation.id == stay.invitation_id).first()
+        inv = invitations_by_id.get(stay.invitation_id) if invitations_by_id is not None else None
+        if inv is None:
+            inv = db.query(Invitation).filter(Invitation.id == stay.invitation_id).first()
         if inv:
-            return invitation_in_owner_personal_guest_scope(db, inv, allowed_unit_ids)
-    rows = db.query(Unit.id).filter(Unit.property_id == stay.property_id).all()
-    ids = [r[0] for r in rows]
+            return invitation_in_owner_personal_guest_scope(
+                db, inv, allowed_unit_ids, unit_ids_by_property=unit_ids_by_property
+            )
+    ids = _property_unit_ids(db, stay.property_id, unit_ids_by_property)
     if len(ids) == 1 and ids[0] in allowed_unit_ids:
         return True
     return False
 
 
-def invitation_in_manager_personal_guest_scope(db: Session, inv: Invitation, manager_unit_ids: set[int]) -> bool:
+def invitation_in_manager_personal_guest_scope(
+    db: Session,
+    inv: Invitation,
+    manager_unit_ids: set[int],
+    *,
+    unit_ids_by_property: dict[int, list[int]] | None = None,
+) -> bool:
     """Manager sees guest data only for units where they are the on-site resident."""
     if inv.unit_id is not None:
         return inv.unit_id in manager_unit_ids
-    rows = db.query(Unit.id).filter(Unit.property_id == inv.property_id).all()
-    ids = [r[0] for r in rows]
+    ids = _property_unit_ids(db, inv.property_id, unit_ids_by_property)
     if len(ids) == 1 and ids[0] in manager_unit_ids:
         return True
     return False
 
 
-def stay_in_manager_personal_guest_scope(db: Session, stay: Stay, manager_unit_ids: set[int]) -> bool:
+def stay_in_manager_personal_guest_scope(
+    db: Session,
+    stay: Stay,
+    manager_unit_ids: set[int],
+    *,
+    invitations_by_id: dict[int, Invitation] | None = None,
+    unit_ids_by_property: dict[int, list[int]] | None = None,
+) -> bool:
     if stay.unit_id is not None:
         return stay.unit_id in manager_unit_ids
     if stay.invitation_id:
-        inv = db.query(Invitation).filter(Invitation.id == stay.invitation_id).first()
+        inv = invitations_by_id.get(stay.invitation_id) if invitations_by_id is not None else None
+        if inv is None:
+            inv = db.query(Invitation).filter(Invitation.id == stay.invitation_id).first()
         if inv:
-            return invitation_in_manager_personal_guest_scope(db, inv, manager_unit_ids)
-    rows = db.query(Unit.id).filter(Unit.property_id == stay.property_id).all()
-    ids = [r[0] for r in rows]
+            return invitation_in_manager_personal_guest_scope(
+                db, inv, manager_unit_ids, unit_ids_by_property=unit_ids_by_property
+            )
+    ids = _property_unit_ids(db, stay.property_id, unit_ids_by_property)
     if len(ids) == 1 and ids[0] in manager_unit_ids:
         return True
     return False
 
 
+# SQL counterparts of the personal-mode guest scope checks above (owner and manager rules are identical; only the unit
+# set differs), for feeds that must filter before LIMIT.
+
+
+def _sole_unit_in_clause(property_id_col, unit_ids: set[int]):
+    """The property has exactly one unit, and it is in ``unit_ids``."""
+    return and_(
+        select(func.count(Unit.id)).where(Unit.property_id == property_id_col).scalar_subquery() == 1,
+        select(Unit.id).where(Unit.property_id == property_id_col, Unit.id.in_(unit_ids)).exists(),
+    )
+
+
+def personal_guest_scope_invitation_ids(unit_ids: set[int]):
+    """SELECT of invitation ids in personal guest scope (``invitation_in_*_personal_guest_scope``)."""
+    return select(Invitation.id).where(
+        or_(
+            and_(Invitation.unit_id.isnot(None), Invitation.unit_id.in_(unit_ids)),
+            and_(Invitation.unit_id.is_(None), _sole_unit_in_clause(Invitation.property_id, unit_ids)),
+        )
+    )
+
+
+def personal_guest_scope_stay_ids(unit_ids: set[int]):
+    """SELECT of stay ids in personal guest scope (``stay_in_*_personal_guest_scope``)."""
+    return select(Stay.id).where(
+        or_(
+            and_(Stay.unit_id.isnot(None), Stay.unit_id.in_(unit_ids)),
+            and_(Stay.unit_id.is_(None), Stay.invitation_id.in_(personal_guest_scope_invitation_ids(unit_ids))),
+            and_(
+                Stay.unit_id.is_(None),
+                ~select(Invitation.id).where(Invitation.id == Stay.invitation_id).exists(),
+                _sole_unit_in_clause(Stay.property_id, unit_ids),
+            ),
+        )
+    )
+
+
 def get_manager_personal_mode_units(db: Session, user_id: int) -> list[int]:
     """Return unit IDs where this property manager has Personal Mode (lives on-site)."""
-    rows = db.query(ResidentMode.unit_id).filter(
-        ResidentMode.user_id == user_id,
-        ResidentMode.mode == ResidentModeType.manager_personal,
-    ).all()
-    return [r[0] for r in rows]
+    return list(get_authz_context(db, user_id).manager_personal_units)
 
 
 def get_owner_personal_mode_property_ids(db: Session, user_id: int) -> list[int]:
     """Return property IDs where this owner has Personal Mode (properties marked as primary / owner_occupied).
     Used to scope dashboard alerts in personal mode: only alerts for these properties are shown."""
-    profile = db.query(OwnerProfile).filter(OwnerProfile.user_id == user_id).first()
-    if not profile:
-        return []
-    rows = (
-        db.query(Property.id)
-        .filter(
-            Property.owner_profile_id == profile.id,
-            Property.deleted_at.is_(None),
-            Property.owner_occupied == True,
-        )
-        .all()
-    )
-    return [r[0] for r in rows]
+    return get_authz_context(db, user_id).owner_personal_property_ids
 
 
 def get_manager_personal_mode_property_ids(db: Session, user_id: int) -> list[int]:
     """Return property IDs where this manager has Personal Mode (lives on-site).
     Used to scope dashboard alerts in personal mode: only alerts for these properties are shown."""
-    unit_ids = get_manager_personal_mode_units(db, user_id)
-    if not unit_ids:
-        return []
-    rows = db.query(Unit.property_id).filter(Unit.id.in_(unit_ids)).distinct().all()
-    return [r[0] for r in rows]
+    return list(dict.fromkeys(get_authz_context(db, user_id).manager_personal_units.values()))
 
 
 def validate_invite_email_role(db: Session, email: str, expected_role: UserRole) -> str | None:
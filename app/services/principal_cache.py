@@ -0,0 +1,206 @@
+"""
+Process-wide cache of authenticated principals (the claims auth checks need), keyed by user id.
+
+``get_current_user`` loads the full ``User`` row on every request and ``require_owner_onboarding_complete`` adds an
+``OwnerPOASignature`` lookup; the dashboard fires several of these in parallel per page. A ``Principal`` holds just
+what the auth dependencies decide on (role, identity verification, POA / onboarding status, owner profile id) and is
+loaded in one query, so routes that depend on ``get_current_principal`` do no auth queries on a hit.
+
+Entries are dropped when a session commits a change to the user, their owner profile or a POA signature linked to
+them. Other workers cannot see this process's invalidations, so entries also expire after
+``principal_cache_ttl_seconds``; a token whose role claim disagrees with the cached role, and any check that would
+deny access (identity not verified, POA not linked), re-read the database instead of trusting the cache, so a stale
+entry can only lag behind a revocation, never block a user who just completed onboarding.
+Cached principals are shared between requests and are immutable.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterable
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+
+from app.models.owner import OwnerProfile
+from app.models.owner_poa_signature import OwnerPOASignature
+from app.models.user import User, UserRole
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Authenticated user as seen by the auth dependencies."""
+    user_id: int
+    email: str
+    role: UserRole
+    identity_verified_at: datetime | None
+    poa_waived_at: datetime | None
+    poa_signature_id: int | None  # Master POA linked to this user, if any
+    owner_profile_id: int | None
+
+    @property
+    def id(self) -> int:
+        return self.user_id
+
+    @property
+    def identity_verified(self) -> bool:
+        return self.identity_verified_at is not None
+
+    @property
+    def poa_linked(self) -> bool:
+        """Owner onboarding is complete: Master POA linked, or waived for legacy owners."""
+        return self.poa_signature_id is not None or self.poa_waived_at is not None
+
+
+@dataclass
+class _Entry:
+    version: int
+    stored_at: float
+    principal: Principal
+
+
+_lock = threading.Lock()
+_versions: dict[int, int] = {}
+_entries: OrderedDict[int, _Entry] = OrderedDict()
+_hits = 0
+_misses = 0
+_invalidations = 0
+
+
+def _settings():
+    from app.config import get_settings
+
+    return get_settings()
+
+
+def load_principal(db: Session, user_id: int) -> Principal | None:
+    """Read the principal of ``user_id`` from the database (one query), or None if the user does not exist."""
+    row = db.execute(
+        select(
+            User.id,
+            User.email,
+            User.role,
+            User.identity_verified_at,
+            User.poa_waived_at,
+            OwnerPOASignature.id,
+            OwnerProfile.id,
+        )
+        .outerjoin(OwnerPOASignature, OwnerPOASignature.used_by_user_id == User.id)
+        .outerjoin(OwnerProfile, OwnerProfile.user_id == User.id)
+        .where(User.id == user_id)
+        .limit(1)
+    ).first()
+    if row is None:
+        return None
+    return Principal(*row)
+
+
+def get_principal(db: Session, user_id: int, *, role_claim: str | None = None, fresh: bool = False) -> Principal | None:
+    """Cached principal of ``user_id``, loading (and caching) it on a miss.
+
+    ``role_claim`` is the token's role; a cached entry with a different role is reloaded. ``fresh`` skips the cache
+    read (the result is still stored), for checks about to deny access.
+    """
+    global _hits, _misses
+    settings = _settings()
+    ttl = settings.principal_cache_ttl_seconds
+    with _lock:
+        version = _versions.get(user_id, 0)
+        entry = _entries.get(user_id)
+        if (
+            entry is not None
+            and not fresh
+            and ttl > 0
+            and entry.version == version
+            and time.monotonic() - entry.stored_at <= ttl
+            and (role_claim is None or entry.principal.role.value == role_claim)
+        ):
+            _entries.move_to_end(user_id)
+            _hits += 1
+            return entry.principal
+        if entry is not None:
+            del _entries[user_id]
+        _misses += 1
+
+    principal = load_principal(db, user_id)
+    if principal is None or ttl <= 0:
+        return principal
+    with _lock:
+        # A commit that touched the user while we were reading may have raced our read; do not cache that value.
+        if version == _versions.get(user_id, 0):
+            _entries[user_id] = _Entry(version, time.monotonic(), principal)
+            _entries.move_to_end(user_id)
+            while len(_entries) > max(1, settings.principal_cache_max_entries):
+                _entries.popitem(last=False)
+    return principal
+
+
+def invalidate_principals(user_ids: Iterable[int]) -> None:
+    """Drop the cached principals of these users (this process only)."""
+    global _invalidations
+    ids = {int(u) for u in user_ids if u is not None}
+    if not ids:
+        return
+    with _lock:
+        for uid in ids:
+            _versions[uid] = _versions.get(uid, 0) + 1
+            _entries.pop(uid, None)
+        _invalidations += len(ids)
+
+
+def clear_principal_cache() -> None:
+    global _hits, _misses, _invalidations
+    with _lock:
+        _entries.clear()
+        _versions.clear()
+        _hits = _misses = _invalidations = 0
+
+
+def get_principal_cache_stats() -> dict[str, Any]:
+    """Hit/miss counters and size of this worker's principal cache."""
+    with _lock:
+        return {
+            "entries": len(_entries),
+            "hits": _hits,
+            "misses": _misses,
+            "invalidations": _invalidations,
+        }
+
+
+# --- Invalidation: user ids touched by a flush are collected per session and applied on commit (same scheme as
+# app.services.live_page_cache). ---
+
+_SESSION_INFO_KEY = "principal_dirty_user_ids"
+
+
+def _touched_user_ids(session: Session) -> set[int]:
+    user_ids: set[int] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, User):
+            if obj.id is not None:
+                user_ids.add(obj.id)
+        elif isinstance(obj, OwnerProfile):
+            if obj.user_id is not None:
+                user_ids.add(obj.user_id)
+        elif isinstance(obj, OwnerPOASignature):
+            if obj.used_by_user_id is not None:
+                user_ids.add(obj.used_by_user_id)
+            # Unlinking (used_by_user_id -> None) affects the previous user.
+            history = inspect(obj).attrs.used_by_user_id.history
+            user_ids.update(u for u in (history.deleted or ()) if u is not None)
+    return user_ids
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_touched_users(session: Session, flush_context) -> None:
+    touched = _touched_user_ids(session)
+    if touched:
+        session.info.setdefault(_SESSION_INFO_KEY, set()).update(touched)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    invalidate_principals(session.info.pop(_SESSION_INFO_KEY, ()))
@@ -13,8 +13,10 @@ personal mode does NOT unlock tenant-private information.
 """
 from datetime import date
 
-from sqlalchemy import or_
+from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Session
+from app.models.dashboard_alert import DashboardAlert
+from app.models.event_ledger import EventLedger
 from app.models.user import User, UserRole
 from app.models.invitation import Invitation
 from app.models.stay import Stay
@@ -167,23 +169,36 @@ def get_tenant_lane_stay_ids(db: Session, stay_ids: list[int]) -> set[int]:
     return tenant_stay_ids
 
 
-def is_property_lane_for_owner(db: Session, inv: Invitation, owner_user_id: int) -> bool:
+def is_property_lane_for_owner(
+    db: Session,
+    inv: Invitation,
+    owner_user_id: int,
+    *,
+    users_by_id: dict[int, User] | None = None,
+    manager_assignment_pairs: set[tuple[int, int]] | None = None,
+) -> bool:
     """
     True if this invitation is in the property/management lane for this owner.
     Owner can see: invitations they created, or that their assigned managers created.
     Owner cannot see: tenant-invited invitations.
+    ``manager_assignment_pairs`` is an optional preloaded set of (property_id, manager user_id).
     """
-    if is_tenant_lane_invitation(db, inv):
+    if is_tenant_lane_invitation(db, inv, users_by_id=users_by_id):
         return False
     inviter_id = getattr(inv, "invited_by_user_id", None)
     if inviter_id == owner_user_id:
         return True
     if inviter_id is None:
         return inv.owner_id == owner_user_id
-    inviter = db.query(User).filter(User.id == inviter_id).first()
+    if users_by_id is not None and inviter_id in users_by_id:
+        inviter = users_by_id[inviter_id]
+    else:
+        inviter = db.query(User).filter(User.id == inviter_id).first()
     if not inviter:
         return False
     if inviter.role == UserRole.property_manager:
+        if manager_assignment_pairs is not None:
+            return (inv.property_id, inviter_id) in manager_assignment_pairs
         return db.query(PropertyManagerAssignment).filter(
             PropertyManagerAssignment.property_id == inv.property_id,
             PropertyManagerAssignment.user_id == inviter_id,
@@ -191,14 +206,42 @@ def is_property_lane_for_owner(db: Session, inv: Invitation, owner_user_id: int)
     return inviter.role == UserRole.owner and inv.owner_id == owner_user_id
 
 
-def filter_property_lane_invitations_for_owner(db: Session, invitations: list[Invitation], owner_user_id: int) -> list[Invitation]:
+def filter_property_lane_invitations_for_owner(
+    db: Session,
+    invitations: list[Invitation],
+    owner_user_id: int,
+    *,
+    users_by_id: dict[int, User] | None = None,
+    manager_assignment_pairs: set[tuple[int, int]] | None = None,
+) -> list[Invitation]:
     """Filter to only property-lane invitations (exclude tenant-invited)."""
-    return [inv for inv in invitations if is_property_lane_for_owner(db, inv, owner_user_id)]
+    return [
+        inv
+        for inv in invitations
+        if is_property_lane_for_owner(
+            db,
+            inv,
+            owner_user_id,
+            users_by_id=users_by_id,
+            manager_assignment_pairs=manager_assignment_pairs,
+        )
+    ]
 
 
-def filter_property_lane_stays_for_owner(db: Session, stays: list[Stay], owner_user_id: int) -> list[Stay]:
+def filter_property_lane_stays_for_owner(
+    db: Session,
+    stays: list[Stay],
+    owner_user_id: int,
+    *,
+    invitations_by_id: dict[int, Invitation] | None = None,
+    users_by_id: dict[int, User] | None = None,
+) -> list[Stay]:
     """Filter to only property-lane stays (exclude tenant-invited guest stays)."""
-    return [s for s in stays if not is_tenant_lane_stay(db, s)]
+    return [
+        s
+        for s in stays
+        if not is_tenant_lane_stay(db, s, invitations_by_id=invitations_by_id, users_by_id=users_by_id)
+    ]
 
 
 def filter_property_lane_invitations_for_manager(db: Session, invitations: list[Invitation], manager_user_id: int) -> list[Invitation]:
@@ -301,3 +344,91 @@ def filter_manager_presence_on_tenant_leased_units(db: Session, rows: list) -> l
             and getattr(r, "unit_id", None) in leased_unit_ids
         )
     ]
+
+
+# SQL counterparts of the ledger filters above. Log endpoints page through the ledger with LIMIT, so the lane and
+# presence exclusions must run in the WHERE clause; filtering a page in Python afterwards would return short pages.
+
+
+def _tenant_user_ids_select():
+    return select(User.id).where(User.role == UserRole.tenant)
+
+
+def tenant_lane_stay_clause():
+    """WHERE clause equivalent of ``is_tenant_lane_stay`` (true for tenant-lane stays; never NULL)."""
+    tenant_invitation_ids = select(Invitation.id).where(
+        Invitation.invited_by_user_id.in_(_tenant_user_ids_select())
+    )
+    return or_(
+        and_(Stay.invitation_id.isnot(None), Stay.invitation_id.in_(tenant_invitation_ids)),
+        and_(
+            Stay.invitation_id.is_(None),
+            Stay.invited_by_user_id.isnot(None),
+            Stay.invited_by_user_id.in_(_tenant_user_ids_select()),
+        ),
+    )
+
+
+def tenant_lane_invitation_clause():
+    """WHERE clause equivalent of ``is_tenant_lane_invitation``."""
+    return and_(
+        Invitation.invited_by_user_id.isnot(None),
+        Invitation.invited_by_user_id.in_(_tenant_user_ids_select()),
+    )
+
+
+def _tenant_lane_exclusion_clause(invitation_id_col, stay_id_col):
+    """Rows whose ``invitation_id`` / ``stay_id`` do not point at a tenant-lane invitation or stay."""
+    tenant_invitation_ids = select(Invitation.id).where(
+        Invitation.invited_by_user_id.in_(_tenant_user_ids_select())
+    )
+    tenant_stay_ids_via_invitation = select(Stay.id).where(Stay.invitation_id.in_(tenant_invitation_ids))
+    tenant_stay_ids_direct = select(Stay.id).where(
+        Stay.invitation_id.is_(None),
+        Stay.invited_by_user_id.in_(_tenant_user_ids_select()),
+    )
+    return and_(
+        or_(invitation_id_col.is_(None), invitation_id_col.not_in(tenant_invitation_ids)),
+        or_(
+            stay_id_col.is_(None),
+            and_(
+                stay_id_col.not_in(tenant_stay_ids_via_invitation),
+                stay_id_col.not_in(tenant_stay_ids_direct),
+            ),
+        ),
+    )
+
+
+def tenant_lane_ledger_exclusion_clause():
+    """WHERE clause equivalent of ``filter_tenant_lane_from_ledger_rows``."""
+    return _tenant_lane_exclusion_clause(EventLedger.invitation_id, EventLedger.stay_id)
+
+
+def tenant_lane_alert_exclusion_clause():
+    """WHERE clause dropping dashboard alerts about tenant-lane invitations or stays (owner/manager feeds);
+    equivalent of filtering with ``get_tenant_lane_invitation_ids`` / ``get_tenant_lane_stay_ids``."""
+    return _tenant_lane_exclusion_clause(DashboardAlert.invitation_id, DashboardAlert.stay_id)
+
+
+def tenant_presence_ledger_exclusion_clause():
+    """WHERE clause equivalent of ``filter_tenant_presence_from_owner_manager_ledger``."""
+    return or_(
+        EventLedger.action_type.not_in(sorted(_TENANT_PRESENCE_LEDGER_ACTIONS)),
+        EventLedger.actor_user_id.is_(None),
+        EventLedger.actor_user_id.not_in(_tenant_user_ids_select()),
+    )
+
+
+def manager_leased_unit_presence_exclusion_clause(today: date | None = None):
+    """WHERE clause equivalent of ``filter_manager_presence_on_tenant_leased_units``."""
+    today = today or date.today()
+    leased_unit_ids = select(TenantAssignment.unit_id).where(
+        TenantAssignment.start_date <= today,
+        or_(TenantAssignment.end_date.is_(None), TenantAssignment.end_date >= today),
+    )
+    return or_(
+        EventLedger.action_type.not_in(sorted(_TENANT_PRESENCE_LEDGER_ACTIONS)),
+        EventLedger.stay_id.is_not(None),
+        EventLedger.unit_id.is_(None),
+        EventLedger.unit_id.not_in(leased_unit_ids),
+    )
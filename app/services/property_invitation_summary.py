@@ -21,7 +21,10 @@ from sqlalchemy.orm import Session
 from app.models.invitation import Invitation
 from app.services.invitation_kinds import is_property_invited_tenant_signup_kind
 from app.services.state_resolver import resolve_tenant_lease_lifecycle, resolve_unified_invitation_lifecycle
-from app.services.tenant_lease_window import find_tenant_assignment_for_invitation_summary
+from app.services.tenant_lease_window import (
+    find_tenant_assignment_for_invitation_summary,
+    find_tenant_assignments_for_invitation_summaries,
+)
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -51,22 +54,45 @@ class InvitationPipelineCounts:
     cancelled: int
 
 
-def summarize_invitations_pipeline(invitations: list[Invitation], db: Session) -> InvitationPipelineCounts:
-    today = date.today()
-    pending = accepted = active = cancelled = 0
+def pipeline_bucket(lifecycle: str) -> str:
+    """Pipeline count a lifecycle falls in: pending | accepted | active | cancelled (all ended outcomes)."""
+    if lifecycle in ("PENDING_STAGED", "PENDING_INVITED"):
+        return "pending"
+    if lifecycle == "ACCEPTED":
+        return "accepted"
+    if lifecycle == "ACTIVE":
+        return "active"
+    return "cancelled"
+
+
+def pipeline_buckets(invitations: list[Invitation], db: Session, *, today: date | None = None) -> dict[int, str]:
+    """``pipeline_bucket(resolve_invitation_pipeline_lifecycle(inv))`` for many invitations, keyed by invitation id.
+
+    Tenant assignments are matched for all invitations at once. The CSV-ledger lookup only separates
+    PENDING_STAGED from PENDING_INVITED, which share the pending bucket, so it is skipped.
+    """
+    today = today or date.today()
+    assignments = find_tenant_assignments_for_invitation_summaries(db, invitations)
+    out: dict[int, str] = {}
     for inv in invitations:
-        lc = resolve_invitation_pipeline_lifecycle(inv, db, today=today)
-        if lc in ("PENDING_STAGED", "PENDING_INVITED"):
-            pending += 1
-        elif lc == "ACCEPTED":
-            accepted += 1
-        elif lc == "ACTIVE":
-            active += 1
+        if is_property_invited_tenant_signup_kind(getattr(inv, "invitation_kind", None)) and getattr(
+            inv, "unit_id", None
+        ) is not None:
+            lifecycle = resolve_tenant_lease_lifecycle(
+                tenant_assignment=assignments.get(inv.id), tenant_invitation=inv, today=today
+            )
         else:
-            cancelled += 1
-    return InvitationPipelineCounts(
-        pending=pending, accepted=accepted, active=active, cancelled=cancelled
-    )
+            lifecycle = resolve_unified_invitation_lifecycle(inv, today=today)
+        out[inv.id] = pipeline_bucket(lifecycle)
+    return out
+
+
+def summarize_invitations_pipeline(invitations: list[Invitation], db: Session) -> InvitationPipelineCounts:
+    counts = {"pending": 0, "accepted": 0, "active": 0, "cancelled": 0}
+    buckets = pipeline_buckets(invitations, db)
+    for inv in invitations:
+        counts[buckets[inv.id]] += 1
+    return InvitationPipelineCounts(**counts)
 
 
 def invitation_counts_dict(invitations: list[Invitation], db: Session) -> dict[str, int]:
@@ -0,0 +1,575 @@
+"""
+Property state read model (``property_state_snapshots``, app.models.property_state_snapshot).
+
+The owner and manager property lists used to rebuild every property's display occupancy, unit counts and invitation
+pipeline counts from stays, invitations, tenant assignments and resident modes on each request. The same values are
+now kept as one snapshot row per property (plus one per unit) and the lists read those rows:
+
+- **Write side**: a flush that touches a property, unit, stay, invitation, tenant assignment, resident mode or
+  manager assignment marks the property dirty on the session. In the API and worker processes the commit only
+  deletes the dirty properties' rows (one statement) and, once committed, queues them for ``PropertyStateRefresher``,
+  a daemon thread that recomputes them with the same logic the views used (``resolve_units_occupancy``,
+  ``pipeline_buckets`` and the owner / manager lane filters) in its own transaction, coalescing repeated writes to a
+  property. Without a running refresher (scripts, tests, disabled) the rows are recomputed inside the commit.
+- **Read side**: ``get_property_states`` returns the stored rows computed for today; a property without one (never
+  written, waiting for the refresher, or last written on an earlier day, since lease windows and invitation lifecycles move with the calendar)
+  is computed live for that request.
+- **Reconciler**: ``run_property_state_reconcile_job`` runs nightly, recomputes every property, reports rows that
+  drifted from the current logic (writes that bypassed the ORM, inviter role changes) and rewrites all rows for
+  the new day.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Iterable
+
+from sqlalchemy import event, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.invitation import Invitation
+from app.models.owner import OccupancyStatus, OwnerProfile, Property
+from app.models.property_manager_assignment import PropertyManagerAssignment
+from app.models.property_state_snapshot import PropertyStateSnapshot
+from app.models.resident_mode import ResidentMode
+from app.models.stay import Stay
+from app.models.tenant_assignment import TenantAssignment
+from app.models.unit import Unit
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+_PIPELINE_BUCKETS = ("pending", "accepted", "active", "cancelled")
+_RECONCILE_BATCH_SIZE = 200
+
+
+@dataclass(frozen=True)
+class PropertyState:
+    """Derived state of one property as of ``computed_for`` (one snapshot row plus its unit rows)."""
+
+    property_id: int
+    computed_for: date
+    occupancy_status: str
+    unit_count: int  # Unit rows; 0 for a single-unit property without any
+    occupied_unit_count: int
+    active_stay_count: int
+    shield_mode_enabled: bool
+    invitation_counts: tuple[int, int, int, int]  # owner property lane: pending, accepted, active, cancelled
+    invitation_counts_by_inviter: dict[int, tuple[int, int, int, int]] = field(default_factory=dict)
+    unit_statuses: dict[int, str] = field(default_factory=dict)
+
+    def invitation_counts_dict(self, inviter_user_id: int | None = None) -> dict[str, int]:
+        """``invitation_counts_dict`` shape for the owner's lane, or for the invitations one user created
+        (``filter_property_lane_invitations_for_manager``)."""
+        if inviter_user_id is None:
+            counts = self.invitation_counts
+        else:
+            counts = self.invitation_counts_by_inviter.get(inviter_user_id, (0, 0, 0, 0))
+        return {f"invitation_{b}_count": n for b, n in zip(_PIPELINE_BUCKETS, counts)}
+
+
+_lock = threading.Lock()
+_snapshot_reads = 0
+_live_computes = 0
+_refreshed = 0
+_last_reconcile: dict[str, Any] | None = None
+
+
+def compute_property_states(
+    db: Session, property_ids: Iterable[int], today: date | None = None
+) -> dict[int, PropertyState]:
+    """Compute (without storing) the state of these properties from the source tables as of ``today``."""
+    from app.services.privacy_lanes import is_property_lane_for_owner
+    from app.services.occupancy import resolve_units_occupancy
+    from app.services.property_invitation_summary import pipeline_buckets
+    from app.services.shield_mode_policy import effective_shield_mode_enabled
+    from app.services.unit_display_order import query_units_for_properties_ordered
+
+    today = today or date.today()
+    ids = sorted({int(pid) for pid in property_ids if pid is not None})
+    props = db.query(Property).filter(Property.id.in_(ids)).all() if ids else []
+    if not props:
+        return {}
+    ids = [p.id for p in props]
+
+    units_by_property: dict[int, list[Unit]] = defaultdict(list)
+    all_units = query_units_for_properties_ordered(db, ids).all()
+    for u in all_units:
+        units_by_property[u.property_id].append(u)
+    occupancy = resolve_units_occupancy(db, all_units, today, property_ids=ids)
+    active_stays = dict(
+        db.query(Stay.property_id, func.count(Stay.id))
+        .filter(
+            Stay.property_id.in_(ids),
+            Stay.checked_in_at.isnot(None),
+            Stay.checked_out_at.is_(None),
+            Stay.cancelled_at.is_(None),
+        )
+        .group_by(Stay.property_id)
+        .all()
+    )
+    owner_user_ids = dict(
+        db.query(OwnerProfile.id, OwnerProfile.user_id)
+        .filter(OwnerProfile.id.in_({p.owner_profile_id for p in props}))
+        .all()
+    )
+    manager_pairs = {
+        (pid, uid)
+        for pid, uid in db.query(PropertyManagerAssignment.property_id, PropertyManagerAssignment.user_id)
+        .filter(PropertyManagerAssignment.property_id.in_(ids))
+        .all()
+    }
+    invitations = db.query(Invitation).filter(Invitation.property_id.in_(ids)).order_by(Invitation.id).all()
+    inviter_ids = {inv.invited_by_user_id for inv in invitations if inv.invited_by_user_id is not None}
+    users_by_id = {u.id: u for u in db.query(User).filter(User.id.in_(inviter_ids)).all()} if inviter_ids else {}
+    props_by_id = {p.id: p for p in props}
+    buckets = pipeline_buckets(invitations, db, today=today)
+
+    owner_lane: dict[int, list[int]] = {pid: [0, 0, 0, 0] for pid in ids}
+    by_inviter: dict[int, dict[int, list[int]]] = {pid: {} for pid in ids}
+    for inv in invitations:
+        bucket = _PIPELINE_BUCKETS.index(buckets[inv.id])
+        if inv.invited_by_user_id is not None:
+            by_inviter[inv.property_id].setdefault(inv.invited_by_user_id, [0, 0, 0, 0])[bucket] += 1
+        owner_uid = owner_user_ids.get(props_by_id[inv.property_id].owner_profile_id)
+        if owner_uid is not None and is_property_lane_for_owner(
+            db, inv, owner_uid, users_by_id=users_by_id, manager_assignment_pairs=manager_pairs
+        ):
+            owner_lane[inv.property_id][bucket] += 1
+
+    out: dict[int, PropertyState] = {}
+    for p in props:
+        units = units_by_property.get(p.id, [])
+        status = occupancy.property_status(p, units)
+        if units:
+            occupied = occupancy.occupied_count(units)
+        else:
+            occupied = 1 if (status or "").lower() == OccupancyStatus.occupied.value else 0
+        out[p.id] = PropertyState(
+            property_id=p.id,
+            computed_for=today,
+            occupancy_status=status,
+            unit_count=len(units),
+            occupied_unit_count=occupied,
+            active_stay_count=int(active_stays.get(p.id) or 0),
+            shield_mode_enabled=effective_shield_mode_enabled(p),
+            invitation_counts=tuple(owner_lane[p.id]),
+            invitation_counts_by_inviter={uid: tuple(c) for uid, c in by_inviter[p.id].items()},
+            unit_statuses={u.id: occupancy.unit_status(u.id) for u in units},
+        )
+    return out
+
+
+def _load_stored_states(db: Session, property_ids: list[int]) -> dict[int, PropertyState]:
+    """Stored states of these properties (any day)."""
+    rows = (
+        db.query(PropertyStateSnapshot).filter(PropertyStateSnapshot.property_id.in_(property_ids)).all()
+        if property_ids
+        else []
+    )
+    property_rows: dict[int, PropertyStateSnapshot] = {}
+    unit_rows: dict[int, dict[int, PropertyStateSnapshot]] = defaultdict(dict)
+    for r in rows:
+        if r.unit_id is None:
+            property_rows[r.property_id] = r
+        else:
+            unit_rows[r.property_id][r.unit_id] = r
+    out: dict[int, PropertyState] = {}
+    for pid, r in property_rows.items():
+        out[pid] = PropertyState(
+            property_id=pid,
+            computed_for=r.computed_for,
+            occupancy_status=r.occupancy_status,
+            unit_count=r.unit_count,
+            occupied_unit_count=r.occupied_unit_count,
+            active_stay_count=r.active_stay_count,
+            shield_mode_enabled=bool(r.shield_mode_enabled),
+            invitation_counts=(
+                r.invitation_pending_count,
+                r.invitation_accepted_count,
+                r.invitation_active_count,
+                r.invitation_cancelled_count,
+            ),
+            invitation_counts_by_inviter={
+                int(uid): tuple(c) for uid, c in (r.invitation_counts_by_inviter or {}).items()
+            },
+            unit_statuses={
+                uid: u.occupancy_status
+                for uid, u in unit_rows.get(pid, {}).items()
+                if u.computed_for == r.computed_for
+            },
+        )
+    return out
+
+
+def _snapshot_rows(state: PropertyState) -> list[PropertyStateSnapshot]:
+    pending, accepted, active, cancelled = state.invitation_counts
+    rows = [
+        PropertyStateSnapshot(
+            property_id=state.property_id,
+            unit_id=None,
+            computed_for=state.computed_for,
+            occupancy_status=state.occupancy_status,
+            unit_count=state.unit_count,
+            occupied_unit_count=state.occupied_unit_count,
+            active_stay_count=state.active_stay_count,
+            shield_mode_enabled=state.shield_mode_enabled,
+            invitation_pending_count=pending,
+            invitation_accepted_count=accepted,
+            invitation_active_count=active,
+            invitation_cancelled_count=cancelled,
+            invitation_counts_by_inviter={str(uid): list(c) for uid, c in state.invitation_counts_by_inviter.items()},
+        )
+    ]
+    rows.extend(
+        PropertyStateSnapshot(
+            property_id=state.property_id,
+            unit_id=unit_id,
+            computed_for=state.computed_for,
+            occupancy_status=status,
+        )
+        for unit_id, status in state.unit_statuses.items()
+    )
+    return rows
+
+
+def _write_states(db: Session, property_ids: Iterable[int], states: dict[int, PropertyState]) -> None:
+    """Replace the snapshot rows of ``property_ids`` with ``states`` (properties missing from it keep no rows)."""
+    ids = list(property_ids)
+    if not ids:
+        return
+    db.query(PropertyStateSnapshot).filter(PropertyStateSnapshot.property_id.in_(ids)).delete(
+        synchronize_session=False
+    )
+    db.add_all([row for state in states.values() for row in _snapshot_rows(state)])
+    db.flush()
+
+
+def refresh_property_state_snapshots(
+    db: Session, property_ids: Iterable[int], today: date | None = None
+) -> dict[int, PropertyState]:
+    """Recompute and rewrite the snapshot rows of these properties in the current transaction."""
+    global _refreshed
+    ids = sorted({int(pid) for pid in property_ids if pid is not None})
+    states = compute_property_states(db, ids, today)
+    _write_states(db, ids, states)
+    with _lock:
+        _refreshed += len(ids)
+    return states
+
+
+def get_property_states(
+    db: Session, property_ids: Iterable[int], today: date | None = None
+) -> dict[int, PropertyState]:
+    """State of each property for ``today``: the stored snapshot when it was computed for today, else computed live
+    (not stored; the next write to the property or the nightly reconciler stores it)."""
+    global _snapshot_reads, _live_computes
+    today = today or date.today()
+    ids = sorted({int(pid) for pid in property_ids if pid is not None})
+    states = {pid: s for pid, s in _load_stored_states(db, ids).items() if s.computed_for == today}
+    missing = [pid for pid in ids if pid not in states]
+    if missing:
+        states.update(compute_property_states(db, missing, today))
+    with _lock:
+        _snapshot_reads += len(ids) - len(missing)
+        _live_computes += len(missing)
+    return states
+
+
+def reconcile_property_state_snapshots(
+    db: Session, today: date | None = None, *, batch_size: int = _RECONCILE_BATCH_SIZE
+) -> dict[str, Any]:
+    """Recompute every property, compare with its stored snapshot and rewrite all rows for ``today``.
+
+    Commits per batch of properties. ``drifted`` counts rows computed for the same day whose values differ from the
+    current logic, i.e. writes the commit-time refresh did not see; rows from an earlier day are only ``stale``."""
+    global _last_reconcile
+    today = today or date.today()
+    report: dict[str, Any] = {
+        "started_at": datetime.now(timezone.utc),
+        "finished_at": None,
+        "computed_for": today,
+        "properties": 0,
+        "missing": 0,
+        "stale": 0,
+        "drifted": 0,
+        "orphaned_rows": 0,
+        "drifted_property_ids": [],
+    }
+    last_id = 0
+    while True:
+        ids = [
+            pid
+            for (pid,) in db.query(Property.id).filter(Property.id > last_id).order_by(Property.id).limit(batch_size)
+        ]
+        if not ids:
+            break
+        last_id = ids[-1]
+        stored = _load_stored_states(db, ids)
+        computed = compute_property_states(db, ids, today)
+        for pid, state in computed.items():
+            old = stored.get(pid)
+            if old is None:
+                report["missing"] += 1
+            elif old.computed_for != today:
+                report["stale"] += 1
+            elif old != state:
+                report["drifted"] += 1
+                if len(report["drifted_property_ids"]) < 50:
+                    report["drifted_property_ids"].append(pid)
+        _write_states(db, ids, computed)
+        db.commit()
+        report["properties"] += len(computed)
+    report["orphaned_rows"] = (
+        db.query(PropertyStateSnapshot)
+        .filter(PropertyStateSnapshot.property_id.not_in(select(Property.id)))
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    report["finished_at"] = datetime.now(timezone.utc)
+    with _lock:
+        _last_reconcile = dict(report)
+    return report
+
+
+def run_property_state_reconcile_job() -> None:
+    """Nightly: rebuild the property state snapshots for the new day and log drift from the write-time refresh."""
+    from app.database import get_background_job_session
+
+    logger.info("Property state reconcile job: started")
+    db: Session = get_background_job_session()
+    try:
+        report = reconcile_property_state_snapshots(db)
+        log = logger.warning if report["drifted"] else logger.info
+        log(
+            "Property state reconcile job: properties=%d missing=%d stale=%d drifted=%d orphaned_rows=%d%s",
+            report["properties"],
+            report["missing"],
+            report["stale"],
+            report["drifted"],
+            report["orphaned_rows"],
+            f" drifted_property_ids={report['drifted_property_ids']}" if report["drifted"] else "",
+        )
+    except Exception as e:
+        db.rollback()
+        logger.exception("Property state reconcile job: failed: %s", e)
+    finally:
+        db.close()
+
+
+def clear_property_state_stats() -> None:
+    global _snapshot_reads, _live_computes, _refreshed, _last_reconcile
+    with _lock:
+        _snapshot_reads = _live_computes = _refreshed = 0
+        _last_reconcile = None
+
+
+def get_property_state_stats() -> dict[str, Any]:
+    """Read / refresh counters of this worker and the last reconcile report it ran (None if none yet)."""
+    with _lock:
+        reads = _snapshot_reads + _live_computes
+        return {
+            "snapshot_reads": _snapshot_reads,
+            "live_computes": _live_computes,
+            "snapshot_hit_rate": round(_snapshot_reads / reads, 4) if reads else 0.0,
+            "refreshed_properties": _refreshed,
+            "queued_refreshes": _refresher.pending if _refresher is not None else 0,
+            "last_reconcile": dict(_last_reconcile) if _last_reconcile else None,
+        }
+
+
+def _default_session_factory() -> Session:
+    from app.database import get_background_job_session
+
+    return get_background_job_session()
+
+
+class PropertyStateRefresher:
+    """Daemon thread that rewrites the snapshots of properties queued by committed writes."""
+
+    def __init__(self, *, session_factory: Callable[[], Session] | None = None):
+        from app.config import get_settings
+
+        self._session_factory = session_factory or _default_session_factory
+        self._delay = max(0.0, get_settings().property_state_refresh_delay_seconds)
+        self._pending: set[int] = set()
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="property_state_refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.drain()  # whatever the thread did not get to
+
+    def enqueue(self, property_ids: Iterable[int]) -> None:
+        with self._cond:
+            self._pending.update(property_ids)
+            self._cond.notify_all()
+
+    def drain(self) -> int:
+        """Refresh everything queued so far on the calling thread. Returns the number of properties."""
+        with self._cond:
+            ids, self._pending = self._pending, set()
+        if ids:
+            self.refresh(ids)
+        return len(ids)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            with self._cond:
+                while not self._pending and not self._stop.is_set():
+                    self._cond.wait()
+            # Let a burst of writes to the same properties collapse into one recompute.
+            self._stop.wait(self._delay)
+            self.drain()
+
+    def refresh(self, property_ids: Iterable[int]) -> None:
+        """Recompute and rewrite these properties in one transaction. Rows another worker committed for the same
+        property first win; such properties are retried one by one and skipped on conflict."""
+        ids = sorted(property_ids)
+        db = self._session_factory()
+        try:
+            try:
+                refresh_property_state_snapshots(db, ids)
+                db.commit()
+                return
+            except IntegrityError:
+                db.rollback()
+            for pid in ids:
+                try:
+                    refresh_property_state_snapshots(db, [pid])
+                    db.commit()
+                except IntegrityError:
+                    db.rollback()
+        except Exception:
+            db.rollback()
+            logger.exception("Property state refresh: failed for %s properties (computed live until rewritten)", len(ids))
+        finally:
+            db.close()
+
+
+_refresher: PropertyStateRefresher | None = None
+_refresher_lock = threading.Lock()
+
+
+def start_property_state_refresher(
+    session_factory: Callable[[], Session] | None = None,
+) -> PropertyStateRefresher | None:
+    """Start the process-wide refresher (API and worker processes). None when disabled in settings."""
+    global _refresher
+    from app.config import get_settings
+
+    if not get_settings().property_state_refresh_async:
+        return None
+    with _refresher_lock:
+        if _refresher is None:
+            _refresher = PropertyStateRefresher(session_factory=session_factory)
+        _refresher.start()
+        return _refresher
+
+
+def stop_property_state_refresher() -> None:
+    global _refresher
+    with _refresher_lock:
+        if _refresher is not None:
+            _refresher.stop()
+            _refresher = None
+
+
+# --- Write side: property ids touched by a flush are collected per session. Before commit their rows are deleted
+# (refresher running) or recomputed (inline); after commit the deleted ones are queued for the refresher. Ids left over
+# from a rolled-back flush are handled with the next commit, which only costs an extra recompute. ---
+
+_SESSION_INFO_KEY = "property_state_dirty_ids"
+_QUEUED_INFO_KEY = "property_state_queued_ids"
+_PROPERTY_SCOPED = (Unit, Stay, Invitation, PropertyManagerAssignment)
+_UNIT_SCOPED = (TenantAssignment, ResidentMode)
+
+
+def _touched_property_ids(session: Session) -> set[int]:
+    property_ids: set[int] = set()
+    unit_ids: set[int] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Property):
+            if obj.id is not None:
+                property_ids.add(obj.id)
+        elif isinstance(obj, _PROPERTY_SCOPED):
+            if obj.property_id is not None:
+                property_ids.add(obj.property_id)
+        elif isinstance(obj, _UNIT_SCOPED):
+            if obj.unit_id is not None:
+                unit_ids.add(obj.unit_id)
+    if unit_ids:
+        property_ids.update(
+            pid
+            for (pid,) in session.connection().execute(select(Unit.property_id).where(Unit.id.in_(unit_ids)))
+            if pid
+        )
+    return property_ids
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_touched_properties(session: Session, flush_context) -> None:
+    touched = _touched_property_ids(session)
+    if touched:
+        session.info.setdefault(_SESSION_INFO_KEY, set()).update(touched)
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_on_commit(session: Session) -> None:
+    from app.services.event_ledger import flush_ledger_batch
+
+    # Queued ledger rows are part of this commit; flush them first so their flush is seen here too.
+    flush_ledger_batch(session)
+    if session.new or session.dirty or session.deleted:
+        session.flush()
+    dirty = session.info.pop(_SESSION_INFO_KEY, None)
+    if not dirty:
+        return
+    refresher = _refresher
+    if refresher is not None and refresher.running:
+        # Readers compute these properties live until the refresher has rewritten them.
+        session.query(PropertyStateSnapshot).filter(PropertyStateSnapshot.property_id.in_(dirty)).delete(
+            synchronize_session=False
+        )
+        session.info.setdefault(_QUEUED_INFO_KEY, set()).update(dirty)
+    else:
+        refresh_property_state_snapshots(session, dirty)
+
+
+@event.listens_for(Session, "after_commit")
+def _queue_on_commit(session: Session) -> None:
+    queued = session.info.pop(_QUEUED_INFO_KEY, None)
+    refresher = _refresher
+    if queued and refresher is not None:
+        refresher.enqueue(queued)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_queued_on_rollback(session: Session) -> None:
+    session.info.pop(_QUEUED_INFO_KEY, None)
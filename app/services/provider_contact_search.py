@@ -10,8 +10,6 @@ Excludes or deprioritizes billing/payments emails so only general contact emails
 import re
 from typing import Any
 
-import httpx
-
 # Max organic results to fetch when snippets have no emails
 PAGE_FETCH_MAX_URLS = 4
 PAGE_FETCH_MAX_CHARS = 200_000
@@ -105,6 +103,8 @@ def _fetch_page_text_headless(url: str) -> str:
 
 def _fetch_page_text(url: str) -> str:
     """Fetch URL and return body as plain text. On 403 Forbidden, retry with headless browser."""
+    import httpx
+
     try:
         with httpx.Client(timeout=10, follow_redirects=True) as client:
             r = client.get(
@@ -205,6 +205,8 @@ def find_provider_emails_serpapi(
     url = "https://serpapi.com/search.json"
     params = {"engine": "google", "q": query, "api_key": api_key, "num": 10}
     print(f"[ProviderContact] Calling SerpApi: GET {url} q={query!r}")
+    import httpx
+
     try:
         with httpx.Client(timeout=15) as client:
             r = client.get(url, params=params)
@@ -0,0 +1,44 @@
+"""
+Process-wide fixed-window rate limiter for authenticated bulk endpoints (e.g. POST /public/verify/batch).
+
+Each caller key gets a budget of ``limit`` units per ``window_seconds``; a request costing more than what is left is
+refused with the seconds until the window resets. Counters are per worker, so the effective limit across N workers
+is up to N times the configured one.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Hashable
+
+_MAX_KEYS = 10000  # windows of idle callers are pruned past this many keys
+
+_lock = threading.Lock()
+_windows: dict[Hashable, tuple[float, int]] = {}  # key -> (window start, units used)
+
+
+def consume(key: Hashable, cost: int, *, limit: int, window_seconds: int) -> int | None:
+    """Charge ``cost`` units to ``key``. Returns None when allowed, else seconds until the caller may retry.
+
+    ``limit <= 0`` disables the limit.
+    """
+    if limit <= 0:
+        return None
+    now = time.monotonic()
+    window = max(1, window_seconds)
+    with _lock:
+        start, used = _windows.get(key, (now, 0))
+        if now - start >= window:
+            start, used = now, 0
+        if used + cost > limit:
+            return max(1, int(start + window - now + 0.999))
+        _windows[key] = (start, used + cost)
+        if len(_windows) > _MAX_KEYS:
+            for k in [k for k, (s, _) in _windows.items() if now - s >= window]:
+                del _windows[k]
+    return None
+
+
+def clear_rate_limits() -> None:
+    with _lock:
+        _windows.clear()
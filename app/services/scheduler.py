@@ -0,0 +1,357 @@
+"""
+Single-leader cron scheduling.
+
+Every scheduler instance (each API process in ``scheduler_mode=embedded``, or ``python -m app.worker``) runs an
+APScheduler ``BackgroundScheduler`` with one heartbeat job. On each heartbeat it tries to take or keep leadership;
+only the leader has the cron jobs from ``scheduled_jobs()`` added, so invitation cleanup, the Status Confirmation
+test-mode catchup, the bulk upload sweep, the property state reconcile and the email row purge run once per schedule
+however many processes are up. Leadership is:
+
+- PostgreSQL: a session advisory lock held on a connection detached from the pool. The server releases it when that
+  connection drops, so a standby takes over on its next heartbeat after the leader dies. Needs a session-level
+  connection (direct Postgres or a Session pooler), not a transaction pooler.
+- other databases (SQLite in dev): a ``scheduler_leases`` row the leader renews every heartbeat; once it has not
+  been renewed for ``scheduler_lease_seconds`` another instance claims it.
+
+Each cron run by the leader is recorded in ``job_runs`` (status, duration, error).
+"""
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import time
+import traceback
+import uuid
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.job_run import JobRun
+from app.models.scheduler_lease import SchedulerLease
+
+logger = logging.getLogger(__name__)
+
+SCHEDULER_LOCK_NAME = "cron-scheduler"
+_ADVISORY_LOCK_KEY = zlib.crc32(f"docustay:{SCHEDULER_LOCK_NAME}".encode("utf-8"))
+
+
+def _settings():
+    from app.config import get_settings
+
+    return get_settings()
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass(frozen=True)
+class ScheduledJob:
+    name: str
+    func: Callable[[], Any]
+    trigger: str  # APScheduler trigger: "cron" | "interval"
+    trigger_args: dict[str, Any] = field(default_factory=dict)
+
+
+def scheduled_jobs() -> list[ScheduledJob]:
+    """The cron jobs the leader runs."""
+    from app.routers.owners import resume_orphaned_bulk_upload_jobs
+    from app.services.email_dispatcher import run_notification_attempt_purge_job
+    from app.services.invitation_cleanup import run_all_invitation_cleanup_jobs
+    from app.services.property_state import run_property_state_reconcile_job
+
+    settings = _settings()
+    # Guest / manager / transfer invitation expiry in one DB session: every minute in test mode, else hourly at :00.
+    jobs = [
+        ScheduledJob(
+            "invitation_cleanup",
+            run_all_invitation_cleanup_jobs,
+            "cron",
+            {"minute": "*"} if getattr(settings, "test_mode", False) else {"minute": 0},
+        )
+    ]
+    if getattr(settings, "dms_test_mode", False):
+        from app.services.stay_timer import run_dms_test_mode_catchup_job
+
+        # Every minute: turn stay reminders on for stays that checked in >2 min ago.
+        jobs.append(ScheduledJob("dms_test_mode_catchup", run_dms_test_mode_catchup_job, "cron", {"minute": "*"}))
+    # Bulk uploads whose worker died without the process restarting.
+    jobs.append(ScheduledJob("bulk_upload_resume", resume_orphaned_bulk_upload_jobs, "interval", {"minutes": 5}))
+    # Property state snapshots for the new day, plus a drift report against the live computation.
+    jobs.append(
+        ScheduledJob(
+            "property_state_reconcile",
+            run_property_state_reconcile_job,
+            "cron",
+            {"hour": settings.property_state_reconcile_hour, "minute": 5},
+        )
+    )
+    # Sent/failed outbound email rows past their retention.
+    jobs.append(
+        ScheduledJob("notification_attempt_purge", run_notification_attempt_purge_job, "cron", {"hour": 3, "minute": 30})
+    )
+    return jobs
+
+
+# --- Leadership ---
+
+
+class AdvisoryLockLeadership:
+    """PostgreSQL session advisory lock on a dedicated connection (detached from the pool, so it never returns to it)."""
+
+    def __init__(self, engine, key: int = _ADVISORY_LOCK_KEY) -> None:
+        self._engine = engine
+        self._key = key
+        self._conn = None
+        self._held = False
+
+    def _scalar(self, sql: str):
+        value = self._conn.execute(text(sql), {"key": self._key}).scalar()
+        self._conn.commit()  # the lock is session-level; do not sit idle in a transaction
+        return value
+
+    def acquire_or_renew(self) -> bool:
+        try:
+            if self._conn is None:
+                self._conn = self._engine.connect()
+                self._conn.detach()
+                self._held = False
+            if self._held:
+                self._scalar("SELECT 1")  # still connected means still holding the lock
+            else:
+                self._held = bool(self._scalar("SELECT pg_try_advisory_lock(:key)"))
+            return self._held
+        except Exception:
+            logger.exception("Scheduler: advisory lock connection failed; leadership dropped")
+            self._close()
+            return False
+
+    def release(self) -> None:
+        if self._conn is not None and self._held:
+            try:
+                self._scalar("SELECT pg_advisory_unlock(:key)")
+            except Exception:
+                pass
+        self._close()
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+        self._conn = None
+        self._held = False
+
+
+class LeaseLeadership:
+    """Lease row in scheduler_leases: renewed by its holder, claimable by anyone once ``expires_at`` has passed."""
+
+    def __init__(self, session_factory: Callable[[], Session], holder: str, *, name: str = SCHEDULER_LOCK_NAME,
+                 lease_seconds: int | None = None) -> None:
+        self._session_factory = session_factory
+        self._holder = holder
+        self._name = name
+        self._lease_seconds = lease_seconds
+
+    def acquire_or_renew(self) -> bool:
+        now = _now()
+        lease = self._lease_seconds if self._lease_seconds is not None else _settings().scheduler_lease_seconds
+        expires_at = now + timedelta(seconds=max(1, lease))
+        db = self._session_factory()
+        try:
+            q = db.query(SchedulerLease).filter(SchedulerLease.name == self._name)
+            n = q.filter(SchedulerLease.holder == self._holder).update(
+                {"expires_at": expires_at}, synchronize_session=False
+            )
+            if not n:
+                n = q.filter(SchedulerLease.expires_at < now).update(
+                    {"holder": self._holder, "acquired_at": now, "expires_at": expires_at}, synchronize_session=False
+                )
+            if not n and q.first() is None:
+                db.add(SchedulerLease(name=self._name, holder=self._holder, acquired_at=now, expires_at=expires_at))
+                n = 1
+            db.commit()
+            return bool(n)
+        except IntegrityError:
+            db.rollback()  # another instance inserted the lease first
+            return False
+        except Exception:
+            db.rollback()
+            logger.exception("Scheduler: lease renewal failed; leadership dropped")
+            return False
+        finally:
+            db.close()
+
+    def release(self) -> None:
+        db = self._session_factory()
+        try:
+            db.query(SchedulerLease).filter(
+                SchedulerLease.name == self._name, SchedulerLease.holder == self._holder
+            ).delete(synchronize_session=False)
+            db.commit()
+        except Exception:
+            db.rollback()
+        finally:
+            db.close()
+
+
+# --- Run history ---
+
+
+def run_recorded(job: ScheduledJob, *, holder: str, session_factory: Callable[[], Session]) -> str:
+    """Run ``job`` and record it in job_runs. Returns the final status. A failure to record does not skip the run."""
+    started = time.perf_counter()
+    run_id = None
+    db = session_factory()
+    try:
+        row = JobRun(job_name=job.name, holder=holder, status="running", started_at=_now())
+        db.add(row)
+        db.commit()
+        run_id = row.id
+    except Exception:
+        db.rollback()
+        logger.exception("Scheduler: could not record start of %s", job.name)
+    finally:
+        db.close()
+
+    status, error = "succeeded", None
+    try:
+        job.func()
+    except Exception:
+        status, error = "failed", traceback.format_exc(limit=20)
+        logger.exception("Scheduler: job %s failed", job.name)
+
+    if run_id is not None:
+        db = session_factory()
+        try:
+            db.query(JobRun).filter(JobRun.id == run_id).update(
+                {
+                    "status": status,
+                    "finished_at": _now(),
+                    "duration_ms": int((time.perf_counter() - started) * 1000),
+                    "error": error,
+                },
+                synchronize_session=False,
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception("Scheduler: could not record end of %s", job.name)
+        finally:
+            db.close()
+    return status
+
+
+# --- Scheduler ---
+
+
+class LeaderScheduler:
+    """BackgroundScheduler whose cron jobs are present only while this instance holds leadership."""
+
+    def __init__(
+        self,
+        jobs: list[ScheduledJob],
+        *,
+        session_factory: Callable[[], Session] | None = None,
+        leadership=None,
+        holder: str | None = None,
+    ) -> None:
+        from app.database import engine, get_background_job_session
+
+        self.jobs = list(jobs)
+        self.holder = holder or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._session_factory = session_factory or get_background_job_session
+        if leadership is None:
+            if engine.dialect.name == "postgresql":
+                leadership = AdvisoryLockLeadership(engine)
+            else:
+                leadership = LeaseLeadership(self._session_factory, self.holder)
+        self._leadership = leadership
+        self._lock = threading.Lock()
+        self._scheduler = None
+        self.is_leader = False
+
+    def start(self) -> None:
+        from apscheduler.schedulers.background import BackgroundScheduler
+
+        self._scheduler = BackgroundScheduler()
+        self._scheduler.add_job(
+            self.heartbeat,
+            "interval",
+            seconds=max(1, _settings().scheduler_heartbeat_seconds),
+            id="scheduler_heartbeat",
+            next_run_time=_now(),
+            max_instances=1,
+            coalesce=True,
+        )
+        self._scheduler.start()
+
+    def heartbeat(self) -> bool:
+        """Take or keep leadership; add the cron jobs on promotion, remove them on demotion. Returns is_leader."""
+        leader = self._leadership.acquire_or_renew()
+        with self._lock:
+            if leader and not self.is_leader:
+                self.is_leader = True
+                if self._scheduler is not None:
+                    for job in self.jobs:
+                        self._scheduler.add_job(
+                            self.run, job.trigger, args=[job], id=f"cron:{job.name}", replace_existing=True,
+                            max_instances=1, coalesce=True, **job.trigger_args,
+                        )
+                logger.info("Scheduler: %s is the leader; %d cron job(s) scheduled", self.holder, len(self.jobs))
+            elif not leader and self.is_leader:
+                self.is_leader = False
+                if self._scheduler is not None:
+                    for job in self.jobs:
+                        try:
+                            self._scheduler.remove_job(f"cron:{job.name}")
+                        except Exception:
+                            pass
+                logger.warning("Scheduler: %s lost leadership; cron jobs removed", self.holder)
+        return self.is_leader
+
+    def run(self, job: ScheduledJob) -> str | None:
+        """Run one cron job if this instance is (still) the leader."""
+        if not self.is_leader:
+            return None
+        return run_recorded(job, holder=self.holder, session_factory=self._session_factory)
+
+    def stop(self) -> None:
+        if self._scheduler is not None:
+            self._scheduler.shutdown(wait=False)
+            self._scheduler = None
+        with self._lock:
+            self.is_leader = False
+        self._leadership.release()
+
+
+_scheduler: LeaderScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def start_scheduler() -> LeaderScheduler:
+    """Start this process's scheduler instance (idempotent)."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = LeaderScheduler(scheduled_jobs())
+            _scheduler.start()
+            logger.info("Scheduler: %s started (waiting for leadership)", _scheduler.holder)
+        return _scheduler
+
+
+def stop_scheduler() -> None:
+    """Stop the scheduler and hand leadership back so a standby takes over on its next heartbeat."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is not None:
+            _scheduler.stop()
+            _scheduler = None
@@ -1,6 +1,5 @@
 """Smarty US Street API – address standardization for property registration."""
 from dataclasses import dataclass
-import httpx
 from app.config import get_settings
 
 
@@ -40,6 +39,8 @@ def verify_address(street: str, city: str, state: str, zipcode: str | None = Non
 
     print(f"[Smarty] API called: street={street!r} city={city!r} state={state!r} zipcode={zipcode!r}")
 
+    import httpx  # imported on first use; keeps it off the API's import path
+
     try:
         with httpx.Client(timeout=15.0) as client:
             resp = client.get(base_url, params=params)
@@ -0,0 +1,274 @@
+"""
+Per-request SQL profiling (opt-in: ``sql_profiling_enabled``).
+
+``install_sql_profiling(app)`` adds ``SQLProfilingMiddleware`` and hooks SQLAlchemy's cursor and session events.
+While a request is in flight its ``RequestProfile`` (a context variable, so it follows sync endpoints into the
+threadpool) collects:
+
+- ``queries`` / ``db_ms``: statements executed and time spent in the cursor (``before_cursor_execute`` /
+  ``after_cursor_execute``);
+- ``pool_wait_ms``: time from an ORM execute to the connection checkout it triggered (pool queueing plus pre-ping);
+- statement repeats: a statement run more than ``sql_profiling_n_plus_one_threshold`` times in one request is
+  flagged as a likely N+1 (the SQL is parameterized, so a per-row lookup repeats the same text).
+
+Responses carry ``X-DB-Queries`` and ``Server-Timing`` (``db``, ``db-pool``, ``app``). Per-route totals are kept for
+GET /admin/perf; slow requests, N+1 flags and budget overruns go to the ``app.perf`` logger and a bounded in-memory
+slow log. Routes can declare ``@query_budget(n)``; an overrun is logged, or raises ``QueryBudgetExceeded`` when
+``sql_query_budget_strict`` is set (tests). Totals are per worker.
+"""
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from starlette.datastructures import MutableHeaders
+
+logger = logging.getLogger("app.perf")
+
+_STATEMENT_PREVIEW_CHARS = 300
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A route issued more SQL statements than its ``@query_budget`` (raised only when the budget is strict)."""
+
+
+def query_budget(max_queries: int) -> Callable:
+    """Declare the most SQL statements one request to this endpoint may issue. Place under ``@router.get(...)``."""
+
+    def decorate(endpoint: Callable) -> Callable:
+        endpoint.query_budget = int(max_queries)
+        return endpoint
+
+    return decorate
+
+
+@dataclass
+class RequestProfile:
+    queries: int = 0
+    db_ms: float = 0.0
+    pool_wait_ms: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        """Statements run more than ``threshold`` times, most repeated first."""
+        return [(s, n) for s, n in self.statements.most_common() if n > threshold]
+
+
+_current: contextvars.ContextVar[RequestProfile | None] = contextvars.ContextVar("sql_profile", default=None)
+
+_lock = threading.Lock()
+_routes: dict[str, dict[str, Any]] = {}
+_slow: deque[dict[str, Any]] = deque(maxlen=200)
+_installed = False
+
+
+def _settings():
+    from app.config import get_settings
+
+    return get_settings()
+
+
+def current_profile() -> RequestProfile | None:
+    """Profile of the request being served in this context, if profiling is on."""
+    return _current.get()
+
+
+# --- SQLAlchemy hooks: no-ops outside a profiled request ---
+
+_STARTED_KEY = "sql_profiler_started"
+_ORM_EXECUTE_KEY = "sql_profiler_orm_execute_at"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current.get() is not None:
+        conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    profile = _current.get()
+    started = conn.info.get(_STARTED_KEY)
+    if profile is None or not started:
+        return
+    profile.queries += 1
+    profile.db_ms += (time.perf_counter() - started.pop()) * 1000.0
+    profile.statements[statement] += 1
+
+
+def _handle_error(exception_context) -> None:
+    conn = exception_context.connection
+    started = conn.info.get(_STARTED_KEY) if conn is not None else None
+    if started:
+        started.pop()
+
+
+def _mark_orm_execute(orm_execute_state) -> None:
+    if _current.get() is not None:
+        orm_execute_state.session.info[_ORM_EXECUTE_KEY] = time.perf_counter()
+
+
+def _record_pool_wait(session, transaction, connection) -> None:
+    started = session.info.pop(_ORM_EXECUTE_KEY, None)
+    profile = _current.get()
+    if profile is not None and started is not None:
+        profile.pool_wait_ms += (time.perf_counter() - started) * 1000.0
+
+
+def _forget_orm_execute(session, transaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(_ORM_EXECUTE_KEY, None)
+
+
+def install_sql_profiling(app) -> None:
+    """Add the profiling middleware to ``app`` and register the SQLAlchemy hooks (once per process)."""
+    global _installed, _slow
+    app.add_middleware(SQLProfilingMiddleware)
+    with _lock:
+        _slow = deque(_slow, maxlen=max(1, _settings().sql_profiling_slow_log_size))
+        if _installed:
+            return
+        _installed = True
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    event.listen(Session, "do_orm_execute", _mark_orm_execute)
+    event.listen(Session, "after_begin", _record_pool_wait)
+    event.listen(Session, "after_transaction_end", _forget_orm_execute)
+
+
+# --- Middleware ---
+
+
+def _route_name(scope) -> str:
+    route = scope.get("route")
+    return f"{scope.get('method', '')} {getattr(route, 'path', None) or '<unmatched>'}"
+
+
+class SQLProfilingMiddleware:
+    """Pure ASGI middleware: profiles each HTTP request and adds ``X-DB-Queries`` / ``Server-Timing``."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        profile = RequestProfile()
+        token = _current.set(profile)
+        started = time.perf_counter()
+        done: dict[str, Any] = {}
+
+        async def send_with_timing(message) -> None:
+            if message["type"] == "http.response.start":
+                total_ms = (time.perf_counter() - started) * 1000.0
+                budget = getattr(scope.get("endpoint"), "query_budget", None)
+                done.update(route=_route_name(scope), status=message["status"], total_ms=total_ms, budget=budget)
+                if budget is not None and profile.queries > budget and _settings().sql_query_budget_strict:
+                    route = done["route"]
+                    _record(profile, **done)
+                    done.clear()
+                    raise QueryBudgetExceeded(f"{route} issued {profile.queries} SQL statements (budget {budget})")
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Queries"] = str(profile.queries)
+                headers.append(
+                    "Server-Timing",
+                    f"db;dur={profile.db_ms:.1f}, db-pool;dur={profile.pool_wait_ms:.1f}, app;dur={total_ms:.1f}",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            if done:
+                _record(profile, **done)
+
+
+def _record(profile: RequestProfile, *, route: str, status: int, total_ms: float, budget: int | None) -> None:
+    settings = _settings()
+    repeated = profile.repeated_statements(max(1, settings.sql_profiling_n_plus_one_threshold))
+    over_budget = budget is not None and profile.queries > budget
+    with _lock:
+        r = _routes.get(route)
+        if r is None:
+            r = _routes[route] = {
+                "route": route, "requests": 0, "total_ms": 0.0, "max_ms": 0.0, "queries": 0, "max_queries": 0,
+                "db_ms": 0.0, "pool_wait_ms": 0.0, "max_pool_wait_ms": 0.0, "slow_requests": 0,
+                "n_plus_one_requests": 0, "budget": budget, "budget_overruns": 0,
+            }
+        r["requests"] += 1
+        r["total_ms"] += total_ms
+        r["max_ms"] = max(r["max_ms"], total_ms)
+        r["queries"] += profile.queries
+        r["max_queries"] = max(r["max_queries"], profile.queries)
+        r["db_ms"] += profile.db_ms
+        r["pool_wait_ms"] += profile.pool_wait_ms
+        r["max_pool_wait_ms"] = max(r["max_pool_wait_ms"], profile.pool_wait_ms)
+        r["budget"] = budget
+        slow = total_ms >= settings.sql_profiling_slow_request_ms
+        r["slow_requests"] += int(slow)
+        r["n_plus_one_requests"] += int(bool(repeated))
+        r["budget_overruns"] += int(over_budget)
+        if not (slow or repeated or over_budget):
+            return
+        entry = {
+            "at": datetime.now(timezone.utc),
+            "route": route,
+            "status": status,
+            "duration_ms": round(total_ms, 1),
+            "queries": profile.queries,
+            "db_ms": round(profile.db_ms, 1),
+            "pool_wait_ms": round(profile.pool_wait_ms, 1),
+            "budget": budget,
+            "repeated_statements": [
+                {"count": n, "statement": " ".join(s.split())[:_STATEMENT_PREVIEW_CHARS]} for s, n in repeated[:3]
+            ],
+        }
+        _slow.append(entry)
+    logger.warning(
+        "Slow/expensive request: %s status=%s duration_ms=%.1f queries=%d db_ms=%.1f pool_wait_ms=%.1f budget=%s%s",
+        route,
+        status,
+        total_ms,
+        profile.queries,
+        profile.db_ms,
+        profile.pool_wait_ms,
+        budget,
+        "".join(f" repeated x{e['count']}: {e['statement'][:120]}" for e in entry["repeated_statements"]),
+    )
+
+
+def clear_sql_profile_stats() -> None:
+    with _lock:
+        _routes.clear()
+        _slow.clear()
+
+
+def get_sql_profile_stats(limit: int = 20) -> dict[str, Any]:
+    """Worst routes by mean duration (with query / DB / pool-wait averages) and the recent slow-request log."""
+    with _lock:
+        routes = [dict(r) for r in _routes.values()]
+        slow = list(reversed(_slow))
+    for r in routes:
+        n = max(1, r["requests"])
+        r["avg_ms"] = round(r.pop("total_ms") / n, 1)
+        r["avg_queries"] = round(r.pop("queries") / n, 1)
+        r["avg_db_ms"] = round(r.pop("db_ms") / n, 1)
+        r["avg_pool_wait_ms"] = round(r.pop("pool_wait_ms") / n, 1)
+        r["max_ms"] = round(r["max_ms"], 1)
+        r["max_pool_wait_ms"] = round(r["max_pool_wait_ms"], 1)
+    routes.sort(key=lambda r: r["avg_ms"], reverse=True)
+    return {
+        "enabled": _installed,
+        "routes": routes[: max(0, limit)],
+        "slow_requests": slow[: max(0, limit)],
+    }
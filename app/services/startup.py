@@ -0,0 +1,256 @@
+"""
+Fast, idempotent startup.
+
+Every API boot used to run ``Base.metadata.create_all`` (a catalog lookup per table) and reseed the region rules,
+jurisdiction SOT and admin user (including a bcrypt hash of the admin password). Neither changes between boots of
+the same deployment, so both are now fingerprinted:
+
+- schema: a SHA-256 over the table / column / index / constraint definitions on ``Base.metadata``;
+- seed: a SHA-256 over ``app/seed.py`` plus the ADMIN_* environment the admin user is seeded from.
+
+The fingerprints last applied are stored in ``startup_fingerprints``. A boot whose fingerprint matches skips that
+step; any model, seed or admin-env change (or a fresh database, where the table does not exist yet) runs it and
+stores the new fingerprint. ``create_all`` never altered existing tables, so skipping it on an unchanged schema is
+equivalent; ``POST /db-setup`` and ``STARTUP_FINGERPRINT_ENABLED=false`` still force the full path.
+
+Each boot also produces a timing report (import time of app.main, then each startup step) that is logged, kept for
+GET /admin/startup and recorded in ``startup_runs`` with ``APP_RELEASE``, so cold-start time can be tracked per
+release.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from sqlalchemy import MetaData
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.startup_fingerprint import StartupFingerprint
+from app.models.startup_run import StartupRun
+
+logger = logging.getLogger("app.startup")
+
+SCHEMA = "schema"
+SEED = "seed"
+_SEED_MODULE = Path(__file__).resolve().parent.parent / "seed.py"
+
+
+def _settings():
+    from app.config import get_settings
+
+    return get_settings()
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+# --- Fingerprints ---
+
+
+def schema_fingerprint(metadata: MetaData) -> str:
+    """Hash of every table definition on ``metadata``, independent of model import order."""
+    h = hashlib.sha256()
+    for name in sorted(metadata.tables):
+        table = metadata.tables[name]
+        h.update(f"T {name}\n".encode("utf-8"))
+        for col in table.columns:
+            fks = ",".join(sorted(fk.target_fullname for fk in col.foreign_keys))
+            default = col.server_default.arg if col.server_default is not None else None
+            h.update(
+                f"C {col.name} {col.type!r} null={col.nullable} pk={col.primary_key} fk={fks} "
+                f"default={default}\n".encode("utf-8")
+            )
+        # indexes and constraints are sets, often unnamed: hash them as sorted lines
+        lines = [f"I {idx.name} {','.join(c.name for c in idx.columns)} unique={idx.unique}" for idx in table.indexes]
+        lines += [
+            f"K {type(con).__name__} {con.name} {','.join(c.name for c in getattr(con, 'columns', ()))}"
+            for con in table.constraints
+        ]
+        for line in sorted(lines):
+            h.update(f"{line}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def seed_fingerprint() -> str:
+    """Hash of the seed data (app/seed.py) and the admin user environment it reads."""
+    h = hashlib.sha256(_SEED_MODULE.read_bytes())
+    for key in ("ADMIN_EMAIL", "ADMIN_PASSWORD", "ADMIN_FULL_NAME"):
+        h.update(f"\n{key}=".encode("utf-8"))
+        h.update(hashlib.sha256((os.environ.get(key) or "").encode("utf-8")).digest())
+    return h.hexdigest()
+
+
+def load_fingerprints(db: Session) -> dict[str, str]:
+    """Stored fingerprints by name; empty when the table does not exist yet (fresh database)."""
+    try:
+        return {row.name: row.fingerprint for row in db.query(StartupFingerprint).all()}
+    except Exception:
+        db.rollback()
+        return {}
+
+
+def save_fingerprint(db: Session, name: str, fingerprint: str) -> None:
+    """Upsert one fingerprint. A concurrent boot storing the same row first is not an error."""
+    release = (_settings().app_release or "").strip() or None
+    try:
+        row = db.get(StartupFingerprint, name)
+        if row is None:
+            db.add(StartupFingerprint(name=name, fingerprint=fingerprint, release=release, updated_at=_now()))
+        else:
+            row.fingerprint, row.release, row.updated_at = fingerprint, release, _now()
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+
+
+# --- Timing report ---
+
+
+class StartupReport:
+    """Ordered per-step timings for one boot."""
+
+    def __init__(self, import_ms: float | None = None) -> None:
+        self.started_at = _now()
+        self.import_ms = import_ms
+        self.steps: list[dict[str, Any]] = []
+        self._t0 = time.perf_counter()
+        self.total_ms: float | None = None
+
+    @contextmanager
+    def step(self, name: str):
+        """Time a step. The body may set ``outcome["outcome"]``; an exception is recorded as "failed" and re-raised."""
+        outcome = {"outcome": "ok"}
+        t0 = time.perf_counter()
+        try:
+            yield outcome
+        except Exception:
+            outcome["outcome"] = "failed"
+            raise
+        finally:
+            self.steps.append(
+                {"name": name, "ms": round((time.perf_counter() - t0) * 1000, 1), "outcome": outcome["outcome"]}
+            )
+
+    def outcome(self, name: str) -> str | None:
+        for s in self.steps:
+            if s["name"] == name:
+                return s["outcome"]
+        return None
+
+    def finish(self) -> None:
+        self.total_ms = round((time.perf_counter() - self._t0) * 1000, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "release": (_settings().app_release or "").strip() or None,
+            "started_at": self.started_at,
+            "import_ms": round(self.import_ms, 1) if self.import_ms is not None else None,
+            "startup_ms": self.total_ms,
+            "steps": list(self.steps),
+        }
+
+    def summary(self) -> str:
+        parts = [f"{s['name']}={s['ms']:.0f}ms({s['outcome']})" for s in self.steps]
+        head = f"import={self.import_ms:.0f}ms " if self.import_ms is not None else ""
+        return f"{head}startup={self.total_ms or 0:.0f}ms " + " ".join(parts)
+
+
+_last_report: dict[str, Any] | None = None
+_report_lock = threading.Lock()
+
+
+def sync_schema_and_seed(
+    engine,
+    session_factory: Callable[[], Session],
+    metadata: MetaData,
+    *,
+    report: StartupReport | None = None,
+    force: bool = False,
+) -> dict[str, str]:
+    """Create tables and seed reference data unless the stored fingerprints say nothing changed.
+
+    Returns {"schema": "applied"|"skipped", "seed": "applied"|"skipped"}.
+    """
+    from app.seed import seed_admin_user, seed_jurisdiction_sot, seed_region_rules
+
+    report = report or StartupReport()
+    force = force or not _settings().startup_fingerprint_enabled
+    result: dict[str, str] = {}
+    db = session_factory()
+    try:
+        stored = {} if force else load_fingerprints(db)
+
+        with report.step(SCHEMA) as step:
+            fp = schema_fingerprint(metadata)
+            if stored.get(SCHEMA) == fp:
+                step["outcome"] = "skipped"
+            else:
+                metadata.create_all(bind=engine)
+                save_fingerprint(db, SCHEMA, fp)
+                step["outcome"] = "applied"
+            result[SCHEMA] = step["outcome"]
+
+        with report.step(SEED) as step:
+            fp = seed_fingerprint()
+            if stored.get(SEED) == fp:
+                step["outcome"] = "skipped"
+            else:
+                seed_region_rules(db)
+                seed_jurisdiction_sot(db)
+                seed_admin_user(db)
+                save_fingerprint(db, SEED, fp)
+                step["outcome"] = "applied"
+            result[SEED] = step["outcome"]
+    finally:
+        db.close()
+    return result
+
+
+def record_startup(report: StartupReport, session_factory: Callable[[], Session] | None = None) -> dict[str, Any]:
+    """Finish ``report``, log it, keep it for GET /admin/startup and store it in startup_runs (best effort)."""
+    global _last_report
+    if report.total_ms is None:
+        report.finish()
+    data = report.as_dict()
+    logger.info("[startup] Timing (release=%s): %s", data["release"] or "-", report.summary())
+    with _report_lock:
+        _last_report = data
+    if session_factory is None:
+        from app.database import SessionLocal as session_factory
+    db = session_factory()
+    try:
+        db.add(
+            StartupRun(
+                release=data["release"],
+                holder=f"{socket.gethostname()}:{os.getpid()}",
+                started_at=report.started_at,
+                import_ms=int(report.import_ms) if report.import_ms is not None else None,
+                startup_ms=int(report.total_ms),
+                schema_outcome=report.outcome(SCHEMA),
+                seed_outcome=report.outcome(SEED),
+                steps=data["steps"],
+            )
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.warning("[startup] Could not record startup timing: %s", e)
+    finally:
+        db.close()
+    return data
+
+
+def get_startup_report() -> dict[str, Any] | None:
+    """This process's startup timing report, or None before startup has finished."""
+    with _report_lock:
+        return dict(_last_report) if _last_report is not None else None
@@ -1,9 +1,13 @@
 """Module G: Stay Timer, legal notifications, and Status Confirmation (stay end reminders)."""
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import date, timedelta, datetime, timezone
+from typing import Callable
 from zoneinfo import ZoneInfo
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import event, exists, or_
 from sqlalchemy.sql import func
 
 logger = logging.getLogger("uvicorn.error")
@@ -19,6 +23,7 @@ from app.models.owner import OwnerProfile, Property, USAT_TOKEN_STAGED, USAT_TOK
 from app.models.property_manager_assignment import PropertyManagerAssignment
 from app.models.tenant_assignment import TenantAssignment
 from app.models.unit import Unit
+from app.models.user_daily_task import UserDailyTask
 from app.services.notifications import (
     send_stay_legal_warning,
     send_overstay_alert,
@@ -35,11 +40,17 @@ from app.services.notifications import (
     send_tenant_guest_jurisdiction_threshold_approaching_notice,
     send_guest_authorization_dates_only_email,
 )
-from app.services.privacy_lanes import is_tenant_lane_stay, is_tenant_lane_invitation
+from app.services.privacy_lanes import (
+    is_tenant_lane_invitation,
+    is_tenant_lane_stay,
+    tenant_lane_invitation_clause,
+    tenant_lane_stay_clause,
+)
 from app.services.guest_stay_email_scope import guest_stay_inviter_user_for_email
 from app.services.audit_log import create_log, CATEGORY_STATUS_CHANGE, CATEGORY_SHIELD_MODE, CATEGORY_DEAD_MANS_SWITCH
 from app.services.event_ledger import (
     create_ledger_event,
+    ledger_batch,
     ACTION_OVERSTAY_OCCURRED,
     ACTION_SHIELD_MODE_ON,
     ACTION_VACANT_MONITORING_NO_RESPONSE,
@@ -94,6 +105,60 @@ GUEST_NOTICE_AUTH_END_WINDOW = "Guest notice: stay end within 2 days (informatio
 TENANT_NOTICE_GUEST_JURISDICTION_THRESHOLD_48H = "Tenant notice: guest stay approaching jurisdiction threshold (2 days)"
 
 
+@dataclass(frozen=True)
+class PropertyShard:
+    """One slice of the portfolio for the stay notification job: properties with ``id % count == index``.
+
+    Every sub-job's writes are scoped to a single property (stay, unit and property rows, and their alerts/logs), so
+    shards never touch the same rows and can run concurrently on separate sessions.
+    """
+
+    index: int
+    count: int
+
+    def clause(self, property_id_column):
+        return property_id_column % self.count == self.index
+
+
+def _in_shard(q, shard: PropertyShard | None, property_id_column):
+    return q if shard is None else q.filter(shard.clause(property_id_column))
+
+
+# SQL counterparts of the per-stay checks, so candidate queries return only rows that still need work.
+
+
+def _managed_property_clause(property_id_column):
+    """WHERE clause equivalent of ``property_is_managed_by_docustay``."""
+    return exists().where(Property.id == property_id_column, Property.deleted_at.is_(None))
+
+
+def _stay_audit_logged_clause(*titles: str):
+    return exists().where(AuditLog.stay_id == Stay.id, AuditLog.title.in_(titles))
+
+
+def _stay_ledger_sent_clause(action_type: str):
+    return exists().where(EventLedger.stay_id == Stay.id, EventLedger.action_type == action_type)
+
+
+def _open_checked_in_stay_filters():
+    return (Stay.checked_in_at.isnot(None), Stay.checked_out_at.is_(None), Stay.cancelled_at.is_(None))
+
+
+def _stay_ids_with_audit_titles(db: Session, stay_ids: list[int], titles: tuple[str, ...]) -> dict[int, set[str]]:
+    """Which of ``titles`` are already logged for each stay: one query instead of one per stay and title."""
+    logged: dict[int, set[str]] = {}
+    if not stay_ids:
+        return logged
+    for sid, title in (
+        db.query(AuditLog.stay_id, AuditLog.title)
+        .filter(AuditLog.stay_id.in_(stay_ids), AuditLog.title.in_(titles))
+        .distinct()
+        .all()
+    ):
+        logged.setdefault(sid, set()).add(title)
+    return logged
+
+
 def _status_confirmation_eligible_stay(db: Session, stay: Stay) -> bool:
     """Property Status Confirmation applies only to property/management-lane stays (tenant lease), not tenant-invited guests."""
     return not is_tenant_lane_stay(db, stay)
@@ -105,13 +170,8 @@ def _deadline_no_response_already_logged(db: Session, stay_id: int) -> bool:
     )
 
 
-def _guest_end_window_notice_already_sent(db: Session, stay_id: int) -> bool:
-    """True if this stay already received the informational guest end-window notice (current or legacy audit title)."""
-    return (
-        _dms_already_logged(db, GUEST_NOTICE_AUTH_END_WINDOW, stay_id=stay_id)
-        or _dms_already_logged(db, GUEST_NOTICE_AUTH_48H, stay_id=stay_id)
-        or _dms_already_logged(db, GUEST_NOTICE_AUTH_TODAY, stay_id=stay_id)
-    )
+# The informational guest end-window notice was sent if any of these (current or legacy) audit titles exists for the stay.
+_GUEST_END_WINDOW_NOTICE_TITLES = frozenset({GUEST_NOTICE_AUTH_END_WINDOW, GUEST_NOTICE_AUTH_48H, GUEST_NOTICE_AUTH_TODAY})
 
 
 def get_overstays(db: Session) -> list[Stay]:
@@ -137,32 +197,30 @@ def _relationship_owner_user_id_for_stay(db: Session, stay: Stay) -> int | None:
     return getattr(inv, "invited_by_user_id", None) if inv else None
 
 
-def send_overstay_alerts_and_log(db: Session) -> None:
+def send_overstay_alerts_and_log(db: Session, *, shard: PropertyShard | None = None) -> int:
     """For each overstay not yet logged: email stakeholders and guest, then append audit log.
 
     Tenant-lane stays route to the relationship owner (stay.invited_by_user_id, else invitation
     inviter) and the guest only — not the property owner/manager by default. If the stay is
     tenant-lane but no relationship owner with email can be resolved, escalates to the property
     owner/manager path.
+
+    Returns the number of candidate stays (overstays on managed properties not yet logged).
     """
     from app.services.display_names import label_for_stay
 
-    overstays = get_overstays(db)
+    # Only act once per stay: overstays already logged are excluded in the query.
+    overstays = _in_shard(
+        db.query(Stay).filter(
+            *_open_checked_in_stay_filters(),
+            Stay.stay_end_date < date.today(),
+            _managed_property_clause(Stay.property_id),
+            ~_stay_audit_logged_clause("Overstay occurred"),
+        ),
+        shard,
+        Stay.property_id,
+    ).order_by(Stay.id).all()
     for stay in overstays:
-        if not property_is_managed_by_docustay(db, stay.property_id):
-            continue
-        # Only act once per stay: skip if we already logged this overstay
-        existing = (
-            db.query(AuditLog)
-            .filter(
-                AuditLog.stay_id == stay.id,
-                AuditLog.title == "Overstay occurred",
-            )
-            .first()
-        )
-        if existing:
-            continue
-
         owner = db.query(User).filter(User.id == stay.owner_id).first()
         guest = db.query(User).filter(User.id == stay.guest_id).first()
         prop = db.query(Property).filter(Property.id == stay.property_id).first()
@@ -291,16 +349,46 @@ def send_overstay_alerts_and_log(db: Session) -> None:
             severity="urgent", property_id=stay.property_id, stay_id=stay.id, invitation_id=getattr(stay, "invitation_id", None), meta={"stay_end_date": end_str},
         )
         db.commit()
+    return len(overstays)
 
 
-def get_stays_approaching_limit(db: Session, days_before: int | None = None) -> list[Stay]:
-    """Stays whose end date is within days_before (default from config) or on final day."""
+def get_stays_approaching_limit(
+    db: Session,
+    days_before: int | None = None,
+    *,
+    managed_only: bool = False,
+    shard: PropertyShard | None = None,
+) -> list[Stay]:
+    """Stays whose end date is within days_before (default from config) or on final day.
+
+    managed_only: only stays on properties DocuStay manages (the ones send_legal_warnings_for_stay acts on).
+    """
     days = days_before if days_before is not None else settings.notification_days_before_limit
     threshold = date.today() + timedelta(days=days)
-    return db.query(Stay).filter(
+    q = db.query(Stay).filter(
         Stay.stay_end_date >= date.today(),
         Stay.stay_end_date <= threshold,
-    ).all()
+    )
+    if managed_only:
+        q = q.filter(_managed_property_clause(Stay.property_id))
+    return _in_shard(q, shard, Stay.property_id).order_by(Stay.id).all()
+
+
+def send_stay_legal_warnings(db: Session, *, shard: PropertyShard | None = None) -> int:
+    """Legal warnings for every managed stay approaching its limit; region rules are loaded once, not per stay.
+    Returns the number of candidate stays."""
+    stays = get_stays_approaching_limit(db, managed_only=True, shard=shard)
+    region_codes = {s.region_code for s in stays}
+    rules = (
+        {r.region_code: r for r in db.query(RegionRule).filter(RegionRule.region_code.in_(region_codes)).order_by(RegionRule.id.desc())}
+        if region_codes
+        else {}
+    )
+    for stay in stays:
+        rule = rules.get(stay.region_code)
+        statute_ref = rule.statute_reference if rule else stay.region_code
+        send_legal_warnings_for_stay(stay, db, statute_ref or stay.region_code)
+    return len(stays)
 
 
 def send_legal_warnings_for_stay(stay: Stay, db: Session, statute_ref: str) -> None:
@@ -370,39 +458,21 @@ def _dms_already_logged(
     return q.first() is not None
 
 
-def _dms_ledger_sent(db: Session, action_type: str, stay_id: int) -> bool:
-    """True if an EventLedger row already exists for this Status Confirmation stage and stay."""
-    return (
-        db.query(EventLedger)
-        .filter(EventLedger.action_type == action_type, EventLedger.stay_id == stay_id)
-        .first()
-        is not None
-    )
-
-
-def _dms_tenant_assignment_ledger_sent(db: Session, action_type: str, tenant_assignment_id: int) -> bool:
-    return (
-        db.query(EventLedger)
-        .filter(
-            EventLedger.action_type == action_type,
-            EventLedger.target_object_type == "TenantAssignment",
-            EventLedger.target_object_id == tenant_assignment_id,
-        )
-        .first()
-        is not None
-    )
-
-
-def _ta_status_confirmation_audit_logged(db: Session, title: str, tenant_assignment_id: int) -> bool:
-    for row in (
-        db.query(AuditLog)
-        .filter(AuditLog.title == title, AuditLog.category == CATEGORY_DEAD_MANS_SWITCH)
-        .all()
+def _ta_status_confirmation_audit_logged_ids(db: Session, title: str, property_ids: set[int]) -> set[int]:
+    """Tenant assignment ids that already have this Status Confirmation audit row on the given properties.
+    One scan per phase (the id lives in the JSON meta), instead of re-reading every row with this title per assignment."""
+    if not property_ids:
+        return set()
+    ids: set[int] = set()
+    for (meta,) in db.query(AuditLog.meta).filter(
+        AuditLog.title == title,
+        AuditLog.category == CATEGORY_DEAD_MANS_SWITCH,
+        AuditLog.property_id.in_(property_ids),
     ):
-        meta = row.meta or {}
-        if meta.get("tenant_assignment_id") == tenant_assignment_id:
-            return True
-    return False
+        ta_id = (meta or {}).get("tenant_assignment_id")
+        if ta_id is not None:
+            ids.add(ta_id)
+    return ids
 
 
 def _tenant_assignment_property_lane_eligible(db: Session, ta: TenantAssignment) -> bool:
@@ -450,8 +520,10 @@ def _materialize_tenant_assignment_status_confirmation(
     restrict_property_ids: set[int] | None,
     phase: str,
     occ_prompt_detail: str,
-) -> None:
-    """48h-before or lease-ends-today for owner/manager tenant unit leases (TenantAssignment without guest Stay)."""
+    shard: PropertyShard | None = None,
+) -> int:
+    """48h-before or lease-ends-today for owner/manager tenant unit leases (TenantAssignment without guest Stay).
+    Returns the number of candidate assignments."""
     from app.services.tenant_lease_window import find_invitation_matching_tenant_assignment
 
     if phase == "48h":
@@ -465,26 +537,39 @@ def _materialize_tenant_assignment_status_confirmation(
         alert_type = "tenant_lease_urgent"
         alert_title = "Tenant lease ends today — confirm occupancy"
     else:
-        return
+        return 0
 
+    # Managed property and ledger dedupe in SQL; already-alerted assignments never come back.
     q = (
         db.query(TenantAssignment)
         .join(Unit, Unit.id == TenantAssignment.unit_id)
         .filter(
             TenantAssignment.end_date == target_end_date,
             TenantAssignment.end_date.isnot(None),
+            _managed_property_clause(Unit.property_id),
+            ~exists().where(
+                EventLedger.action_type == ledger_action,
+                EventLedger.target_object_type == "TenantAssignment",
+                EventLedger.target_object_id == TenantAssignment.id,
+            ),
         )
     )
     if restrict_property_ids is not None:
         q = q.filter(Unit.property_id.in_(list(restrict_property_ids)))
+    candidates = _in_shard(q, shard, Unit.property_id).order_by(TenantAssignment.id).all()
+    audit_logged = _ta_status_confirmation_audit_logged_ids(
+        db,
+        title,
+        {pid for (pid,) in db.query(Unit.property_id).filter(Unit.id.in_({ta.unit_id for ta in candidates}))}
+        if candidates
+        else set(),
+    )
 
-    for ta in q.all():
+    for ta in candidates:
         if not _tenant_assignment_property_lane_eligible(db, ta):
             continue
         if _unit_has_property_lane_checked_in_stay_ending_on(db, ta.unit_id, target_end_date):
             continue
-        if _dms_tenant_assignment_ledger_sent(db, ledger_action, ta.id):
-            continue
 
         unit = db.query(Unit).filter(Unit.id == ta.unit_id).first()
         prop = db.query(Property).filter(Property.id == unit.property_id).first() if unit else None
@@ -507,7 +592,7 @@ def _materialize_tenant_assignment_status_confirmation(
         unit_lbl = (getattr(unit, "unit_label", None) or str(unit.id)).strip()
         place = f"{prop_nm} (Unit {unit_lbl})"
 
-        if _ta_status_confirmation_audit_logged(db, title, ta.id):
+        if ta.id in audit_logged:
             create_ledger_event(
                 db,
                 ledger_action,
@@ -615,6 +700,7 @@ def _materialize_tenant_assignment_status_confirmation(
             },
         )
         db.commit()
+    return len(candidates)
 
 
 def _get_guest_name(db: Session, stay: Stay) -> str:
@@ -707,6 +793,41 @@ def dms_test_mode_unknown_deadline_utc(db: Session, stay: Stay) -> datetime | No
     return latest + timedelta(minutes=DMS_TEST_MODE_RESPONSE_WINDOW_MINUTES)
 
 
+def dms_test_mode_unknown_deadlines_utc(db: Session, stay_ids: list[int]) -> dict[int, datetime]:
+    """Bulk ``dms_test_mode_unknown_deadline_utc``: stay_id -> deadline, for stays that have been notified."""
+    from app.models.dashboard_alert import DashboardAlert
+
+    if not stay_ids:
+        return {}
+    latest: dict[int, datetime] = {}
+    alert_rows = (
+        db.query(DashboardAlert.stay_id, func.max(DashboardAlert.created_at))
+        .filter(
+            DashboardAlert.stay_id.in_(stay_ids),
+            DashboardAlert.alert_type.in_(["dms_48h", "dms_urgent"]),
+        )
+        .group_by(DashboardAlert.stay_id)
+        .all()
+    )
+    audit_rows = (
+        db.query(AuditLog.stay_id, func.max(AuditLog.created_at))
+        .filter(
+            AuditLog.stay_id.in_(stay_ids),
+            AuditLog.category == CATEGORY_DEAD_MANS_SWITCH,
+            AuditLog.title.in_((DMS_TITLE_48H_BEFORE, DMS_TITLE_URGENT_TODAY)),
+        )
+        .group_by(AuditLog.stay_id)
+        .all()
+    )
+    for sid, ts in list(alert_rows) + list(audit_rows):
+        u = _ensure_utc(ts)
+        if sid is None or u is None:
+            continue
+        latest[sid] = u if sid not in latest else max(latest[sid], u)
+    window = timedelta(minutes=DMS_TEST_MODE_RESPONSE_WINDOW_MINUTES)
+    return {sid: ts + window for sid, ts in latest.items()}
+
+
 def _run_dead_mans_switch_job_test_mode(db: Session) -> None:
     """Status Confirmation test mode: simulated lease end + 2 min; in-app + audit notifications; Unknown 5 min after latest notification if no response."""
     now = datetime.now(timezone.utc)
@@ -947,7 +1068,8 @@ def run_dms_test_mode_catchup_job() -> None:
                 "Status Confirmation test-mode catchup job: turned stay reminders on for %d stay(s), running run_dead_mans_switch_job",
                 len(to_turn_on),
             )
-            run_dead_mans_switch_job(db)
+            with ledger_batch(db):
+                run_dead_mans_switch_job(db)
         else:
             logger.info("Status Confirmation test-mode catchup job: no stays needed stay reminders on, done")
     except Exception as e:
@@ -962,59 +1084,63 @@ def run_dead_mans_switch_job(
     *,
     reference_date: date | None = None,
     restrict_property_ids: set[int] | None = None,
-) -> None:
+    shard: PropertyShard | None = None,
+) -> int:
     """Status Confirmation: 48h before alert, today alert, 48h after auto-execute. When DMS_TEST_MODE=true, simulated end +2 min from check-in/create; Unknown 5 min after latest notification if no response.
 
     reference_date: calendar \"today\" for eligibility (e.g. browser date on login).
     restrict_property_ids: when set, only process stays on these properties (owner/manager materialization).
+    shard: when set, only process this slice of properties (stay notification job runner).
+
+    Candidate stays come from set-based queries: lane eligibility, managed property and the ledger/audit dedupe are
+    part of the WHERE clause. Returns the number of candidate stays and tenant assignments across all steps.
     """
     if settings.dms_test_mode:
+        if shard is not None and shard.index != 0:
+            return 0
         logger.info(
             "Status Confirmation job: running test-mode path (effective end = check-in/create + %d min; unknown %d min after latest notification)",
             DMS_TEST_MODE_MINUTES_AFTER_CREATE,
             DMS_TEST_MODE_RESPONSE_WINDOW_MINUTES,
         )
         _run_dead_mans_switch_job_test_mode(db)
-        return
+        return 0
 
     today = reference_date if reference_date is not None else date.today()
     two_days_later = today + timedelta(days=2)
     two_days_ago = today - timedelta(days=2)
 
-    # Stays with stay reminders enabled (integer 1)
-    def dms_enabled(s: Stay) -> bool:
-        return getattr(s, "dead_mans_switch_enabled", 0) == 1
-
     def alert_email(s: Stay) -> bool:
         return getattr(s, "dead_mans_switch_alert_email", 1) == 1
 
-    def _stay_scope_filter(q):
+    def _eligible_stays(*criteria):
+        """Open, checked-in, property-lane stays on managed properties in scope, matching ``criteria``."""
+        q = db.query(Stay).filter(
+            *_open_checked_in_stay_filters(),
+            ~tenant_lane_stay_clause(),
+            _managed_property_clause(Stay.property_id),
+            *criteria,
+        )
         if restrict_property_ids is not None:
-            return q.filter(Stay.property_id.in_(list(restrict_property_ids)))
-        return q
+            q = q.filter(Stay.property_id.in_(list(restrict_property_ids)))
+        return _in_shard(q, shard, Stay.property_id).order_by(Stay.id)
 
     occ_prompt_detail = OCC_PROMPT_RESPOND_DETAIL
-
-    # 1) 48 hours before lease end: turn stay reminders on for this stay (prod: not on from creation) and send alert
-    for stay in _stay_scope_filter(
-        db.query(Stay).filter(
-            Stay.checked_in_at.isnot(None),
-            Stay.stay_end_date == two_days_later,
-            Stay.checked_out_at.is_(None),
-            Stay.cancelled_at.is_(None),
-        )
-    ).all():
-        if not _status_confirmation_eligible_stay(db, stay):
-            continue
-        if not property_is_managed_by_docustay(db, stay.property_id):
-            continue
-        # In prod, stay reminders turn on here (48h before lease end), not at creation or check-in
-        if not dms_enabled(stay):
-            stay.dead_mans_switch_enabled = 1
-            db.add(stay)
-            db.commit()
-        if _dms_ledger_sent(db, ACTION_DMS_48H_ALERT, stay.id):
-            continue
+    candidates = 0
+
+    # 1) 48 hours before lease end: turn stay reminders on for this stay (prod: not on from creation) and send alert.
+    # In prod, stay reminders turn on here (48h before lease end), not at creation or check-in — also for stays whose
+    # alert was already sent.
+    to_enable = _eligible_stays(Stay.stay_end_date == two_days_later, Stay.dead_mans_switch_enabled != 1).all()
+    for stay in to_enable:
+        stay.dead_mans_switch_enabled = 1
+    if to_enable:
+        db.commit()
+    step_stays = _eligible_stays(
+        Stay.stay_end_date == two_days_later, ~_stay_ledger_sent_clause(ACTION_DMS_48H_ALERT)
+    ).all()
+    candidates += len(step_stays)
+    for stay in step_stays:
         if _dms_already_logged(db, DMS_TITLE_48H_BEFORE, stay_id=stay.id):
             create_ledger_event(
                 db,
@@ -1090,41 +1216,36 @@ def run_dead_mans_switch_job(
         )
         db.commit()
 
-    _materialize_tenant_assignment_status_confirmation(
+    candidates += _materialize_tenant_assignment_status_confirmation(
         db,
         target_end_date=two_days_later,
         restrict_property_ids=restrict_property_ids,
         phase="48h",
         occ_prompt_detail=occ_prompt_detail,
+        shard=shard,
     )
 
-    # 1.5) Last day of guest's stay: activate Shield Mode for the property (any checked-in stay ending today)
-    stays_ending_today = [
-        s
-        for s in _stay_scope_filter(
-            db.query(Stay).filter(
-                Stay.checked_in_at.isnot(None),
-                Stay.stay_end_date == today,
-                Stay.checked_out_at.is_(None),
-                Stay.cancelled_at.is_(None),
-            )
-        ).all()
-        if _status_confirmation_eligible_stay(db, s)
-    ]
-    property_ids_ending_today = {s.property_id for s in stays_ending_today}
-    for prop_id in property_ids_ending_today:
-        if restrict_property_ids is not None and prop_id not in restrict_property_ids:
-            continue
-        if not property_is_managed_by_docustay(db, prop_id):
-            continue
+    # 1.5) Last day of guest's stay: activate Shield Mode for the property (any checked-in stay ending today).
+    # Only properties with Shield off and no activation logged today; the first such stay per property is used.
+    from datetime import time as dt_time
+
+    start_of_today = datetime.combine(today, dt_time.min).replace(tzinfo=timezone.utc)
+    stays_for_shield: dict[int, Stay] = {}
+    for s in _eligible_stays(
+        Stay.stay_end_date == today,
+        exists().where(Property.id == Stay.property_id, Property.shield_mode_enabled != 1),
+        ~exists().where(
+            AuditLog.property_id == Stay.property_id,
+            AuditLog.title == SHIELD_ACTIVATED_LAST_DAY,
+            AuditLog.created_at >= start_of_today,
+        ),
+    ):
+        stays_for_shield.setdefault(s.property_id, s)
+    candidates += len(stays_for_shield)
+    for prop_id, stay_for_prop in stays_for_shield.items():
         prop = db.query(Property).filter(Property.id == prop_id).first()
         if not prop or getattr(prop, "shield_mode_enabled", 0) == 1:
             continue
-        if _dms_already_logged(db, SHIELD_ACTIVATED_LAST_DAY, property_id=prop_id, since_date=today):
-            continue
-        stay_for_prop = next((s for s in stays_ending_today if s.property_id == prop_id), None)
-        if not stay_for_prop:
-            continue
         owner = db.query(User).filter(User.id == stay_for_prop.owner_id).first()
         prop.shield_mode_enabled = 1
         db.add(prop)
@@ -1178,23 +1299,14 @@ def run_dead_mans_switch_job(
         )
         db.commit()
 
-    # 2) Lease end date = today (urgent; only for checked-in stays)
-    for stay in _stay_scope_filter(
-        db.query(Stay).filter(
-            Stay.checked_in_at.isnot(None),
-            Stay.stay_end_date == today,
-            Stay.checked_out_at.is_(None),
-            Stay.cancelled_at.is_(None),
-        )
-    ).all():
-        if not _status_confirmation_eligible_stay(db, stay):
-            continue
-        if not property_is_managed_by_docustay(db, stay.property_id):
-            continue
-        if not dms_enabled(stay):
-            continue
-        if _dms_ledger_sent(db, ACTION_DMS_URGENT_TODAY, stay.id):
-            continue
+    # 2) Lease end date = today (urgent; only for checked-in stays with stay reminders on)
+    step_stays = _eligible_stays(
+        Stay.stay_end_date == today,
+        Stay.dead_mans_switch_enabled == 1,
+        ~_stay_ledger_sent_clause(ACTION_DMS_URGENT_TODAY),
+    ).all()
+    candidates += len(step_stays)
+    for stay in step_stays:
         if _dms_already_logged(db, DMS_TITLE_URGENT_TODAY, stay_id=stay.id):
             create_ledger_event(
                 db,
@@ -1270,36 +1382,25 @@ def run_dead_mans_switch_job(
         )
         db.commit()
 
-    _materialize_tenant_assignment_status_confirmation(
+    candidates += _materialize_tenant_assignment_status_confirmation(
         db,
         target_end_date=today,
         restrict_property_ids=restrict_property_ids,
         phase="urgent_today",
         occ_prompt_detail=occ_prompt_detail,
+        shard=shard,
     )
 
     # 3) 48 hours after lease end – occupancy Unknown until PM/owner confirms (no auto-checkout; no Shield; no USAT staging)
-    for stay in _stay_scope_filter(
-        db.query(Stay).filter(
-            Stay.checked_in_at.isnot(None),
-            Stay.stay_end_date <= two_days_ago,
-            Stay.checked_out_at.is_(None),
-            Stay.cancelled_at.is_(None),
-        )
-    ).all():
-        if not _status_confirmation_eligible_stay(db, stay):
-            continue
-        if not property_is_managed_by_docustay(db, stay.property_id):
-            continue
-        if not dms_enabled(stay):
-            continue
-        if getattr(stay, "occupancy_confirmation_response", None) is not None:
-            continue
-        if getattr(stay, "dead_mans_switch_triggered_at", None) is not None:
-            continue
-        if _deadline_no_response_already_logged(db, stay.id):
-            continue
-
+    step_stays = _eligible_stays(
+        Stay.stay_end_date <= two_days_ago,
+        Stay.dead_mans_switch_enabled == 1,
+        Stay.occupancy_confirmation_response.is_(None),
+        Stay.dead_mans_switch_triggered_at.is_(None),
+        ~_stay_audit_logged_clause(DMS_TITLE_NO_RESPONSE_UNKNOWN, _LEGACY_DMS_AUTO_EXECUTED_TITLE),
+    ).all()
+    candidates += len(step_stays)
+    for stay in step_stays:
         owner = db.query(User).filter(User.id == stay.owner_id).first()
         prop = db.query(Property).filter(Property.id == stay.property_id).first()
         guest_name = _get_guest_name(db, stay)
@@ -1373,8 +1474,10 @@ def run_dead_mans_switch_job(
             meta={"stay_end_date": stay.stay_end_date.isoformat(), "guest_name": guest_name},
         )
         db.commit()
+    return candidates
+
 
-    # Vacant monitoring audit title (idempotency)
+# Vacant monitoring audit title (idempotency)
 VACANT_MONITORING_FLIPPED = "Vacant monitoring: no response – status UNCONFIRMED"
 
 
@@ -1421,23 +1524,111 @@ def run_status_confirmation_materialize_for_user(
     run_dead_mans_switch_job(db, reference_date=ref, restrict_property_ids=prop_ids)
 
 
-def run_vacant_monitoring_job(db: Session) -> None:
-    """Vacant-unit monitoring: prompt at defined intervals; no response by deadline → flip to UNCONFIRMED, Shield on."""
+STATUS_CONFIRMATION_LOGIN_TASK = "status_confirmation_materialize"
+
+
+def _claim_user_daily_task(db: Session, user_id: int, task: str, for_date: date) -> tuple[bool, date | None]:
+    """Advance the user's watermark for ``task`` to ``for_date`` unless it is already there (or later).
+    Returns (claimed, previous watermark). The conditional UPDATE makes concurrent claims (other workers or API
+    processes) race safely: only one of them wins a given day."""
+    from sqlalchemy.exc import IntegrityError
+
+    row = db.query(UserDailyTask).filter(UserDailyTask.user_id == user_id, UserDailyTask.task == task).first()
+    if row is None:
+        db.add(UserDailyTask(user_id=user_id, task=task, last_run_for=for_date))
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            return False, None
+        return True, None
+    previous = row.last_run_for
+    if previous is not None and previous >= for_date:
+        return False, previous
+    n = (
+        db.query(UserDailyTask)
+        .filter(
+            UserDailyTask.id == row.id,
+            or_(UserDailyTask.last_run_for.is_(None), UserDailyTask.last_run_for < for_date),
+        )
+        .update({"last_run_for": for_date}, synchronize_session=False)
+    )
+    db.commit()
+    return bool(n), previous
+
+
+def _release_user_daily_task(db: Session, user_id: int, task: str, for_date: date, previous: date | None) -> None:
+    """Undo a claim after the task failed, so the next sign-in retries it."""
+    db.rollback()
+    db.query(UserDailyTask).filter(
+        UserDailyTask.user_id == user_id,
+        UserDailyTask.task == task,
+        UserDailyTask.last_run_for == for_date,
+    ).update({"last_run_for": previous}, synchronize_session=False)
+    db.commit()
+
+
+def materialize_status_confirmation_for_user_once(user_id: int, for_date: date) -> bool:
+    """Deferred sign-in task: run ``run_status_confirmation_materialize_for_user`` at most once per user per calendar
+    day, on its own background session. Returns whether it ran."""
+    db = get_background_job_session()
+    try:
+        user = db.query(User).filter(User.id == user_id).first()
+        if user is None or user.role not in (UserRole.owner, UserRole.property_manager):
+            return False
+        claimed, previous = _claim_user_daily_task(db, user_id, STATUS_CONFIRMATION_LOGIN_TASK, for_date)
+        if not claimed:
+            return False
+        started = time.perf_counter()
+        try:
+            run_status_confirmation_materialize_for_user(db, user, client_calendar_date=for_date)
+        except Exception:
+            _release_user_daily_task(db, user_id, STATUS_CONFIRMATION_LOGIN_TASK, for_date, previous)
+            raise
+        logger.info(
+            "Status Confirmation materialized after sign-in: user_id=%s for=%s in %d ms",
+            user_id,
+            for_date.isoformat(),
+            int((time.perf_counter() - started) * 1000),
+        )
+        return True
+    finally:
+        db.close()
+
+
+def defer_status_confirmation_materialize_for_user(user: User, *, client_calendar_date: date | None = None) -> bool:
+    """Sign-in hook for owners and property managers: queue ``materialize_status_confirmation_for_user_once`` on the
+    deferred-work pool and return immediately, so sign-in latency does not depend on portfolio size. Debounced per
+    user while a run is queued or in progress. Returns whether a job was queued."""
+    from app.background_jobs import submit_keyed_job
+
+    if user.role not in (UserRole.owner, UserRole.property_manager):
+        return False
+    for_date = client_calendar_date or date.today()
+    return submit_keyed_job(
+        f"{STATUS_CONFIRMATION_LOGIN_TASK}:{user.id}",
+        materialize_status_confirmation_for_user_once,
+        user.id,
+        for_date,
+    )
+
+
+def run_vacant_monitoring_job(db: Session, *, shard: PropertyShard | None = None) -> int:
+    """Vacant-unit monitoring: prompt at defined intervals; no response by deadline → flip to UNCONFIRMED, Shield on.
+    Returns the number of monitored vacant properties."""
     interval_days = getattr(settings, "vacant_monitoring_interval_days", 7) or 7
     response_days = getattr(settings, "vacant_monitoring_response_days", 7) or 7
     now = datetime.now(timezone.utc)
-    today = now.date()
 
-    vacant_with_monitoring = (
-        db.query(Property)
-        .filter(
+    monitored = _in_shard(
+        db.query(Property).filter(
             Property.occupancy_status == OccupancyStatus.vacant.value,
             Property.deleted_at.is_(None),
-        )
-        .all()
-    )
-    # Filter by vacant_monitoring_enabled (attribute may not exist on older DBs)
-    monitored = [p for p in vacant_with_monitoring if getattr(p, "vacant_monitoring_enabled", 0) == 1]
+            Property.vacant_monitoring_enabled == 1,
+        ),
+        shard,
+        Property.id,
+    ).order_by(Property.id).all()
 
     for prop in monitored:
         last_prompted = getattr(prop, "vacant_monitoring_last_prompted_at", None)
@@ -1531,6 +1722,7 @@ def run_vacant_monitoring_job(db: Session) -> None:
             severity="warning", meta={"occupancy_status_previous": prev_status},
         )
         db.commit()
+    return len(monitored)
 
 
 DMS_24H_UNCONFIRMED_TO_UNKNOWN = "Status Confirmation: 24h no response – status set to Unknown"
@@ -1674,7 +1866,8 @@ def run_tenant_lane_guest_stay_ending_notifications(
     *,
     only_guest_user_id: int | None = None,
     client_calendar_date: date | None = None,
-) -> None:
+    shard: PropertyShard | None = None,
+) -> int:
     """Tenant-invited guest stays only: alert tenant; informational email to guest (dates only). Not Status Confirmation.
 
     Runs with real calendar dates even when DMS_TEST_MODE is true (Status Confirmation uses a short test window; guest-ending notices do not).
@@ -1684,6 +1877,8 @@ def run_tenant_lane_guest_stay_ending_notifications(
     When ``client_calendar_date`` is set (from ``X-Client-Calendar-Date``), the guest's local calendar day drives the window so it matches the UI.
 
     When ``only_guest_user_id`` is set, only stays for that guest user are processed (used on guest login / dashboard for that user).
+
+    Returns the number of candidate stays.
     """
     calendar_refs = _guest_end_notification_calendar_refs(client_calendar_date=client_calendar_date)
     # SQL prefilter: stays that could fall in the window for some ref (end between min(ref) and max(ref)+2).
@@ -1692,21 +1887,28 @@ def run_tenant_lane_guest_stay_ending_notifications(
     # Guest date reminders are informational (planned authorization dates). Do not require check-in:
     # guests may have a signed agreement and valid dates but never complete in-app check-in / confirmation.
     q = (
-        db.query(Stay)
+        db.query(Stay, tenant_lane_stay_clause())
         .filter(
             Stay.checked_out_at.is_(None),
             Stay.cancelled_at.is_(None),
             Stay.revoked_at.is_(None),
             Stay.stay_end_date >= end_lo,
             Stay.stay_end_date <= end_hi,
+            _managed_property_clause(Stay.property_id),
         )
     )
     if only_guest_user_id is not None:
         q = q.filter(Stay.guest_id == only_guest_user_id)
-    candidates = q.all()
-    for stay in candidates:
-        if not property_is_managed_by_docustay(db, stay.property_id):
-            continue
+    candidates = _in_shard(q, shard, Stay.property_id).order_by(Stay.id).all()
+    # Notices already sent, for all candidates at once. Each title is logged at most once per stay per run, so the
+    # snapshot stays valid while the loop below adds rows.
+    logged = _stay_ids_with_audit_titles(
+        db,
+        [stay.id for stay, _ in candidates],
+        (TENANT_NOTICE_GUEST_AUTH_TODAY, TENANT_NOTICE_GUEST_AUTH_48H, *sorted(_GUEST_END_WINDOW_NOTICE_TITLES)),
+    )
+    for stay, tenant_lane in candidates:
+        already = logged.get(stay.id, set())
         prop = db.query(Property).filter(Property.id == stay.property_id).first()
         property_name = _get_property_name(db, prop)
         guest_user = db.query(User).filter(User.id == stay.guest_id).first()
@@ -1734,7 +1936,7 @@ def run_tenant_lane_guest_stay_ending_notifications(
         tenant_two_day = any((end_cal - r).days == 2 for r in calendar_refs)
 
         if ends_today:
-            if not _dms_already_logged(db, TENANT_NOTICE_GUEST_AUTH_TODAY, stay_id=stay.id):
+            if TENANT_NOTICE_GUEST_AUTH_TODAY not in already:
                 if tenant_email:
                     try:
                         send_tenant_guest_authorization_ending_notice(
@@ -1764,9 +1966,7 @@ def run_tenant_lane_guest_stay_ending_notifications(
                     meta={"guest_id": stay.guest_id, "tenant_user_id": tenant_uid},
                 )
                 db.commit()
-        elif tenant_two_day and is_tenant_lane_stay(db, stay) and not _dms_already_logged(
-            db, TENANT_NOTICE_GUEST_AUTH_48H, stay_id=stay.id
-        ):
+        elif tenant_two_day and tenant_lane and TENANT_NOTICE_GUEST_AUTH_48H not in already:
             if tenant_email:
                 try:
                     send_tenant_guest_authorization_ending_notice(
@@ -1797,7 +1997,7 @@ def run_tenant_lane_guest_stay_ending_notifications(
             )
             db.commit()
 
-        if not _guest_end_window_notice_already_sent(db, stay.id):
+        if not already & _GUEST_END_WINDOW_NOTICE_TITLES:
             if guest_email:
                 try:
                     send_guest_authorization_dates_only_email(
@@ -1837,6 +2037,7 @@ def run_tenant_lane_guest_stay_ending_notifications(
         u = db.query(User).filter(User.id == only_guest_user_id).first()
         if u and u.role == UserRole.guest:
             _materialize_guest_archive_approaching_end_notifications(db, u, calendar_refs)
+    return len(candidates)
 
 
 def _iter_tenant_jurisdiction_archive_invitations(
@@ -1844,27 +2045,30 @@ def _iter_tenant_jurisdiction_archive_invitations(
     calendar_refs: list[date],
     *,
     only_tenant_user_id: int | None,
+    shard: PropertyShard | None = None,
 ) -> list[Invitation]:
-    """Tenant-lane guest invitations with a signed agreement and no Stay row, end date in the jurisdiction-threshold window."""
+    """Tenant-lane guest invitations with a signed agreement and no Stay row, end date in the jurisdiction-threshold window,
+    on a managed property and not yet notified."""
     end_lo = min(calendar_refs) + timedelta(days=2)
     end_hi = max(calendar_refs) + timedelta(days=2)
     q = db.query(Invitation).filter(
         Invitation.stay_end_date >= end_lo,
         Invitation.stay_end_date <= end_hi,
-        Invitation.invited_by_user_id.isnot(None),
+        func.lower(func.trim(Invitation.invitation_kind)) == "guest",
+        tenant_lane_invitation_clause(),
+        ~exists().where(Stay.invitation_id == Invitation.id),
+        exists().where(AgreementSignature.invitation_code == Invitation.invitation_code),
+        _managed_property_clause(Invitation.property_id),
+        ~exists().where(
+            EventLedger.action_type == ACTION_TENANT_GUEST_JURISDICTION_THRESHOLD_APPROACHING,
+            EventLedger.invitation_id == Invitation.id,
+            EventLedger.stay_id.is_(None),
+        ),
     )
     if only_tenant_user_id is not None:
         q = q.filter(Invitation.invited_by_user_id == only_tenant_user_id)
     out: list[Invitation] = []
-    for inv in q.all():
-        if (getattr(inv, "invitation_kind", None) or "").strip().lower() != "guest":
-            continue
-        if not is_tenant_lane_invitation(db, inv):
-            continue
-        if db.query(Stay).filter(Stay.invitation_id == inv.id).first():
-            continue
-        if not db.query(AgreementSignature).filter(AgreementSignature.invitation_code == inv.invitation_code).first():
-            continue
+    for inv in _in_shard(q, shard, Invitation.property_id).order_by(Invitation.id).all():
         end_cal = _coerce_stay_calendar_date(inv.stay_end_date)
         if not any((end_cal - r).days == 2 for r in calendar_refs):
             continue
@@ -1873,21 +2077,8 @@ def _iter_tenant_jurisdiction_archive_invitations(
 
 
 def _emit_tenant_jurisdiction_threshold_for_archive_invitation(db: Session, inv: Invitation) -> None:
-    if not property_is_managed_by_docustay(db, inv.property_id):
-        return
+    """Notify for one invitation from ``_iter_tenant_jurisdiction_archive_invitations`` (managed and dedupe already applied)."""
     inv_id = inv.id
-    already = (
-        db.query(EventLedger)
-        .filter(
-            EventLedger.action_type == ACTION_TENANT_GUEST_JURISDICTION_THRESHOLD_APPROACHING,
-            EventLedger.invitation_id == inv_id,
-            EventLedger.stay_id.is_(None),
-        )
-        .first()
-    )
-    if already:
-        return
-
     tenant_uid = inv.invited_by_user_id
     tenant = db.query(User).filter(User.id == tenant_uid).first() if tenant_uid else None
     tenant_email = (tenant.email or "").strip() if tenant else ""
@@ -1951,12 +2142,14 @@ def run_tenant_invited_guest_jurisdiction_threshold_notifications(
     *,
     only_tenant_user_id: int | None = None,
     client_calendar_date: date | None = None,
-) -> None:
+    shard: PropertyShard | None = None,
+) -> int:
     """Tenant who invited the guest: dashboard + email alert 2 calendar days before the jurisdiction threshold date.
 
     Today is a calendar date (not a time). Threshold date is represented by the documented stay end date.
     Covers active Stays and archive-only invitations (signed agreement on file, no Stay row).
     Idempotent per (stay_id, invitation_id) for stays; per invitation with stay_id NULL for archives.
+    Returns the number of candidate stays and archive invitations.
     """
     calendar_refs = _guest_end_notification_calendar_refs(client_calendar_date=client_calendar_date)
     # Pre-filter: anything that could have (end - ref) == 2
@@ -1971,36 +2164,26 @@ def run_tenant_invited_guest_jurisdiction_threshold_notifications(
             Stay.stay_end_date >= end_lo,
             Stay.stay_end_date <= end_hi,
             Stay.invited_by_user_id.isnot(None),
+            Stay.invitation_id.isnot(None),
+            # Tenant lane only (tenant-invited guest), managed property, not yet emitted for this stay+invitation
+            tenant_lane_stay_clause(),
+            _managed_property_clause(Stay.property_id),
+            ~exists().where(
+                EventLedger.action_type == ACTION_TENANT_GUEST_JURISDICTION_THRESHOLD_APPROACHING,
+                EventLedger.stay_id == Stay.id,
+                EventLedger.invitation_id == Stay.invitation_id,
+            ),
         )
     )
     if only_tenant_user_id is not None:
         q = q.filter(Stay.invited_by_user_id == only_tenant_user_id)
-    stays = q.all()
+    stays = _in_shard(q, shard, Stay.property_id).order_by(Stay.id).all()
     for s in stays:
-        if not property_is_managed_by_docustay(db, s.property_id):
-            continue
-        # Tenant lane only (tenant-invited guest)
-        if not is_tenant_lane_stay(db, s):
-            continue
-        inv_id = getattr(s, "invitation_id", None)
-        if inv_id is None:
-            continue
+        inv_id = s.invitation_id
         # Exactly 2-day buffer for at least one reference calendar day
         end_cal = _coerce_stay_calendar_date(s.stay_end_date)
         if not any((end_cal - r).days == 2 for r in calendar_refs):
             continue
-        # Idempotent: already emitted for this stay+invitation
-        already = (
-            db.query(EventLedger)
-            .filter(
-                EventLedger.action_type == ACTION_TENANT_GUEST_JURISDICTION_THRESHOLD_APPROACHING,
-                EventLedger.stay_id == s.id,
-                EventLedger.invitation_id == inv_id,
-            )
-            .first()
-        )
-        if already:
-            continue
 
         tenant_uid = getattr(s, "invited_by_user_id", None)
         tenant = db.query(User).filter(User.id == tenant_uid).first() if tenant_uid else None
@@ -2058,10 +2241,12 @@ def run_tenant_invited_guest_jurisdiction_threshold_notifications(
         )
         db.commit()
 
-    for inv in _iter_tenant_jurisdiction_archive_invitations(
-        db, calendar_refs, only_tenant_user_id=only_tenant_user_id
-    ):
+    archive = _iter_tenant_jurisdiction_archive_invitations(
+        db, calendar_refs, only_tenant_user_id=only_tenant_user_id, shard=shard
+    )
+    for inv in archive:
         _emit_tenant_jurisdiction_threshold_for_archive_invitation(db, inv)
+    return len(stays) + len(archive)
 
 
 def run_guest_stay_approaching_end_notifications_on_login(
@@ -2081,39 +2266,41 @@ def run_guest_stay_approaching_end_notifications_on_login(
     )
 
 
-def run_status_confirmation_daily_reminder_job(db: Session) -> None:
-    """After initial 'unknown' outcome, remind PM/owner daily until they confirm."""
+def _stays_on_managed_properties_with_status(status: str):
+    """Criteria: the stay's property is managed and its occupancy status is ``status`` (case-insensitive)."""
+    return exists().where(
+        Property.id == Stay.property_id,
+        Property.deleted_at.is_(None),
+        func.lower(Property.occupancy_status) == status,
+    )
+
+
+def run_status_confirmation_daily_reminder_job(db: Session, *, shard: PropertyShard | None = None) -> int:
+    """After initial 'unknown' outcome, remind PM/owner daily until they confirm. Returns the number of candidate stays."""
     today_utc = datetime.now(timezone.utc).date()
     reminder_title = f"Status Confirmation: daily reminder – {today_utc.isoformat()}"
-    stays = (
-        db.query(Stay)
-        .filter(
+    stays = _in_shard(
+        db.query(Stay).filter(
             Stay.dead_mans_switch_triggered_at.isnot(None),
             Stay.occupancy_confirmation_response.is_(None),
             Stay.checked_out_at.is_(None),
             Stay.cancelled_at.is_(None),
-        )
-        .all()
-    )
+            Stay.dead_mans_switch_enabled != 0,
+            Stay.dead_mans_switch_alert_email == 1,
+            ~tenant_lane_stay_clause(),
+            _stays_on_managed_properties_with_status(OccupancyStatus.unknown.value),
+            ~_stay_audit_logged_clause(reminder_title),
+        ),
+        shard,
+        Stay.property_id,
+    ).order_by(Stay.id).all()
     for stay in stays:
-        if not _status_confirmation_eligible_stay(db, stay):
-            continue
-        if not getattr(stay, "dead_mans_switch_enabled", 0):
-            continue
         trig = _ensure_utc(stay.dead_mans_switch_triggered_at)
         if trig is not None and trig.astimezone(timezone.utc).date() >= today_utc:
             continue
         prop = db.query(Property).filter(Property.id == stay.property_id).first()
         if not prop:
             continue
-        if not property_is_managed_by_docustay(db, stay.property_id):
-            continue
-        if (getattr(prop, "occupancy_status", None) or "").lower() != OccupancyStatus.unknown.value:
-            continue
-        if _dms_already_logged(db, reminder_title, stay_id=stay.id):
-            continue
-        if getattr(stay, "dead_mans_switch_alert_email", 1) != 1:
-            continue
         guest_name = _get_guest_name(db, stay)
         property_name = _get_property_name(db, prop)
         owner_email, manager_emails = _get_owner_and_manager_emails(db, prop)
@@ -2148,33 +2335,30 @@ def run_status_confirmation_daily_reminder_job(db: Session) -> None:
             meta={"stay_end_date": stay.stay_end_date.isoformat(), "occupancy_prompt": True, "phase": "unknown_reminder"},
         )
         db.commit()
+    return len(stays)
 
 
-def run_dms_24h_unconfirmed_to_unknown_job(db: Session) -> None:
-    """24h after Status Confirmation deadline: if owner/manager has not confirmed (vacated/renewed/holdover), set property status to Unknown."""
+def run_dms_24h_unconfirmed_to_unknown_job(db: Session, *, shard: PropertyShard | None = None) -> int:
+    """24h after Status Confirmation deadline: if owner/manager has not confirmed (vacated/renewed/holdover), set property status to Unknown.
+    Returns the number of candidate stays."""
     cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
-    stays = (
-        db.query(Stay)
-        .filter(
+    stays = _in_shard(
+        db.query(Stay).filter(
             Stay.dead_mans_switch_triggered_at.isnot(None),
             Stay.dead_mans_switch_triggered_at <= cutoff,
             Stay.occupancy_confirmation_response.is_(None),
             Stay.checked_out_at.is_(None),
             Stay.cancelled_at.is_(None),
-        )
-        .all()
-    )
+            _stays_on_managed_properties_with_status(OccupancyStatus.unconfirmed.value),
+            ~_stay_audit_logged_clause(DMS_24H_UNCONFIRMED_TO_UNKNOWN, _LEGACY_DMS_24H_UNCONFIRMED_TITLE),
+        ),
+        shard,
+        Stay.property_id,
+    ).order_by(Stay.id).all()
     for stay in stays:
         prop = db.query(Property).filter(Property.id == stay.property_id).first()
-        if not prop:
-            continue
-        if not property_is_managed_by_docustay(db, stay.property_id):
-            continue
-        if (getattr(prop, "occupancy_status", None) or "").lower() != OccupancyStatus.unconfirmed.value:
-            continue
-        if _dms_already_logged(db, DMS_24H_UNCONFIRMED_TO_UNKNOWN, stay_id=stay.id) or _dms_already_logged(
-            db, _LEGACY_DMS_24H_UNCONFIRMED_TITLE, stay_id=stay.id
-        ):
+        # Re-check in memory: an earlier stay on the same property may already have flipped it this run.
+        if not prop or (prop.occupancy_status or "").lower() != OccupancyStatus.unconfirmed.value:
             continue
         prev_status = getattr(prop, "occupancy_status", None) or "unconfirmed"
         prop.occupancy_status = OccupancyStatus.unknown.value
@@ -2194,30 +2378,29 @@ def run_dms_24h_unconfirmed_to_unknown_job(db: Session) -> None:
             prop.id,
             stay.id,
         )
+    return len(stays)
 
 
-def mark_expired_guest_authorizations(db: Session) -> None:
+def mark_expired_guest_authorizations(db: Session, *, shard: PropertyShard | None = None) -> int:
     """Find stays that have ended (stay_end_date < today) without check-out, revocation, or cancellation,
-    and create a GuestAuthorizationExpired ledger event for each. Idempotent: only fires once per stay."""
+    and create a GuestAuthorizationExpired ledger event for each. Idempotent: only fires once per stay.
+    Returns the number of candidate stays."""
     from app.services.event_ledger import ACTION_GUEST_AUTHORIZATION_EXPIRED, create_ledger_event
     today = date.today()
-    expired_stays = db.query(Stay).filter(
-        Stay.stay_end_date < today,
-        Stay.checked_out_at.is_(None),
-        Stay.revoked_at.is_(None),
-        Stay.cancelled_at.is_(None),
-        Stay.checked_in_at.isnot(None),
-    ).all()
-    from app.models.event_ledger import EventLedger
+    expired_stays = _in_shard(
+        db.query(Stay).filter(
+            Stay.stay_end_date < today,
+            Stay.checked_out_at.is_(None),
+            Stay.revoked_at.is_(None),
+            Stay.cancelled_at.is_(None),
+            Stay.checked_in_at.isnot(None),
+            _managed_property_clause(Stay.property_id),
+            ~_stay_ledger_sent_clause(ACTION_GUEST_AUTHORIZATION_EXPIRED),
+        ),
+        shard,
+        Stay.property_id,
+    ).order_by(Stay.id).all()
     for s in expired_stays:
-        if not property_is_managed_by_docustay(db, s.property_id):
-            continue
-        already = db.query(EventLedger).filter(
-            EventLedger.action_type == ACTION_GUEST_AUTHORIZATION_EXPIRED,
-            EventLedger.stay_id == s.id,
-        ).first()
-        if already:
-            continue
         create_ledger_event(
             db,
             ACTION_GUEST_AUTHORIZATION_EXPIRED,
@@ -2244,26 +2427,124 @@ def mark_expired_guest_authorizations(db: Session) -> None:
             severity="info", property_id=s.property_id, stay_id=s.id, meta={"stay_end_date": str(s.stay_end_date)},
         )
     db.commit()
+    return len(expired_stays)
+
+
+@dataclass
+class StayJobStepReport:
+    name: str
+    duration_ms: int = 0
+    candidates: int = 0  # rows returned by the step's candidate queries, summed over shards
+    rows_written: int = 0  # ORM rows inserted, updated or deleted (flushed), summed over shards
+    failed_shards: int = 0
+
+
+@dataclass
+class StayJobReport:
+    started_at: datetime
+    shards: int
+    duration_ms: int = 0
+    steps: list[StayJobStepReport] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        out = asdict(self)
+        out["started_at"] = self.started_at.isoformat()
+        return out
+
+
+# Sub-jobs in run order; each takes (db, *, shard) and returns its candidate row count.
+STAY_NOTIFICATION_JOB_STEPS: tuple[tuple[str, Callable[..., int]], ...] = (
+    ("legal_warnings", send_stay_legal_warnings),
+    ("overstays", send_overstay_alerts_and_log),
+    ("expired_authorizations", mark_expired_guest_authorizations),
+    ("status_confirmation", run_dead_mans_switch_job),
+    ("tenant_guest_stay_ending", run_tenant_lane_guest_stay_ending_notifications),
+    ("tenant_guest_jurisdiction_threshold", run_tenant_invited_guest_jurisdiction_threshold_notifications),
+    ("status_confirmation_daily_reminder", run_status_confirmation_daily_reminder_job),
+    ("vacant_monitoring", run_vacant_monitoring_job),
+    ("status_confirmation_24h_unknown", run_dms_24h_unconfirmed_to_unknown_job),
+)
 
 
-def run_stay_notification_job() -> None:
-    """Run once per day (or on demand): find stays approaching limit, send emails; then detect overstays, email owner+guest and log; then Status Confirmation job; then 24h follow-up."""
-    if not settings.notification_cron_enabled:
-        return
+def _stay_job_shard_count(bind) -> int:
+    """Property shards run concurrently: stay_job_shards, at most half the engine's pool (the rest stays free for
+    HTTP requests). SQLite serializes writers anyway, so it always gets one."""
+    if bind.dialect.name == "sqlite":
+        return 1
+    limit = max(1, int(getattr(settings, "stay_job_shards", 1) or 1))
+    pool = bind.pool
+    if callable(getattr(pool, "size", None)):
+        capacity = int(pool.size()) + max(0, int(getattr(pool, "_max_overflow", 0) or 0))
+        limit = min(limit, max(1, capacity // 2))
+    return limit
+
+
+def _run_stay_job_shard(name: str, step: Callable[..., int], shard: PropertyShard | None) -> tuple[int, int, bool]:
+    """Run one sub-job on one shard with its own session. Returns (candidates, rows written, ok)."""
     db = get_background_job_session()
+    written = 0
+
+    def _count_flushed(session, _flush_context):
+        nonlocal written
+        written += len(session.new) + len(session.deleted) + sum(1 for o in session.dirty if session.is_modified(o))
+
+    event.listen(db, "after_flush", _count_flushed)
     try:
-        stays = get_stays_approaching_limit(db)
-        for stay in stays:
-            rule = db.query(RegionRule).filter(RegionRule.region_code == stay.region_code).first()
-            statute_ref = rule.statute_reference if rule else stay.region_code
-            send_legal_warnings_for_stay(stay, db, statute_ref or stay.region_code)
-        send_overstay_alerts_and_log(db)
-        mark_expired_guest_authorizations(db)
-        run_dead_mans_switch_job(db)
-        run_tenant_lane_guest_stay_ending_notifications(db)
-        run_tenant_invited_guest_jurisdiction_threshold_notifications(db)
-        run_status_confirmation_daily_reminder_job(db)
-        run_vacant_monitoring_job(db)
-        run_dms_24h_unconfirmed_to_unknown_job(db)
+        with ledger_batch(db):
+            candidates = int(step(db, shard=shard) or 0)
+        return candidates, written, True
+    except Exception:
+        db.rollback()
+        logger.exception("Stay notification job: %s failed (shard %s)", name, shard)
+        return 0, written, False
     finally:
         db.close()
+
+
+def run_stay_notification_job() -> StayJobReport | None:
+    """Run once per day (or on demand): find stays approaching limit, send emails; then detect overstays, email owner+guest and log; then Status Confirmation job; then 24h follow-up.
+
+    Sub-jobs run in order. Within each, the portfolio is split into property shards that run in parallel, each on
+    its own background session; the next sub-job starts once every shard has finished. A failing shard is logged
+    and does not stop the other shards or later sub-jobs. Returns the per-sub-job report (also logged).
+    """
+    if not settings.notification_cron_enabled:
+        return None
+    probe = get_background_job_session()
+    try:
+        count = _stay_job_shard_count(probe.get_bind())
+    finally:
+        probe.close()
+    shards: list[PropertyShard | None] = [None] if count <= 1 else [PropertyShard(i, count) for i in range(count)]
+    report = StayJobReport(started_at=datetime.now(timezone.utc), shards=len(shards))
+    run_started = time.perf_counter()
+    executor = ThreadPoolExecutor(max_workers=len(shards), thread_name_prefix="stay-job") if len(shards) > 1 else None
+    try:
+        for name, step in STAY_NOTIFICATION_JOB_STEPS:
+            started = time.perf_counter()
+            if executor is None:
+                results = [_run_stay_job_shard(name, step, shards[0])]
+            else:
+                results = list(executor.map(lambda sh: _run_stay_job_shard(name, step, sh), shards))
+            step_report = StayJobStepReport(
+                name=name,
+                duration_ms=int((time.perf_counter() - started) * 1000),
+                candidates=sum(r[0] for r in results),
+                rows_written=sum(r[1] for r in results),
+                failed_shards=sum(1 for r in results if not r[2]),
+            )
+            report.steps.append(step_report)
+            logger.info(
+                "Stay notification job: %s candidates=%d rows_written=%d duration_ms=%d failed_shards=%d",
+                name,
+                step_report.candidates,
+                step_report.rows_written,
+                step_report.duration_ms,
+                step_report.failed_shards,
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+    report.duration_ms = int((time.perf_counter() - run_started) * 1000)
+    logger.info("Stay notification job: finished in %d ms across %d shard(s)", report.duration_ms, report.shards)
+    return report
@@ -0,0 +1,486 @@
+"""Stay view assembler: builds ``OwnerStayView`` rows for owner, manager and tenant guest-history dashboards.
+
+All rows referenced by a page (properties, units, invitations, users, guest profiles, region rules, signature
+labels, occupancy unknown flags) are preloaded in a bounded number of set-based queries by
+``build_stay_view_context``; the row builders then work from in-memory maps instead of querying per stay.
+Jurisdiction data comes from the process-wide SOT cache (``jurisdiction_sot``).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from typing import Any, Iterable
+
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.agreement_signature import AgreementSignature
+from app.models.guest import GuestProfile
+from app.models.invitation import Invitation
+from app.models.owner import OccupancyStatus, Property
+from app.models.region_rule import RegionRule, RiskLevel, StayClassification
+from app.models.stay import Stay
+from app.models.unit import Unit
+from app.models.user import User
+from app.schemas.dashboard import OwnerStayView
+from app.schemas.jle import JLEInput, JLEResult
+from app.services.display_names import label_from_invitation
+from app.services.invitation_kinds import is_property_invited_tenant_signup_kind
+from app.services.jle import resolve_jurisdiction
+from app.services.occupancy import legitimate_occupancy_unknown_keys, normalize_occupancy_status_for_display
+from app.services.privacy_lanes import REDACTED_GUEST_AUTHORIZATION_LABEL, is_tenant_lane_stay
+from app.services.state_resolver import resolve_guest_stay_state_fields
+
+
+@dataclass
+class StayViewContext:
+    """Preloaded rows for one stay-list response. Maps are keyed by primary key unless noted."""
+
+    properties_by_id: dict[int, Property] = field(default_factory=dict)
+    units_by_id: dict[int, Unit] = field(default_factory=dict)
+    unit_ids_by_property: dict[int, list[int]] = field(default_factory=dict)
+    invitations_by_id: dict[int, Invitation] = field(default_factory=dict)
+    users_by_id: dict[int, User] = field(default_factory=dict)
+    guest_profiles_by_user_id: dict[int, GuestProfile] = field(default_factory=dict)
+    region_rules_by_code: dict[str, RegionRule] = field(default_factory=dict)
+    # invitation_code -> label from the latest AgreementSignature (only for invitations without guest name/email)
+    signature_labels_by_code: dict[str, str] = field(default_factory=dict)
+    # invitation_id -> guest_id of a Stay on that invitation (label fallback for invitation-only rows)
+    stay_guest_by_invitation_id: dict[int, int] = field(default_factory=dict)
+    # invitation ids that have at least one Stay row (tenant guest history: cancelled invites)
+    invitation_ids_with_stay: set[int] = field(default_factory=set)
+    occupancy_unknown_keys: set[tuple[int, int | None]] = field(default_factory=set)
+    # Status Confirmation test mode only: stay_id -> deadline before occupancy may flip to Unknown
+    dms_test_deadlines_by_stay_id: dict[int, datetime] = field(default_factory=dict)
+    dms_test_mode: bool = False
+    jle_by_region: dict[str, JLEResult | None] = field(default_factory=dict)
+    today: date = field(default_factory=date.today)
+    now: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+def _invitation_region(inv: Invitation, prop: Property | None) -> str:
+    return (getattr(inv, "region_code", None) or "").strip() or (getattr(prop, "region_code", None) or "") or "US"
+
+
+def load_lane_maps(
+    db: Session,
+    stays: Iterable[Stay],
+    invitations: Iterable[Invitation] = (),
+    *,
+    invitations_by_id: dict[int, Invitation] | None = None,
+    users_by_id: dict[int, User] | None = None,
+) -> tuple[dict[int, Invitation], dict[int, User]]:
+    """Invitations referenced by ``stays`` plus all inviter Users, for lane/scope filtering with
+    ``privacy_lanes`` / ``permissions`` helpers before the view context is built. Extends the given maps."""
+    inv_map: dict[int, Invitation] = invitations_by_id if invitations_by_id is not None else {}
+    user_map: dict[int, User] = users_by_id if users_by_id is not None else {}
+    stays = list(stays)
+    for inv in invitations:
+        inv_map[inv.id] = inv
+    missing_inv_ids = {s.invitation_id for s in stays if s.invitation_id is not None} - inv_map.keys()
+    if missing_inv_ids:
+        for inv in db.query(Invitation).filter(Invitation.id.in_(missing_inv_ids)).all():
+            inv_map[inv.id] = inv
+    inviter_ids = {s.invited_by_user_id for s in stays if s.invited_by_user_id is not None}
+    inviter_ids |= {i.invited_by_user_id for i in inv_map.values() if i.invited_by_user_id is not None}
+    missing_user_ids = inviter_ids - user_map.keys()
+    if missing_user_ids:
+        for u in db.query(User).filter(User.id.in_(missing_user_ids)).all():
+            user_map[u.id] = u
+    return inv_map, user_map
+
+
+def unit_ids_by_property(db: Session, property_ids: Iterable[int]) -> dict[int, list[int]]:
+    """property_id -> unit ids (one query), for the ``unit_ids_by_property`` scope-helper argument."""
+    property_ids = set(property_ids)
+    out: dict[int, list[int]] = {pid: [] for pid in property_ids}
+    if property_ids:
+        for uid, pid in db.query(Unit.id, Unit.property_id).filter(Unit.property_id.in_(property_ids)).order_by(Unit.id).all():
+            out[pid].append(uid)
+    return out
+
+
+def build_stay_view_context(
+    db: Session,
+    stays: Iterable[Stay],
+    invitations: Iterable[Invitation] = (),
+    *,
+    invitations_by_id: dict[int, Invitation] | None = None,
+    users_by_id: dict[int, User] | None = None,
+) -> StayViewContext:
+    """Load everything the row builders need for ``stays`` and invitation-only ``invitations``.
+
+    Query count is independent of the number of rows. Pass the maps from ``load_lane_maps`` when the caller
+    has already loaded invitations / users for lane filtering.
+    """
+    stays = list(stays)
+    invitations = list(invitations)
+    ctx = StayViewContext(dms_test_mode=bool(getattr(get_settings(), "dms_test_mode", False)))
+
+    inv_map: dict[int, Invitation] = dict(invitations_by_id or {})
+    for inv in invitations:
+        inv_map[inv.id] = inv
+    missing_inv_ids = {s.invitation_id for s in stays if s.invitation_id is not None} - inv_map.keys()
+    if missing_inv_ids:
+        for inv in db.query(Invitation).filter(Invitation.id.in_(missing_inv_ids)).all():
+            inv_map[inv.id] = inv
+    ctx.invitations_by_id = inv_map
+
+    property_ids = {s.property_id for s in stays} | {inv.property_id for inv in invitations}
+    if property_ids:
+        for p in db.query(Property).filter(Property.id.in_(property_ids)).all():
+            ctx.properties_by_id[p.id] = p
+        for u in db.query(Unit).filter(Unit.property_id.in_(property_ids)).order_by(Unit.id).all():
+            ctx.units_by_id[u.id] = u
+            ctx.unit_ids_by_property.setdefault(u.property_id, []).append(u.id)
+
+    # Label fallbacks for invitations without a direct guest name/email (see display_names.label_from_invitation).
+    unnamed = [i for i in inv_map.values() if not (i.guest_name or i.guest_email or "").strip()]
+    if unnamed:
+        codes = {i.invitation_code for i in unnamed if i.invitation_code}
+        if codes:
+            sig_rows = (
+                db.query(
+                    AgreementSignature.invitation_code,
+                    AgreementSignature.guest_full_name,
+                    AgreementSignature.guest_email,
+                )
+                .filter(AgreementSignature.invitation_code.in_(codes))
+                .order_by(AgreementSignature.signed_at.asc())
+                .all()
+            )
+            for code, full_name, email in sig_rows:
+                # Ascending order: the latest signature wins, matching ``order_by(signed_at.desc()).first()``.
+                ctx.signature_labels_by_code[code] = (full_name or email or "").strip()
+    inv_ids_for_stay_lookup = set(inv_map.keys())
+    if inv_ids_for_stay_lookup:
+        for inv_id, guest_id in (
+            db.query(Stay.invitation_id, Stay.guest_id)
+            .filter(Stay.invitation_id.in_(inv_ids_for_stay_lookup))
+            .order_by(Stay.id)
+            .all()
+        ):
+            ctx.invitation_ids_with_stay.add(inv_id)
+            if guest_id and inv_id not in ctx.stay_guest_by_invitation_id:
+                ctx.stay_guest_by_invitation_id[inv_id] = guest_id
+
+    user_ids: set[int] = set()
+    for s in stays:
+        for uid in (s.guest_id, s.invited_by_user_id):
+            if uid is not None:
+                user_ids.add(uid)
+    for inv in inv_map.values():
+        if inv.invited_by_user_id is not None:
+            user_ids.add(inv.invited_by_user_id)
+    user_ids |= set(ctx.stay_guest_by_invitation_id.values())
+    if users_by_id:
+        ctx.users_by_id.update(users_by_id)
+    missing_user_ids = user_ids - ctx.users_by_id.keys()
+    if missing_user_ids:
+        for u in db.query(User).filter(User.id.in_(missing_user_ids)).all():
+            ctx.users_by_id[u.id] = u
+    if user_ids:
+        for gp in db.query(GuestProfile).filter(GuestProfile.user_id.in_(user_ids)).all():
+            ctx.guest_profiles_by_user_id.setdefault(gp.user_id, gp)
+
+    region_codes = {s.region_code for s in stays if s.region_code}
+    for inv in invitations:
+        region_codes.add(_invitation_region(inv, ctx.properties_by_id.get(inv.property_id)))
+    if region_codes:
+        for rule in db.query(RegionRule).filter(RegionRule.region_code.in_(region_codes)).all():
+            ctx.region_rules_by_code.setdefault(rule.region_code, rule)
+
+    unknown_prop_ids = {
+        pid
+        for pid, p in ctx.properties_by_id.items()
+        if (p.occupancy_status or "").strip().lower() == OccupancyStatus.unknown.value
+    }
+    ctx.occupancy_unknown_keys = legitimate_occupancy_unknown_keys(db, unknown_prop_ids)
+
+    if ctx.dms_test_mode and stays:
+        from app.services.stay_timer import dms_test_mode_unknown_deadlines_utc
+
+        ctx.dms_test_deadlines_by_stay_id = dms_test_mode_unknown_deadlines_utc(db, [s.id for s in stays])
+    return ctx
+
+
+# --- Labels (in-memory equivalents of app.services.display_names) ---
+
+
+def _label_from_user_id(ctx: StayViewContext, user_id: int | None) -> str | None:
+    if not user_id:
+        return None
+    u = ctx.users_by_id.get(user_id)
+    if not u:
+        return None
+    gp = ctx.guest_profiles_by_user_id.get(user_id)
+    legal = (gp.full_legal_name if gp else None) or ""
+    if legal.strip():
+        return legal.strip()
+    fn = (u.full_name or "").strip()
+    if fn:
+        return fn
+    em = (u.email or "").strip()
+    return em or None
+
+
+def _label_from_invitation(db: Session, ctx: StayViewContext, inv: Invitation) -> str:
+    direct = (inv.guest_name or inv.guest_email or "").strip()
+    if direct:
+        return direct
+    sig_label = ctx.signature_labels_by_code.get(inv.invitation_code)
+    if sig_label:
+        return sig_label
+    ulabel = _label_from_user_id(ctx, ctx.stay_guest_by_invitation_id.get(inv.id))
+    if ulabel:
+        return ulabel
+    inv_kind = (getattr(inv, "invitation_kind", None) or "").strip().lower()
+    if is_property_invited_tenant_signup_kind(inv_kind):
+        # Rare on guest-stay lists; the tenant-assignment lookup stays in display_names.
+        return label_from_invitation(db, inv)
+    code = (inv.invitation_code or "").strip()
+    return f"Authorization {code}" if code else "Unknown invitee"
+
+
+def _label_for_stay(db: Session, ctx: StayViewContext, stay: Stay) -> str:
+    if stay.guest_id:
+        ulabel = _label_from_user_id(ctx, stay.guest_id)
+        if ulabel:
+            return ulabel
+    if stay.invitation_id:
+        inv = ctx.invitations_by_id.get(stay.invitation_id)
+        if inv:
+            return _label_from_invitation(db, ctx, inv)
+    return "Unknown invitee"
+
+
+def _unit_label_if_multi_unit(ctx: StayViewContext, property_id: int | None, unit_id: int | None) -> str | None:
+    if not property_id or not unit_id:
+        return None
+    prop = ctx.properties_by_id.get(property_id)
+    if not prop or not bool(getattr(prop, "is_multi_unit", False)):
+        return None
+    u = ctx.units_by_id.get(unit_id)
+    if not u:
+        return None
+    lab = (getattr(u, "unit_label", None) or "").strip()
+    return lab or None
+
+
+def _legal_fields(db: Session, ctx: StayViewContext, region_code: str, duration_days: int) -> dict[str, Any]:
+    """Classification, max days, risk and statutes for a row (RegionRule + JLE; JLE memoized per region)."""
+    rule = ctx.region_rules_by_code.get(region_code)
+    if region_code not in ctx.jle_by_region:
+        # Dashboard rows only read classification/risk/statutes, which do not depend on duration.
+        ctx.jle_by_region[region_code] = resolve_jurisdiction(
+            db,
+            JLEInput(
+                region_code=region_code,
+                stay_duration_days=duration_days,
+                owner_occupied=True,
+                property_type=None,
+                guest_has_permanent_address=True,
+            ),
+        )
+    jle = ctx.jle_by_region[region_code]
+    return {
+        "legal_classification": (jle.legal_classification if jle else None)
+        or (rule.stay_classification_label if rule else None)
+        or StayClassification.guest,
+        "max_stay_allowed_days": rule.max_stay_days if rule else 0,
+        "risk_indicator": (jle.risk_level if jle else None) or (rule.risk_level if rule else None) or RiskLevel.low,
+        "applicable_laws": (jle.applicable_statutes if jle else [])
+        or ([rule.statute_reference] if rule and rule.statute_reference else []),
+    }
+
+
+def _confirmation_fields(db: Session, ctx: StayViewContext, s: Stay, prop: Property | None) -> dict[str, Any]:
+    """Status Confirmation fields for owner/manager rows (prod: stay_end + 48h; test mode: see stay_timer)."""
+    from app.services.stay_timer import dms_test_mode_effective_end_utc
+
+    checked_out = s.checked_out_at is not None
+    cancelled = s.cancelled_at is not None
+    conf_resp = s.occupancy_confirmation_response
+    dms_on = bool(s.dead_mans_switch_enabled)
+    now = ctx.now
+    today = ctx.today
+    eligible = not is_tenant_lane_stay(
+        db, s, invitations_by_id=ctx.invitations_by_id, users_by_id=ctx.users_by_id
+    )
+    eff_test = dms_test_mode_effective_end_utc(s) if ctx.dms_test_mode and eligible else None
+    if eff_test is not None:
+        confirmation_deadline_at = ctx.dms_test_deadlines_by_stay_id.get(s.id)
+        needs_conf = (
+            not checked_out
+            and not cancelled
+            and dms_on
+            and conf_resp is None
+            and confirmation_deadline_at is not None
+            and now < confirmation_deadline_at
+        )
+    else:
+        confirmation_deadline_at = (
+            datetime.combine(s.stay_end_date + timedelta(days=2), dt_time.min, tzinfo=timezone.utc)
+            if s.stay_end_date
+            else None
+        )
+        needs_conf = (
+            not checked_out
+            and not cancelled
+            and dms_on
+            and conf_resp is None
+            and confirmation_deadline_at is not None
+            and now < confirmation_deadline_at
+            and s.stay_end_date <= (today + timedelta(days=2))  # in prompt window (48h before or after)
+        )
+    prop_status = (
+        normalize_occupancy_status_for_display(
+            db,
+            prop.id,
+            s.unit_id,
+            getattr(prop, "occupancy_status", None) or OccupancyStatus.vacant.value,
+            unknown_keys=ctx.occupancy_unknown_keys,
+        )
+        if prop
+        else OccupancyStatus.vacant.value
+    )
+    show_confirm_ui = needs_conf or (
+        prop_status in (OccupancyStatus.unconfirmed.value, OccupancyStatus.unknown.value)
+        and not checked_out
+        and not cancelled
+        and dms_on
+        and conf_resp is None
+        and (
+            (eff_test is not None and now >= eff_test)
+            or (eff_test is None and s.stay_end_date < today)
+        )
+    )
+    return {
+        "needs_occupancy_confirmation": needs_conf,
+        "show_occupancy_confirmation_ui": show_confirm_ui,
+        "confirmation_deadline_at": confirmation_deadline_at if show_confirm_ui else None,
+    }
+
+
+# --- Row builders ---
+
+
+def stay_row_view(
+    db: Session,
+    ctx: StayViewContext,
+    s: Stay,
+    *,
+    show_guest_pii: bool,
+    status_confirmation: bool = True,
+    include_unit_label: bool = False,
+) -> OwnerStayView:
+    """One ``OwnerStayView`` for a physical Stay.
+
+    ``status_confirmation=False`` is for tenant guest history (Status Confirmation is owner/manager only).
+    """
+    prop = ctx.properties_by_id.get(s.property_id)
+    property_name = (prop.name if prop else None) or (f"{prop.city}, {prop.state}" if prop else None) or "Property"
+    guest_name = _label_for_stay(db, ctx, s) if show_guest_pii else REDACTED_GUEST_AUTHORIZATION_LABEL
+    invite_id_val = None
+    token_state_val = None
+    inv_for_state = ctx.invitations_by_id.get(s.invitation_id) if s.invitation_id else None
+    if inv_for_state:
+        invite_id_val = inv_for_state.invitation_code if show_guest_pii else None
+        token_state_val = getattr(inv_for_state, "token_state", None) or "BURNED"
+    if status_confirmation:
+        conf = _confirmation_fields(db, ctx, s, prop)
+    else:
+        conf = {
+            "needs_occupancy_confirmation": False,
+            "show_occupancy_confirmation_ui": False,
+            "confirmation_deadline_at": None,
+        }
+    unit_label = None
+    if include_unit_label:
+        unit_id_for_label = s.unit_id or (getattr(inv_for_state, "unit_id", None) if inv_for_state else None)
+        unit_label = _unit_label_if_multi_unit(ctx, s.property_id, unit_id_for_label)
+    state_fields = resolve_guest_stay_state_fields(db, stay=s, invitation=inv_for_state, today=ctx.today)
+    return OwnerStayView(
+        stay_id=s.id,
+        property_id=s.property_id,
+        invite_id=invite_id_val,
+        token_state=token_state_val,
+        invitation_only=False,
+        guest_name=guest_name,
+        property_name=property_name,
+        unit_label=unit_label,
+        stay_start_date=s.stay_start_date,
+        stay_end_date=s.stay_end_date,
+        region_code=s.region_code,
+        **_legal_fields(db, ctx, s.region_code, s.intended_stay_duration_days),
+        revoked_at=s.revoked_at,
+        checked_in_at=s.checked_in_at,
+        checked_out_at=s.checked_out_at,
+        cancelled_at=s.cancelled_at,
+        usat_token_released_at=s.usat_token_released_at,
+        dead_mans_switch_enabled=bool(s.dead_mans_switch_enabled),
+        **conf,
+        occupancy_confirmation_response=s.occupancy_confirmation_response,
+        property_deleted_at=getattr(prop, "deleted_at", None) if prop else None,
+        **state_fields,
+    )
+
+
+def invitation_row_view(
+    db: Session,
+    ctx: StayViewContext,
+    inv: Invitation,
+    *,
+    show_guest_pii: bool,
+    include_unit_label: bool = False,
+    cancelled: bool = False,
+) -> OwnerStayView | None:
+    """One invitation-only ``OwnerStayView`` (BURNED/EXPIRED invite with no Stay, or a cancelled invite).
+
+    Returns None when the invitation's property no longer exists.
+    """
+    prop = ctx.properties_by_id.get(inv.property_id)
+    if prop is None:
+        return None
+    property_name = (prop.name or "").strip() or (f"{getattr(prop, 'city', '')}, {getattr(prop, 'state', '')}".strip(", ")) or "Property"
+    region = _invitation_region(inv, prop)
+    start, end = inv.stay_start_date, inv.stay_end_date
+    duration_days = (end - start).days if start and end else 0
+    if cancelled:
+        token_state = (getattr(inv, "token_state", None) or "REVOKED").upper()
+        checked_out_dt = None
+        cancelled_ts = inv.created_at if getattr(inv, "created_at", None) else ctx.now
+    else:
+        token_state = (getattr(inv, "token_state", None) or "BURNED").upper()
+        # For EXPIRED (no Stay row), show as completed so past stays appear
+        checked_out_dt = datetime.combine(end, dt_time.min, tzinfo=timezone.utc) if token_state == "EXPIRED" and end else None
+        cancelled_ts = None
+    unit_label = _unit_label_if_multi_unit(ctx, inv.property_id, inv.unit_id) if include_unit_label else None
+    state_fields = resolve_guest_stay_state_fields(db, stay=None, invitation=inv, today=ctx.today)
+    return OwnerStayView(
+        stay_id=-inv.id,
+        property_id=inv.property_id,
+        invite_id=inv.invitation_code if show_guest_pii else None,
+        token_state=token_state,
+        invitation_only=True,
+        guest_name=_label_from_invitation(db, ctx, inv) if show_guest_pii else REDACTED_GUEST_AUTHORIZATION_LABEL,
+        property_name=property_name,
+        unit_label=unit_label,
+        stay_start_date=start,
+        stay_end_date=end,
+        region_code=region,
+        **_legal_fields(db, ctx, region, duration_days),
+        revoked_at=None,
+        checked_in_at=None,
+        checked_out_at=checked_out_dt,
+        cancelled_at=cancelled_ts,
+        usat_token_released_at=None,
+        dead_mans_switch_enabled=bool(getattr(inv, "dead_mans_switch_enabled", 0)),
+        needs_occupancy_confirmation=False,
+        show_occupancy_confirmation_ui=False,
+        confirmation_deadline_at=None,
+        occupancy_confirmation_response=None,
+        property_deleted_at=getattr(prop, "deleted_at", None),
+        **state_fields,
+    )
+
@@ -283,6 +283,67 @@ def find_tenant_assignment_for_invitation_summary(db: Session, inv: Invitation)
     return None
 
 
+def find_tenant_assignments_for_invitation_summaries(
+    db: Session, invitations: list[Invitation]
+) -> dict[int, TenantAssignment | None]:
+    """``find_tenant_assignment_for_invitation_summary`` for many invitations, keyed by invitation id.
+
+    Loads the candidate assignments and users with two queries instead of a few per invitation; the matching rules
+    are the same.
+    """
+    wanted = [
+        inv
+        for inv in invitations
+        if getattr(inv, "unit_id", None) is not None
+        and is_property_invited_tenant_signup_kind(getattr(inv, "invitation_kind", None))
+    ]
+    out: dict[int, TenantAssignment | None] = {inv.id: None for inv in invitations}
+    if not wanted:
+        return out
+
+    by_unit: dict[int, list[TenantAssignment]] = {}
+    for ta in (
+        db.query(TenantAssignment)
+        .filter(TenantAssignment.unit_id.in_({inv.unit_id for inv in wanted}))
+        .order_by(TenantAssignment.id)
+    ):
+        by_unit.setdefault(ta.unit_id, []).append(ta)
+    emails = {(getattr(inv, "guest_email", None) or "").strip().lower() for inv in wanted} - {""}
+    ta_user_ids = {ta.user_id for rows in by_unit.values() for ta in rows}
+    users = (
+        db.query(User.id, User.email)
+        .filter(or_(func.lower(func.trim(User.email)).in_(emails), User.id.in_(ta_user_ids)))
+        .order_by(User.id)
+        .all()
+        if emails or ta_user_ids
+        else []
+    )
+    email_by_user_id = {uid: (email or "").strip().lower() for uid, email in users}
+    user_id_by_email: dict[str, int] = {}
+    for uid, email in users:
+        user_id_by_email.setdefault((email or "").strip().lower(), uid)
+
+    for inv in wanted:
+        inv_email = (getattr(inv, "guest_email", None) or "").strip().lower()
+        candidates = by_unit.get(inv.unit_id, [])
+        user_id = user_id_by_email.get(inv_email) if inv_email and "@" in inv_email else None
+        if is_tenant_lease_extension_kind(getattr(inv, "invitation_kind", None)):
+            same_start = [ta for ta in candidates if ta.user_id == user_id and ta.start_date == inv.stay_start_date]
+            out[inv.id] = same_start[-1] if user_id is not None and same_start else None
+            continue
+        if user_id is not None:
+            own = [ta for ta in candidates if ta.user_id == user_id and assignment_matches_invitation_dates(ta, inv)]
+            if own:
+                out[inv.id] = own[0]
+                continue
+        matches = [ta for ta in candidates if assignment_matches_invitation_dates(ta, inv)]
+        if len(matches) == 1:
+            out[inv.id] = matches[0]
+        elif len(matches) > 1 and inv_email:
+            out[inv.id] = next((ta for ta in matches if email_by_user_id.get(ta.user_id) == inv_email), None)
+    return out
+
+
 def assert_tenant_lease_extension_no_other_occupant_conflict(
     db: Session, tenant_assignment: TenantAssignment, new_end_date: date
 ) -> None:
@@ -0,0 +1,122 @@
+"""
+Token (Invitation ID) lookup for the public verify portal.
+
+Tokens are matched case-insensitively on ``lower(invitation_code)``, which is served by the functional index
+``ix_invitations_invitation_code_lower`` (scripts/migrate_invitation_code_lookup_index.py adds it to existing
+databases). Tokens that matched nothing are remembered in a small per-worker negative cache for
+``verify_negative_cache_ttl_seconds`` so repeated bad tokens (typos, scanners, brute-force probing) skip the query.
+Creating an invitation drops its code from the cache on commit; other workers forget it after the TTL.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterable
+
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+
+from app.models.invitation import Invitation
+
+_lock = threading.Lock()
+_not_found: OrderedDict[str, float] = OrderedDict()  # normalized token -> monotonic time it was found missing
+_hits = 0
+_misses = 0
+
+
+def normalize_token_id(token_id: str | None) -> str:
+    """Canonical lookup key for a submitted token: surrounding whitespace dropped, case folded."""
+    return (token_id or "").strip().lower()
+
+
+def _ttl() -> int:
+    from app.config import get_settings
+
+    return get_settings().verify_negative_cache_ttl_seconds
+
+
+def _known_missing(key: str, ttl: int) -> bool:
+    global _hits
+    seen = _not_found.get(key)
+    if seen is None:
+        return False
+    if time.monotonic() - seen > ttl:
+        del _not_found[key]
+        return False
+    _hits += 1
+    return True
+
+
+def _remember_missing(keys: Iterable[str], ttl: int) -> None:
+    from app.config import get_settings
+
+    if ttl <= 0:
+        return
+    cap = max(1, get_settings().verify_negative_cache_max_entries)
+    now = time.monotonic()
+    with _lock:
+        for key in keys:
+            _not_found[key] = now
+            _not_found.move_to_end(key)
+        while len(_not_found) > cap:
+            _not_found.popitem(last=False)
+
+
+def find_invitations_by_tokens(db: Session, token_ids: Iterable[str]) -> dict[str, Invitation]:
+    """Invitations for the given tokens in one indexed query, keyed by ``normalize_token_id``. Tokens without a
+    match are absent from the result (and remembered in the negative cache)."""
+    global _misses
+    ttl = _ttl()
+    keys = {normalize_token_id(t) for t in token_ids} - {""}
+    with _lock:
+        wanted = [k for k in keys if ttl <= 0 or not _known_missing(k, ttl)]
+        _misses += len(wanted)
+    if not wanted:
+        return {}
+    found: dict[str, Invitation] = {}
+    for inv in db.query(Invitation).filter(func.lower(Invitation.invitation_code).in_(wanted)).order_by(Invitation.id):
+        found.setdefault(normalize_token_id(inv.invitation_code), inv)
+    _remember_missing((k for k in wanted if k not in found), ttl)
+    return found
+
+
+def find_invitation_by_token(db: Session, token_id: str) -> Invitation | None:
+    """Invitation whose code matches ``token_id`` case-insensitively, or None."""
+    return find_invitations_by_tokens(db, [token_id]).get(normalize_token_id(token_id))
+
+
+def forget_missing_tokens(token_ids: Iterable[str]) -> None:
+    with _lock:
+        for key in {normalize_token_id(t) for t in token_ids}:
+            _not_found.pop(key, None)
+
+
+def clear_token_lookup_cache() -> None:
+    global _hits, _misses
+    with _lock:
+        _not_found.clear()
+        _hits = _misses = 0
+
+
+def get_token_lookup_cache_stats() -> dict[str, Any]:
+    """Negative cache counters for this worker: hits are lookups answered without a query."""
+    with _lock:
+        return {"entries": len(_not_found), "hits": _hits, "misses": _misses}
+
+
+_SESSION_INFO_KEY = "verify_new_invitation_codes"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_new_codes(session: Session, flush_context) -> None:
+    codes = [obj.invitation_code for obj in session.new if isinstance(obj, Invitation) and obj.invitation_code]
+    if codes:
+        session.info.setdefault(_SESSION_INFO_KEY, set()).update(codes)
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_on_commit(session: Session) -> None:
+    codes = session.info.pop(_SESSION_INFO_KEY, None)
+    if codes:
+        forget_missing_tokens(codes)
@@ -5,6 +5,7 @@ Pipeline (see docs/UTILITY_BUCKET.md and docs/UTILITY_PROVIDERS_FLOW.md):
   2. Electric/gas: Rewiring America API (ZIP)
   3. Water: EPA ECHO API (primary), EPA SDWIS CSV fallback (state/county/city)
   4. Internet: FCC BDC provider summary CSV
+Steps 2-4 run concurrently with per-source deadlines (see lookup_utility_providers).
 
 All providers come from APIs or regularly updated datasets; no hardcoded provider lists.
 """
@@ -12,15 +13,17 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-import httpx
-
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
+from app.services.http_client import shared_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -112,14 +115,14 @@ def _fetch_rewiring_america(zip5: str, address: str | None) -> list[dict[str, An
     params: dict[str, str] = {"zip": zip5}
     print(f"[UtilityLookup] Calling Rewiring America API: zip={zip5}")
     try:
-        with httpx.Client(timeout=15.0) as client:
-            r = client.get(
-                f"{_REWIRING_AMERICA_BASE}/api/v1/utilities",
-                params=params,
-                headers={"Authorization": f"Bearer {api_key}"},
-            )
-            r.raise_for_status()
-            data = r.json()
+        r = shared_http_client().get(
+            f"{_REWIRING_AMERICA_BASE}/api/v1/utilities",
+            params=params,
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=15.0,
+        )
+        r.raise_for_status()
+        data = r.json()
         print(f"[UtilityLookup] Rewiring America response: keys={list(data.keys()) if isinstance(data, dict) else 'n/a'}")
     except Exception as e:
         print(f"[UtilityLookup] Rewiring America request failed: {e}")
@@ -175,6 +178,107 @@ def _raw_to_providers(raw_list: list[dict[str, Any]]) -> list[UtilityProvider]:
     return result
 
 
+# Per-source deadlines, in seconds from when the leg is started. A leg that misses its deadline is left out of the
+# bucket (its thread still finishes in the background, bounded by the HTTP timeouts); the other legs are returned.
+LEG_DEADLINES_SECONDS: dict[str, float] = {
+    "census": 10.0,
+    "electric_gas": 15.0,
+    "water": 30.0,
+    "internet": 10.0,
+}
+# Part of the water deadline kept for the SDWIS CSV fallback: EPA ECHO calls must finish before the rest runs out.
+WATER_CSV_RESERVE_SECONDS = 5.0
+_MAX_WORKERS = 16
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _lookup_executor() -> ThreadPoolExecutor:
+    """Process-wide pool for the legs (not per call, so an abandoned slow leg never blocks the caller on shutdown)."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix="utility-lookup")
+    return _executor
+
+
+def _timed(fn, *args, **kwargs) -> tuple[Any, float]:
+    t0 = time.perf_counter()
+    return fn(*args, **kwargs), (time.perf_counter() - t0) * 1000.0
+
+
+def _await_leg(name: str, future: Future | None, started: float, timings: dict[str, dict[str, Any]]) -> Any:
+    """Result of a leg submitted at `started` (time.monotonic), or None if skipped / failed / past its deadline."""
+    if future is None:
+        timings[name] = {"status": "skipped", "ms": 0.0}
+        return None
+    remaining = max(0.0, started + LEG_DEADLINES_SECONDS[name] - time.monotonic())
+    try:
+        result, ms = future.result(timeout=remaining)
+    except FuturesTimeoutError:
+        timings[name] = {"status": "timeout", "ms": round((time.monotonic() - started) * 1000.0, 1)}
+        logger.warning("[UtilityLookup] %s leg missed its %.0fs deadline; bucket built without it", name, LEG_DEADLINES_SECONDS[name])
+        return None
+    except Exception as e:
+        timings[name] = {"status": "error", "ms": round((time.monotonic() - started) * 1000.0, 1)}
+        logger.warning("[UtilityLookup] %s leg failed: %s", name, e)
+        return None
+    timings[name] = {"status": "ok", "ms": round(ms, 1)}
+    return result
+
+
+def _census_leg(lat: float, lon: float):
+    from app.services.census_geocoder import lat_lng_to_geography
+    return lat_lng_to_geography(lat, lon)
+
+
+def _water_leg(
+    state_abbrev: str, city: str | None, county_name: str | None, water_csv_path, started: float
+) -> list[dict[str, Any]]:
+    from app.services.water_lookup import lookup_water_providers
+    echo_deadline = started + LEG_DEADLINES_SECONDS["water"] - WATER_CSV_RESERVE_SECONDS
+    water_providers = lookup_water_providers(
+        state_abbrev, city=city, county_name=county_name, csv_path=water_csv_path, echo_deadline=echo_deadline
+    )
+    return [
+        {
+            "name": w.get("name") or "Water System",
+            "type": "water",
+            "utilityapi_id": None,
+            "phone": w.get("contact_phone"),
+            "email": w.get("contact_email"),
+            "raw": w.get("raw") or w,
+        }
+        for w in water_providers
+    ]
+
+
+def _internet_leg(
+    lat: float | None,
+    lon: float | None,
+    zip5: str | None,
+    state_abbrev: str | None,
+    state_fips: str | None,
+    county_fips: str | None,
+) -> list[dict[str, Any]]:
+    from app.services.fcc_broadband import fetch_fcc_providers
+    fcc_providers = fetch_fcc_providers(
+        lat or 0.0, lon or 0.0,
+        zip_code=zip5,
+        state_abbreviation=state_abbrev,
+        state_fips=state_fips,
+        county_fips=county_fips,
+    )
+    out: list[dict[str, Any]] = []
+    for f in fcc_providers:
+        name = (f.get("name") or "").strip()
+        if name:
+            out.append({"name": name, "type": "internet", "utilityapi_id": None, "phone": None, "raw": f.get("raw") or f})
+    return out
+
+
 def lookup_utility_providers(
     zip_code: str | None,
     lat: float | None = None,
@@ -183,101 +287,73 @@ def lookup_utility_providers(
     city: str | None = None,
     state_abbreviation: str | None = None,
     water_csv_path: Path | str | None = None,
+    timings: dict[str, dict[str, Any]] | None = None,
 ) -> list[UtilityProvider]:
     """
     Build Utility Bucket for a location: electric, gas, water, internet.
 
     All data from APIs or regularly updated datasets: Census (lat/lng → county, state),
     Rewiring America (electric/gas by ZIP), EPA SDWIS CSV (water), FCC BDC CSV (internet).
+
+    Legs run concurrently on a shared thread pool: Census and Rewiring America start at once; water and internet
+    start as soon as Census answers (they need its county / FIPS). Each leg has a deadline (LEG_DEADLINES_SECONDS)
+    and the bucket is assembled from the legs that finished in time; the water leg stops waiting on EPA ECHO
+    WATER_CSV_RESERVE_SECONDS before its deadline so the CSV fallback still answers. If `timings` is given it is filled with
+    {leg: {"status": ok|timeout|error|skipped, "ms": float}}.
     """
+    if timings is None:
+        timings = {}
     zip5 = None
     if zip_code and str(zip_code).strip():
         zip5 = str(zip_code).strip().split("-")[0][:5]
     print(f"[UtilityLookup] Starting lookup: zip={zip5}, lat={lat}, lon={lon}, address={address or '(none)'}")
+    t0 = time.monotonic()
+    pool = _lookup_executor()
+
+    # Census (lat/lng → county, state) for water/internet context; electric + gas (Rewiring America, by ZIP) is independent.
+    census_started = time.monotonic()
+    census_future = pool.submit(_timed, _census_leg, lat, lon) if lat is not None and lon is not None else None
+    ra_started = time.monotonic()
+    ra_future = pool.submit(_timed, _fetch_rewiring_america, zip5, address) if zip5 else None
+    if not zip5:
+        print("[UtilityLookup] No ZIP code; electric/gas may be missing; water needs state")
 
-    # Step 1: Census geocoder (lat/lng → county, state) for water/internet context
     county_name: str | None = None
     state_abbrev: str | None = state_abbreviation
     state_fips: str | None = None
     county_fips: str | None = None
-    if lat is not None and lon is not None:
-        try:
-            from app.services.census_geocoder import lat_lng_to_geography
-            geo = lat_lng_to_geography(lat, lon)
-            if geo:
-                county_name = geo.county_name or None
-                if geo.state_abbreviation:
-                    state_abbrev = geo.state_abbreviation
-                state_fips = (geo.state_fips or "").strip() or None
-                county_fips = (geo.county_fips or "").strip() or None
-                print(f"[UtilityLookup] Census result: state={state_abbrev}, county={county_name}, state_fips={state_fips}, county_fips={county_fips}")
-        except Exception as e:
-            print(f"[UtilityLookup] Census geocoder failed: {e}")
-
-    if not zip5:
-        print("[UtilityLookup] No ZIP code; electric/gas may be missing; water needs state")
+    geo = _await_leg("census", census_future, census_started, timings)
+    if geo:
+        county_name = geo.county_name or None
+        if geo.state_abbreviation:
+            state_abbrev = geo.state_abbreviation
+        state_fips = (geo.state_fips or "").strip() or None
+        county_fips = (geo.county_fips or "").strip() or None
+        print(f"[UtilityLookup] Census result: state={state_abbrev}, county={county_name}, state_fips={state_fips}, county_fips={county_fips}")
+
+    # Water (SQLite cache → EPA ECHO → SDWIS CSV) and internet (county cache or FCC BDC fallback).
+    water_started = time.monotonic()
+    water_future = (
+        pool.submit(_timed, _water_leg, state_abbrev, city, county_name, water_csv_path, water_started)
+        if state_abbrev
+        else None
+    )
+    internet_started = time.monotonic()
+    internet_future = pool.submit(_timed, _internet_leg, lat, lon, zip5, state_abbrev, state_fips, county_fips)
 
+    # Assembled in the fixed electric/gas → water → internet order regardless of which leg finished first.
     raw_list: list[dict[str, Any]] = []
-
-    # Step 2: Electric + gas — Rewiring America (by ZIP)
-    if zip5:
-        ra = _fetch_rewiring_america(zip5, address)
-        if ra:
-            raw_list.extend(ra)
-            print(f"[UtilityLookup] Rewiring America returned {len(ra)} electric/gas entries")
-
-    # Step 3: Water — EPA SDWIS CSV (state/county/city)
-    if state_abbrev:
-        try:
-            from app.services.water_lookup import lookup_water_providers
-            water_providers = lookup_water_providers(
-                state_abbrev,
-                city=city,
-                county_name=county_name,
-                csv_path=water_csv_path,
-            )
-            for w in water_providers:
-                raw_list.append({
-                    "name": w.get("name") or "Water System",
-                    "type": "water",
-                    "utilityapi_id": None,
-                    "phone": w.get("contact_phone"),
-                    "email": w.get("contact_email"),
-                    "raw": w.get("raw") or w,
-                })
-            if water_providers:
-                print(f"[UtilityLookup] Water CSV lookup returned {len(water_providers)} provider(s)")
-        except Exception as e:
-            print(f"[UtilityLookup] Water lookup failed: {e}")
-
-    # Step 4: Internet — county cache (state_fips/county_fips) or fallback to FCC BDC CSV
-    try:
-        from app.services.fcc_broadband import fetch_fcc_providers
-        fcc_providers = fetch_fcc_providers(
-            lat or 0.0, lon or 0.0,
-            zip_code=zip5,
-            state_abbreviation=state_abbrev,
-            state_fips=state_fips,
-            county_fips=county_fips,
-        )
-        for f in fcc_providers:
-            name = (f.get("name") or "").strip()
-            if name:
-                raw_list.append({
-                    "name": name,
-                    "type": "internet",
-                    "utilityapi_id": None,
-                    "phone": None,
-                    "raw": f.get("raw") or f,
-                })
-        if fcc_providers:
-            print(f"[UtilityLookup] Internet providers: {len(fcc_providers)} (cache or CSV)")
-    except Exception as e:
-        print(f"[UtilityLookup] FCC CSV lookup failed: {e}")
+    raw_list.extend(_await_leg("electric_gas", ra_future, ra_started, timings) or [])
+    raw_list.extend(_await_leg("water", water_future, water_started, timings) or [])
+    raw_list.extend(_await_leg("internet", internet_future, internet_started, timings) or [])
 
     result = _raw_to_providers(raw_list)
+    legs = " ".join(f"{name}={t['status']}/{t['ms']:.0f}ms" for name, t in timings.items())
     print(f"[UtilityLookup] Final bucket: {len(result)} provider(s). Types: {[p.provider_type for p in result]}")
-    logger.info("[UtilityLookup] ZIP=%s lat=%s lon=%s -> %s provider(s)", zip5, lat, lon, len(result))
+    logger.info(
+        "[UtilityLookup] ZIP=%s lat=%s lon=%s -> %s provider(s) in %.0fms (%s)",
+        zip5, lat, lon, len(result), (time.monotonic() - t0) * 1000.0, legs,
+    )
     return result
 
 
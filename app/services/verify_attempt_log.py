@@ -0,0 +1,162 @@
+"""Buffered audit logging for public verify attempts.
+
+Every POST /public/verify (and each token of /public/verify/batch) is audit-logged. In the API process the rows are
+put on a bounded in-process queue and a daemon thread writes them in batches, one session and one commit per batch,
+so a burst of attempts does not turn into a burst of commits on request sessions. When the queue is full, or the
+logger is not running (scripts, tests, disabled), the row is written inline on the caller's session instead.
+
+Only app.main starts the logger; stopping it flushes whatever is still queued.
+"""
+import logging
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.services.audit_log import create_log
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class VerifyAttempt:
+    """Arguments of one ``create_log`` call."""
+
+    category: str
+    title: str
+    message: str
+    property_id: int | None = None
+    stay_id: int | None = None
+    invitation_id: int | None = None
+    ip_address: str | None = None
+    user_agent: str | None = None
+    meta: dict[str, Any] = field(default_factory=dict)
+
+    def write(self, db: Session) -> None:
+        create_log(
+            db,
+            self.category,
+            self.title,
+            self.message,
+            property_id=self.property_id,
+            stay_id=self.stay_id,
+            invitation_id=self.invitation_id,
+            ip_address=self.ip_address,
+            user_agent=self.user_agent,
+            meta=self.meta,
+        )
+
+
+def _default_session_factory() -> Session:
+    from app.database import get_background_job_session
+
+    return get_background_job_session()
+
+
+class VerifyAttemptLogger:
+    def __init__(self, *, session_factory: Callable[[], Session] | None = None):
+        s = get_settings()
+        self._session_factory = session_factory or _default_session_factory
+        self._batch_size = max(1, s.verify_attempt_log_batch_size)
+        self._flush_seconds = max(0.05, s.verify_attempt_log_flush_seconds)
+        self._queue: queue.Queue[VerifyAttempt] = queue.Queue(maxsize=max(1, s.verify_attempt_log_queue_maxsize))
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="verify_attempt_log", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        # Whatever the worker did not get to.
+        while True:
+            batch = self._take(block=False)
+            if not batch:
+                break
+            self.write(batch)
+
+    def enqueue(self, attempt: VerifyAttempt) -> bool:
+        """Queue one attempt; False when the queue is full (caller writes it inline)."""
+        try:
+            self._queue.put_nowait(attempt)
+        except queue.Full:
+            return False
+        return True
+
+    def _take(self, block: bool) -> list[VerifyAttempt]:
+        batch: list[VerifyAttempt] = []
+        try:
+            if block:
+                batch.append(self._queue.get(timeout=self._flush_seconds))
+            while len(batch) < self._batch_size:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            batch = self._take(block=True)
+            if batch:
+                self.write(batch)
+
+    def write(self, batch: list[VerifyAttempt]) -> None:
+        """Write a batch in one transaction; a failure is logged and the batch dropped (audit only, never blocks)."""
+        db = self._session_factory()
+        try:
+            for attempt in batch:
+                attempt.write(db)
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception("Verify attempt log: failed to write %s audit rows", len(batch))
+        finally:
+            db.close()
+
+
+_attempt_logger: VerifyAttemptLogger | None = None
+_attempt_logger_lock = threading.Lock()
+
+
+def start_verify_attempt_logger() -> VerifyAttemptLogger | None:
+    """Start the process-wide logger (API process only). None when disabled in settings."""
+    global _attempt_logger
+    if not get_settings().verify_attempt_log_buffered:
+        return None
+    with _attempt_logger_lock:
+        if _attempt_logger is None:
+            _attempt_logger = VerifyAttemptLogger()
+        _attempt_logger.start()
+        return _attempt_logger
+
+
+def stop_verify_attempt_logger() -> None:
+    global _attempt_logger
+    with _attempt_logger_lock:
+        if _attempt_logger is not None:
+            _attempt_logger.stop()
+            _attempt_logger = None
+
+
+def log_verify_attempt(db: Session, attempt: VerifyAttempt) -> bool:
+    """Record one verify attempt. Returns True when it was buffered; False when it was added to ``db`` inline and
+    the caller must commit."""
+    attempt_logger = _attempt_logger
+    if attempt_logger is not None and attempt_logger.running and attempt_logger.enqueue(attempt):
+        return True
+    attempt.write(db)
+    return False
@@ -61,10 +61,12 @@ def lookup_water_providers(
     city: str | None = None,
     county_name: str | None = None,
     csv_path: Path | str | None = None,
+    echo_deadline: float | None = None,
 ) -> list[dict[str, Any]]:
     """
     Look up water systems by state and optionally city or county.
     Tries SQLite cache first (if populated by water_csv_job); then EPA ECHO API; then local CSV.
+    ``echo_deadline`` (time.monotonic()) bounds the ECHO calls so a slow ECHO still leaves time for the CSV.
     Returns list of dicts with at least: name, contact_phone, contact_city, contact_state.
     """
     # Prefer SQLite cache when populated (no external call)
@@ -84,6 +86,7 @@ def lookup_water_providers(
             state_abbreviation,
             county_name=county_name,
             city=city,
+            deadline=echo_deadline,
         )
         if echo_list:
             logger.info("Water from EPA ECHO: %s provider(s)", len(echo_list))
@@ -9,8 +9,6 @@ source, we mark the provider as approved; otherwise rejected. Status in_progress
 import re
 from typing import Any
 
-import httpx
-
 from app.utility_providers.sqlite_cache import (
     get_pending_providers_to_verify,
     update_pending_provider_verification,
@@ -39,6 +37,8 @@ def _serpapi_search_provider(provider_name: str, state: str | None, county: str
     query += " utility"
     url = "https://serpapi.com/search.json"
     params = {"engine": "google", "q": query, "api_key": api_key, "num": 10}
+    import httpx
+
     try:
         with httpx.Client(timeout=15) as client:
             r = client.get(url, params=params)
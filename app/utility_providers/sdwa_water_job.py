@@ -6,7 +6,8 @@ Source: EPA ECHO SDWA download (ZIP) or local extracted folder/CSV.
 - CSV inside: SDWA_PUB_WATER_SYSTEMS.csv with PWSID, PWS_NAME, STATE_CODE, EMAIL_ADDR, PHONE_NUMBER, etc.
 
 Merges into water_provider_cache (adds new providers, updates existing by PWSID). Does not remove
-rows that exist in the DB but are not in the CSV. Contact email and phone are extracted and stored.
+rows that exist in the DB but are not in the CSV. Contact email and phone are extracted and stored,
+along with the normalized state_key / city_key lookup columns (see sqlite_cache.water_key).
 
 Do not schedule in startup; run via script or scheduler when needed.
 """
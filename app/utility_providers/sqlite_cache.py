@@ -13,9 +13,12 @@ from __future__ import annotations
 
 import logging
 import os
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +29,13 @@ _WATER_TABLE = "water_provider_cache"
 _BDC_FALLBACK_TABLE = "internet_bdc_fallback"
 _PENDING_PROVIDERS_TABLE = "pending_providers"  # user-added providers not in our list; details fetched later
 
+# Lookups run on every property registration: they reuse read-only connections from a small per-DB pool (WAL mode,
+# so the load jobs can rewrite the tables while readers keep going) and ensure the schema once per process.
+_READ_POOL_SIZE = 4
+_read_pools: dict[str, "queue.LifoQueue[sqlite3.Connection]"] = {}
+_read_pools_lock = threading.Lock()
+_schema_ready: set[tuple[str, str]] = set()
+
 
 def _project_root() -> Path:
     return Path(__file__).resolve().parents[2]
@@ -54,6 +64,54 @@ def get_connection(read_only: bool = False) -> sqlite3.Connection:
     return conn
 
 
+def _ensure_schema_once(path: str, which: str) -> None:
+    """Run the (write) schema setup for lookups once per process and DB path. which: "water" | "all"."""
+    if (path, which) in _schema_ready:
+        return
+    conn = get_connection()
+    try:
+        if which == "water":
+            _ensure_water_table_only(conn)
+        else:
+            ensure_tables(conn)
+        # Persistent per DB file: readers no longer block (or are blocked by) the load jobs' writes.
+        conn.execute("PRAGMA journal_mode=WAL")
+    finally:
+        conn.close()
+    _schema_ready.add((path, which))
+
+
+@contextmanager
+def read_connection(which: str = "all") -> Iterator[sqlite3.Connection]:
+    """Pooled read-only connection for lookups. The connection goes back to the pool unless a sqlite error was raised."""
+    path = get_db_path()
+    _ensure_schema_once(path, which)
+    with _read_pools_lock:
+        pool = _read_pools.setdefault(path, queue.LifoQueue(maxsize=_READ_POOL_SIZE))
+    try:
+        conn = pool.get_nowait()
+    except queue.Empty:
+        conn = sqlite3.connect(f"{Path(path).as_uri()}?mode=ro", uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+    healthy = False
+    try:
+        yield conn
+        healthy = True
+    finally:
+        if healthy:
+            try:
+                pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+        else:
+            conn.close()
+
+
+def water_key(value: str | None) -> str:
+    """Lookup key for water_provider_cache state/city: upper-case, whitespace collapsed."""
+    return " ".join((value or "").strip().upper().split())
+
+
 def _ensure_water_table_only(conn: sqlite3.Connection) -> None:
     """Ensure only the water_provider_cache table exists (and contactemail column). Used by water lookup so we do not run pending_providers migrations/indexes, which can fail on old DBs with 'no such column: property_id'."""
     conn.executescript(f"""
@@ -66,7 +124,9 @@ def _ensure_water_table_only(conn: sqlite3.Connection) -> None:
             contactphone TEXT,
             contactemail TEXT,
             status TEXT NOT NULL,
-            updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+            updated_at TEXT NOT NULL DEFAULT (datetime('now')),
+            state_key TEXT,
+            city_key TEXT
         );
         CREATE INDEX IF NOT EXISTS idx_water_cache_state_city
         ON {_WATER_TABLE} (contactstate, contactcity);
@@ -79,6 +139,32 @@ def _ensure_water_table_only(conn: sqlite3.Connection) -> None:
             conn.commit()
     except Exception:
         pass
+    _ensure_water_keys(conn)
+    conn.commit()
+
+
+def _ensure_water_keys(conn: sqlite3.Connection) -> None:
+    """Add/backfill state_key, city_key (normalized lookup keys) and the covering lookup indexes.
+    Rows written by upsert_water_providers_* already carry keys; this only fills rows from older DBs."""
+    cur = conn.execute(f"PRAGMA table_info({_WATER_TABLE})")
+    columns = [row[1] for row in cur.fetchall()]
+    for col in ("state_key", "city_key"):
+        if col not in columns:
+            conn.execute(f"ALTER TABLE {_WATER_TABLE} ADD COLUMN {col} TEXT")
+    stale = conn.execute(f"SELECT pwsid, contactstate, contactcity FROM {_WATER_TABLE} WHERE state_key IS NULL").fetchall()
+    if stale:
+        conn.executemany(
+            f"UPDATE {_WATER_TABLE} SET state_key = ?, city_key = ? WHERE pwsid = ?",
+            [(water_key(r[1]), water_key(r[2]), r[0]) for r in stale],
+        )
+        logger.info("Water cache: backfilled lookup keys on %d rows", len(stale))
+    # Cover every column get_water_providers_from_db reads, in ORDER BY pwsname order, for both lookup shapes.
+    conn.executescript(f"""
+        CREATE INDEX IF NOT EXISTS idx_water_cache_city_key
+        ON {_WATER_TABLE} (state_key, city_key, pwsname, pwsid, contactcity, contactstate, contactphone, contactemail);
+        CREATE INDEX IF NOT EXISTS idx_water_cache_state_key
+        ON {_WATER_TABLE} (state_key, pwsname, pwsid, contactcity, contactstate, contactphone, contactemail);
+    """)
     conn.commit()
 
 
@@ -113,7 +199,9 @@ def ensure_tables(conn: sqlite3.Connection) -> None:
             contactphone TEXT,
             contactemail TEXT,
             status TEXT NOT NULL,
-            updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+            updated_at TEXT NOT NULL DEFAULT (datetime('now')),
+            state_key TEXT,
+            city_key TEXT
         );
         CREATE INDEX IF NOT EXISTS idx_water_cache_state_city
         ON {_WATER_TABLE} (contactstate, contactcity);
@@ -152,6 +240,7 @@ def ensure_tables(conn: sqlite3.Connection) -> None:
             conn.commit()
     except Exception:
         pass
+    _ensure_water_keys(conn)
     # Migration: add pending_providers columns if table existed without them (e.g. old DB)
     # Must run before creating indexes on property_id/verification_status or they fail
     try:
@@ -189,16 +278,12 @@ def get_internet_providers_for_county(state_fips: str, county_fips: str) -> List
     if len(state_fips) != 2 or len(county_fips) != 3:
         return []
     try:
-        conn = get_connection(read_only=True)
-        try:
-            ensure_tables(conn)
+        with read_connection() as conn:
             cur = conn.execute(
                 f"SELECT provider_name FROM {_TABLE} WHERE state_fips = ? AND county_fips = ? ORDER BY provider_name",
                 (state_fips, county_fips),
             )
             return [row[0] for row in cur.fetchall()]
-        finally:
-            conn.close()
     except Exception as e:
         logger.warning("Internet cache lookup failed: %s", e)
         return []
@@ -281,6 +366,10 @@ def get_pending_counties() -> List[tuple[str, str]]:
 
 # ---------- Water provider cache (EPA SDWIS CSV) ----------
 
+_WATER_UPSERT_SQL = f"""INSERT OR REPLACE INTO {_WATER_TABLE}
+    (pwsid, pwsname, state, contactcity, contactstate, contactphone, contactemail, status, updated_at, state_key, city_key)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
 
 def upsert_water_providers_bulk(
     rows: List[dict],
@@ -308,7 +397,7 @@ def upsert_water_providers_bulk(
             logger.info("Water cache: deduped by pwsid from %d to %d rows", len(rows), len(by_pwsid))
         conn.execute(f"DELETE FROM {_WATER_TABLE}")
         now = __import__("datetime").datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-        count = 0
+        values = []
         for row in by_pwsid.values():
             pwsid = (row.get("pwsid") or "").strip()
             pwsname = (row.get("pwsname") or "").strip() or ""
@@ -318,15 +407,13 @@ def upsert_water_providers_bulk(
             contactphone = (row.get("contactphone") or "").strip()
             contactemail = (row.get("contactemail") or row.get("EMAIL_ADDR") or row.get("email") or "").strip()
             status = (row.get("status") or "").strip() or "Active"
-            conn.execute(
-                f"""INSERT OR REPLACE INTO {_WATER_TABLE}
-                    (pwsid, pwsname, state, contactcity, contactstate, contactphone, contactemail, status, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (pwsid, pwsname, state, contactcity, contactstate, contactphone, contactemail, status, now),
+            values.append(
+                (pwsid, pwsname, state, contactcity, contactstate, contactphone, contactemail, status, now,
+                 water_key(contactstate), water_key(contactcity))
             )
-            count += 1
+        conn.executemany(_WATER_UPSERT_SQL, values)
         conn.commit()
-        return count
+        return len(values)
     finally:
         if own and conn:
             conn.close()
@@ -348,7 +435,7 @@ def upsert_water_providers_merge(
     try:
         ensure_tables(conn)
         now = __import__("datetime").datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-        count = 0
+        values = []
         skipped = 0
         for row in rows:
             pwsid = (row.get("pwsid") or "").strip()
@@ -364,15 +451,13 @@ def upsert_water_providers_merge(
             contactphone = (row.get("contactphone") or "").strip()
             contactemail = (row.get("contactemail") or row.get("EMAIL_ADDR") or row.get("email") or "").strip()
             status = (row.get("status") or "").strip() or "Active"
-            conn.execute(
-                f"""INSERT OR REPLACE INTO {_WATER_TABLE}
-                    (pwsid, pwsname, state, contactcity, contactstate, contactphone, contactemail, status, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (pwsid, pwsname, state, contactcity, contactstate, contactphone, contactemail, status, now),
+            values.append(
+                (pwsid, pwsname, state, contactcity, contactstate, contactphone, contactemail, status, now,
+                 water_key(contactstate), water_key(contactcity))
             )
-            count += 1
+        conn.executemany(_WATER_UPSERT_SQL, values)
         conn.commit()
-        return (count, skipped)
+        return (len(values), skipped)
     finally:
         if own and conn:
             conn.close()
@@ -383,28 +468,26 @@ def get_water_providers_from_db(
     city: str | None = None,
 ) -> List[dict]:
     """
-    Look up water providers from cache by contactstate (and optionally contactcity).
-    state_abbreviation should be 2-letter uppercase. Returns list of dicts with name, contact_phone, contact_city, contact_state, raw.
+    Look up water providers from cache by contactstate (and optionally contactcity), matched on the normalized
+    state_key / city_key columns (see water_key). state_abbreviation is a 2-letter code. Returns list of dicts with name, contact_phone, contact_city, contact_state, raw.
     """
-    state = (state_abbreviation or "").strip().upper()
+    state = water_key(state_abbreviation)
     if not state:
         return []
     try:
-        conn = get_connection(read_only=True)
-        try:
-            _ensure_water_table_only(conn)
+        with read_connection("water") as conn:
+            # state_key / city_key are stored normalized, so both shapes are covering-index range scans.
             if city and (city or "").strip():
-                city_norm = " ".join((city or "").strip().upper().split())
                 cur = conn.execute(
                     f"""SELECT pwsid, pwsname, contactcity, contactstate, contactphone, contactemail FROM {_WATER_TABLE}
-                        WHERE UPPER(TRIM(contactstate)) = ? AND UPPER(TRIM(contactcity)) = ?
+                        WHERE state_key = ? AND city_key = ?
                         ORDER BY pwsname LIMIT 100""",
-                    (state, city_norm),
+                    (state, water_key(city)),
                 )
             else:
                 cur = conn.execute(
                     f"""SELECT pwsid, pwsname, contactcity, contactstate, contactphone, contactemail FROM {_WATER_TABLE}
-                        WHERE UPPER(TRIM(contactstate)) = ?
+                        WHERE state_key = ?
                         ORDER BY pwsname LIMIT 100""",
                     (state,),
                 )
@@ -420,8 +503,6 @@ def get_water_providers_from_db(
                     "raw": r,
                 })
             return out
-        finally:
-            conn.close()
     except Exception as e:
         logger.warning("Water cache lookup failed: %s", e)
         return []
@@ -477,16 +558,12 @@ def replace_internet_bdc_fallback(
 def get_internet_bdc_fallback_providers(limit: int = 10) -> List[dict]:
     """Return top N providers from internet_bdc_fallback table (for fallback when county cache misses)."""
     try:
-        conn = get_connection(read_only=True)
-        try:
-            ensure_tables(conn)
+        with read_connection() as conn:
             cur = conn.execute(
                 f"SELECT rank, provider_name, total_units FROM {_BDC_FALLBACK_TABLE} ORDER BY rank LIMIT ?",
                 (limit,),
             )
             return [{"name": row[1], "raw": {"holding_company": row[1], "total_units": row[2], "rank": row[0]}} for row in cur.fetchall()]
-        finally:
-            conn.close()
     except Exception as e:
         logger.warning("Internet BDC fallback lookup failed: %s", e)
         return []
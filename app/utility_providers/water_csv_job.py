@@ -4,6 +4,7 @@ Background job: populate SQLite water_provider_cache from EPA SDWIS CSV.
 Single source: local CSV (e.g. CSV.csv) with columns pwsid, pwsname, state,
 contactcity, contactstate, contactphone, status. Rows with status=CLOSED are skipped.
 Run on schedule or after updating the CSV; lookup can then use DB instead of parsing CSV.
+Each row is written with its normalized state_key / city_key lookup columns (see sqlite_cache.water_key).
 """
 
 from __future__ import annotations
@@ -0,0 +1,49 @@
+"""
+Standalone cron worker: ``python -m app.worker``.
+
+Runs the leader-elected scheduler (app.services.scheduler) without the API, so web workers can be scaled with
+``SCHEDULER_MODE=off`` while one or more worker processes share the cron work; only the current leader runs jobs and
+a standby takes over if it dies. Stops on SIGINT / SIGTERM and releases leadership.
+"""
+from __future__ import annotations
+
+import logging
+import signal
+import threading
+
+import app.models  # noqa: F401  (register all tables on Base.metadata)
+from app.database import Base, engine
+from app.models.job_run import JobRun
+from app.models.scheduler_lease import SchedulerLease
+
+# Session hooks that keep derived state in step with the jobs' writes are registered on import.
+import app.services.live_page_cache  # noqa: F401
+import app.services.property_state  # noqa: F401
+
+logger = logging.getLogger("app.worker")
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    logging.getLogger("apscheduler.executors").setLevel(logging.WARNING)  # one line per heartbeat otherwise
+    from app.services.property_state import start_property_state_refresher, stop_property_state_refresher
+    from app.services.scheduler import start_scheduler, stop_scheduler
+
+    # The API creates the full schema on startup; the worker only needs its own tables to exist.
+    Base.metadata.create_all(bind=engine, tables=[JobRun.__table__, SchedulerLease.__table__])
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stop.set())
+    start_property_state_refresher()  # the jobs' commits queue snapshot refreshes instead of recomputing inline
+    scheduler = start_scheduler()
+    logger.info("Worker %s running %d cron job(s) while leader", scheduler.holder, len(scheduler.jobs))
+    try:
+        stop.wait()
+    finally:
+        stop_scheduler()
+        stop_property_state_refresher()
+        logger.info("Worker %s stopped", scheduler.holder)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Add and backfill event_ledger.search_text (the log search document) and, on PostgreSQL, its trigram index.
+
+Safe to re-run: the column and indexes are created only if missing, and only rows with search_text IS NULL are
+filled. search_text is derived data; no ledger fact columns are touched.
+
+Run from project root:
+  python scripts/backfill_ledger_search_text.py
+  python scripts/backfill_ledger_search_text.py --batch-size 5000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+try:
+    from dotenv import load_dotenv
+    load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
+except ImportError:
+    pass
+
+from sqlalchemy import text
+
+
+def column_exists(conn, dialect_name: str) -> bool:
+    if dialect_name == "sqlite":
+        r = conn.execute(text("PRAGMA table_info(event_ledger)"))
+        return any(row[1] == "search_text" for row in r.fetchall())
+    r = conn.execute(
+        text(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_name = 'event_ledger' AND column_name = 'search_text'"
+        )
+    )
+    return r.fetchone() is not None
+
+
+def ensure_schema(engine) -> None:
+    dialect_name = engine.dialect.name
+    with engine.connect() as conn:
+        if not column_exists(conn, dialect_name):
+            conn.execute(text("ALTER TABLE event_ledger ADD COLUMN search_text TEXT"))
+            conn.commit()
+            print("Added search_text to event_ledger.")
+    if dialect_name != "postgresql":
+        return
+    # CONCURRENTLY cannot run inside a transaction block.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        conn.execute(
+            text(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_event_ledger_search_text_trgm "
+                "ON event_ledger USING gin (search_text gin_trgm_ops)"
+            )
+        )
+        # Lets the not-yet-backfilled fallback branch of ledger_search_clause use an index scan; empty once done.
+        conn.execute(
+            text(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_event_ledger_search_text_pending "
+                "ON event_ledger (id) WHERE search_text IS NULL"
+            )
+        )
+    print("Trigram index on event_ledger.search_text is in place.")
+
+
+def backfill(batch_size: int) -> int:
+    from app.database import SessionLocal
+    from app.models.event_ledger import EventLedger
+    from app.services.event_ledger import ledger_search_document, property_search_addresses
+
+    db = SessionLocal()
+    total = 0
+    last_id = 0
+    started = time.monotonic()
+    try:
+        while True:
+            rows = (
+                db.query(EventLedger.id, EventLedger.action_type, EventLedger.meta, EventLedger.property_id)
+                .filter(EventLedger.search_text.is_(None), EventLedger.id > last_id)
+                .order_by(EventLedger.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+            addresses = property_search_addresses(db, [r.property_id for r in rows])
+            db.bulk_update_mappings(
+                EventLedger,
+                [
+                    {
+                        "id": r.id,
+                        "search_text": ledger_search_document(
+                            r.action_type,
+                            r.meta if isinstance(r.meta, dict) else None,
+                            property_address=addresses.get(r.property_id),
+                        ),
+                    }
+                    for r in rows
+                ],
+            )
+            db.commit()
+            total += len(rows)
+            last_id = rows[-1].id
+            print(f"  {total} rows backfilled (through id {last_id}, {time.monotonic() - started:.1f}s)")
+    finally:
+        db.close()
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=2000)
+    args = parser.parse_args()
+
+    from app.database import engine
+
+    ensure_schema(engine)
+    n = backfill(max(1, args.batch_size))
+    print(f"Done. {n} ledger rows backfilled.")
+
+
+if __name__ == "__main__":
+    main()
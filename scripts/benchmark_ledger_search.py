@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark log search: legacy ``action_type ILIKE / meta::text ILIKE`` vs the trigram-indexed ``search_text`` column.
+
+PostgreSQL only. Builds a synthetic ledger in a scratch table (event_ledger_search_bench; the real event_ledger is
+not touched), indexes it the same way scripts/backfill_ledger_search_text.py indexes event_ledger, then times each
+search term through both predicates.
+
+Run from project root:
+  python scripts/benchmark_ledger_search.py                 # 1,000,000 rows
+  python scripts/benchmark_ledger_search.py --rows 200000 --repeat 10 --keep
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+try:
+    from dotenv import load_dotenv
+    load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
+except ImportError:
+    pass
+
+from sqlalchemy import text
+
+TABLE = "event_ledger_search_bench"
+DEFAULT_TERMS = ["guest417@example.com", "maple", "checkout", "invitationcreated", "zzz-no-match"]
+
+_BUILD_SQL = f"""
+CREATE TABLE {TABLE} AS
+SELECT
+    g AS id,
+    now() - (g || ' seconds')::interval AS created_at,
+    (ARRAY['InvitationCreated','StayCheckedIn','StayCheckedOut','PresenceStatusChanged','PropertyUpdated'])[1 + g % 5]
+        AS action_type,
+    jsonb_build_object(
+        'guest_email', 'guest' || (g % 50000) || '@example.com',
+        'guest_name', 'Guest ' || (g % 50000),
+        'property_name', (ARRAY['Maple Court','Ocean Villa','Pine Loft','Harbor House'])[1 + g % 4] || ' ' || (g % 997),
+        'message', 'Synthetic ledger event ' || g
+    ) AS meta
+FROM generate_series(1, :rows) AS g
+"""
+
+_SEARCH_TEXT_SQL = f"""
+UPDATE {TABLE} SET search_text = lower(
+    action_type || ' ' || (SELECT string_agg(value, ' ') FROM jsonb_each_text(meta))
+)
+"""
+
+LEGACY_PREDICATE = "(action_type ILIKE :term OR CAST(meta AS TEXT) ILIKE :term)"
+INDEXED_PREDICATE = "search_text LIKE :term"
+
+
+def build(conn, rows: int) -> None:
+    t0 = time.monotonic()
+    conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+    conn.execute(text(_BUILD_SQL), {"rows": rows})
+    conn.execute(text(f"ALTER TABLE {TABLE} ADD COLUMN search_text TEXT"))
+    conn.execute(text(_SEARCH_TEXT_SQL))
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    conn.execute(text(f"CREATE INDEX ON {TABLE} USING gin (search_text gin_trgm_ops)"))
+    conn.execute(text(f"CREATE INDEX ON {TABLE} (created_at DESC, id DESC)"))
+    conn.execute(text(f"ANALYZE {TABLE}"))
+    print(f"Built {rows} synthetic rows in {time.monotonic() - t0:.1f}s")
+
+
+def time_query(conn, predicate: str, term: str, repeat: int, limit: int) -> tuple[list[float], int]:
+    sql = text(
+        f"SELECT id FROM {TABLE} WHERE {predicate} ORDER BY created_at DESC, id DESC LIMIT :limit"
+    )
+    timings = []
+    n = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        n = len(conn.execute(sql, {"term": f"%{term}%", "limit": limit}).fetchall())
+        timings.append((time.perf_counter() - t0) * 1000.0)
+    return timings, n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=50, help="Page size, as the log endpoints request")
+    parser.add_argument("--term", action="append", dest="terms", help="Search term (repeatable)")
+    parser.add_argument("--reuse", action="store_true", help="Reuse an existing bench table instead of rebuilding")
+    parser.add_argument("--keep", action="store_true", help="Keep the bench table afterwards")
+    args = parser.parse_args()
+
+    from app.database import engine
+
+    if engine.dialect.name != "postgresql":
+        print("This benchmark needs PostgreSQL (pg_trgm); DATABASE_URL points at", engine.dialect.name)
+        sys.exit(1)
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if not args.reuse:
+            build(conn, args.rows)
+        print(f"{'term':<26} {'legacy p50':>11} {'indexed p50':>12} {'speedup':>8} {'rows':>5}")
+        for term in args.terms or DEFAULT_TERMS:
+            legacy, n_legacy = time_query(conn, LEGACY_PREDICATE, term.lower(), args.repeat, args.limit)
+            indexed, n_indexed = time_query(conn, INDEXED_PREDICATE, term.lower(), args.repeat, args.limit)
+            p50_legacy = statistics.median(legacy)
+            p50_indexed = statistics.median(indexed)
+            flag = "" if n_legacy == n_indexed else f"  (row count differs: {n_legacy} vs {n_indexed})"
+            print(
+                f"{term:<26} {p50_legacy:>9.1f}ms {p50_indexed:>10.1f}ms "
+                f"{p50_legacy / max(p50_indexed, 0.001):>7.1f}x {n_indexed:>5}{flag}"
+            )
+        if not args.keep:
+            conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+
+
+if __name__ == "__main__":
+    main()
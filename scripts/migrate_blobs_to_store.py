@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Move signed PDFs and ownership proofs out of the database into the content-addressed blob store.
+
+1. Adds the <field>_sha256 columns (agreement_signatures.signed_pdf_sha256, property_authority_letters.signed_pdf_sha256,
+   properties.ownership_proof_sha256) if they do not exist.
+2. For every row that still holds the bytes inline, writes them to the blob store (blob_store_path), records the
+   digest and clears the inline column, committing per batch. Safe to re-run and to interrupt.
+
+Run it on a host that sees the same blob_store_path as the API servers.
+Works with both SQLite and PostgreSQL (uses app database URL)."""
+import os
+import sys
+
+# Add project root so app imports work
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+from app.config import get_settings
+from app.services.blob_store import get_blob_store
+
+# (table, inline bytes column, digest column)
+BLOB_COLUMNS = [
+    ("agreement_signatures", "signed_pdf_bytes", "signed_pdf_sha256"),
+    ("property_authority_letters", "signed_pdf_bytes", "signed_pdf_sha256"),
+    ("properties", "ownership_proof_bytes", "ownership_proof_sha256"),
+]
+
+BATCH_SIZE = 100
+
+
+def column_exists(conn, dialect_name: str, table: str, column: str) -> bool:
+    if dialect_name == "sqlite":
+        r = conn.execute(text(f"PRAGMA table_info({table})"))
+        return any(row[1] == column for row in r.fetchall())
+    if dialect_name == "postgresql":
+        r = conn.execute(
+            text(
+                "SELECT 1 FROM information_schema.columns "
+                "WHERE table_name = :table AND column_name = :column"
+            ),
+            {"table": table, "column": column},
+        )
+        return r.fetchone() is not None
+    return False
+
+
+def move_blobs(conn, table: str, bytes_column: str, sha_column: str, batch_size: int = BATCH_SIZE) -> int:
+    """Move inline bytes of ``table`` into the blob store; returns the number of rows moved."""
+    store = get_blob_store()
+    moved = 0
+    while True:
+        rows = conn.execute(
+            text(
+                f"SELECT id, {bytes_column} FROM {table} "
+                f"WHERE {bytes_column} IS NOT NULL AND {sha_column} IS NULL ORDER BY id LIMIT :n"
+            ),
+            {"n": batch_size},
+        ).fetchall()
+        if not rows:
+            return moved
+        for row_id, data in rows:
+            digest = store.put(bytes(data))
+            conn.execute(
+                text(f"UPDATE {table} SET {sha_column} = :digest, {bytes_column} = NULL WHERE id = :id"),
+                {"digest": digest, "id": row_id},
+            )
+        conn.commit()
+        moved += len(rows)
+        print(f"{table}: moved {moved} {bytes_column} value(s) to the blob store...")
+
+
+def migrate(engine=None):
+    if engine is None:
+        engine = create_engine(get_settings().database_url)
+    dialect_name = engine.dialect.name
+
+    with engine.connect() as conn:
+        for table, bytes_column, sha_column in BLOB_COLUMNS:
+            if column_exists(conn, dialect_name, table, sha_column):
+                print(f"{sha_column} already exists in {table} table.")
+            else:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {sha_column} VARCHAR(64)"))
+                conn.commit()
+                print(f"Added {sha_column} to {table} table.")
+        for table, bytes_column, sha_column in BLOB_COLUMNS:
+            moved = move_blobs(conn, table, bytes_column, sha_column)
+            print(f"{table}: {moved} row(s) moved to {get_blob_store().root}.")
+
+
+if __name__ == "__main__":
+    migrate()
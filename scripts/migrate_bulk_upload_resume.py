@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Add attempts / heartbeat_at to bulk_upload_jobs (resumable async bulk uploads) if they do not exist.
+The bulk_upload_job_groups checkpoint table is new and is created by create_all on startup.
+Works with both SQLite and PostgreSQL (uses app database URL)."""
+import os
+import sys
+
+# Add project root so app imports work
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+from app.config import get_settings
+
+COLUMNS = {
+    "attempts": "INTEGER NOT NULL DEFAULT 0",
+    "heartbeat_at": "TIMESTAMP WITH TIME ZONE",
+}
+
+
+def column_exists(conn, dialect_name: str, column: str) -> bool:
+    if dialect_name == "sqlite":
+        r = conn.execute(text("PRAGMA table_info(bulk_upload_jobs)"))
+        return any(row[1] == column for row in r.fetchall())
+    if dialect_name == "postgresql":
+        r = conn.execute(
+            text(
+                "SELECT 1 FROM information_schema.columns "
+                "WHERE table_name = 'bulk_upload_jobs' AND column_name = :column"
+            ),
+            {"column": column},
+        )
+        return r.fetchone() is not None
+    return False
+
+
+def migrate():
+    settings = get_settings()
+    engine = create_engine(settings.database_url)
+    dialect_name = engine.dialect.name
+
+    with engine.connect() as conn:
+        for column, ddl in COLUMNS.items():
+            if column_exists(conn, dialect_name, column):
+                print(f"{column} already exists in bulk_upload_jobs table.")
+                continue
+            if dialect_name == "sqlite" and column == "heartbeat_at":
+                ddl = "DATETIME"
+            conn.execute(text(f"ALTER TABLE bulk_upload_jobs ADD COLUMN {column} {ddl}"))
+            conn.commit()
+            print(f"Added {column} to bulk_upload_jobs table.")
+
+
+if __name__ == "__main__":
+    migrate()
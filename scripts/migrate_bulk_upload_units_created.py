@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Add units_created to bulk_upload_jobs and bulk_upload_job_groups (async bulk upload status reports the units a
+job created, carried over per checkpointed group on resume) if it does not exist.
+Works with both SQLite and PostgreSQL (uses app database URL)."""
+import os
+import sys
+
+# Add project root so app imports work
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+from app.config import get_settings
+
+TABLES = ("bulk_upload_jobs", "bulk_upload_job_groups")
+
+
+def column_exists(conn, dialect_name: str, table: str, column: str) -> bool:
+    if dialect_name == "sqlite":
+        r = conn.execute(text(f"PRAGMA table_info({table})"))
+        return any(row[1] == column for row in r.fetchall())
+    if dialect_name == "postgresql":
+        r = conn.execute(
+            text(
+                "SELECT 1 FROM information_schema.columns "
+                "WHERE table_name = :table AND column_name = :column"
+            ),
+            {"table": table, "column": column},
+        )
+        return r.fetchone() is not None
+    return False
+
+
+def migrate():
+    settings = get_settings()
+    engine = create_engine(settings.database_url)
+    dialect_name = engine.dialect.name
+
+    with engine.connect() as conn:
+        for table in TABLES:
+            if column_exists(conn, dialect_name, table, "units_created"):
+                print(f"units_created already exists in {table} table.")
+                continue
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN units_created INTEGER NOT NULL DEFAULT 0"))
+            conn.commit()
+            print(f"Added units_created to {table} table.")
+
+
+if __name__ == "__main__":
+    migrate()
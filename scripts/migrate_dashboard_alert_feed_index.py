@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Create the (user_id, created_at, id) index on dashboard_alerts used by the keyset-paged GET /dashboard/alerts feed.
+New databases get it (and the user_alert_counters table) from create_all.
+Works with both SQLite and PostgreSQL (uses app database URL). On PostgreSQL the index is built CONCURRENTLY so
+alert writes are not blocked while it builds."""
+import os
+import sys
+
+# Add project root so app imports work
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+from app.config import get_settings
+
+INDEX_NAME = "ix_dashboard_alerts_user_created_id"
+
+
+def migrate():
+    settings = get_settings()
+    engine = create_engine(settings.database_url)
+    dialect_name = engine.dialect.name
+
+    if dialect_name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(
+                text(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+                    "ON dashboard_alerts (user_id, created_at, id)"
+                )
+            )
+    else:
+        with engine.connect() as conn:
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON dashboard_alerts (user_id, created_at, id)"))
+            conn.commit()
+    print(f"{INDEX_NAME} is in place.")
+
+
+if __name__ == "__main__":
+    migrate()
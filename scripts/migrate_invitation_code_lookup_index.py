@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Create the functional index on lower(invitations.invitation_code) used by the public verify portal's
+case-insensitive token lookup (app.services.token_verification). New databases get it from create_all.
+Works with both SQLite and PostgreSQL (uses app database URL). On PostgreSQL the index is built CONCURRENTLY so
+verify traffic is not blocked while it builds."""
+import os
+import sys
+
+# Add project root so app imports work
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+from app.config import get_settings
+
+INDEX_NAME = "ix_invitations_invitation_code_lower"
+
+
+def migrate():
+    settings = get_settings()
+    engine = create_engine(settings.database_url)
+    dialect_name = engine.dialect.name
+
+    if dialect_name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(
+                text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} ON invitations (lower(invitation_code))")
+            )
+    else:
+        with engine.connect() as conn:
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON invitations (lower(invitation_code))"))
+            conn.commit()
+    print(f"{INDEX_NAME} is in place.")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Add the outbound email queue columns to notification_attempts (app.services.email_dispatcher) if they do not exist,
+and make dashboard_alert_id nullable (queued emails are not tied to an alert).
+Works with both SQLite and PostgreSQL (uses app database URL). SQLite cannot drop NOT NULL in place: recreate the
+notification_attempts table there (dev databases: drop it and restart; create_all builds the new shape)."""
+import os
+import sys
+
+# Add project root so app imports work
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+from app.config import get_settings
+
+COLUMNS = {
+    "status": "VARCHAR(16)",
+    "recipient": "VARCHAR(255)",
+    "subject": "VARCHAR(500)",
+    "body_html": "TEXT",
+    "body_text": "TEXT",
+    "attempt_count": "INTEGER NOT NULL DEFAULT 0",
+    "next_attempt_at": "TIMESTAMP WITH TIME ZONE",
+    "sent_at": "TIMESTAMP WITH TIME ZONE",
+}
+
+
+def column_exists(conn, dialect_name: str, column: str) -> bool:
+    if dialect_name == "sqlite":
+        r = conn.execute(text("PRAGMA table_info(notification_attempts)"))
+        return any(row[1] == column for row in r.fetchall())
+    if dialect_name == "postgresql":
+        r = conn.execute(
+            text(
+                "SELECT 1 FROM information_schema.columns "
+                "WHERE table_name = 'notification_attempts' AND column_name = :column"
+            ),
+            {"column": column},
+        )
+        return r.fetchone() is not None
+    return False
+
+
+def migrate():
+    settings = get_settings()
+    engine = create_engine(settings.database_url)
+    dialect_name = engine.dialect.name
+
+    with engine.connect() as conn:
+        for column, ddl in COLUMNS.items():
+            if column_exists(conn, dialect_name, column):
+                print(f"{column} already exists in notification_attempts table.")
+                continue
+            if dialect_name == "sqlite" and ddl.startswith("TIMESTAMP"):
+                ddl = "DATETIME"
+            conn.execute(text(f"ALTER TABLE notification_attempts ADD COLUMN {column} {ddl}"))
+            conn.commit()
+            print(f"Added {column} to notification_attempts table.")
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_notification_attempts_status_next_attempt "
+                "ON notification_attempts (status, next_attempt_at)"
+            )
+        )
+        conn.commit()
+        if dialect_name == "postgresql":
+            conn.execute(text("ALTER TABLE notification_attempts ALTER COLUMN dashboard_alert_id DROP NOT NULL"))
+            conn.commit()
+            print("notification_attempts.dashboard_alert_id is nullable.")
+        elif dialect_name == "sqlite":
+            print("SQLite: recreate notification_attempts if dashboard_alert_id is still NOT NULL (see docstring).")
+
+
+if __name__ == "__main__":
+    migrate()
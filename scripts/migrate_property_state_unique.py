@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""Add the unique (property_id, unit_id) indexes on property_state_snapshots so concurrent refreshes cannot leave
+duplicate rows. New databases get them from create_all.
+Snapshot rows are derived data: existing rows (possibly duplicated) are deleted first, properties are computed live
+until their next write or the nightly reconcile rewrites them.
+Works with both SQLite and PostgreSQL (uses app database URL)."""
+import os
+import sys
+
+# Add project root so app imports work
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+from app.config import get_settings
+
+INDEXES = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_property_state_snapshots_property_unit "
+    "ON property_state_snapshots (property_id, unit_id)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_property_state_snapshots_property_row "
+    "ON property_state_snapshots (property_id) WHERE unit_id IS NULL",
+)
+
+
+def migrate():
+    settings = get_settings()
+    engine = create_engine(settings.database_url)
+    with engine.begin() as conn:
+        deleted = conn.execute(text("DELETE FROM property_state_snapshots")).rowcount
+        for ddl in INDEXES:
+            conn.execute(text(ddl))
+    print(f"Deleted {deleted} snapshot rows; unique property state indexes are in place.")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,63 @@
+"""Shared test fixtures: a fresh in-memory SQLite database per test, plus the helpers most suites repeat."""
+import unittest
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401  (register all tables on Base.metadata)
+from app.database import Base
+from app.models.user import User, UserRole
+
+
+def memory_engine(*, create_tables: bool = True) -> Engine:
+    """In-memory SQLite shared by every session and thread of one test (StaticPool: one connection)."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    if create_tables:
+        Base.metadata.create_all(engine)
+    return engine
+
+
+class DatabaseTestCase(unittest.TestCase):
+    """Per test: ``self.engine`` with every table, ``self.Session`` (sessionmaker) and ``self.db``, an open session
+    closed on cleanup. Subclasses call ``super().setUp()`` first, then add their own rows."""
+
+    session_options: dict = {"autoflush": False}
+    create_tables = True
+
+    def setUp(self):
+        super().setUp()
+        self.engine = memory_engine(create_tables=self.create_tables)
+        self.Session = sessionmaker(bind=self.engine, **self.session_options)
+        self.db = self.Session()
+        self.addCleanup(self.db.close)
+
+    def _user(self, email: str, role: UserRole = UserRole.owner, **fields) -> User:
+        u = User(email=email, hashed_password="x", role=role, **fields)
+        self.db.add(u)
+        self.db.flush()
+        return u
+
+    def capture_statements(self) -> list[str]:
+        """SQL statements executed on ``self.engine`` from now until the end of the test."""
+        statements: list[str] = []
+
+        def _before(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(self.engine, "before_cursor_execute", _before)
+        self.addCleanup(event.remove, self.engine, "before_cursor_execute", _before)
+        return statements
+
+    def get_db_override(self):
+        """Replacement for ``app.database.get_db``: one session of this test's database per request."""
+
+        def _db():
+            db = self.Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        return _db
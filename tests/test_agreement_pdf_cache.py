@@ -0,0 +1,64 @@
+"""Rendered agreement PDF cache (agreement_content_to_pdf)."""
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app.config import get_settings
+from app.services import agreement_pdf_cache, agreements
+
+
+class TestAgreementPdfCache(unittest.TestCase):
+    def setUp(self):
+        agreement_pdf_cache.clear_agreement_pdf_cache()
+        self.addCleanup(agreement_pdf_cache.clear_agreement_pdf_cache)
+        for name, value in (
+            ("agreement_pdf_cache_max_entries", 2),
+            ("agreement_pdf_cache_max_bytes", 10 * 1024 * 1024),
+            ("agreement_pdf_cache_dir", ""),
+        ):
+            patcher = mock.patch.object(get_settings(), name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.render = mock.patch.object(agreements, "_render_agreement_pdf", wraps=agreements._render_agreement_pdf)
+        self.rendered = self.render.start()
+        self.addCleanup(self.render.stop)
+
+    def test_repeat_downloads_skip_the_render(self):
+        first = agreements.agreement_content_to_pdf("Guest Agreement", "**Guest:** Gina\n\nStay terms.")
+        again = agreements.agreement_content_to_pdf("Guest Agreement", "**Guest:** Gina\n\nStay terms.")
+        self.assertTrue(first.startswith(b"%PDF"))
+        self.assertIs(again, first)
+        other = agreements.agreement_content_to_pdf("Guest Agreement", "**Guest:** Gus\n\nStay terms.")
+        retitled = agreements.agreement_content_to_pdf("Tenant Agreement", "**Guest:** Gina\n\nStay terms.")
+        self.assertNotEqual(other, first)
+        self.assertNotEqual(retitled, first)
+        self.assertEqual(self.rendered.call_count, 3)
+
+        stats = agreement_pdf_cache.get_agreement_pdf_cache_stats()
+        self.assertEqual((stats["memory_hits"], stats["misses"], stats["renders"]), (1, 3, 3))
+        self.assertEqual(stats["hit_rate"], 0.25)
+        self.assertGreater(stats["render_ms_avg"], 0)
+        self.assertEqual(stats["entries"], 2)  # bounded: the oldest render was evicted
+
+        agreements.agreement_content_to_pdf("Guest Agreement", "**Guest:** Gina\n\nStay terms.")
+        self.assertEqual(self.rendered.call_count, 4)
+
+    def test_disk_cache_survives_memory_eviction_and_is_pruned(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        with mock.patch.object(get_settings(), "agreement_pdf_cache_dir", tmp.name), \
+                mock.patch.object(get_settings(), "agreement_pdf_cache_disk_max_entries", 2):
+            first = agreements.agreement_content_to_pdf("Doc", "one")
+            agreement_pdf_cache.clear_agreement_pdf_cache()
+            self.assertEqual(agreements.agreement_content_to_pdf("Doc", "one"), first)
+            self.assertEqual(self.rendered.call_count, 1)
+            self.assertEqual(agreement_pdf_cache.get_agreement_pdf_cache_stats()["disk_hits"], 1)
+
+            agreements.agreement_content_to_pdf("Doc", "two")
+            agreements.agreement_content_to_pdf("Doc", "three")
+            self.assertEqual(len(list(Path(tmp.name).glob("*.pdf"))), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
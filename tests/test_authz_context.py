@@ -0,0 +1,98 @@
+"""AuthzContext: permission helpers answer from per-session scope sets, loaded once and dropped on scope writes."""
+import unittest
+from datetime import date, datetime, timezone
+
+from app.models.owner import OwnerProfile, Property
+from app.models.property_manager_assignment import PropertyManagerAssignment
+from app.models.resident_mode import ResidentMode, ResidentModeType
+from app.models.tenant_assignment import TenantAssignment
+from app.models.unit import Unit
+from app.models.user import UserRole
+from app.services.permissions import (
+    Action,
+    can_access_property,
+    can_access_unit,
+    can_perform_action,
+    get_manager_personal_mode_units,
+    get_owner_personal_mode_units,
+    owner_profile_property_ids,
+)
+from tests.support import DatabaseTestCase
+
+
+class TestAuthzContext(DatabaseTestCase):
+    session_options = {"autoflush": False, "expire_on_commit": False}
+
+    def setUp(self):
+        super().setUp()
+        db = self.db
+        self.owner = self._user("owner@example.com", UserRole.owner)
+        self.manager = self._user("manager@example.com", UserRole.property_manager)
+        self.tenant = self._user("tenant@example.com", UserRole.tenant)
+        profile = OwnerProfile(user_id=self.owner.id)
+        db.add(profile)
+        db.flush()
+
+        def prop(name, **kw):
+            p = Property(owner_profile_id=profile.id, name=name, street="1 Main", city="Tampa", state="FL",
+                         region_code="FL", **kw)
+            db.add(p)
+            db.flush()
+            return p
+
+        self.home = prop("Home", owner_occupied=True)
+        self.rental = prop("Rental", owner_occupied=False, is_multi_unit=True)
+        self.gone = prop("Gone", owner_occupied=False, deleted_at=datetime.now(timezone.utc))
+        self.r1, self.r2 = Unit(property_id=self.rental.id, unit_label="1"), Unit(property_id=self.rental.id, unit_label="2")
+        db.add_all([self.r1, self.r2])
+        db.flush()
+        db.add(PropertyManagerAssignment(property_id=self.rental.id, user_id=self.manager.id))
+        db.add(ResidentMode(user_id=self.manager.id, unit_id=self.r2.id, mode=ResidentModeType.manager_personal))
+        db.add(TenantAssignment(unit_id=self.r1.id, user_id=self.tenant.id, start_date=date.today()))
+        db.commit()
+        self.queries = self.capture_statements()
+
+    def test_scope_matches_the_lane_rules(self):
+        db, owner, manager, tenant = self.db, self.owner, self.manager, self.tenant
+        self.assertTrue(can_access_property(db, owner, self.rental.id))
+        self.assertFalse(can_access_property(db, owner, self.rental.id, "personal"))
+        self.assertFalse(can_access_property(db, owner, self.gone.id))
+        self.assertEqual(owner_profile_property_ids(db, owner.id), {self.home.id, self.rental.id, self.gone.id})
+        # The owner-occupied single-unit home has no Unit row yet: personal mode creates it.
+        home_units = get_owner_personal_mode_units(db, owner.id)
+        self.assertEqual(len(home_units), 1)
+        self.assertTrue(can_access_unit(db, owner, home_units[0], "personal"))
+        self.assertFalse(can_access_unit(db, owner, self.r1.id, "personal"))
+        self.assertTrue(can_perform_action(db, owner, Action.MODIFY_BILLING))
+
+        self.assertTrue(can_access_property(db, manager, self.rental.id))
+        self.assertFalse(can_access_property(db, manager, self.home.id))
+        self.assertTrue(can_access_property(db, manager, self.rental.id, "personal"))
+        self.assertTrue(can_access_unit(db, manager, self.r2.id, "personal"))
+        self.assertFalse(can_access_unit(db, manager, self.r1.id, "personal"))
+        self.assertEqual(get_manager_personal_mode_units(db, manager.id), [self.r2.id])
+        self.assertTrue(can_perform_action(db, manager, Action.VIEW_BILLING, property_id=self.rental.id))
+
+        self.assertTrue(can_perform_action(db, tenant, Action.SET_PRESENCE, unit_id=self.r1.id))
+        self.assertFalse(can_perform_action(db, tenant, Action.SET_PRESENCE, unit_id=self.r2.id))
+        self.assertTrue(can_access_property(db, tenant, self.rental.id))
+        self.assertFalse(can_access_unit(db, tenant, 10_000))
+
+    def test_repeated_checks_query_once_and_scope_writes_reload(self):
+        db, manager = self.db, self.manager
+        for _ in range(20):
+            can_access_property(db, manager, self.rental.id)
+            can_access_unit(db, manager, self.r1.id)
+            can_access_unit(db, manager, self.r2.id, "personal")
+        # managed properties, personal-mode units, and the property of each unit once
+        self.assertEqual(len(self.queries), 4)
+
+        db.add(PropertyManagerAssignment(property_id=self.home.id, user_id=manager.id))
+        db.flush()
+        self.assertTrue(can_access_property(db, manager, self.home.id))
+        db.rollback()
+        self.assertFalse(can_access_property(db, manager, self.home.id))
+
+
+if __name__ == "__main__":
+    unittest.main()
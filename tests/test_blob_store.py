@@ -0,0 +1,134 @@
+"""Content-addressed blob store for signed PDFs and ownership proofs."""
+import hashlib
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models.agreement_signature import AgreementSignature
+from app.services import blob_store
+from tests.support import DatabaseTestCase
+
+_MIGRATION = Path(__file__).resolve().parents[1] / "scripts" / "migrate_blobs_to_store.py"
+
+
+def _signature(**kw) -> AgreementSignature:
+    fields = dict(
+        invitation_code="INV-1",
+        region_code="FL",
+        guest_email="guest@example.com",
+        guest_full_name="Gina Guest",
+        typed_signature="Gina Guest",
+        acks_read=True,
+        acks_temporary=True,
+        acks_vacate=True,
+        acks_electronic=True,
+        document_id="doc",
+        document_title="Agreement",
+        document_hash="h",
+        document_content="content",
+    )
+    fields.update(kw)
+    return AgreementSignature(**fields)
+
+
+class TestBlobStore(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = blob_store.BlobStore(tmp.name)
+        patcher = mock.patch.object(blob_store, "_store", self.store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_put_is_content_addressed_and_idempotent(self):
+        data = b"%PDF-1.4 signed"
+        digest = self.store.put(data)
+        self.assertEqual(digest, hashlib.sha256(data).hexdigest())
+        self.assertEqual(self.store.put(data), digest)
+        path = self.store.path(digest)
+        self.assertEqual(path.relative_to(self.store.root).parts, (digest[:2], digest[2:4], digest))
+        self.assertEqual(self.store.get(digest), data)
+        self.assertEqual([p.name for p in path.parent.iterdir()], [digest])  # no temp files left behind
+        with self.assertRaises(ValueError):
+            self.store.path("../../etc/passwd")
+
+    def test_row_keeps_digest_and_loading_it_does_not_pull_bytes(self):
+        sig = _signature()
+        blob_store.store_blob(sig, "signed_pdf", b"%PDF new")
+        legacy = _signature(invitation_code="INV-2", signed_pdf_bytes=b"%PDF legacy")
+        self.db.add_all([sig, legacy, _signature(invitation_code="INV-3")])
+        self.db.commit()
+        self.db.expunge_all()
+
+        rows = {s.invitation_code: s for s in self.db.query(AgreementSignature).all()}
+        self.assertNotIn("signed_pdf_bytes", rows["INV-1"].__dict__)
+        self.assertNotIn("signed_pdf_bytes", rows["INV-2"].__dict__)
+        self.assertEqual(
+            {code: s.has_signed_pdf for code, s in rows.items()}, {"INV-1": True, "INV-2": True, "INV-3": False}
+        )
+        self.assertEqual(blob_store.read_blob(rows["INV-1"], "signed_pdf"), b"%PDF new")
+        self.assertEqual(blob_store.read_blob(rows["INV-2"], "signed_pdf"), b"%PDF legacy")
+        self.assertIsNone(blob_store.read_blob(rows["INV-3"], "signed_pdf"))
+
+        pending = self.db.query(AgreementSignature.invitation_code).filter(~AgreementSignature.has_signed_pdf).all()
+        self.assertEqual(pending, [("INV-3",)])
+
+    def test_download_supports_range_requests(self):
+        data = bytes(range(256)) * 40
+        sig = _signature()
+        blob_store.store_blob(sig, "signed_pdf", data)
+        self.db.add(sig)
+        self.db.commit()
+
+        api = FastAPI()
+
+        @api.get("/pdf/{signature_id}")
+        def pdf(signature_id: int, db: Session = Depends(get_db)):
+            row = db.query(AgreementSignature).filter(AgreementSignature.id == signature_id).first()
+            resp = blob_store.blob_response(row, "signed_pdf", media_type="application/pdf", filename="s.pdf")
+            if resp is None:
+                raise HTTPException(status_code=404)
+            return resp
+
+        api.dependency_overrides[get_db] = lambda: self.db
+        client = TestClient(api)
+
+        full = client.get(f"/pdf/{sig.id}")
+        self.assertEqual(full.status_code, 200)
+        self.assertEqual(full.content, data)
+        self.assertEqual(full.headers["content-disposition"], 'inline; filename="s.pdf"')
+        part = client.get(f"/pdf/{sig.id}", headers={"Range": "bytes=100-199"})
+        self.assertEqual(part.status_code, 206)
+        self.assertEqual(part.content, data[100:200])
+
+    def test_migration_moves_inline_bytes_to_the_store(self):
+        self.db.add_all([_signature(signed_pdf_bytes=b"%PDF one"), _signature(invitation_code="INV-2")])
+        self.db.commit()
+        spec = importlib.util.spec_from_file_location("migrate_blobs_to_store", _MIGRATION)
+        migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(migration)
+
+        with mock.patch("builtins.print"):
+            migration.migrate(self.engine)
+            migration.migrate(self.engine)
+
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                text("SELECT invitation_code, signed_pdf_sha256, signed_pdf_bytes FROM agreement_signatures ORDER BY id")
+            ).fetchall()
+        digest = hashlib.sha256(b"%PDF one").hexdigest()
+        self.assertEqual([tuple(r) for r in rows], [("INV-1", digest, None), ("INV-2", None, None)])
+        self.assertEqual(self.store.get(digest), b"%PDF one")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,313 @@
+"""Async CSV bulk upload: staged, chunked ingestion and the multi-row ledger writer it uses."""
+import time
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest import mock
+
+from app.config import get_settings
+from app.models.bulk_upload_job import BulkUploadJob, BulkUploadJobGroup
+from app.models.event_ledger import EventLedger
+from app.models.invitation import Invitation
+from app.models.owner import OwnerProfile, Property
+from app.models.unit import Unit
+from app.models.user import User, UserRole
+from app.routers import owners
+from app.routers.owners import (
+    _bulk_csv_chunk_groups,
+    _bulk_csv_prepare_rows,
+    _process_bulk_upload_background,
+    resume_orphaned_bulk_upload_jobs,
+)
+from app.services.event_ledger import (
+    ACTION_BULK_UPLOAD_PROPERTY_CREATED,
+    ACTION_BULK_UPLOAD_PROPERTY_UPDATED,
+    ACTION_INVITATION_CREATED_CSV,
+    create_ledger_event,
+    create_ledger_events,
+    ledger_batch,
+)
+from tests.support import DatabaseTestCase
+
+_HEADER = "Address,Unit,City,State,Zip,Occupied,Tenant Name,Lease Start,Lease End,Property Name,Tax ID"
+
+
+class TestBulkUploadPipeline(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.owner = self._user("owner@example.com")
+        # Billing already set up, so post-processing does not reach Stripe.
+        self.profile = OwnerProfile(user_id=self.owner.id, onboarding_billing_completed_at=datetime.now(timezone.utc))
+        self.db.add(self.profile)
+        self.db.flush()
+        self.existing = Property(
+            owner_profile_id=self.profile.id,
+            name="Harbor House",
+            street="9 Old Rd",
+            city="Tampa",
+            state="FL",
+            zip_code="33601",
+            region_code="FL",
+            owner_occupied=False,
+            occupancy_status="vacant",
+            tax_id="OLD",
+        )
+        self.db.add(self.existing)
+        self.db.commit()
+
+    def _run(self, lines: list[str]) -> BulkUploadJob:
+        csv_text = "\n".join([_HEADER, *lines])
+        self.db.add(BulkUploadJob(job_key="job", user_id=self.owner.id, csv_content=csv_text))
+        self.db.commit()
+        _process_bulk_upload_background("job", csv_text, self.owner.id, session_factory=self.Session)
+        self.db.expire_all()
+        return self.db.query(BulkUploadJob).filter(BulkUploadJob.job_key == "job").one()
+
+    def test_rows_ahead_of_first_invalid_row_are_ingested(self):
+        job = self._run(
+            [
+                "100 Main St,1A,Miami,FL,33101,YES,Ada Lovelace,2026-01-01,2026-12-31,,",
+                "100 Main St,1B,Miami,FL,33101,NO,,,,,",
+                "7 Lone Ln,,Orlando,FL,32801,YES,Grace Hopper,2026-02-01,2026-06-30,,",
+                "9 Old Rd,,Tampa,FL,33601,NO,,,,Harbor House,NEW",
+                "1 Broken Rd,,,FL,33101,NO,,,,,",
+                "2 Never Rd,,Miami,FL,33101,NO,,,,,",
+            ]
+        )
+        self.assertEqual(job.status, "completed")
+        self.assertEqual((job.total_rows, job.processed_rows), (6, 4))
+        self.assertEqual((job.created, job.updated, job.units_created), (2, 1, 2))
+        self.assertEqual(job.failed_from_row, 5)
+        self.assertEqual(job.failure_reason, "Missing required column: City.")
+
+        props = {p.street: p for p in self.db.query(Property).all()}
+        self.assertEqual(set(props), {"100 Main St", "7 Lone Ln", "9 Old Rd"})
+        self.assertTrue(props["100 Main St"].is_multi_unit)
+        self.assertEqual(props["9 Old Rd"].tax_id, "NEW")
+        self.assertTrue(all(p.live_slug and p.usat_token for p in props.values() if p.id != self.existing.id))
+        labels = {(u.property_id, u.unit_label) for u in self.db.query(Unit).all()}
+        self.assertEqual(
+            labels,
+            {(props["100 Main St"].id, "1A"), (props["100 Main St"].id, "1B"), (props["7 Lone Ln"].id, "1")},
+        )
+        invites = {(i.guest_name, i.property_id) for i in self.db.query(Invitation).all()}
+        self.assertEqual(
+            invites, {("Ada Lovelace", props["100 Main St"].id), ("Grace Hopper", props["7 Lone Ln"].id)}
+        )
+        actions = [r.action_type for r in self.db.query(EventLedger).all()]
+        self.assertEqual(actions.count(ACTION_BULK_UPLOAD_PROPERTY_CREATED), 2)
+        self.assertEqual(actions.count(ACTION_BULK_UPLOAD_PROPERTY_UPDATED), 1)
+        self.assertEqual(actions.count(ACTION_INVITATION_CREATED_CSV), 2)
+
+    def test_repeat_upload_does_not_duplicate_open_tenant_invites(self):
+        line = "9 Old Rd,,Tampa,FL,33601,YES,Ada Lovelace,2026-01-01,2026-12-31,Harbor House,OLD"
+        self._run([line])
+        self.db.query(BulkUploadJob).delete()
+        self.db.commit()
+        self._run([line])
+        self.assertEqual(self.db.query(Invitation).count(), 1)
+        self.assertEqual(self.db.query(Unit).filter(Unit.property_id == self.existing.id).count(), 1)
+
+    def test_chunks_keep_property_groups_whole(self):
+        lines = [f"{n % 3} Main St,{n},Miami,FL,33101,NO,,,,," for n in range(9)]
+        rows = [dict(zip(_HEADER.split(","), ln.split(","))) for ln in lines]
+        norm_to_orig = {h.strip().lower().replace(" ", "_"): h for h in _HEADER.split(",")}
+        prepared, failed_from_row, _ = _bulk_csv_prepare_rows(self.db, rows, norm_to_orig)
+        self.assertIsNone(failed_from_row)
+        chunks = _bulk_csv_chunk_groups(prepared, chunk_rows=4)
+        self.assertEqual([[len(g) for g in c] for c in chunks], [[3], [3], [3]])
+        for chunk in chunks:
+            for group in chunk:
+                self.assertEqual(len({r.key for r in group}), 1)
+                self.assertEqual([r.row_num for r in group], sorted(r.row_num for r in group))
+
+    def test_orphaned_job_resumes_from_committed_groups(self):
+        lines = [f"{n} Main St,,Miami,FL,33101,NO,,,,," for n in range(1, 6)]
+        real_ingest = owners._bulk_upload_ingest_groups
+
+        def crash_on_fourth_group(db, groups, **kw):
+            if any(r.street == "4 Main St" for g in groups for r in g):
+                raise RuntimeError("worker died")
+            return real_ingest(db, groups, **kw)
+
+        with mock.patch.object(get_settings(), "bulk_upload_chunk_rows", 1):
+            with mock.patch.object(owners, "_bulk_upload_ingest_groups", crash_on_fourth_group):
+                job = self._run(lines)
+            self.assertEqual(job.status, "failed")
+            self.assertEqual(self.db.query(BulkUploadJobGroup).count(), 3)
+            # As if the process died mid-run: still "processing", heartbeat long gone.
+            job.status = "processing"
+            job.heartbeat_at = datetime.now(timezone.utc) - timedelta(hours=1)
+            self.db.commit()
+            swept = resume_orphaned_bulk_upload_jobs(session_factory=self.Session, run_inline=True)
+
+        self.assertEqual(swept, {"resumed": 1, "failed": 0})
+        self.db.expire_all()
+        job = self.db.query(BulkUploadJob).filter(BulkUploadJob.job_key == "job").one()
+        self.assertEqual((job.status, job.processed_rows, job.created), ("completed", 5, 5))
+        self.assertEqual(job.attempts, 1)
+        streets = [p.street for p in self.db.query(Property).filter(Property.id != self.existing.id).all()]
+        self.assertEqual(sorted(streets), [f"{n} Main St" for n in range(1, 6)])
+
+    def test_chunk_committed_by_another_run_is_skipped(self):
+        real_ingest = owners._bulk_upload_ingest_groups
+
+        def raced(db, groups, **kw):
+            # Another run commits the same group's checkpoint while this one is ingesting it.
+            other = self.Session()
+            job_id = other.query(BulkUploadJob.id).filter(BulkUploadJob.job_key == "job").scalar()
+            key = owners._bulk_upload_group_hash(groups[0][0].key)
+            other.add(BulkUploadJobGroup(job_id=job_id, group_key=key, first_row=2, row_count=1))
+            other.commit()
+            other.close()
+            return real_ingest(db, groups, **kw)
+
+        with mock.patch.object(owners, "_bulk_upload_ingest_groups", raced):
+            job = self._run(["1 Main St,,Miami,FL,33101,NO,,,,,"])
+        self.assertEqual((job.status, job.created), ("completed", 0))
+        self.assertEqual(self.db.query(Property).count(), 1)
+        self.assertEqual(self.db.query(BulkUploadJobGroup).count(), 1)
+
+    def test_other_integrity_error_fails_the_job(self):
+        real_ingest = owners._bulk_upload_ingest_groups
+
+        def duplicate_user(db, groups, **kw):
+            out = real_ingest(db, groups, **kw)
+            db.add(User(email="owner@example.com", hashed_password="x", role=UserRole.owner))
+            return out
+
+        with mock.patch.object(owners, "_bulk_upload_ingest_groups", duplicate_user):
+            job = self._run(["1 Main St,,Miami,FL,33101,NO,,,,,"])
+        self.assertEqual(job.status, "failed")
+        self.assertEqual(self.db.query(BulkUploadJobGroup).count(), 0)
+        self.assertEqual(self.db.query(Property).count(), 1)
+
+    def test_run_stops_once_another_run_takes_the_job_over(self):
+        lines = [f"{n} Main St,,Miami,FL,33101,NO,,,,," for n in range(1, 4)]
+        real_ingest = owners._bulk_upload_ingest_groups
+
+        def swept_during_second_chunk(db, groups, **kw):
+            if any(r.street == "2 Main St" for g in groups for r in g):
+                # A sweep claims the job while this chunk is still running.
+                db.query(BulkUploadJob).update({BulkUploadJob.attempts: BulkUploadJob.attempts + 1})
+            return real_ingest(db, groups, **kw)
+
+        with mock.patch.object(get_settings(), "bulk_upload_chunk_rows", 1):
+            with mock.patch.object(owners, "_bulk_upload_ingest_groups", swept_during_second_chunk):
+                job = self._run(lines)
+
+        # The old run wrote progress for its first chunk only and left the job to the run that took it over.
+        self.assertEqual((job.status, job.attempts, job.processed_rows, job.created), ("processing", 1, 1, 1))
+        self.assertIsNone(job.error_message)
+        self.assertEqual(self.db.query(BulkUploadJobGroup).count(), 2)
+
+    def test_heartbeat_is_refreshed_while_a_chunk_runs(self):
+        stale = datetime.now(timezone.utc) - timedelta(hours=1)
+        job = BulkUploadJob(job_key="slow", user_id=self.owner.id, csv_content="x", attempts=2, heartbeat_at=stale)
+        self.db.add(job)
+        self.db.commit()
+        bind = SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+        with mock.patch.object(get_settings(), "bulk_upload_heartbeat_seconds", 0.05):
+            with owners._bulk_upload_heartbeat(self.Session, bind, job.id, 2):
+                time.sleep(0.3)  # one slow chunk
+        self.db.expire_all()
+        self.assertFalse(owners._bulk_upload_job_is_stale(job, datetime.now(timezone.utc)))
+        # A run that lost its lease no longer beats for the job.
+        self.assertFalse(owners._bulk_upload_job_progress(self.db, job.id, 1, heartbeat_at=stale))
+
+    def test_sweep_skips_live_jobs_and_fails_exhausted_ones(self):
+        now = datetime.now(timezone.utc)
+        self.db.add_all(
+            [
+                BulkUploadJob(job_key="live", user_id=self.owner.id, csv_content="x", attempts=1, heartbeat_at=now),
+                BulkUploadJob(
+                    job_key="spent",
+                    user_id=self.owner.id,
+                    csv_content="x",
+                    attempts=get_settings().bulk_upload_max_attempts,
+                    heartbeat_at=now - timedelta(hours=1),
+                ),
+            ]
+        )
+        self.db.commit()
+        swept = resume_orphaned_bulk_upload_jobs(session_factory=self.Session, run_inline=True)
+        self.assertEqual(swept, {"resumed": 0, "failed": 1})
+        self.db.expire_all()
+        status = {j.job_key: j.status for j in self.db.query(BulkUploadJob).all()}
+        self.assertEqual(status, {"live": "processing", "spent": "failed"})
+
+
+class TestCreateLedgerEvents(DatabaseTestCase):
+    session_options = {}
+
+    def setUp(self):
+        super().setUp()
+        owner = self._user("owner@example.com")
+        profile = OwnerProfile(user_id=owner.id)
+        self.db.add(profile)
+        self.db.flush()
+        common = dict(owner_profile_id=profile.id, city="Tampa", state="FL", region_code="FL", owner_occupied=False)
+        self.active = Property(name="Maple Court", street="12 Harbor Rd", **common)
+        self.inactive = Property(name="Gone", street="1 Gone Rd", deleted_at=datetime.now(timezone.utc), **common)
+        self.db.add_all([self.active, self.inactive])
+        self.db.commit()
+
+    def test_matches_single_event_writer_and_skips_inactive_properties(self):
+        kwargs = dict(
+            target_object_type="Property",
+            property_id=self.active.id,
+            meta={"message": "CSV bulk upload", "when": date(2026, 1, 1)},
+        )
+        single = create_ledger_event(self.db, ACTION_BULK_UPLOAD_PROPERTY_CREATED, **kwargs)
+        batch = create_ledger_events(
+            self.db,
+            [
+                dict(action_type=ACTION_BULK_UPLOAD_PROPERTY_CREATED, **kwargs),
+                dict(action_type=ACTION_BULK_UPLOAD_PROPERTY_CREATED, property_id=self.inactive.id),
+                dict(action_type=ACTION_BULK_UPLOAD_PROPERTY_UPDATED),
+            ],
+        )
+        self.db.commit()
+        self.assertIsNone(batch[1])
+        self.assertEqual(
+            (batch[0].action_type, batch[0].meta, batch[0].search_text),
+            (single.action_type, single.meta, single.search_text),
+        )
+        self.assertIsNotNone(batch[2].id)
+        self.assertEqual(self.db.query(EventLedger).count(), 3)
+
+    def test_single_event_looks_up_its_property_once(self):
+        active_id = self.active.id
+        statements = self.capture_statements()
+        row = create_ledger_event(self.db, ACTION_BULK_UPLOAD_PROPERTY_UPDATED, property_id=active_id)
+        # Managed-property check and search address come from the same query.
+        self.assertEqual(sum(1 for s in statements if "FROM properties" in s), 1)
+        self.assertIn("12 harbor rd", row.search_text)
+
+    def test_ledger_batch_resolves_each_property_once_and_inserts_on_commit(self):
+        active_id, inactive_id = self.active.id, self.inactive.id
+        single = create_ledger_event(
+            self.db, ACTION_BULK_UPLOAD_PROPERTY_UPDATED, property_id=active_id, meta={"row": 0}
+        )
+        self.db.commit()
+        statements = self.capture_statements()
+
+        with ledger_batch(self.db):
+            for i in range(20):
+                create_ledger_event(self.db, ACTION_BULK_UPLOAD_PROPERTY_UPDATED, property_id=active_id, meta={"row": i})
+                self.assertIsNone(
+                    create_ledger_event(self.db, ACTION_BULK_UPLOAD_PROPERTY_UPDATED, property_id=inactive_id)
+                )
+            self.assertFalse([s for s in statements if "event_ledger" in s])  # queued, nothing written yet
+            self.db.commit()
+            create_ledger_event(self.db, ACTION_BULK_UPLOAD_PROPERTY_UPDATED, property_id=active_id)
+            self.db.rollback()  # the queued event goes with the transaction, as a flushed one would
+
+        self.assertEqual(sum(1 for s in statements if "FROM properties" in s), 2)  # one lookup per property
+        rows = self.db.query(EventLedger).filter(EventLedger.id != single.id).order_by(EventLedger.id).all()
+        self.assertEqual([r.meta for r in rows], [{"row": i} for i in range(20)])
+        self.assertEqual(rows[0].search_text, single.search_text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+"""GET /dashboard/alerts scoping in SQL (full keyset pages) and the per-user unread alert counter."""
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from unittest import mock
+
+from fastapi import Response
+from app.config import get_settings
+from app.models.dashboard_alert import DashboardAlert
+from app.models.guest import PurposeOfStay, RelationshipToOwner
+from app.models.invitation import Invitation
+from app.models.owner import OwnerProfile, Property
+from app.models.property_manager_assignment import PropertyManagerAssignment
+from app.models.resident_mode import ResidentMode, ResidentModeType
+from app.models.stay import Stay
+from app.models.unit import Unit
+from app.models.user import UserRole
+from app.models.user_alert_counter import UserAlertCounter
+from app.routers import dashboard
+from app.services.dashboard_alerts import create_dashboard_alert, get_unread_alert_count
+from app.services.permissions import (
+    invitation_in_owner_personal_guest_scope,
+    personal_guest_scope_invitation_ids,
+    personal_guest_scope_stay_ids,
+    stay_in_owner_personal_guest_scope,
+)
+from tests.support import DatabaseTestCase
+
+
+class TestDashboardAlertsFeed(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        db = self.db
+        self.owner = self._user("owner@example.com", UserRole.owner)
+        self.manager = self._user("manager@example.com", UserRole.property_manager)
+        tenant = self._user("tenant@example.com", UserRole.tenant)
+        guest = self._user("guest@example.com", UserRole.guest)
+        profile = OwnerProfile(user_id=self.owner.id)
+        db.add(profile)
+        db.flush()
+
+        def prop(name, **kw):
+            p = Property(owner_profile_id=profile.id, name=name, street="1 Main", city="Tampa", state="FL",
+                         region_code="FL", **kw)
+            db.add(p)
+            db.flush()
+            return p
+
+        home = prop("Home", owner_occupied=True)
+        rental = prop("Rental", owner_occupied=False)
+        gone = prop("Gone", owner_occupied=False, deleted_at=datetime.now(timezone.utc))
+        home_unit = Unit(property_id=home.id, unit_label="1")
+        r1, r2 = Unit(property_id=rental.id, unit_label="1"), Unit(property_id=rental.id, unit_label="2")
+        db.add_all([home_unit, r1, r2])
+        db.flush()
+        db.add(PropertyManagerAssignment(property_id=rental.id, user_id=self.manager.id))
+        db.add(ResidentMode(user_id=self.manager.id, unit_id=r2.id, mode=ResidentModeType.manager_personal))
+        today = date.today()
+
+        def invitation(code, p, inviter, unit=None):
+            inv = Invitation(invitation_code=code, owner_id=self.owner.id, property_id=p.id, unit_id=unit.id if unit else None,
+                             invited_by_user_id=inviter.id, stay_start_date=today, stay_end_date=today + timedelta(days=5),
+                             purpose_of_stay=PurposeOfStay.personal, relationship_to_owner=RelationshipToOwner.friend,
+                             region_code="FL")
+            db.add(inv)
+            db.flush()
+            return inv
+
+        def stay(p, inv=None, unit=None, inviter=None):
+            s = Stay(guest_id=guest.id, owner_id=self.owner.id, property_id=p.id, unit_id=unit.id if unit else None,
+                     invitation_id=inv.id if inv else None, invited_by_user_id=(inviter or self.owner).id,
+                     stay_start_date=today, stay_end_date=today + timedelta(days=5), intended_stay_duration_days=5,
+                     purpose_of_stay=PurposeOfStay.personal, relationship_to_owner=RelationshipToOwner.friend,
+                     region_code="FL")
+            db.add(s)
+            db.flush()
+            return s
+
+        home_inv = invitation("HOME", home, self.owner)
+        r1_inv = invitation("R1", rental, self.owner, r1)
+        r2_inv = invitation("R2", rental, self.manager, r2)
+        tenant_inv = invitation("TEN", rental, tenant, r1)
+        rental_inv = invitation("RENT", rental, self.owner)  # no unit on a multi-unit property
+        self.invitations = [home_inv, r1_inv, r2_inv, tenant_inv, rental_inv]
+        home_stay = stay(home, home_inv)
+        bare_home_stay = stay(home)
+        r2_stay = stay(rental, r2_inv, r2, self.manager)
+        tenant_stay = stay(rental, tenant_inv, inviter=tenant)
+        rental_stay = stay(rental, rental_inv)
+        self.stays = [home_stay, bare_home_stay, r2_stay, tenant_stay, rental_stay]
+        self.unit_sets = [{home_unit.id}, {r2.id}, {r1.id, r2.id}, {home_unit.id, r1.id}]
+
+        base = datetime(2026, 3, 1, 12, 0, 0)
+        self.names: dict[int, str] = {}
+        specs = [
+            ("billing", None, {}),
+            ("shield_on-home", "shield_on", dict(property_id=home.id)),
+            ("shield_on-gone", "shield_on", dict(property_id=gone.id)),
+            ("expired-home-inv", "invitation_expired", dict(property_id=home.id, invitation_id=home_inv.id)),
+            ("overstay-home-stay", "overstay", dict(property_id=home.id, stay_id=home_stay.id)),
+            ("overstay-bare-home-stay", "overstay", dict(property_id=home.id, stay_id=bare_home_stay.id)),
+            ("expired-r1", "invitation_expired", dict(property_id=rental.id, invitation_id=r1_inv.id)),
+            ("dms-r2", "dms_48h", dict(property_id=rental.id, stay_id=r2_stay.id, invitation_id=r2_inv.id)),
+            ("expired-tenant", "invitation_expired", dict(property_id=rental.id, invitation_id=tenant_inv.id)),
+            ("overstay-tenant", "overstay", dict(property_id=rental.id, stay_id=tenant_stay.id)),
+            ("overstay-rental", "overstay", dict(property_id=rental.id, stay_id=rental_stay.id)),
+            ("transfer", "property_transfer_completed", dict(property_id=rental.id)),
+        ]
+        for user in (self.owner, self.manager):
+            for i, (name, alert_type, kw) in enumerate(specs):
+                a = DashboardAlert(user_id=user.id, alert_type=alert_type or "vacant_monitoring", title=name,
+                                   message=name, created_at=base + timedelta(minutes=i // 2), **kw)
+                db.add(a)
+                db.flush()
+                self.names[a.id] = name
+        db.commit()
+
+    def _feed(self, user, mode, limit=100):
+        names, cursor = [], None
+        while True:
+            response = Response()
+            page = dashboard.list_alerts(response, limit=limit, cursor=cursor, db=self.db, current_user=user,
+                                         context_mode=mode)
+            names.append([self.names[a.id] for a in page])
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                return names
+
+    def test_personal_scope_sql_matches_python_checks(self):
+        for units in self.unit_sets:
+            with self.subTest(units=units):
+                inv_ids = {r[0] for r in self.db.execute(personal_guest_scope_invitation_ids(units))}
+                stay_ids = {r[0] for r in self.db.execute(personal_guest_scope_stay_ids(units))}
+                self.assertEqual(
+                    inv_ids,
+                    {i.id for i in self.invitations if invitation_in_owner_personal_guest_scope(self.db, i, units)},
+                )
+                self.assertEqual(
+                    stay_ids, {s.id for s in self.stays if stay_in_owner_personal_guest_scope(self.db, s, units)}
+                )
+
+    def test_scoping_applies_before_the_limit(self):
+        owner_business = ["transfer", "overstay-rental", "dms-r2", "expired-r1", "overstay-bare-home-stay",
+                          "overstay-home-stay", "expired-home-inv", "shield_on-home", "billing"]
+        self.assertEqual(self._feed(self.owner, "business"), [owner_business])
+        pages = self._feed(self.owner, "business", limit=4)
+        self.assertEqual([len(p) for p in pages], [4, 4, 1])
+        self.assertEqual([n for p in pages for n in p], owner_business)
+
+        self.assertEqual(
+            self._feed(self.owner, "personal"),
+            [["transfer", "overstay-bare-home-stay", "overstay-home-stay", "expired-home-inv"]],
+        )
+        self.assertEqual(
+            self._feed(self.manager, "business"),
+            [["transfer", "overstay-rental", "dms-r2", "expired-r1", "billing"]],
+        )
+        self.assertEqual(self._feed(self.manager, "personal", limit=1), [["transfer"], ["dms-r2"]])
+
+    def test_unread_counter_tracks_alert_writes(self):
+        user_id = self.owner.id
+        self.assertEqual(get_unread_alert_count(self.db, user_id), 9)  # the owner's business feed
+        create_dashboard_alert(self.db, user_id, "shield_on", "Shield on", "Shield on")
+        self.db.commit()
+        alert_id = next(i for i, n in self.names.items() if n == "billing" and
+                        self.db.get(DashboardAlert, i).user_id == user_id)
+        dashboard.mark_alert_read(alert_id, db=self.db, current_user=self.owner)
+        dashboard.mark_alert_read(alert_id, db=self.db, current_user=self.owner)  # already read: no double count
+        self.assertEqual(dashboard.unread_alert_count(db=self.db, current_user=self.owner).unread_count, 9)
+
+        # Drift (e.g. rows removed outside the app) is corrected by the periodic recount.
+        self.db.query(DashboardAlert).filter(DashboardAlert.user_id == user_id, DashboardAlert.title == "transfer").delete()
+        self.db.commit()
+        self.assertEqual(get_unread_alert_count(self.db, user_id), 9)
+        with mock.patch.object(get_settings(), "dashboard_alert_unread_reconcile_seconds", 0):
+            self.assertEqual(get_unread_alert_count(self.db, user_id), 8)
+        self.assertEqual(self.db.get(UserAlertCounter, user_id).unread_count, 8)
+
+    def test_unread_counter_only_counts_alerts_the_feed_shows(self):
+        for user in (self.owner, self.manager):
+            shown = {n for page in self._feed(user, "business") + self._feed(user, "personal") for n in page}
+            self.assertEqual(get_unread_alert_count(self.db, user.id), len(shown))
+
+        manager_id = self.manager.id
+        tenant_alert = self.db.query(DashboardAlert).filter(
+            DashboardAlert.user_id == manager_id, DashboardAlert.title == "expired-tenant"
+        ).one()
+        # Hidden by role (a tenant-only type) and by tenant lane: neither counts, and marking them read changes nothing.
+        hidden = create_dashboard_alert(self.db, manager_id, "guest_extension_request", "Extension", "Extension")
+        self.db.commit()
+        self.assertEqual(get_unread_alert_count(self.db, manager_id), 5)
+        for alert_id in (hidden.id, tenant_alert.id):
+            dashboard.mark_alert_read(alert_id, db=self.db, current_user=self.manager)
+        self.assertEqual(get_unread_alert_count(self.db, manager_id), 5)
+
+        # Reading every alert the feed shows clears the badge.
+        visible = [a.id for a in dashboard.list_alerts(Response(), cursor=None, db=self.db, current_user=self.manager,
+                                                       context_mode="business")]
+        for alert_id in visible:
+            dashboard.mark_alert_read(alert_id, db=self.db, current_user=self.manager)
+        self.assertEqual(dashboard.unread_alert_count(db=self.db, current_user=self.manager).unread_count, 0)
+        with mock.patch.object(get_settings(), "dashboard_alert_unread_reconcile_seconds", 0):
+            self.assertEqual(get_unread_alert_count(self.db, manager_id), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,223 @@
+"""Outbound email dispatcher: persisted queue, batched delivery, retry with backoff; Mailgun batch payload."""
+import json
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+from urllib.parse import parse_qs
+
+import httpx
+
+from app.config import get_settings
+from app.models.notification_attempt import NotificationAttempt
+from app.services import notifications
+from app.services.email_dispatcher import EmailDispatcher, OutboundEmail, purge_notification_attempts, retry_delay
+from app.services.notifications import EmailSendResult
+from tests.support import DatabaseTestCase
+
+
+class TestEmailDispatcher(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.calls: list[tuple[list[str], str]] = []
+        self.results: list[EmailSendResult] = []
+
+    def _deliver(self, recipients, subject, html, text=None):
+        self.calls.append((list(recipients), subject))
+        return self.results.pop(0) if self.results else EmailSendResult(True)
+
+    def _dispatcher(self, **settings) -> EmailDispatcher:
+        with mock.patch.multiple(get_settings(), email_poll_seconds=15.0, **settings):
+            return EmailDispatcher(session_factory=self.Session, deliver=self._deliver, batch_limit=lambda: 1000)
+
+    def _rows(self) -> list[NotificationAttempt]:
+        self.db.expire_all()
+        return self.db.query(NotificationAttempt).order_by(NotificationAttempt.id).all()
+
+    def test_identical_messages_share_one_provider_call(self):
+        d = self._dispatcher()
+        notice = dict(subject="Status confirmation", html="<p>Vacant or occupied?</p>")
+        d.dispatch(
+            [
+                OutboundEmail("pm1@example.com", **notice),
+                OutboundEmail("pm2@example.com", **notice),
+                OutboundEmail("owner@example.com", "Welcome", "<p>Hi</p>"),
+                OutboundEmail("PM1@example.com", **notice),
+            ]
+        )
+        self.assertEqual(
+            self.calls,
+            [
+                (["pm1@example.com", "pm2@example.com"], "Status confirmation"),
+                (["PM1@example.com"], "Status confirmation"),
+                (["owner@example.com"], "Welcome"),
+            ],
+        )
+        rows = self._rows()
+        self.assertEqual([(r.channel, r.status, r.success, r.attempt_count) for r in rows], [("email", "sent", True, 1)] * 4)
+        self.assertTrue(all(r.dashboard_alert_id is None and r.sent_at for r in rows))
+
+    def test_transient_failures_retry_with_backoff_then_give_up(self):
+        d = self._dispatcher(email_max_attempts=3, email_retry_base_seconds=30)
+        self.results = [EmailSendResult(False, retryable=True, error="Mailgun 503")]
+        d.dispatch([OutboundEmail("a@example.com", "S", "<p>x</p>")])
+        (row,) = self._rows()
+        self.assertEqual((row.status, row.attempt_count, row.error_message), ("retry", 1, "Mailgun 503"))
+        # Not due yet.
+        self.assertEqual(d.send_due(), 0)
+
+        self.results = [EmailSendResult(False, retryable=True, error="timeout")]
+        row.next_attempt_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        self.db.commit()
+        self.assertEqual(d.send_due(), 1)
+        (row,) = self._rows()
+        self.assertEqual((row.status, row.attempt_count), ("retry", 2))
+
+        self.results = [EmailSendResult(False, retryable=True, error="timeout")]
+        row.next_attempt_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        self.db.commit()
+        d.send_due()
+        (row,) = self._rows()
+        self.assertEqual((row.status, row.attempt_count, row.success, row.next_attempt_at), ("failed", 3, False, None))
+        self.assertEqual(len(self.calls), 3)
+        self.assertEqual([retry_delay(n, 30).total_seconds() for n in (1, 2, 3)], [30, 60, 120])
+        self.assertEqual(retry_delay(20, 30), timedelta(hours=1))
+
+    def test_permanent_failure_is_not_retried(self):
+        d = self._dispatcher()
+        self.results = [EmailSendResult(False, retryable=False, error="Mailgun 400")]
+        d.dispatch([OutboundEmail("bad@", "S", "<p>x</p>")])
+        (row,) = self._rows()
+        self.assertEqual((row.status, row.attempt_count), ("failed", 1))
+
+    def test_full_queue_leaves_overflow_to_the_sweep(self):
+        d = self._dispatcher(email_queue_maxsize=1)
+        self.assertTrue(d.enqueue(OutboundEmail("a@example.com", "S", "<p>x</p>")))
+        self.assertTrue(d.enqueue(OutboundEmail("b@example.com", "S", "<p>x</p>")))
+        self.assertEqual([(r.recipient, r.status) for r in self._rows()], [("a@example.com", "sending"), ("b@example.com", "queued")])
+        self.assertEqual(d.send_due(), 1)
+        # Stopping releases what is still queued in memory to the next sweep instead of waiting out its lease.
+        d.stop()
+        rows = self._rows()
+        self.assertEqual([(r.recipient, r.status) for r in rows], [("a@example.com", "queued"), ("b@example.com", "sent")])
+        self.assertEqual(self.calls, [(["b@example.com"], "S")])
+
+    def test_enqueued_message_is_persisted_before_the_worker_takes_it(self):
+        d = self._dispatcher()
+        self.assertTrue(d.enqueue(OutboundEmail("invite@example.com", "Invitation", "<p>Join</p>")))
+        self.assertEqual(d.send_queued(d._take(block=False)), 1)
+        self.db.query(NotificationAttempt).delete()
+        self.db.commit()
+        self.calls.clear()
+
+        self.assertTrue(d.enqueue(OutboundEmail("code@example.com", "Your code", "<p>123456</p>")))
+        (row,) = self._rows()
+        self.assertEqual((row.status, row.attempt_count), ("sending", 0))
+        # The process dies with the id still in memory: once the lease runs out another process's sweep sends it.
+        row.next_attempt_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        self.db.commit()
+        self.assertEqual(self._dispatcher().send_due(), 1)
+        # The original worker, had it survived, no longer holds the row and does not send it again.
+        self.assertEqual(d.send_queued(d._take(block=False)), 0)
+        self.assertEqual(self.calls, [(["code@example.com"], "Your code")])
+        self.assertEqual(self._rows()[0].status, "sent")
+
+    def test_expired_lease_is_resent_but_live_lease_is_not(self):
+        d = self._dispatcher()
+        now = datetime.now(timezone.utc)
+        self.db.add_all(
+            [
+                NotificationAttempt(channel="email", success=False, status="sending", recipient="live@example.com",
+                                    subject="S", body_html="x", next_attempt_at=now + timedelta(minutes=4)),
+                NotificationAttempt(channel="email", success=False, status="sending", recipient="dead@example.com",
+                                    subject="S", body_html="x", next_attempt_at=now - timedelta(minutes=1)),
+            ]
+        )
+        self.db.commit()
+        self.assertEqual(d.send_due(), 1)
+        self.assertEqual(self.calls, [(["dead@example.com"], "S")])
+
+
+    def test_bodies_are_cleared_once_a_row_is_sent_or_failed(self):
+        d = self._dispatcher(email_max_attempts=2)
+        self.results = [
+            EmailSendResult(True),
+            EmailSendResult(False, retryable=True, error="Mailgun 503"),
+            EmailSendResult(False, retryable=False, error="Mailgun 400"),
+        ]
+        d.dispatch(
+            [
+                OutboundEmail("reset@example.com", "Reset", "<a href='/reset?t=secret'>Reset</a>", "secret"),
+                OutboundEmail("retry@example.com", "Code", "<p>123456</p>"),
+                OutboundEmail("bad@", "Code 2", "<p>654321</p>"),
+            ]
+        )
+        rows = {r.recipient: r for r in self._rows()}
+        for recipient in ("reset@example.com", "bad@"):
+            row = rows[recipient]
+            self.assertEqual((row.subject, row.body_html, row.body_text), (None, None, None))
+        self.assertEqual((rows["reset@example.com"].status, rows["bad@"].status), ("sent", "failed"))
+        # A row that will be retried still needs its message.
+        self.assertEqual((rows["retry@example.com"].status, rows["retry@example.com"].body_html), ("retry", "<p>123456</p>"))
+
+    def test_purge_deletes_old_terminal_rows_and_scrubs_the_rest(self):
+        now = datetime.now(timezone.utc)
+        old = now - timedelta(days=31)
+
+        def row(status, created_at, channel="email", **fields):
+            return NotificationAttempt(channel=channel, success=status == "sent", status=status, created_at=created_at,
+                                       recipient="a@example.com", **fields)
+
+        self.db.add_all(
+            [
+                row("sent", old),
+                row("failed", old),
+                row("retry", old, subject="S", body_html="x"),
+                row("sent", now, subject="S", body_html="<p>123456</p>", body_text="123456"),
+                row(None, old, channel="sms"),  # alert-log row
+            ]
+        )
+        self.db.commit()
+        with mock.patch.object(get_settings(), "email_attempt_retention_days", 30):
+            self.assertEqual(purge_notification_attempts(self.db, now=now), {"deleted": 2, "scrubbed": 1})
+        rows = self._rows()
+        self.assertEqual([(r.channel, r.status) for r in rows], [("email", "retry"), ("email", "sent"), ("sms", None)])
+        self.assertEqual(rows[0].body_html, "x")
+        self.assertEqual((rows[1].subject, rows[1].body_html, rows[1].body_text), (None, None, None))
+
+
+class TestMailgunTransport(unittest.TestCase):
+    def setUp(self):
+        self.requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return httpx.Response(200, json={"id": "<msg@mg.example.com>"})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        self.addCleanup(client.close)
+        patches = [
+            mock.patch.object(notifications, "_http_client", client),
+            mock.patch.multiple(get_settings(), mailgun_api_key="key", mailgun_domain="mg.example.com", mailgun_base_url="https://api.mailgun.net"),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_batch_sends_individual_copies_over_the_shared_client(self):
+        result = notifications.deliver_email_batch(["a@example.com", "b@example.com"], "S", "<p>x</p>")
+        self.assertTrue(result.ok)
+        (req,) = self.requests
+        form = parse_qs(req.content.decode())
+        self.assertEqual(form["to"], ["a@example.com", "b@example.com"])
+        self.assertEqual(json.loads(form["recipient-variables"][0]), {"a@example.com": {}, "b@example.com": {}})
+        self.assertEqual(form["from"], ["DocuStay <noreply@mg.example.com>"])
+        self.assertEqual(notifications.email_batch_limit(), notifications.MAILGUN_BATCH_MAX)
+
+    def test_send_email_is_inline_without_a_running_dispatcher(self):
+        self.assertTrue(notifications.send_email("a@example.com", "S", "<p>x</p>"))
+        (req,) = self.requests
+        self.assertNotIn("recipient-variables", parse_qs(req.content.decode()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""Endpoint benchmark harness (scripts/benchmark_endpoints.py): deterministic portfolio, query counts, baseline diff."""
+import importlib.util
+import sys
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+from sqlalchemy.orm import sessionmaker
+
+from app import database
+from app.config import get_settings
+from tests.support import memory_engine
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "benchmark_endpoints.py"
+_spec = importlib.util.spec_from_file_location("benchmark_endpoints", _SCRIPT)
+bench = sys.modules[_spec.name] = importlib.util.module_from_spec(_spec)  # dataclasses resolve via sys.modules
+_spec.loader.exec_module(bench)
+
+
+class TestEndpointBenchmark(unittest.TestCase):
+    def _database(self):
+        engine = memory_engine(create_tables=False)
+        bench.prepare_database(engine)
+        return engine, sessionmaker(bind=engine, autoflush=False)
+
+    def _portfolio(self, factory, seed=42):
+        with factory() as db:
+            return bench.generate_portfolio(db, scale=1, seed=seed, today=date(2026, 3, 1))
+
+    def test_generator_is_deterministic(self):
+        first = self._portfolio(self._database()[1])
+        again = self._portfolio(self._database()[1])
+        self.assertEqual((first.digest, first.counts), (again.digest, again.counts))
+        self.assertEqual(first.counts["properties"], bench.OWNERS * bench.PROPERTIES_PER_OWNER)
+        self.assertEqual(first.counts["ledger_events"], first.counts["properties"] * bench.LEDGER_EVENTS_PER_PROPERTY)
+        self.assertNotEqual(self._portfolio(self._database()[1], seed=7).digest, first.digest)
+
+    def test_run_records_every_case_and_flags_regressions(self):
+        _engine, factory = self._database()
+        portfolio = self._portfolio(factory)
+        with mock.patch.object(database, "SessionLocal", factory), \
+                mock.patch.object(get_settings(), "mailgun_api_key", ""), \
+                mock.patch.object(get_settings(), "sendgrid_api_key", ""):
+            results = bench.run_benchmarks(portfolio, repeat=1)
+
+        self.assertEqual(set(results), {name for name, *_ in bench._cases(portfolio)} | {"stay_notification_job"})
+        self.assertTrue(all(r["queries"] > 0 for r in results.values()))
+        self.assertEqual(results["manager_properties"]["rows"], bench.PROPERTIES_PER_OWNER // 2)
+
+        self.assertEqual(bench.compare(results, results), [])
+        baseline = {name: dict(r) for name, r in results.items()}
+        baseline["owner_properties"]["queries"] -= 1
+        baseline["public_live"]["ms"] = 0.001
+        regressions = bench.compare(results, baseline, min_ms=0.0)
+        self.assertEqual([line.split(":")[0] for line in regressions], ["owner_properties", "public_live"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Tests for the process-wide jurisdiction SOT cache (jurisdiction_sot.py)."""
+import unittest
+
+from app.seed import seed_jurisdiction_sot
+from app.services.jurisdiction_sot import (
+    get_jurisdiction_cache_stats,
+    get_jurisdiction_for_property,
+    get_jurisdiction_for_region,
+    invalidate_jurisdiction_cache,
+    warm_jurisdiction_cache,
+)
+from tests.support import DatabaseTestCase
+
+
+class TestJurisdictionSotCache(DatabaseTestCase):
+    session_options = {}
+
+    def setUp(self) -> None:
+        super().setUp()
+        invalidate_jurisdiction_cache()
+        self.addCleanup(invalidate_jurisdiction_cache)
+
+    def test_lookups_after_warm_issue_no_queries(self) -> None:
+        db = self.db
+        seed_jurisdiction_sot(db)
+        self.assertEqual(warm_jurisdiction_cache(db), 50)
+        statements = self.capture_statements()
+        for _ in range(20):
+            self.assertEqual(get_jurisdiction_for_region(db, "ca").name, "California")
+            self.assertEqual(get_jurisdiction_for_property(db, "10001-1234", None).region_code, "NY")
+        self.assertEqual(statements, [])
+        ca = get_jurisdiction_for_region(db, "CA")
+        self.assertEqual([s.citation for s in ca.statutes][0], "CA Civil Code § 1940.1, AB 1482")
+        self.assertIsNone(get_jurisdiction_for_region(db, "ZZ"))
+        self.assertIsNone(get_jurisdiction_for_property(db, "00000", None))
+
+    def test_first_lookup_warms_and_counts_hits_and_misses(self) -> None:
+        db = self.db
+        seed_jurisdiction_sot(db)
+        before = get_jurisdiction_cache_stats()
+        self.assertFalse(before["warm"])
+        get_jurisdiction_for_region(db, "TX")
+        get_jurisdiction_for_region(db, "FL")
+        stats = get_jurisdiction_cache_stats()
+        self.assertTrue(stats["warm"])
+        self.assertEqual(stats["misses"] - before["misses"], 1)
+        self.assertEqual(stats["hits"] - before["hits"], 1)
+
+    def test_invalidate_bumps_version_and_drops_entries(self) -> None:
+        seed_jurisdiction_sot(self.db)
+        warm_jurisdiction_cache(self.db)
+        version = get_jurisdiction_cache_stats()["version"]
+        invalidate_jurisdiction_cache()
+        stats = get_jurisdiction_cache_stats()
+        self.assertEqual(stats["version"], version + 1)
+        self.assertFalse(stats["warm"])
+
+    def test_empty_sot_is_not_cached(self) -> None:
+        db = self.db
+        self.assertIsNone(get_jurisdiction_for_region(db, "CA"))
+        self.assertFalse(get_jurisdiction_cache_stats()["warm"])
+        seed_jurisdiction_sot(db)
+        self.assertEqual(get_jurisdiction_for_region(db, "CA").region_code, "CA")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,265 @@
+"""Keyset pagination over EventLedger and the SQL form of the owner/manager ledger privacy filters."""
+import json
+import unittest
+from datetime import date, datetime, timedelta, timezone
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.database import get_db
+from app.models.event_ledger import EventLedger
+from app.models.guest import PurposeOfStay, RelationshipToOwner
+from app.models.invitation import Invitation
+from app.models.owner import OwnerProfile, Property
+from app.models.stay import Stay
+from app.models.tenant_assignment import TenantAssignment
+from app.models.unit import Unit
+from app.models.user import User, UserRole
+from app.routers import dashboard
+from app.services.auth import create_access_token
+from app.services.event_ledger import ACTION_PRESENCE_STATUS_CHANGED, ACTION_PROPERTY_UPDATED
+from app.services.ledger_pagination import (
+    InvalidLedgerCursor,
+    decode_ledger_cursor,
+    encode_ledger_cursor,
+    fetch_ledger_page,
+    iter_ledger_batches,
+)
+from app.services.privacy_lanes import (
+    filter_manager_presence_on_tenant_leased_units,
+    filter_tenant_lane_from_ledger_rows,
+    filter_tenant_presence_from_owner_manager_ledger,
+    manager_leased_unit_presence_exclusion_clause,
+    tenant_lane_ledger_exclusion_clause,
+    tenant_presence_ledger_exclusion_clause,
+)
+from tests.support import DatabaseTestCase
+
+
+class TestLedgerKeysetPagination(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        base = datetime(2026, 3, 1, 12, 0, 0)
+        # Several rows share a timestamp so the id tie-breaker is exercised.
+        for i, minutes in enumerate([0, 0, 0, 5, 5, 10, 20]):
+            self.db.add(EventLedger(action_type=f"A{i}", created_at=base + timedelta(minutes=minutes)))
+        self.db.commit()
+        self.expected = [
+            r.id
+            for r in self.db.query(EventLedger)
+            .order_by(EventLedger.created_at.desc(), EventLedger.id.desc())
+            .all()
+        ]
+
+    def test_cursor_round_trip(self):
+        row = self.db.query(EventLedger).first()
+        created_at, row_id = decode_ledger_cursor(encode_ledger_cursor(row))
+        self.assertEqual(row_id, row.id)
+        self.assertEqual(created_at, row.created_at.replace(tzinfo=timezone.utc))
+
+    def test_invalid_cursor_rejected(self):
+        for bad in ("not-a-cursor", "Zm9v", ""):
+            with self.subTest(bad=bad), self.assertRaises(InvalidLedgerCursor):
+                decode_ledger_cursor(bad)
+
+    def test_pages_cover_every_row_once_in_order(self):
+        seen, cursor = [], None
+        while True:
+            rows, cursor = fetch_ledger_page(self.db.query(EventLedger), limit=3, cursor=cursor)
+            seen.extend(r.id for r in rows)
+            if cursor is None:
+                break
+        self.assertEqual(seen, self.expected)
+
+    def test_no_limit_returns_all_without_cursor(self):
+        rows, cursor = fetch_ledger_page(self.db.query(EventLedger), limit=None)
+        self.assertEqual([r.id for r in rows], self.expected)
+        self.assertIsNone(cursor)
+
+    def test_batches_follow_keyset_and_respect_max_rows(self):
+        batches = list(iter_ledger_batches(self.db.query(EventLedger), batch_size=2))
+        self.assertEqual([r.id for b in batches for r in b], self.expected)
+        self.assertTrue(all(len(b) <= 2 for b in batches))
+        capped = list(iter_ledger_batches(self.db.query(EventLedger), batch_size=2, max_rows=5))
+        self.assertEqual([r.id for b in capped for r in b], self.expected[:5])
+
+
+class TestLedgerLogEndpoints(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        now = datetime.now(timezone.utc)
+        owner = self._user("owner@example.com", identity_verified_at=now, poa_waived_at=now)
+        profile = OwnerProfile(user_id=owner.id)
+        self.db.add(profile)
+        self.db.flush()
+        prop = Property(owner_profile_id=profile.id, street="1 Main", city="Miami", state="FL", region_code="FL",
+                        owner_occupied=False)
+        self.db.add(prop)
+        self.db.flush()
+        for i in range(7):
+            self.db.add(EventLedger(action_type=ACTION_PROPERTY_UPDATED, property_id=prop.id, actor_user_id=owner.id,
+                                    created_at=now - timedelta(minutes=i)))
+        self.db.commit()
+        self.expected = [
+            r.id for r in self.db.query(EventLedger).order_by(EventLedger.created_at.desc(), EventLedger.id.desc())
+        ]
+
+        self.request_ledger_reads = []
+
+        def _db():
+            db = self.Session()
+            event.listen(db, "do_orm_execute", self._track_request_session_reads)
+            try:
+                yield db
+            finally:
+                db.close()
+
+        api = FastAPI()
+        api.include_router(dashboard.router)
+        api.dependency_overrides[get_db] = _db
+        self.client = TestClient(api)
+        self.headers = {"Authorization": "Bearer " + create_access_token(owner.id, owner.email, UserRole.owner)}
+
+    def _track_request_session_reads(self, state):
+        if "event_ledger" in str(state.statement):
+            self.request_ledger_reads.append(state.statement)
+
+    def test_ndjson_stream_reads_through_its_own_session(self):
+        resp = self.client.get(
+            "/dashboard/owner/logs", params={"limit": 5},
+            headers={**self.headers, "Accept": "application/x-ndjson"},
+        )
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.headers["content-type"], "application/x-ndjson")
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        self.assertEqual([e["id"] for e in lines], self.expected[:5])
+        self.assertEqual(self.request_ledger_reads, [])
+
+    def test_owner_and_manager_logs_return_every_row_unless_limited(self):
+        for path in ("/dashboard/owner/logs", "/dashboard/manager/logs"):
+            limit = next(p for p in dashboard.router.routes if p.path == path).dependant.query_params
+            self.assertIsNone(next(q for q in limit if q.name == "limit").default)
+        resp = self.client.get("/dashboard/owner/logs", headers=self.headers)
+        self.assertEqual([e["id"] for e in resp.json()], self.expected)
+        self.assertTrue(self.request_ledger_reads)  # JSON pages are read in the request
+        self.assertNotIn("X-Next-Cursor", resp.headers)
+        resp = self.client.get("/dashboard/owner/logs", params={"limit": 3}, headers=self.headers)
+        self.assertEqual([e["id"] for e in resp.json()], self.expected[:3])
+        self.assertIn("X-Next-Cursor", resp.headers)
+
+
+class TestLedgerPrivacyClauses(DatabaseTestCase):
+    """The WHERE-clause exclusions must drop exactly the rows the Python post-filters drop."""
+
+    def setUp(self):
+        super().setUp()
+        db = self.db
+        owner = self._user("owner@example.com", UserRole.owner)
+        tenant = self._user("tenant@example.com", UserRole.tenant)
+        guest = self._user("guest@example.com", UserRole.guest)
+        profile = OwnerProfile(user_id=owner.id)
+        db.add(profile)
+        db.flush()
+        prop = Property(
+            owner_profile_id=profile.id, street="1 Main", city="Miami", state="FL", region_code="FL", owner_occupied=False
+        )
+        db.add(prop)
+        db.flush()
+        leased = Unit(property_id=prop.id, unit_label="1")
+        vacant = Unit(property_id=prop.id, unit_label="2")
+        db.add_all([leased, vacant])
+        db.flush()
+        today = date.today()
+        db.add(TenantAssignment(unit_id=leased.id, user_id=tenant.id, start_date=today - timedelta(days=30)))
+
+        def invitation(code: str, inviter: User | None) -> Invitation:
+            inv = Invitation(
+                invitation_code=code,
+                owner_id=owner.id,
+                property_id=prop.id,
+                invited_by_user_id=inviter.id if inviter else None,
+                stay_start_date=today,
+                stay_end_date=today + timedelta(days=5),
+                purpose_of_stay=PurposeOfStay.personal,
+                relationship_to_owner=RelationshipToOwner.friend,
+                region_code="FL",
+            )
+            db.add(inv)
+            db.flush()
+            return inv
+
+        def stay(inv: Invitation | None, inviter: User | None) -> Stay:
+            s = Stay(
+                guest_id=guest.id,
+                owner_id=owner.id,
+                property_id=prop.id,
+                invitation_id=inv.id if inv else None,
+                invited_by_user_id=inviter.id if inviter else None,
+                stay_start_date=today,
+                stay_end_date=today + timedelta(days=5),
+                intended_stay_duration_days=5,
+                purpose_of_stay=PurposeOfStay.personal,
+                relationship_to_owner=RelationshipToOwner.friend,
+                region_code="FL",
+            )
+            db.add(s)
+            db.flush()
+            return s
+
+        tenant_inv = invitation("T1", tenant)
+        owner_inv = invitation("O1", owner)
+        legacy_inv = invitation("L1", None)
+        tenant_stay = stay(tenant_inv, tenant)
+        owner_stay = stay(owner_inv, owner)
+        direct_tenant_stay = stay(None, tenant)
+        direct_owner_stay = stay(None, owner)
+
+        rows = [
+            dict(action_type="X", invitation_id=tenant_inv.id),
+            dict(action_type="X", invitation_id=owner_inv.id),
+            dict(action_type="X", invitation_id=legacy_inv.id),
+            dict(action_type="X", stay_id=tenant_stay.id),
+            dict(action_type="X", stay_id=owner_stay.id),
+            dict(action_type="X", stay_id=direct_tenant_stay.id),
+            dict(action_type="X", stay_id=direct_owner_stay.id),
+            dict(action_type="X"),
+            dict(action_type=ACTION_PRESENCE_STATUS_CHANGED, actor_user_id=tenant.id, unit_id=leased.id),
+            dict(action_type=ACTION_PRESENCE_STATUS_CHANGED, actor_user_id=owner.id, unit_id=leased.id),
+            dict(action_type=ACTION_PRESENCE_STATUS_CHANGED, actor_user_id=owner.id, unit_id=vacant.id),
+            dict(action_type=ACTION_PRESENCE_STATUS_CHANGED, actor_user_id=None, unit_id=vacant.id),
+            dict(action_type=ACTION_PRESENCE_STATUS_CHANGED, actor_user_id=owner.id, unit_id=leased.id, stay_id=owner_stay.id),
+            dict(action_type=ACTION_PRESENCE_STATUS_CHANGED, actor_user_id=owner.id),
+        ]
+        for kw in rows:
+            db.add(EventLedger(property_id=prop.id, **kw))
+        db.commit()
+
+    def _ids(self, rows) -> set[int]:
+        return {r.id for r in rows}
+
+    def test_tenant_lane_clause_matches_python_filter(self):
+        all_rows = self.db.query(EventLedger).all()
+        sql_rows = self.db.query(EventLedger).filter(tenant_lane_ledger_exclusion_clause()).all()
+        self.assertEqual(self._ids(sql_rows), self._ids(filter_tenant_lane_from_ledger_rows(self.db, all_rows)))
+        self.assertLess(len(sql_rows), len(all_rows))
+
+    def test_tenant_presence_clause_matches_python_filter(self):
+        all_rows = self.db.query(EventLedger).all()
+        sql_rows = self.db.query(EventLedger).filter(tenant_presence_ledger_exclusion_clause()).all()
+        self.assertEqual(
+            self._ids(sql_rows), self._ids(filter_tenant_presence_from_owner_manager_ledger(self.db, all_rows))
+        )
+        self.assertLess(len(sql_rows), len(all_rows))
+
+    def test_leased_unit_presence_clause_matches_python_filter(self):
+        all_rows = self.db.query(EventLedger).all()
+        sql_rows = self.db.query(EventLedger).filter(manager_leased_unit_presence_exclusion_clause()).all()
+        self.assertEqual(
+            self._ids(sql_rows), self._ids(filter_manager_presence_on_tenant_leased_units(self.db, all_rows))
+        )
+        self.assertLess(len(sql_rows), len(all_rows))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""Event ledger search document (search_text) and the log search clause."""
+import unittest
+
+from app.models.event_ledger import EventLedger
+from app.models.owner import OwnerProfile, Property
+from app.services.event_ledger import (
+    ACTION_GUEST_INVITE_CANCELLED,
+    create_ledger_event,
+    ledger_search_clause,
+    ledger_search_document,
+)
+from tests.support import DatabaseTestCase
+
+
+class TestLedgerSearch(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        owner = self._user("owner@example.com")
+        profile = OwnerProfile(user_id=owner.id)
+        self.db.add(profile)
+        self.db.flush()
+        self.prop = Property(
+            owner_profile_id=profile.id,
+            name="Maple Court",
+            street="12 Harbor Rd",
+            city="Tampa",
+            state="FL",
+            region_code="FL",
+            owner_occupied=False,
+        )
+        self.db.add(self.prop)
+        self.db.commit()
+
+    def _search(self, term: str) -> set[int]:
+        return {r.id for r in self.db.query(EventLedger).filter(ledger_search_clause(term)).all()}
+
+    def test_document_includes_title_and_nested_meta_values(self):
+        doc = ledger_search_document(
+            ACTION_GUEST_INVITE_CANCELLED,
+            {"guest_name": "Ada Lovelace", "extra": {"note": "Late Arrival"}, "flag": True},
+            property_address="12 Harbor Rd Tampa",
+        )
+        self.assertIn(ACTION_GUEST_INVITE_CANCELLED.lower(), doc)
+        self.assertIn("ada lovelace", doc)
+        self.assertIn("late arrival", doc)
+        self.assertIn("harbor rd", doc)
+        self.assertNotIn("true", doc)
+        self.assertEqual(doc, doc.lower())
+
+    def test_create_ledger_event_writes_search_text(self):
+        entry = create_ledger_event(
+            self.db,
+            ACTION_GUEST_INVITE_CANCELLED,
+            property_id=self.prop.id,
+            meta={"guest_email": "Ada@Example.com"},
+        )
+        self.db.commit()
+        self.assertIn("ada@example.com", entry.search_text)
+        self.assertIn("maple court", entry.search_text)
+        self.assertEqual(self._search("HARBOR"), {entry.id})
+        self.assertEqual(self._search("ada@example"), {entry.id})
+        self.assertEqual(self._search("nothing-like-this"), set())
+
+    def test_rows_without_search_text_fall_back_to_meta_match(self):
+        legacy = EventLedger(action_type="StayCheckedIn", meta={"guest_name": "Grace Hopper"})
+        self.db.add(legacy)
+        self.db.commit()
+        self.assertIsNone(legacy.search_text)
+        self.assertEqual(self._search("grace"), {legacy.id})
+        self.assertEqual(self._search("staycheckedin"), {legacy.id})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Public live page: ETag / If-None-Match and write-driven invalidation of the live page cache."""
+import json
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.config import get_settings
+from app.database import get_db
+from app.dependencies import get_optional_current_user
+from app.models.owner import OwnerProfile, Property
+from app.models.owner_live_slug import OwnerLiveSlug
+from app.models.unit import Unit
+from app.routers import public
+from app.services import live_page_cache
+from app.services.event_ledger import ACTION_PRESENCE_STATUS_CHANGED, create_ledger_event
+from tests.support import DatabaseTestCase
+
+
+class TestLivePageCache(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        owner = self._user("owner@example.com", full_name="Olive Owner")
+        profile = OwnerProfile(user_id=owner.id)
+        self.db.add(profile)
+        self.db.flush()
+        self.prop = Property(owner_profile_id=profile.id, name="Harbor House", street="1 Main", city="Tampa",
+                             state="FL", region_code="FL", owner_occupied=False)
+        self.other = Property(owner_profile_id=profile.id, name="Other", street="2 Main", city="Tampa",
+                              state="FL", region_code="FL", owner_occupied=False)
+        self.db.add_all([self.prop, self.other])
+        self.db.flush()
+        self.db.add(Unit(property_id=self.prop.id, unit_label="1"))
+        self.db.add(OwnerLiveSlug(property_id=self.prop.id, owner_user_id=owner.id, slug="harbor",
+                                  expires_at=datetime.now(timezone.utc) + timedelta(days=30)))
+        self.db.commit()
+        self.owner_id = owner.id
+
+        live_page_cache.clear_live_page_cache()
+        self.addCleanup(live_page_cache.clear_live_page_cache)
+        patcher = mock.patch.object(get_settings(), "live_page_cache_ttl_seconds", 300)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        api = FastAPI()
+        api.include_router(public.router)
+        api.dependency_overrides[get_db] = self.get_db_override()
+        api.dependency_overrides[get_optional_current_user] = lambda: None
+        self.client = TestClient(api)
+
+    def test_etag_revalidation_is_served_from_cache(self):
+        first = self.client.get("/public/live/harbor")
+        self.assertEqual(first.status_code, 200)
+        etag = first.headers["etag"]
+        self.assertTrue(etag.startswith('"'))
+        self.assertEqual(first.json()["property"]["name"], "Harbor House")
+
+        with mock.patch.object(public, "_build_live_property_page") as build:
+            again = self.client.get("/public/live/harbor")
+            not_modified = self.client.get("/public/live/harbor", headers={"If-None-Match": f'W/"x", {etag}'})
+        build.assert_not_called()
+        self.assertEqual(again.content, first.content)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.headers["etag"], etag)
+        self.assertEqual(live_page_cache.get_live_page_cache_stats()["hits"], 2)
+
+    def test_writes_to_the_property_invalidate_only_that_property(self):
+        etag = self.client.get("/public/live/harbor").headers["etag"]
+
+        self.db.add(Unit(property_id=self.other.id, unit_label="9"))
+        self.db.commit()
+        self.assertEqual(self.client.get("/public/live/harbor", headers={"If-None-Match": etag}).status_code, 304)
+
+        create_ledger_event(self.db, ACTION_PRESENCE_STATUS_CHANGED, property_id=self.prop.id,
+                            actor_user_id=self.owner_id, meta={"message": "Marked present"})
+        self.db.commit()
+        fresh = self.client.get("/public/live/harbor", headers={"If-None-Match": etag})
+        self.assertEqual(fresh.status_code, 200)
+        self.assertNotEqual(fresh.headers["etag"], etag)
+        self.assertEqual(len(fresh.json()["logs"]), 1)
+
+        self.db.add(Unit(property_id=self.prop.id, unit_label="2"))
+        self.db.commit()
+        body = self.client.get("/public/live/harbor").json()
+        self.assertEqual([u["unit_label"] for u in body["property"]["unit_statuses"]], ["1", "2"])
+
+    def test_cached_page_matches_uncached_build(self):
+        cached = self.client.get("/public/live/harbor").json()
+        with mock.patch.object(get_settings(), "live_page_cache_ttl_seconds", 0):
+            uncached = self.client.get("/public/live/harbor").json()
+        cached.pop("generated_at")
+        uncached.pop("generated_at")
+        self.assertEqual(json.dumps(cached, sort_keys=True), json.dumps(uncached, sort_keys=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
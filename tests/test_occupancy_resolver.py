@@ -0,0 +1,147 @@
+"""Bulk occupancy resolver: same answers as the per-unit helpers, constant query count."""
+import unittest
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import event
+
+from app.models.guest import PurposeOfStay, RelationshipToOwner
+from app.models.owner import OccupancyStatus, OwnerProfile, Property
+from app.models.resident_mode import ResidentMode, ResidentModeType
+from app.models.stay import Stay
+from app.models.tenant_assignment import TenantAssignment
+from app.models.unit import Unit
+from app.models.user import UserRole
+from app.services.occupancy import (
+    _unit_occupied_by_lease_invite_resident_or_stay,
+    has_legitimate_occupancy_unknown,
+    normalize_occupancy_status_for_display,
+    resolve_units_occupancy,
+)
+from tests.support import DatabaseTestCase
+
+
+class TestResolveUnitsOccupancy(DatabaseTestCase):
+    session_options = {}
+
+    def setUp(self):
+        super().setUp()
+        self.today = date.today()
+        self.owner = self._user("owner@example.com", UserRole.owner)
+        self.tenant = self._user("tenant@example.com", UserRole.tenant)
+        self.manager = self._user("manager@example.com", UserRole.property_manager)
+        self.guest = self._user("guest@example.com", UserRole.guest)
+        self.profile = OwnerProfile(user_id=self.owner.id)
+        self.db.add(self.profile)
+        self.db.flush()
+
+    def _property(self, n_units: int, occupancy_status: str = "vacant") -> tuple[Property, list[Unit]]:
+        prop = Property(
+            owner_profile_id=self.profile.id,
+            street="1 Main",
+            city="Miami",
+            state="FL",
+            region_code="FL",
+            owner_occupied=False,
+            occupancy_status=occupancy_status,
+        )
+        self.db.add(prop)
+        self.db.flush()
+        units = [Unit(property_id=prop.id, unit_label=str(i + 1)) for i in range(n_units)]
+        self.db.add_all(units)
+        self.db.flush()
+        return prop, units
+
+    def _stay(self, unit: Unit, **kw) -> Stay:
+        s = Stay(
+            guest_id=self.guest.id,
+            owner_id=self.owner.id,
+            property_id=unit.property_id,
+            unit_id=unit.id,
+            stay_start_date=self.today - timedelta(days=2),
+            stay_end_date=self.today + timedelta(days=2),
+            intended_stay_duration_days=4,
+            purpose_of_stay=PurposeOfStay.personal,
+            relationship_to_owner=RelationshipToOwner.friend,
+            region_code="FL",
+            **kw,
+        )
+        self.db.add(s)
+        return s
+
+    def _per_unit_status(self, unit: Unit) -> str:
+        if (unit.occupancy_status or "").lower() == OccupancyStatus.occupied.value:
+            return OccupancyStatus.occupied.value
+        if _unit_occupied_by_lease_invite_resident_or_stay(self.db, unit, self.today):
+            return OccupancyStatus.occupied.value
+        return normalize_occupancy_status_for_display(self.db, unit.property_id, unit.id, unit.occupancy_status)
+
+    def _count_queries(self, fn) -> int:
+        count = {"n": 0}
+
+        def _before(*_a, **_kw):
+            count["n"] += 1
+
+        event.listen(self.engine, "before_cursor_execute", _before)
+        try:
+            fn()
+        finally:
+            event.remove(self.engine, "before_cursor_execute", _before)
+        return count["n"]
+
+    def test_matches_per_unit_helpers(self):
+        now = datetime.now(timezone.utc)
+        prop, units = self._property(7, occupancy_status="unknown")
+        units[0].occupancy_status = "occupied"
+        self.db.add(TenantAssignment(unit_id=units[1].id, user_id=self.tenant.id, start_date=self.today - timedelta(days=10)))
+        self.db.add(
+            TenantAssignment(
+                unit_id=units[2].id,
+                user_id=self.tenant.id,
+                start_date=self.today - timedelta(days=30),
+                end_date=self.today - timedelta(days=1),
+            )
+        )
+        self.db.add(ResidentMode(user_id=self.manager.id, unit_id=units[3].id, mode=ResidentModeType.manager_personal))
+        self._stay(units[4], checked_in_at=now)
+        units[5].occupancy_status = "unknown"
+        self._stay(units[5], dead_mans_switch_triggered_at=now)
+        units[6].occupancy_status = "unknown"
+        empty_prop, _ = self._property(0, occupancy_status="unknown")
+        self.db.commit()
+
+        snap = resolve_units_occupancy(self.db, units, self.today, property_ids=[empty_prop.id])
+        for u in units:
+            with self.subTest(unit=u.unit_label):
+                self.assertEqual(snap.unit_status(u.id), self._per_unit_status(u))
+        self.assertEqual(snap.occupied_count(units), 4)
+        self.assertEqual(snap.unit_status(units[5].id), OccupancyStatus.unknown.value)
+        self.assertEqual(snap.unit_status(units[6].id), OccupancyStatus.vacant.value)
+        self.assertEqual(snap.occupancy_source(units[1].id), "tenant_assignment")
+        self.assertEqual(snap.occupancy_source(units[3].id), "manager_resident")
+        self.assertEqual(snap.occupancy_source(units[4].id), "guest_stay")
+        self.assertEqual(snap.occupancy_source(units[4].id, guest_detail_unit_ids=set()), "none")
+        self.assertEqual(snap.occupancy_source(units[0].id), "none")
+        self.assertEqual(snap.property_status(prop, units), OccupancyStatus.occupied.value)
+        # Stored "unknown" without an unanswered Status Confirmation displays as vacant.
+        self.assertFalse(has_legitimate_occupancy_unknown(self.db, empty_prop.id))
+        self.assertEqual(snap.property_status(empty_prop, []), OccupancyStatus.vacant.value)
+        with self.assertRaises(KeyError):
+            snap.property_status(Property(id=10_000), [])
+
+    def test_query_count_independent_of_unit_count(self):
+        _, small = self._property(3)
+        _, large = self._property(60)
+        for u in large[::3]:
+            self.db.add(TenantAssignment(unit_id=u.id, user_id=self.tenant.id, start_date=self.today))
+        self.db.commit()
+        # Reload so expired attributes are not refreshed one unit at a time inside the measured block.
+        small = self.db.query(Unit).filter(Unit.id.in_([u.id for u in small])).all()
+        large = self.db.query(Unit).filter(Unit.id.in_([u.id for u in large])).all()
+        n_small = self._count_queries(lambda: resolve_units_occupancy(self.db, small, self.today))
+        n_large = self._count_queries(lambda: resolve_units_occupancy(self.db, large, self.today))
+        self.assertEqual(n_small, n_large)
+        self.assertLessEqual(n_large, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Principal cache: auth without queries on a hit, invalidation on commit, onboarding checks never denied from cache."""
+import unittest
+from datetime import datetime, timezone
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.database import get_db
+from app.dependencies import require_owner_onboarding_complete, require_owner_onboarding_complete_principal
+from app.models.owner import OwnerProfile
+from app.models.owner_poa_signature import OwnerPOASignature
+from app.models.user import User, UserRole
+from app.routers import dashboard
+from app.services import principal_cache
+from app.services.auth import create_access_token
+from tests.support import DatabaseTestCase
+
+
+class TestPrincipalCache(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        principal_cache.clear_principal_cache()
+        self.addCleanup(principal_cache.clear_principal_cache)
+        self.queries = self.capture_statements()
+        owner = self._user("o@example.com", identity_verified_at=datetime.now(timezone.utc))
+        self.db.add(OwnerProfile(user_id=owner.id))
+        self.db.commit()
+        self.owner_id = owner.id
+        self.db.close()
+        principal_cache.clear_principal_cache()
+
+    def _sign_poa(self):
+        with self.Session() as db:
+            db.add(
+                OwnerPOASignature(
+                    owner_email="o@example.com", owner_full_name="O", typed_signature="O", document_id="poa",
+                    document_title="POA", document_hash="0" * 64, document_content="-", used_by_user_id=self.owner_id,
+                )
+            )
+            db.commit()
+
+    def test_hits_skip_the_database_and_commits_invalidate(self):
+        with self.Session() as db:
+            first = principal_cache.get_principal(db, self.owner_id, role_claim="owner")
+            self.assertEqual((first.role, first.poa_linked), (UserRole.owner, False))
+            self.assertIsNotNone(first.owner_profile_id)
+            self.queries.clear()
+            self.assertIs(principal_cache.get_principal(db, self.owner_id, role_claim="owner"), first)
+            self.assertEqual(self.queries, [])
+            # A token carrying another role than the cached one is re-read.
+            principal_cache.get_principal(db, self.owner_id, role_claim="admin")
+            self.assertEqual(len(self.queries), 1)
+
+        self._sign_poa()  # commit linking a POA to the user drops the entry
+        with self.Session() as db:
+            self.assertTrue(principal_cache.get_principal(db, self.owner_id).poa_linked)
+            user = db.get(User, self.owner_id)
+            user.identity_verified_at = None
+            db.commit()
+        with self.Session() as db:
+            self.assertFalse(principal_cache.get_principal(db, self.owner_id).identity_verified)
+        stats = principal_cache.get_principal_cache_stats()
+        self.assertEqual((stats["entries"], stats["invalidations"]), (1, 2))
+
+    def test_onboarding_check_rereads_a_cached_denial(self):
+        with self.Session() as db:
+            self.assertFalse(principal_cache.get_principal(db, self.owner_id).poa_linked)  # cached: not linked
+        # Linked by a write this process did not see (another worker): the cache still says "not linked".
+        with self.engine.begin() as conn:
+            conn.execute(
+                OwnerPOASignature.__table__.insert().values(
+                    owner_email="o@example.com", owner_full_name="O", typed_signature="O", signature_method="typed",
+                    acks_read=True, acks_temporary=True, acks_vacate=True, acks_electronic=True, document_id="poa",
+                    document_title="POA", document_hash="0" * 64, document_content="-",
+                    signed_at=datetime.now(timezone.utc), used_by_user_id=self.owner_id,
+                )
+            )
+        with self.Session() as db:
+            cached = principal_cache.get_principal(db, self.owner_id)
+            self.assertTrue(require_owner_onboarding_complete_principal(db=db, principal=cached).poa_linked)
+            self.queries.clear()
+            principal = require_owner_onboarding_complete_principal(
+                db=db, principal=principal_cache.get_principal(db, self.owner_id)
+            )
+            self.assertEqual(self.queries, [])  # now served from the cache
+            # Routes that need the row still get the User, authorized from the same principal.
+            self.assertEqual(require_owner_onboarding_complete(db=db, principal=principal).id, self.owner_id)
+
+    def test_principal_routes_do_no_auth_queries_when_cached(self):
+        api = FastAPI()
+        api.include_router(dashboard.router)
+        api.dependency_overrides[get_db] = self.get_db_override()
+        client = TestClient(api)
+        headers = {"Authorization": "Bearer " + create_access_token(self.owner_id, "o@example.com", UserRole.owner)}
+        self._sign_poa()
+        for path in ("/dashboard/alerts/unread-count", "/dashboard/owner/stays"):
+            self.assertEqual(client.get(path, headers=headers).status_code, 200)
+            self.queries.clear()
+            client.get(path, headers=headers)
+            self.assertFalse([q for q in self.queries if "FROM users" in q], path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,232 @@
+"""Property state read model: commit-time snapshot refresh, list reads and the nightly reconciler."""
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from unittest import mock
+
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from app.config import get_settings
+from app.models.guest import PurposeOfStay, RelationshipToOwner
+from app.models.invitation import Invitation
+from app.models.owner import OwnerProfile, Property
+from app.models.property_manager_assignment import PropertyManagerAssignment
+from app.models.property_state_snapshot import PropertyStateSnapshot
+from app.models.stay import Stay
+from app.models.tenant_assignment import TenantAssignment
+from app.models.unit import Unit
+from app.models.user import UserRole
+from app.routers import managers, owners
+from app.services import property_state
+from app.services.occupancy import resolve_units_occupancy
+from app.services.privacy_lanes import (
+    filter_property_lane_invitations_for_manager,
+    filter_property_lane_invitations_for_owner,
+)
+from app.services.property_invitation_summary import (
+    invitation_counts_dict,
+    pipeline_bucket,
+    pipeline_buckets,
+    resolve_invitation_pipeline_lifecycle,
+)
+from tests.support import DatabaseTestCase
+
+
+class TestPropertyState(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        property_state.clear_property_state_stats()
+        db = self.db
+        self.owner = self._user("owner@example.com", UserRole.owner)
+        self.manager = self._user("manager@example.com", UserRole.property_manager)
+        self.guest = self._user("guest@example.com", UserRole.guest)
+        self.profile = OwnerProfile(user_id=self.owner.id)
+        db.add(self.profile)
+        db.flush()
+        common = dict(owner_profile_id=self.profile.id, street="1 Main", city="Tampa", state="FL", region_code="FL",
+                      live_slug=None)
+        self.building = Property(name="Building", owner_occupied=False, is_multi_unit=True, **common)
+        self.house = Property(name="House", owner_occupied=True, **common)
+        db.add_all([self.building, self.house])
+        db.flush()
+        self.units = [Unit(property_id=self.building.id, unit_label=str(i)) for i in (1, 2, 3)]
+        db.add_all(self.units)
+        db.add(PropertyManagerAssignment(property_id=self.building.id, user_id=self.manager.id))
+        db.flush()
+        today = date.today()
+        for code, inviter, unit, status in (
+            ("OWN-P", self.owner, self.units[0], "pending"),
+            ("OWN-A", self.owner, self.units[1], "accepted"),
+            ("MGR-P", self.manager, self.units[2], "pending"),
+            ("MGR-X", self.manager, None, "cancelled"),
+        ):
+            db.add(self._invitation(code, self.building, inviter, unit, status, today))
+        db.add(TenantAssignment(unit_id=self.units[0].id, user_id=self.guest.id, start_date=today - timedelta(days=30)))
+        db.commit()
+
+    def _invitation(self, code, prop, inviter, unit, status, today, **kw):
+        kw.setdefault("stay_end_date", today + timedelta(days=5))
+        return Invitation(
+            invitation_code=code, owner_id=self.owner.id, property_id=prop.id, unit_id=unit.id if unit else None,
+            invited_by_user_id=inviter.id, stay_start_date=today, purpose_of_stay=PurposeOfStay.personal,
+            relationship_to_owner=RelationshipToOwner.friend, region_code="FL", status=status, **kw,
+        )
+
+    def _computed_the_old_way(self, prop, viewer):
+        """What the list endpoints derived from the source tables before the snapshot."""
+        units = self.db.query(Unit).filter(Unit.property_id == prop.id).all()
+        occupancy = resolve_units_occupancy(self.db, units, property_ids=[prop.id])
+        invs = self.db.query(Invitation).filter(Invitation.property_id == prop.id).all()
+        if viewer.role == UserRole.owner:
+            lane = filter_property_lane_invitations_for_owner(self.db, invs, viewer.id)
+        else:
+            lane = filter_property_lane_invitations_for_manager(self.db, invs, viewer.id)
+        return occupancy.property_status(prop, units), occupancy.occupied_count(units), invitation_counts_dict(lane, self.db)
+
+    def _rows(self, prop):
+        return self.db.query(PropertyStateSnapshot).filter(PropertyStateSnapshot.property_id == prop.id).all()
+
+    def test_commit_writes_snapshot_matching_the_live_computation(self):
+        self.assertEqual(len(self._rows(self.building)), 4)  # property row + 3 unit rows
+        self.assertEqual(len(self._rows(self.house)), 1)
+        states = property_state.get_property_states(self.db, [self.building.id, self.house.id])
+        self.assertEqual(property_state.get_property_state_stats()["snapshot_reads"], 2)
+        self.assertEqual(states, property_state.compute_property_states(self.db, [self.building.id, self.house.id]))
+
+        state = states[self.building.id]
+        status, occupied, owner_counts = self._computed_the_old_way(self.building, self.owner)
+        self.assertEqual((state.occupancy_status, state.occupied_unit_count, state.unit_count), (status, occupied, 3))
+        self.assertEqual(occupied, 1)  # unit 1 has an active lease
+        self.assertEqual(state.invitation_counts_dict(), owner_counts)
+        self.assertEqual(
+            state.invitation_counts_dict(self.manager.id), self._computed_the_old_way(self.building, self.manager)[2]
+        )
+
+        listed = {p.id: p for p in owners.list_my_properties(db=self.db, current_user=self.owner,
+                                                               context_mode="business", inactive=False)}
+        self.assertEqual(listed[self.building.id].invitation_pending_count, owner_counts["invitation_pending_count"])
+        self.assertEqual((listed[self.house.id].unit_count, listed[self.house.id].vacant_unit_count), (1, 1))
+        summary = managers.list_assigned_properties(db=self.db, current_user=self.manager, context_mode="business")
+        self.assertEqual([(s.id, s.occupied_count, s.invitation_pending_count) for s in summary],
+                         [(self.building.id, 1, 1)])
+
+    def test_writes_refresh_in_their_transaction(self):
+        stay = Stay(
+            guest_id=self.guest.id, owner_id=self.owner.id, property_id=self.building.id, unit_id=self.units[2].id,
+            invited_by_user_id=self.owner.id, stay_start_date=date.today(), stay_end_date=date.today() + timedelta(days=3),
+            intended_stay_duration_days=3, purpose_of_stay=PurposeOfStay.personal,
+            relationship_to_owner=RelationshipToOwner.friend, region_code="FL",
+            checked_in_at=datetime.now(timezone.utc),
+        )
+        self.db.add(stay)
+        self.db.flush()
+        self.db.rollback()
+        self.assertEqual(property_state.get_property_states(self.db, [self.building.id])[self.building.id]
+                         .occupied_unit_count, 1)
+
+        self.db.add(stay)
+        self.db.commit()
+        state = property_state.get_property_states(self.db, [self.building.id])[self.building.id]
+        self.assertEqual((state.occupied_unit_count, state.active_stay_count), (2, 1))
+        self.assertEqual(state.unit_statuses[self.units[2].id], "occupied")
+        self.assertEqual(property_state.get_property_state_stats()["live_computes"], 0)
+
+        # A row written on an earlier day is not served; that property is computed live.
+        tomorrow = date.today() + timedelta(days=1)
+        property_state.get_property_states(self.db, [self.building.id], today=tomorrow)
+        self.assertEqual(property_state.get_property_state_stats()["live_computes"], 1)
+
+    def test_reconciler_reports_drift_and_rewrites_rows(self):
+        # A bulk UPDATE bypasses the ORM, so no commit-time refresh sees it.
+        self.db.execute(text("UPDATE units SET occupancy_status = 'occupied' WHERE id = :id"), {"id": self.units[1].id})
+        self.db.execute(text("UPDATE property_state_snapshots SET computed_for = :d WHERE property_id = :p"),
+                        {"d": date.today() - timedelta(days=1), "p": self.house.id})
+        self.db.commit()
+        self.assertEqual(property_state.get_property_states(self.db, [self.building.id])[self.building.id]
+                         .occupied_unit_count, 1)
+
+        report = property_state.reconcile_property_state_snapshots(self.db)
+        self.assertEqual((report["properties"], report["drifted"], report["stale"], report["missing"]), (2, 1, 1, 0))
+        self.assertEqual(report["drifted_property_ids"], [self.building.id])
+        self.assertEqual(property_state.get_property_states(self.db, [self.building.id])[self.building.id]
+                         .occupied_unit_count, 2)
+        self.assertEqual(property_state.reconcile_property_state_snapshots(self.db)["drifted"], 0)
+        self.assertEqual(property_state.get_property_state_stats()["last_reconcile"]["drifted"], 0)
+
+
+    def test_commit_only_queues_a_background_refresh(self):
+        with mock.patch.object(get_settings(), "property_state_refresh_delay_seconds", 60.0):
+            refresher = property_state.PropertyStateRefresher(session_factory=sessionmaker(bind=self.engine))
+        refresher.start()
+        self.addCleanup(refresher.stop)
+        patcher = mock.patch.object(property_state, "_refresher", refresher)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        inv = self.db.query(Invitation).filter(Invitation.invitation_code == "OWN-P").one()
+        statements = self.capture_statements()
+        inv.status = "cancelled"
+        self.db.commit()
+        self.assertEqual(len(statements), 2, statements)  # the UPDATE and one DELETE of the snapshot rows
+        self.assertEqual(refresher.pending, 1)
+        self.assertEqual(self._rows(self.building), [])
+
+        # Until the refresher gets to it the property is computed live, already reflecting the write.
+        state = property_state.get_property_states(self.db, [self.building.id])[self.building.id]
+        self.assertEqual(state.invitation_counts_dict()["invitation_cancelled_count"], 2)
+        self.assertEqual(property_state.get_property_state_stats()["live_computes"], 1)
+
+        self.assertEqual(refresher.drain(), 1)
+        self.assertEqual(len(self._rows(self.building)), 4)
+        self.assertEqual(property_state.get_property_states(self.db, [self.building.id])[self.building.id], state)
+        self.assertEqual(len(self._rows(self.house)), 1)  # untouched
+
+    def test_one_row_per_property_and_unit(self):
+        for unit_id in (None, self.units[0].id):
+            self.db.add(PropertyStateSnapshot(property_id=self.building.id, unit_id=unit_id,
+                                              computed_for=date.today(), occupancy_status="vacant"))
+            with self.assertRaises(IntegrityError):
+                self.db.flush()
+            self.db.rollback()
+
+    def test_lifecycles_load_with_a_fixed_number_of_queries(self):
+        today = date.today()
+        start, end = today - timedelta(days=10), today + timedelta(days=20)
+        unit = self.units[1]
+        self.db.add(TenantAssignment(unit_id=unit.id, user_id=self.guest.id, start_date=start, end_date=end))
+        lease = dict(invitation_kind="tenant", stay_end_date=end)
+        self.db.add_all([
+            self._invitation("TEN-MINE", self.building, self.owner, unit, "accepted", start,
+                             guest_email="Guest@example.com ", **lease),
+            self._invitation("TEN-DATES", self.building, self.owner, unit, "accepted", start,
+                             guest_email="other@example.com", **lease),
+            self._invitation("TEN-EXT", self.building, self.owner, unit, "pending", start,
+                             guest_email="guest@example.com", invitation_kind="tenant_lease_ext", stay_end_date=end),
+            self._invitation("TEN-NONE", self.building, self.owner, self.units[2], "pending", today,
+                             guest_email="nobody@example.com", **lease),
+        ])
+        self.db.commit()
+        invitations = self.db.query(Invitation).order_by(Invitation.id).all()
+        singles = {inv.id: pipeline_bucket(resolve_invitation_pipeline_lifecycle(inv, self.db)) for inv in invitations}
+        self.assertIn("active", singles.values())
+        statements = self.capture_statements()
+        self.assertEqual(pipeline_buckets(invitations, self.db), singles)
+        self.assertEqual(len(statements), 2)  # tenant assignments of the units, then their users
+
+        del statements[:]
+        property_state.compute_property_states(self.db, [self.building.id])
+        baseline = len(statements)
+        self.db.add_all(
+            self._invitation(f"TEN-{i}", self.building, self.owner, self.units[2], "pending", today,
+                             guest_email=f"t{i}@example.com", **lease)
+            for i in range(20)
+        )
+        self.db.commit()
+        del statements[:]
+        property_state.compute_property_states(self.db, [self.building.id])
+        self.assertEqual(len(statements), baseline)
+
+
+if __name__ == "__main__":
+    unittest.main()
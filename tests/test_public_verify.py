@@ -0,0 +1,159 @@
+"""Public verify: indexed case-insensitive token lookup, negative cache, buffered attempt log, batch endpoint."""
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from unittest import mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.config import get_settings
+from app.database import get_db
+from app.models.audit_log import AuditLog
+from app.models.event_ledger import EventLedger
+from app.models.invitation import Invitation
+from app.models.owner import OwnerProfile, Property
+from app.models.property_manager_assignment import PropertyManagerAssignment
+from app.models.stay import Stay
+from app.models.user import User, UserRole
+from app.routers import public
+from app.services import rate_limit, token_verification
+from app.services.auth import create_access_token
+from app.services.event_ledger import ACTION_VERIFY_ATTEMPT_VALID
+from app.services.token_verification import find_invitation_by_token
+from app.services.verify_attempt_log import VerifyAttempt, VerifyAttemptLogger
+from tests.support import DatabaseTestCase
+
+
+class TestPublicVerify(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        owner = self._user("owner@example.com")
+        guest = self._user("guest@example.com", UserRole.guest, full_name="Gus Guest")
+        profile = OwnerProfile(user_id=owner.id)
+        self.db.add(profile)
+        self.db.flush()
+        self.prop = Property(owner_profile_id=profile.id, name="Harbor House", street="1 Main", city="Tampa",
+                             state="FL", zip_code="33602", region_code="FL", owner_occupied=False)
+        self.db.add(self.prop)
+        self.db.flush()
+        today = date.today()
+        self.active = self._invitation("INV-A1B2C3D4", owner, status="accepted", token_state="BURNED")
+        self.pending = self._invitation("INV-00FF00FF", owner)
+        self.db.add(Stay(
+            guest_id=guest.id, owner_id=owner.id, property_id=self.prop.id, invitation_id=self.active.id,
+            stay_start_date=today - timedelta(days=1), stay_end_date=today + timedelta(days=5),
+            intended_stay_duration_days=6, purpose_of_stay="travel", relationship_to_owner="friend",
+            region_code="FL", checked_in_at=datetime.now(timezone.utc) - timedelta(hours=20),
+        ))
+        self.db.commit()
+        self.owner = owner
+
+        token_verification.clear_token_lookup_cache()
+        self.addCleanup(token_verification.clear_token_lookup_cache)
+        rate_limit.clear_rate_limits()
+        self.addCleanup(rate_limit.clear_rate_limits)
+
+        api = FastAPI()
+        api.include_router(public.router)
+        api.dependency_overrides[get_db] = self.get_db_override()
+        self.client = TestClient(api)
+
+    def _invitation(self, code, owner, **kw):
+        inv = Invitation(
+            invitation_code=code, owner_id=owner.id, property_id=self.prop.id, invited_by_user_id=owner.id,
+            stay_start_date=date.today() - timedelta(days=1), stay_end_date=date.today() + timedelta(days=5),
+            purpose_of_stay="travel", relationship_to_owner="friend", region_code="FL", **kw,
+        )
+        self.db.add(inv)
+        self.db.flush()
+        return inv
+
+    def _auth(self, user):
+        return {"Authorization": "Bearer " + create_access_token(user.id, user.email, user.role)}
+
+    def _batch(self, items, user=None):
+        return self.client.post("/public/verify/batch", json={"items": items}, headers=self._auth(user or self.owner))
+
+    def test_lookup_is_case_insensitive_and_caches_misses(self):
+        self.assertEqual(find_invitation_by_token(self.db, "  inv-a1b2c3d4 ").id, self.active.id)
+        captured = self.capture_statements()
+        self.assertIsNone(find_invitation_by_token(self.db, "INV-NOPE"))
+        self.assertIsNone(find_invitation_by_token(self.db, "inv-nope"))
+        statements = [s for s in captured if "FROM invitations" in s]
+        self.assertEqual(len(statements), 1)
+        self.assertIn("lower(invitations.invitation_code)", statements[0])
+
+        # Creating the invitation forgets the cached miss on commit.
+        self._invitation("INV-NOPE", self.owner)
+        self.db.commit()
+        self.assertIsNotNone(find_invitation_by_token(self.db, "inv-nope"))
+        with mock.patch.object(get_settings(), "verify_negative_cache_ttl_seconds", 0):
+            self.assertIsNone(find_invitation_by_token(self.db, "INV-GONE"))
+        self.assertEqual(token_verification.get_token_lookup_cache_stats()["entries"], 0)
+
+    def test_batch_matches_single_verify_and_logs_every_token(self):
+        tokens = ["inv-a1b2c3d4", "INV-00FF00FF", "INV-MISSING", "", "INV-A1B2C3D4"]
+        items = [{"token_id": t} for t in tokens]
+        items[4]["property_address"] = "99 Elsewhere Rd"
+        singles = [self.client.post("/public/verify", json=item).json() for item in items]
+
+        resp = self._batch(items)
+        self.assertEqual(resp.status_code, 200)
+        results = resp.json()["results"]
+        self.assertEqual([r["token_id"] for r in results], [t.strip() for t in tokens])
+        self.assertEqual([(r["valid"], r["reason"]) for r in results], [(s["valid"], s["reason"]) for s in singles])
+        self.assertEqual([r["valid"] for r in results], [True, False, False, False, False])
+        self.assertEqual(results[0]["status"], singles[0]["status"])
+        self.assertEqual(results[0]["property_address"], "1 Main, Tampa, FL, 33602")
+
+        self.db.expire_all()
+        self.assertEqual(self.db.query(AuditLog).count(), 2 * len(tokens))
+        ledger = self.db.query(EventLedger).filter(EventLedger.action_type == ACTION_VERIFY_ATTEMPT_VALID).all()
+        self.assertEqual(len(ledger), 2)
+
+    def test_batch_size_is_capped(self):
+        with mock.patch.object(get_settings(), "verify_batch_max_tokens", 2):
+            resp = self._batch([{"token_id": "a"}] * 3)
+        self.assertEqual(resp.status_code, 400)
+
+    def test_batch_requires_login_and_only_resolves_the_callers_properties(self):
+        items = [{"token_id": "INV-A1B2C3D4"}]
+        self.assertEqual(self.client.post("/public/verify/batch", json={"items": items}).status_code, 401)
+        guest = self.db.query(User).filter(User.email == "guest@example.com").one()
+        self.assertEqual(self._batch(items, guest).status_code, 403)
+
+        other = self._user("other@example.com")
+        manager = self._user("pm@example.com", UserRole.property_manager)
+        self.db.add(OwnerProfile(user_id=other.id))
+        self.db.commit()
+        # Another owner's valid token looks exactly like an unknown one, and no address or dates leak.
+        result = self._batch(items, other).json()["results"][0]
+        self.assertEqual((result["valid"], result["reason"], result["property_address"]), (False, "Token not found.", None))
+        self.assertEqual(self._batch(items, manager).json()["results"][0]["reason"], "Token not found.")
+
+        self.db.add(PropertyManagerAssignment(property_id=self.prop.id, user_id=manager.id))
+        self.db.commit()
+        self.assertTrue(self._batch(items, manager).json()["results"][0]["valid"])
+
+    def test_batch_is_rate_limited_per_caller(self):
+        with mock.patch.object(get_settings(), "verify_batch_rate_limit_tokens", 3):
+            self.assertEqual(self._batch([{"token_id": "INV-X"}] * 2).status_code, 200)
+            resp = self._batch([{"token_id": "INV-X"}] * 2)
+            self.assertEqual(resp.status_code, 429)
+            self.assertGreaterEqual(int(resp.headers["Retry-After"]), 1)
+            other = self._user("other@example.com")
+            self.db.commit()
+            self.assertEqual(self._batch([{"token_id": "INV-X"}] * 2, other).status_code, 200)
+
+    def test_buffered_logger_writes_batches_and_flushes_on_stop(self):
+        attempt_logger = VerifyAttemptLogger(session_factory=self.Session)
+        for i in range(5):
+            self.assertTrue(attempt_logger.enqueue(VerifyAttempt(
+                "failed_attempt", "Verify attempt – no match", f"Token not found: {i}",
+                meta={"result": "invalid", "reason": "token_not_found"},
+            )))
+        attempt_logger.stop()
+        self.assertEqual(self.db.query(AuditLog).count(), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Single-leader cron scheduling: lease election and failover, leader-only runs and job run history."""
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from app.config import get_settings
+from app.models.job_run import JobRun
+from app.models.scheduler_lease import SchedulerLease
+from app.services import scheduler
+from tests.support import DatabaseTestCase
+
+
+class TestScheduler(DatabaseTestCase):
+    def _instance(self, holder, jobs=()):
+        return scheduler.LeaderScheduler(
+            list(jobs),
+            session_factory=self.Session,
+            leadership=scheduler.LeaseLeadership(self.Session, holder, lease_seconds=30),
+            holder=holder,
+        )
+
+    def _expire_lease(self):
+        with self.Session() as db:
+            db.query(SchedulerLease).update({"expires_at": datetime.now(timezone.utc) - timedelta(seconds=1)})
+            db.commit()
+
+    def test_one_leader_and_failover_when_its_lease_lapses(self):
+        a, b = self._instance("a"), self._instance("b")
+        self.assertEqual((a.heartbeat(), b.heartbeat()), (True, False))
+        self.assertEqual((a.heartbeat(), b.heartbeat()), (True, False))  # renewal keeps it
+
+        self._expire_lease()  # "a" died without releasing
+        self.assertEqual((b.heartbeat(), a.heartbeat()), (True, False))
+        with self.Session() as db:
+            self.assertEqual(db.query(SchedulerLease).one().holder, "b")
+
+        b.stop()  # graceful stop hands the lease back at once
+        self.assertTrue(a.heartbeat())
+
+    def test_only_the_leader_runs_jobs_and_runs_are_recorded(self):
+        calls = []
+
+        def boom():
+            raise RuntimeError("provider down")
+
+        ok = scheduler.ScheduledJob("invitation_cleanup", lambda: calls.append(1), "cron", {"minute": 0})
+        failing = scheduler.ScheduledJob("bulk_upload_resume", boom, "interval", {"minutes": 5})
+        leader, standby = self._instance("a", [ok, failing]), self._instance("b", [ok, failing])
+        leader.heartbeat()
+        standby.heartbeat()
+
+        self.assertIsNone(standby.run(ok))
+        self.assertEqual((leader.run(ok), leader.run(failing)), ("succeeded", "failed"))
+        self.assertEqual(calls, [1])
+        with self.Session() as db:
+            runs = {r.job_name: r for r in db.query(JobRun).all()}
+        self.assertEqual(set(runs), {"invitation_cleanup", "bulk_upload_resume"})
+        self.assertEqual((runs["invitation_cleanup"].status, runs["invitation_cleanup"].holder), ("succeeded", "a"))
+        self.assertIsNotNone(runs["invitation_cleanup"].finished_at)
+        self.assertIn("provider down", runs["bulk_upload_resume"].error)
+
+    def test_scheduled_jobs_follow_settings(self):
+        with mock.patch.object(get_settings(), "test_mode", False), \
+                mock.patch.object(get_settings(), "dms_test_mode", False):
+            jobs = {j.name: j for j in scheduler.scheduled_jobs()}
+        self.assertEqual(
+            set(jobs),
+            {"invitation_cleanup", "bulk_upload_resume", "property_state_reconcile", "notification_attempt_purge"},
+        )
+        self.assertEqual(jobs["invitation_cleanup"].trigger_args, {"minute": 0})
+        with mock.patch.object(get_settings(), "test_mode", True), \
+                mock.patch.object(get_settings(), "dms_test_mode", True):
+            jobs = {j.name: j for j in scheduler.scheduled_jobs()}
+        self.assertEqual(jobs["invitation_cleanup"].trigger_args, {"minute": "*"})
+        self.assertIn("dms_test_mode_catchup", jobs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""Per-request SQL profiling middleware: headers, N+1 flags, slow log / route summary and query budgets."""
+import importlib.util
+import sys
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.database import get_db
+from app.models.user import UserRole
+from app.routers import dashboard, managers, public
+from app.services import sql_profiler
+from app.services.auth import create_access_token
+from app.services.live_page_cache import clear_live_page_cache
+from tests.support import DatabaseTestCase
+
+_BENCH = Path(__file__).resolve().parents[1] / "scripts" / "benchmark_endpoints.py"
+
+
+def _load_bench():
+    spec = importlib.util.spec_from_file_location("benchmark_endpoints", _BENCH)
+    module = sys.modules.get(spec.name)
+    if module is None:
+        module = sys.modules[spec.name] = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
+
+
+class TestSqlProfiler(DatabaseTestCase):
+    create_tables = False  # the benchmark portfolio creates its own schema
+
+    def setUp(self):
+        super().setUp()
+        sql_profiler.clear_sql_profile_stats()
+        self.addCleanup(sql_profiler.clear_sql_profile_stats)
+        for name, value in (("sql_query_budget_strict", False), ("sql_profiling_n_plus_one_threshold", 10),
+                            ("sql_profiling_slow_request_ms", 10_000)):
+            patcher = mock.patch.object(get_settings(), name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _client(self, app: FastAPI) -> TestClient:
+        app.dependency_overrides[get_db] = self.get_db_override()
+        sql_profiler.install_sql_profiling(app)
+        return TestClient(app)
+
+    def test_headers_n_plus_one_and_budget(self):
+        app = FastAPI()
+
+        @app.get("/rows")
+        @sql_profiler.query_budget(20)
+        def rows(db: Session = Depends(get_db)):
+            return [db.execute(text("SELECT :i"), {"i": i}).scalar() for i in range(12)]
+
+        @app.get("/over")
+        @sql_profiler.query_budget(1)
+        def over(db: Session = Depends(get_db)):
+            return [db.execute(text("SELECT 1")).scalar(), db.execute(text("SELECT 2")).scalar()]
+
+        client = self._client(app)
+        response = client.get("/rows")
+        self.assertEqual(response.headers["X-DB-Queries"], "12")
+        self.assertRegex(response.headers["Server-Timing"], r"^db;dur=[\d.]+, db-pool;dur=[\d.]+, app;dur=[\d.]+$")
+        self.assertEqual(client.get("/over").status_code, 200)  # logged only
+
+        stats = sql_profiler.get_sql_profile_stats()
+        routes = {r["route"]: r for r in stats["routes"]}
+        self.assertEqual((routes["GET /rows"]["max_queries"], routes["GET /rows"]["n_plus_one_requests"]), (12, 1))
+        self.assertEqual((routes["GET /over"]["budget"], routes["GET /over"]["budget_overruns"]), (1, 1))
+        flagged = next(e for e in stats["slow_requests"] if e["route"] == "GET /rows")
+        self.assertEqual(flagged["repeated_statements"], [{"count": 12, "statement": "SELECT ?"}])
+
+        with mock.patch.object(get_settings(), "sql_query_budget_strict", True):
+            with self.assertRaises(sql_profiler.QueryBudgetExceeded):
+                client.get("/over")
+            self.assertEqual(client.get("/rows").status_code, 200)
+
+    def test_budgeted_routes_stay_within_budget(self):
+        bench = _load_bench()
+        bench.prepare_database(self.engine)
+        with self.Session() as db:
+            portfolio = bench.generate_portfolio(db, scale=1, today=date.today())
+        app = FastAPI()
+        for router in (dashboard.router, managers.router, public.router):
+            app.include_router(router)
+        client = self._client(app)
+        clear_live_page_cache()
+        owner = {"Authorization": "Bearer " + create_access_token(portfolio.owner_id, portfolio.owner_email,
+                                                                  UserRole.owner)}
+        manager = {"Authorization": "Bearer " + create_access_token(portfolio.manager_id, portfolio.manager_email,
+                                                                    UserRole.property_manager)}
+        with mock.patch.object(get_settings(), "sql_query_budget_strict", True):
+            for path, headers, endpoint in (
+                ("/dashboard/owner/logs", owner, dashboard.owner_logs),
+                ("/dashboard/owner/logs?limit=20", owner, dashboard.owner_logs),
+                ("/managers/properties", manager, managers.list_assigned_properties),
+                (f"/public/live/{portfolio.live_slug}", {}, public.get_live_property_page),
+            ):
+                with self.subTest(path=path):
+                    response = client.get(path, headers=headers)
+                    self.assertEqual(response.status_code, 200)
+                    self.assertLessEqual(int(response.headers["X-DB-Queries"]), endpoint.query_budget)
+
+
+if __name__ == "__main__":
+    unittest.main()
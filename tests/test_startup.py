@@ -0,0 +1,106 @@
+"""Fingerprinted startup: schema / seed steps skipped when unchanged, timing report, lazy SDK imports."""
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+from sqlalchemy import Column, Integer, MetaData, Table, inspect
+
+from app.config import get_settings
+from app.database import Base
+from app.models.region_rule import RegionRule
+from app.models.startup_fingerprint import StartupFingerprint
+from app.models.startup_run import StartupRun
+from app.services import startup
+from tests.support import DatabaseTestCase
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestStartupFingerprints(DatabaseTestCase):
+    create_tables = False  # startup creates the schema itself
+
+    def _sync(self):
+        report = startup.StartupReport(import_ms=12.0)
+        with mock.patch("app.seed.seed_admin_user") as seed_admin, \
+                mock.patch("app.services.jurisdiction_sot.invalidate_jurisdiction_cache"):
+            outcome = startup.sync_schema_and_seed(self.engine, self.Session, Base.metadata, report=report)
+        return outcome, report, seed_admin
+
+    def test_unchanged_schema_and_seed_are_skipped(self):
+        outcome, _, seed_admin = self._sync()  # fresh database: no fingerprint table yet
+        self.assertEqual(outcome, {"schema": "applied", "seed": "applied"})
+        self.assertEqual(seed_admin.call_count, 1)
+        with self.Session() as db:
+            self.assertGreater(db.query(RegionRule).count(), 0)
+            self.assertEqual({r.name for r in db.query(StartupFingerprint).all()}, {"schema", "seed"})
+
+        outcome, report, seed_admin = self._sync()
+        self.assertEqual(outcome, {"schema": "skipped", "seed": "skipped"})
+        seed_admin.assert_not_called()
+        self.assertEqual([s["name"] for s in report.steps], ["schema", "seed"])
+
+        with mock.patch.dict(os.environ, {"ADMIN_PASSWORD": "rotated-password"}):
+            outcome, _, seed_admin = self._sync()
+        self.assertEqual(outcome, {"schema": "skipped", "seed": "applied"})
+        self.assertEqual(seed_admin.call_count, 1)
+
+        with mock.patch.object(get_settings(), "startup_fingerprint_enabled", False):
+            outcome, _, _ = self._sync()
+        self.assertEqual(outcome, {"schema": "applied", "seed": "applied"})
+
+    def test_schema_fingerprint_tracks_model_changes(self):
+        def metadata(*extra):
+            md = MetaData()
+            Table("t", md, Column("id", Integer, primary_key=True), *extra)
+            return md
+
+        self.assertEqual(startup.schema_fingerprint(metadata()), startup.schema_fingerprint(metadata()))
+        self.assertNotEqual(
+            startup.schema_fingerprint(metadata()),
+            startup.schema_fingerprint(metadata(Column("n", Integer, nullable=True))),
+        )
+
+        outcome, _, _ = self._sync()
+        md = MetaData()
+        for t in Base.metadata.sorted_tables:
+            t.to_metadata(md)
+        Table("new_feature", md, Column("id", Integer, primary_key=True))
+        with mock.patch("app.seed.seed_admin_user"), \
+                mock.patch("app.services.jurisdiction_sot.invalidate_jurisdiction_cache"):
+            outcome = startup.sync_schema_and_seed(self.engine, self.Session, md)
+        self.assertEqual(outcome["schema"], "applied")
+        self.assertTrue(inspect(self.engine).has_table("new_feature"))
+
+    def test_startup_report_is_recorded_per_release(self):
+        _, report, _ = self._sync()
+        with report.step("scheduler"):
+            pass
+        with mock.patch.object(get_settings(), "app_release", "2026.10.1"):
+            data = startup.record_startup(report, self.Session)
+        self.assertEqual(data["release"], "2026.10.1")
+        self.assertEqual(startup.get_startup_report()["steps"][-1]["name"], "scheduler")
+        with self.Session() as db:
+            run = db.query(StartupRun).one()
+        self.assertEqual((run.release, run.schema_outcome, run.seed_outcome), ("2026.10.1", "applied", "applied"))
+        self.assertEqual(run.import_ms, 12)
+        self.assertEqual([s["name"] for s in run.steps], ["schema", "seed", "scheduler"])
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_importing_the_app_does_not_load_heavy_sdks(self):
+        code = (
+            "import sys, app.main; "
+            "print('loaded=' + ','.join(m for m in ('stripe', 'reportlab', 'sendgrid', 'twilio', 'httpx') if m in sys.modules))"
+        )
+        env = dict(os.environ, DATABASE_URL="sqlite://")
+        out = subprocess.run(
+            [sys.executable, "-c", code], cwd=_ROOT, env=env, capture_output=True, text=True, timeout=120
+        )
+        self.assertEqual(out.returncode, 0, out.stderr)
+        self.assertEqual(out.stdout.strip().splitlines()[-1], "loaded=")
+
+
+if __name__ == "__main__":
+    unittest.main()
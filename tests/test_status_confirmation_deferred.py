@@ -0,0 +1,99 @@
+"""Deferred, once-a-day Status Confirmation materialization after sign-in."""
+import threading
+import unittest
+from datetime import date, timedelta
+from unittest import mock
+
+from app import background_jobs
+from app.models.user import UserRole
+from app.models.user_daily_task import UserDailyTask
+from app.routers import auth
+from app.services import stay_timer
+from tests.support import DatabaseTestCase
+
+
+class TestStatusConfirmationWatermark(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(stay_timer, "get_background_job_session", self.Session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.owner = self._user("owner@example.com")
+        self.guest = self._user("guest@example.com", UserRole.guest)
+        self.db.commit()
+
+    def _watermark(self):
+        self.db.expire_all()
+        row = self.db.query(UserDailyTask).filter(UserDailyTask.user_id == self.owner.id).first()
+        return row.last_run_for if row else None
+
+    def test_runs_once_per_user_per_day(self):
+        today = date(2026, 3, 2)
+        with mock.patch.object(stay_timer, "run_status_confirmation_materialize_for_user") as run:
+            self.assertTrue(stay_timer.materialize_status_confirmation_for_user_once(self.owner.id, today))
+            self.assertFalse(stay_timer.materialize_status_confirmation_for_user_once(self.owner.id, today))
+            self.assertFalse(
+                stay_timer.materialize_status_confirmation_for_user_once(self.owner.id, today - timedelta(days=1))
+            )
+            self.assertTrue(
+                stay_timer.materialize_status_confirmation_for_user_once(self.owner.id, today + timedelta(days=1))
+            )
+            self.assertFalse(stay_timer.materialize_status_confirmation_for_user_once(self.guest.id, today))
+        self.assertEqual(run.call_count, 2)
+        self.assertEqual(self._watermark(), today + timedelta(days=1))
+
+    def test_failure_restores_watermark_so_next_sign_in_retries(self):
+        first, second = date(2026, 3, 2), date(2026, 3, 3)
+        with mock.patch.object(stay_timer, "run_status_confirmation_materialize_for_user") as run:
+            stay_timer.materialize_status_confirmation_for_user_once(self.owner.id, first)
+            run.side_effect = RuntimeError("boom")
+            with self.assertRaises(RuntimeError):
+                stay_timer.materialize_status_confirmation_for_user_once(self.owner.id, second)
+            self.assertEqual(self._watermark(), first)
+            run.side_effect = None
+            self.assertTrue(stay_timer.materialize_status_confirmation_for_user_once(self.owner.id, second))
+        self.assertEqual(self._watermark(), second)
+
+    def test_auth_trigger_queues_instead_of_running_inline(self):
+        cal = date(2026, 3, 2)
+        with mock.patch.object(stay_timer, "run_status_confirmation_materialize_for_user") as run, \
+                mock.patch.object(background_jobs, "submit_keyed_job", return_value=True) as submit:
+            auth._trigger_guest_approaching_end_notifications_after_auth(
+                self.db, self.owner, client_calendar_date=cal
+            )
+        run.assert_not_called()
+        submit.assert_called_once()
+        key, fn, user_id, for_date = submit.call_args.args
+        self.assertEqual(key, f"status_confirmation_materialize:{self.owner.id}")
+        self.assertIs(fn, stay_timer.materialize_status_confirmation_for_user_once)
+        self.assertEqual((user_id, for_date), (self.owner.id, cal))
+
+
+class TestSubmitKeyedJob(unittest.TestCase):
+    def test_same_key_is_debounced_while_pending(self):
+        started, release, done = threading.Event(), threading.Event(), threading.Event()
+        calls = []
+
+        def slow(tag):
+            calls.append(tag)
+            started.set()
+            release.wait(5)
+            done.set()
+
+        self.assertTrue(background_jobs.submit_keyed_job("k:1", slow, "a"))
+        self.assertTrue(started.wait(5))
+        self.assertFalse(background_jobs.submit_keyed_job("k:1", slow, "b"))
+        release.set()
+        self.assertTrue(done.wait(5))
+        for _ in range(100):
+            if "k:1" not in background_jobs._deferred_pending:
+                break
+            threading.Event().wait(0.01)
+        again = threading.Event()
+        self.assertTrue(background_jobs.submit_keyed_job("k:1", lambda: (calls.append("c"), again.set())))
+        self.assertTrue(again.wait(5))
+        self.assertEqual(calls, ["a", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""Stay notification job: set-based candidate queries, property shards, per-sub-job report."""
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from unittest import mock
+
+from app.models.audit_log import AuditLog
+from app.models.event_ledger import EventLedger
+from app.models.invitation import Invitation
+from app.models.owner import OwnerProfile, Property
+from app.models.stay import Stay
+from app.models.user import UserRole
+from app.services import stay_timer
+from app.services.privacy_lanes import is_tenant_lane_stay, tenant_lane_stay_clause
+from app.services.stay_timer import PropertyShard, run_stay_notification_job, send_overstay_alerts_and_log
+from tests.support import DatabaseTestCase
+
+
+class TestStayNotificationJob(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(stay_timer, "get_background_job_session", self.Session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.owner = self._user("owner@example.com")
+        self.tenant = self._user("tenant@example.com", UserRole.tenant)
+        self.guest = self._user("guest@example.com", UserRole.guest)
+        profile = OwnerProfile(user_id=self.owner.id)
+        self.db.add(profile)
+        self.db.flush()
+        self.props = [
+            Property(owner_profile_id=profile.id, name=f"P{i}", street="1 Main", city="Tampa", state="FL",
+                     region_code="FL", owner_occupied=False)
+            for i in range(4)
+        ]
+        self.props[3].deleted_at = datetime.now(timezone.utc)
+        self.db.add_all(self.props)
+        self.db.commit()
+
+    def _stay(self, prop, *, end_offset, inviter=None, invitation=None, checked_in=True):
+        end = date.today() + timedelta(days=end_offset)
+        stay = Stay(
+            guest_id=self.guest.id, owner_id=self.owner.id, property_id=prop.id,
+            invitation_id=invitation.id if invitation else None,
+            invited_by_user_id=inviter.id if inviter else None,
+            stay_start_date=end - timedelta(days=7), stay_end_date=end, intended_stay_duration_days=7,
+            purpose_of_stay="travel", relationship_to_owner="friend", region_code="FL",
+            checked_in_at=datetime.now(timezone.utc) - timedelta(days=6) if checked_in else None,
+        )
+        self.db.add(stay)
+        self.db.commit()
+        return stay
+
+    def _invitation(self, prop, inviter, code):
+        inv = Invitation(
+            invitation_code=code, owner_id=self.owner.id, property_id=prop.id, invited_by_user_id=inviter.id,
+            stay_start_date=date.today(), stay_end_date=date.today(), purpose_of_stay="travel",
+            relationship_to_owner="friend", region_code="FL",
+        )
+        self.db.add(inv)
+        self.db.commit()
+        return inv
+
+    def test_tenant_lane_clause_matches_python_check(self):
+        tenant_inv = self._invitation(self.props[0], self.tenant, "T1")
+        owner_inv = self._invitation(self.props[0], self.owner, "O1")
+        stays = [
+            self._stay(self.props[0], end_offset=3),
+            self._stay(self.props[0], end_offset=3, inviter=self.tenant),
+            self._stay(self.props[0], end_offset=3, inviter=self.owner),
+            self._stay(self.props[0], end_offset=3, invitation=tenant_inv, inviter=self.owner),
+            self._stay(self.props[0], end_offset=3, invitation=owner_inv, inviter=self.tenant),
+        ]
+        in_sql = {sid for (sid,) in self.db.query(Stay.id).filter(tenant_lane_stay_clause())}
+        not_in_sql = {sid for (sid,) in self.db.query(Stay.id).filter(~tenant_lane_stay_clause())}
+        expected = {s.id for s in stays if is_tenant_lane_stay(self.db, s)}
+        self.assertEqual(in_sql, expected)
+        self.assertEqual(not_in_sql, {s.id for s in stays} - expected)
+        self.assertEqual(len(expected), 2)
+
+    def test_overstay_candidates_exclude_unmanaged_and_already_logged(self):
+        managed = [self._stay(p, end_offset=-3) for p in self.props[:3]]
+        self._stay(self.props[3], end_offset=-3)  # inactive property
+        self._stay(self.props[0], end_offset=-3, checked_in=False)
+        shards = [PropertyShard(i, 2) for i in range(2)]
+        per_shard = [send_overstay_alerts_and_log(self.db, shard=s) for s in shards]
+        self.assertEqual(sum(per_shard), 3)
+        self.assertTrue(all(n > 0 for n in per_shard))
+        logged = {sid for (sid,) in self.db.query(AuditLog.stay_id).filter(AuditLog.title == "Overstay occurred")}
+        self.assertEqual(logged, {s.id for s in managed})
+        # Dedupe is part of the query: nothing comes back on the next run.
+        self.assertEqual(send_overstay_alerts_and_log(self.db), 0)
+
+    def test_run_reports_every_sub_job_and_isolates_failures(self):
+        self._stay(self.props[0], end_offset=-3)
+        self._stay(self.props[1], end_offset=2)
+
+        def boom(db, *, shard=None):
+            raise RuntimeError("boom")
+
+        steps = list(stay_timer.STAY_NOTIFICATION_JOB_STEPS)
+        steps[0] = ("legal_warnings", boom)
+        with mock.patch.object(stay_timer, "STAY_NOTIFICATION_JOB_STEPS", tuple(steps)):
+            report = run_stay_notification_job()
+
+        by_name = {s.name: s for s in report.steps}
+        self.assertEqual([s.name for s in report.steps], [name for name, _ in stay_timer.STAY_NOTIFICATION_JOB_STEPS])
+        self.assertEqual(report.shards, 1)
+        self.assertEqual(by_name["legal_warnings"].failed_shards, 1)
+        self.assertEqual((by_name["overstays"].candidates, by_name["overstays"].failed_shards), (1, 0))
+        self.assertGreater(by_name["overstays"].rows_written, 0)
+        self.assertEqual(by_name["status_confirmation"].candidates, 1)
+        self.db.expire_all()
+        self.assertEqual(
+            self.db.query(EventLedger).filter(EventLedger.action_type == stay_timer.ACTION_DMS_48H_ALERT).count(), 1
+        )
+        self.assertIn("steps", report.as_dict())
+
+        again = {s.name: s for s in run_stay_notification_job().steps}
+        self.assertEqual(again["overstays"].candidates, 0)
+        self.assertEqual(again["status_confirmation"].candidates, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,367 @@
+"""Stay view assembler: owner/manager/tenant stay lists built from one preloaded context match the per-row builder."""
+import unittest
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+
+from app.models.agreement_signature import AgreementSignature
+from app.models.guest import GuestProfile, PurposeOfStay, RelationshipToOwner
+from app.models.invitation import Invitation
+from app.models.owner import OccupancyStatus, OwnerProfile, Property
+from app.models.property_manager_assignment import PropertyManagerAssignment
+from app.models.region_rule import RegionRule, RiskLevel, StayClassification
+from app.models.resident_mode import ResidentMode, ResidentModeType
+from app.models.stay import Stay
+from app.models.tenant_assignment import TenantAssignment
+from app.models.unit import Unit
+from app.models.user import UserRole
+from app.routers.dashboard import (
+    _owner_stay_state_fields,
+    _unit_label_if_multi_unit,
+    manager_stays,
+    owner_stays,
+    tenant_guest_history,
+)
+from app.schemas.dashboard import OwnerStayView
+from app.schemas.jle import JLEInput
+from app.services.display_names import label_for_stay, label_from_invitation
+from app.services.jle import resolve_jurisdiction
+from app.services.jurisdiction_sot import invalidate_jurisdiction_cache
+from app.services.occupancy import normalize_occupancy_status_for_display
+from app.services.privacy_lanes import (
+    REDACTED_GUEST_AUTHORIZATION_LABEL,
+    viewer_is_relationship_owner_for_invitation,
+    viewer_is_relationship_owner_for_stay,
+)
+from tests.support import DatabaseTestCase
+
+
+def _legal_fields(db, region_code: str, duration_days: int) -> dict:
+    rule = db.query(RegionRule).filter(RegionRule.region_code == region_code).first()
+    jle = resolve_jurisdiction(
+        db,
+        JLEInput(
+            region_code=region_code,
+            stay_duration_days=duration_days,
+            owner_occupied=True,
+            property_type=None,
+            guest_has_permanent_address=True,
+        ),
+    )
+    return {
+        "legal_classification": (jle.legal_classification if jle else None)
+        or (rule.stay_classification_label if rule else None)
+        or StayClassification.guest,
+        "max_stay_allowed_days": rule.max_stay_days if rule else 0,
+        "risk_indicator": (jle.risk_level if jle else None) or (rule.risk_level if rule else None) or RiskLevel.low,
+        "applicable_laws": (jle.applicable_statutes if jle else [])
+        or ([rule.statute_reference] if rule and rule.statute_reference else []),
+    }
+
+
+def _reference_stay_row(db, s: Stay, viewer_id: int, *, tenant: bool = False) -> OwnerStayView:
+    """The per-row builder the endpoints used before the assembler (one lookup per field, per stay)."""
+    show_pii = tenant or viewer_is_relationship_owner_for_stay(db, s, viewer_id)
+    prop = db.query(Property).filter(Property.id == s.property_id).first()
+    today, now = date.today(), datetime.now(timezone.utc)
+    conf_resp = s.occupancy_confirmation_response
+    dms_on = bool(s.dead_mans_switch_enabled)
+    needs_conf = show_ui = False
+    deadline = (
+        datetime.combine(s.stay_end_date + timedelta(days=2), dt_time.min, tzinfo=timezone.utc) if s.stay_end_date else None
+    )
+    if not tenant:
+        open_stay = s.checked_out_at is None and s.cancelled_at is None and dms_on and conf_resp is None
+        needs_conf = open_stay and now < deadline and s.stay_end_date <= today + timedelta(days=2)
+        prop_status = normalize_occupancy_status_for_display(
+            db, prop.id, s.unit_id, prop.occupancy_status or OccupancyStatus.vacant.value
+        )
+        show_ui = needs_conf or (
+            prop_status in (OccupancyStatus.unconfirmed.value, OccupancyStatus.unknown.value)
+            and open_stay
+            and s.stay_end_date < today
+        )
+    inv = db.query(Invitation).filter(Invitation.id == s.invitation_id).first() if s.invitation_id else None
+    unit_id = s.unit_id or (inv.unit_id if inv else None)
+    return OwnerStayView(
+        stay_id=s.id,
+        property_id=s.property_id,
+        invite_id=inv.invitation_code if inv and show_pii else None,
+        token_state=(inv.token_state or "BURNED") if inv else None,
+        invitation_only=False,
+        guest_name=label_for_stay(db, s) if show_pii else REDACTED_GUEST_AUTHORIZATION_LABEL,
+        property_name=prop.name or f"{prop.city}, {prop.state}",
+        unit_label=_unit_label_if_multi_unit(db, s.property_id, unit_id) if tenant else None,
+        stay_start_date=s.stay_start_date,
+        stay_end_date=s.stay_end_date,
+        region_code=s.region_code,
+        **_legal_fields(db, s.region_code, s.intended_stay_duration_days),
+        revoked_at=s.revoked_at,
+        checked_in_at=s.checked_in_at,
+        checked_out_at=s.checked_out_at,
+        cancelled_at=s.cancelled_at,
+        usat_token_released_at=s.usat_token_released_at,
+        dead_mans_switch_enabled=dms_on,
+        needs_occupancy_confirmation=needs_conf,
+        show_occupancy_confirmation_ui=show_ui,
+        confirmation_deadline_at=deadline if show_ui else None,
+        occupancy_confirmation_response=conf_resp,
+        property_deleted_at=prop.deleted_at,
+        **_owner_stay_state_fields(db, s, inv),
+    )
+
+
+def _reference_invitation_row(
+    db, inv: Invitation, viewer_id: int, *, tenant: bool = False, cancelled: bool = False
+) -> OwnerStayView:
+    show_pii = tenant or viewer_is_relationship_owner_for_invitation(inv, viewer_id)
+    prop = db.query(Property).filter(Property.id == inv.property_id).first()
+    region = (inv.region_code or "").strip() or prop.region_code or "US"
+    start, end = inv.stay_start_date, inv.stay_end_date
+    token_state = (inv.token_state or ("REVOKED" if cancelled else "BURNED")).upper()
+    return OwnerStayView(
+        stay_id=-inv.id,
+        property_id=inv.property_id,
+        invite_id=inv.invitation_code if show_pii else None,
+        token_state=token_state,
+        invitation_only=True,
+        guest_name=label_from_invitation(db, inv) if show_pii else REDACTED_GUEST_AUTHORIZATION_LABEL,
+        property_name=(prop.name or "").strip() or f"{prop.city}, {prop.state}",
+        unit_label=_unit_label_if_multi_unit(db, inv.property_id, inv.unit_id) if tenant else None,
+        stay_start_date=start,
+        stay_end_date=end,
+        region_code=region,
+        **_legal_fields(db, region, (end - start).days),
+        revoked_at=None,
+        checked_in_at=None,
+        checked_out_at=(
+            datetime.combine(end, dt_time.min, tzinfo=timezone.utc)
+            if not cancelled and token_state == "EXPIRED"
+            else None
+        ),
+        cancelled_at=inv.created_at if cancelled else None,
+        usat_token_released_at=None,
+        dead_mans_switch_enabled=bool(inv.dead_mans_switch_enabled),
+        needs_occupancy_confirmation=False,
+        show_occupancy_confirmation_ui=False,
+        confirmation_deadline_at=None,
+        occupancy_confirmation_response=None,
+        property_deleted_at=prop.deleted_at,
+        **_owner_stay_state_fields(db, None, inv),
+    )
+
+
+class TestStayViewAssembler(DatabaseTestCase):
+    session_options = {"autoflush": False, "expire_on_commit": False}
+
+    def setUp(self):
+        super().setUp()
+        invalidate_jurisdiction_cache()
+        self.addCleanup(invalidate_jurisdiction_cache)
+        db = self.db
+        self.today = date.today()
+        self.owner = self._user("owner@example.com")
+        self.manager = self._user("manager@example.com", UserRole.property_manager)
+        self.tenant = self._user("tenant@example.com", UserRole.tenant)
+        profile = OwnerProfile(user_id=self.owner.id)
+        db.add(profile)
+        db.flush()
+        db.add_all(
+            [
+                RegionRule(region_code="FL", max_stay_days=30, stay_classification_label=StayClassification.guest,
+                           risk_level=RiskLevel.medium, statute_reference="Fla. Stat. 82.035"),
+                RegionRule(region_code="CA", max_stay_days=14, stay_classification_label=StayClassification.lodger,
+                           risk_level=RiskLevel.high),
+            ]
+        )
+        # The owner lives at home (single unit); the rental has a tenant in unit 1 and the manager living in unit 2.
+        self.home = Property(owner_profile_id=profile.id, name="Home", street="1 Bay Rd", city="Tampa", state="FL",
+                             region_code="FL", owner_occupied=True, occupancy_status=OccupancyStatus.unknown.value)
+        self.rental = Property(owner_profile_id=profile.id, name=None, street="2 Elm St", city="Miami", state="FL",
+                               region_code="FL", owner_occupied=False, is_multi_unit=True)
+        db.add_all([self.home, self.rental])
+        db.flush()
+        self.home_unit = Unit(property_id=self.home.id, unit_label="1")
+        self.r1 = Unit(property_id=self.rental.id, unit_label="1")
+        self.r2 = Unit(property_id=self.rental.id, unit_label="2")
+        db.add_all([self.home_unit, self.r1, self.r2])
+        db.flush()
+        db.add_all(
+            [
+                PropertyManagerAssignment(property_id=self.home.id, user_id=self.manager.id),
+                PropertyManagerAssignment(property_id=self.rental.id, user_id=self.manager.id),
+                ResidentMode(user_id=self.manager.id, unit_id=self.r2.id, mode=ResidentModeType.manager_personal),
+                TenantAssignment(unit_id=self.r1.id, user_id=self.tenant.id, start_date=self.today - timedelta(days=90)),
+            ]
+        )
+        self._seq = 0
+        self.expected: dict[str, set[int]] = {"owner": set(), "manager": set(), "tenant": set()}
+
+        # Owner lane at home: labels from the guest profile, the user's name, a signature, the invitation itself.
+        legal = self._guest("legal@example.com", full_name="Nick", legal_name="Nicole Legal")
+        self._add_stay("owner", self.home, self.home_unit, self.owner, legal, region="FL", days=(-10, -1),
+                       dead_mans_switch_enabled=1)
+        named = self._guest("named@example.com", full_name="Sam Named")
+        self._add_stay("owner", self.home, None, self.owner, named, region="CA", days=(-3, 4), with_invitation=False)
+        signed = self._add_invitation("owner", self.home, self.home_unit, self.owner, token_state="BURNED")
+        db.add(
+            AgreementSignature(invitation_code=signed.invitation_code, region_code="FL", guest_email="sig@example.com",
+                               guest_full_name="Sig Nature", typed_signature="Sig Nature", document_id="d",
+                               document_title="Agreement", document_hash="h", document_content="c")
+        )
+        self._add_invitation("owner", self.home, self.home_unit, self.owner, token_state="EXPIRED",
+                             guest_name="Ivy Invited", region_code="CA")
+        # Manager-invited at home: shown to the owner, but redacted (the owner is not the relationship owner).
+        self._add_stay("owner", self.home, self.home_unit, self.manager, self._guest("mgr-home@example.com"),
+                       region="FL", days=(-2, 5))
+        # Manager's own unit: manager personal mode only.
+        self._add_stay("manager", self.rental, self.r2, self.manager, self._guest("mgr-r2@example.com"),
+                       region="FL", days=(-5, 2))
+        self._add_invitation("manager", self.rental, self.r2, self.manager, token_state="EXPIRED", guest_email="x@example.com")
+        # Owner-invited on the rental: outside the owner's personal units, so in no personal list.
+        self._add_stay(None, self.rental, self.r1, self.owner, self._guest("rental@example.com"), region="FL", days=(0, 3))
+        # Tenant lane: never on owner/manager lists, all on the tenant's guest history.
+        self._add_stay("tenant", self.rental, self.r1, self.tenant, self._guest("tg@example.com", full_name="Tia Guest"),
+                       region="FL", days=(-4, 1))
+        self._add_invitation("tenant", self.rental, self.r1, self.tenant, token_state="EXPIRED", guest_name="Ted")
+        self._add_invitation("tenant", self.rental, self.r1, self.tenant, token_state="REVOKED", status="cancelled",
+                             guest_email="cancel@example.com")
+        db.commit()
+
+    def _guest(self, email: str, *, full_name: str | None = None, legal_name: str | None = None):
+        u = self._user(email, UserRole.guest, full_name=full_name)
+        if legal_name:
+            self.db.add(GuestProfile(user_id=u.id, full_legal_name=legal_name, permanent_home_address="1 Far Rd"))
+            self.db.flush()
+        return u
+
+    def _add_invitation(self, lane, prop, unit, inviter, *, days=(-20, -10), status="pending", **fields) -> Invitation:
+        self._seq += 1
+        fields.setdefault("region_code", "FL")
+        inv = Invitation(
+            invitation_code=f"INV-{self._seq}",
+            owner_id=self.owner.id,
+            property_id=prop.id,
+            unit_id=unit.id if unit else None,
+            invited_by_user_id=inviter.id,
+            stay_start_date=self.today + timedelta(days=days[0]),
+            stay_end_date=self.today + timedelta(days=days[1]),
+            purpose_of_stay=PurposeOfStay.personal,
+            relationship_to_owner=RelationshipToOwner.friend,
+            status=status,
+            **fields,
+        )
+        self.db.add(inv)
+        self.db.flush()
+        if lane:
+            self.expected[lane].add(-inv.id)
+        return inv
+
+    def _add_stay(self, lane, prop, unit, inviter, guest, *, region, days, with_invitation=True, **fields) -> Stay:
+        inv = None
+        if with_invitation:
+            inv = self._add_invitation(None, prop, unit, inviter, days=days, status="accepted", token_state="BURNED",
+                                       region_code=region)
+        stay = Stay(
+            guest_id=guest.id,
+            owner_id=self.owner.id,
+            property_id=prop.id,
+            unit_id=unit.id if unit else None,
+            invitation_id=inv.id if inv else None,
+            invited_by_user_id=inviter.id,
+            stay_start_date=self.today + timedelta(days=days[0]),
+            stay_end_date=self.today + timedelta(days=days[1]),
+            intended_stay_duration_days=days[1] - days[0],
+            purpose_of_stay=PurposeOfStay.personal,
+            relationship_to_owner=RelationshipToOwner.friend,
+            region_code=region,
+            **fields,
+        )
+        self.db.add(stay)
+        self.db.flush()
+        if lane:
+            self.expected[lane].add(stay.id)
+        return stay
+
+    def _reference(self, db, viewer_id: int, stay_ids, *, tenant: bool = False) -> dict[int, dict]:
+        out = {}
+        for sid in stay_ids:
+            if sid > 0:
+                row = _reference_stay_row(db, db.get(Stay, sid), viewer_id, tenant=tenant)
+            else:
+                inv = db.get(Invitation, -sid)
+                row = _reference_invitation_row(db, inv, viewer_id, tenant=tenant, cancelled=inv.status == "cancelled")
+            out[sid] = row.model_dump()
+        return out
+
+    def _assert_matches_reference(self, rows: list[OwnerStayView], viewer_id: int, lane: str, *, tenant=False):
+        got = {r.stay_id: r.model_dump() for r in rows}
+        self.assertEqual(set(got), self.expected[lane])
+        with self.Session() as db:
+            expected = self._reference(db, viewer_id, got, tenant=tenant)
+        for sid in got:
+            self.assertEqual(got[sid], expected[sid], sid)
+
+    def test_owner_personal_rows_match_the_per_row_builder(self):
+        rows = owner_stays(db=self.db, current_user=self.owner, context_mode="personal")
+        self._assert_matches_reference(rows, self.owner.id, "owner")
+        by_name = {r.guest_name for r in rows}
+        self.assertTrue({"Nicole Legal", "Sam Named", "Sig Nature", "Ivy Invited"} <= by_name)
+        redacted = [r for r in rows if r.guest_name == REDACTED_GUEST_AUTHORIZATION_LABEL]
+        self.assertEqual([(r.invite_id, r.invitation_only) for r in redacted], [(None, False)])
+        ca = next(r for r in rows if r.guest_name == "Sam Named")
+        fl = next(r for r in rows if r.guest_name == "Nicole Legal")
+        self.assertEqual((ca.max_stay_allowed_days, ca.applicable_laws), (14, []))
+        self.assertEqual((fl.max_stay_allowed_days, fl.applicable_laws), (30, ["Fla. Stat. 82.035"]))
+        self.assertTrue(fl.show_occupancy_confirmation_ui)
+
+    def test_business_mode_lists_no_guest_stays(self):
+        self.assertEqual(owner_stays(db=self.db, current_user=self.owner, context_mode="business"), [])
+        self.assertEqual(manager_stays(db=self.db, current_user=self.manager, context_mode="business"), [])
+
+    def test_manager_personal_rows_match_the_per_row_builder(self):
+        rows = manager_stays(db=self.db, current_user=self.manager, context_mode="personal")
+        self._assert_matches_reference(rows, self.manager.id, "manager")
+        self.assertEqual({r.property_name for r in rows}, {"Miami, FL"})
+
+    def test_tenant_guest_history_rows_match_the_per_row_builder(self):
+        rows = tenant_guest_history(db=self.db, current_user=self.tenant)
+        self._assert_matches_reference(rows, self.tenant.id, "tenant", tenant=True)
+        self.assertEqual({r.unit_label for r in rows}, {"1"})
+        self.assertFalse(any(r.show_occupancy_confirmation_ui for r in rows))
+        cancelled = next(r for r in rows if r.token_state == "REVOKED")
+        self.assertIsNotNone(cancelled.cancelled_at)
+
+    def test_statement_count_does_not_grow_with_the_number_of_stays(self):
+        statements = self.capture_statements()
+
+        def count(call) -> int:
+            with self.Session() as db:
+                start = len(statements)
+                call(db)
+                return len(statements) - start
+
+        calls = {
+            "owner": lambda db: owner_stays(db=db, current_user=self.owner, context_mode="personal"),
+            "manager": lambda db: manager_stays(db=db, current_user=self.manager, context_mode="personal"),
+            "tenant": lambda db: tenant_guest_history(db=db, current_user=self.tenant),
+        }
+        for call in calls.values():
+            count(call)  # warm the jurisdiction cache
+        before = {lane: count(call) for lane, call in calls.items()}
+        # Same regions as the fixture: jurisdiction lookups are per region, not per row.
+        for n in range(10):
+            self._add_stay("owner", self.home, self.home_unit, self.owner,
+                           self._guest(f"more-o{n}@example.com", legal_name=f"Guest {n}"), region="FL", days=(-n, 3))
+            self._add_stay("manager", self.rental, self.r2, self.manager, self._guest(f"more-m{n}@example.com"),
+                           region="FL", days=(-n, 3))
+            self._add_stay("tenant", self.rental, self.r1, self.tenant, self._guest(f"more-t{n}@example.com"),
+                           region="FL", days=(-n, 3))
+            self._add_invitation("owner", self.home, self.home_unit, self.owner, token_state="EXPIRED")
+        self.db.commit()
+        after = {lane: count(call) for lane, call in calls.items()}
+        self.assertEqual(after, before)
+        with self.Session() as db:
+            self.assertEqual({r.stay_id for r in calls["owner"](db)}, self.expected["owner"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""Utility Bucket: concurrent legs, per-source deadlines, stable bucket order."""
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from app.services import utility_lookup
+from app.services.utility_lookup import lookup_utility_providers
+
+
+def _slow(seconds, value):
+    def fn(*_a, **_kw):
+        time.sleep(seconds)
+        return value
+    return fn
+
+
+_GEO = SimpleNamespace(county_name="Hillsborough County", state_abbreviation="FL", state_fips="12", county_fips="057")
+
+
+class TestLookupUtilityProviders(unittest.TestCase):
+    def _patch(self, census, rewiring, water, internet):
+        for target, fn in [
+            ("app.services.census_geocoder.lat_lng_to_geography", census),
+            ("app.services.utility_lookup._fetch_rewiring_america", rewiring),
+            ("app.services.water_lookup.lookup_water_providers", water),
+            ("app.services.fcc_broadband.fetch_fcc_providers", internet),
+        ]:
+            if fn is None:
+                continue
+            p = mock.patch(target, side_effect=fn)
+            self.addCleanup(p.stop)
+            p.start()
+
+    def test_legs_overlap_and_bucket_keeps_type_order(self):
+        internet_args = {}
+
+        def internet(*_a, **kw):
+            internet_args.update(kw)
+            return [{"name": "Fiber Co"}]
+
+        self._patch(
+            census=_slow(0.2, _GEO),
+            rewiring=_slow(0.3, [{"name": "TECO", "type": "electric"}, {"name": "Peoples Gas", "type": "gas"}]),
+            water=_slow(0.2, [{"name": "Tampa Water", "contact_phone": "555", "contact_email": "w@example.com"}]),
+            internet=internet,
+        )
+        timings = {}
+        t0 = time.monotonic()
+        providers = lookup_utility_providers("33602-1234", lat=27.9, lon=-82.4, state_abbreviation="fl", timings=timings)
+        elapsed = time.monotonic() - t0
+
+        # Rewiring America overlaps Census + water (0.3s vs 0.4s critical path) instead of adding to it.
+        self.assertLess(elapsed, 0.65)
+        self.assertEqual(
+            [(p.provider_type, p.name) for p in providers],
+            [("electric", "TECO"), ("gas", "Peoples Gas"), ("water", "Tampa Water"), ("internet", "Fiber Co")],
+        )
+        self.assertEqual(providers[2].email, "w@example.com")
+        self.assertEqual((internet_args["state_fips"], internet_args["county_fips"]), ("12", "057"))
+        self.assertEqual(set(timings), {"census", "electric_gas", "water", "internet"})
+        self.assertTrue(all(t["status"] == "ok" for t in timings.values()))
+        self.assertGreaterEqual(timings["electric_gas"]["ms"], 250)
+
+    def test_leg_past_its_deadline_is_left_out(self):
+        self._patch(
+            census=_slow(0, None),
+            rewiring=_slow(0, [{"name": "TECO", "type": "electric"}]),
+            water=_slow(1.0, [{"name": "Slow Water"}]),
+            internet=lambda *_a, **_kw: [{"name": "Fiber Co"}],
+        )
+        timings = {}
+        with mock.patch.dict(utility_lookup.LEG_DEADLINES_SECONDS, {"water": 0.1}):
+            t0 = time.monotonic()
+            providers = lookup_utility_providers("33602", lat=27.9, lon=-82.4, state_abbreviation="FL", timings=timings)
+        self.assertLess(time.monotonic() - t0, 0.6)
+        self.assertEqual([p.name for p in providers], ["TECO", "Fiber Co"])
+        self.assertEqual(timings["water"]["status"], "timeout")
+        self.assertEqual(timings["census"]["status"], "ok")
+
+    def test_slow_echo_leaves_time_for_the_csv_fallback(self):
+        echo_timeouts = []
+
+        def slow_echo(url, params=None, timeout=None):
+            echo_timeouts.append(timeout)
+            time.sleep(timeout)
+            raise TimeoutError("ECHO read timed out")
+
+        self._patch(
+            census=_slow(0, _GEO),
+            rewiring=_slow(0, []),
+            water=None,  # the real SQLite cache -> ECHO -> CSV chain
+            internet=lambda *_a, **_kw: [],
+        )
+        csv_row = {"pwsname": "Tampa Water Dept", "contactstate": "FL", "contactcity": "Tampa"}
+        timings = {}
+        with mock.patch.dict(utility_lookup.LEG_DEADLINES_SECONDS, {"water": 1.0}), \
+                mock.patch.object(utility_lookup, "WATER_CSV_RESERVE_SECONDS", 0.5), \
+                mock.patch("app.services.epa_echo_water._MIN_TIMEOUT", 0.05), \
+                mock.patch("app.services.epa_echo_water.shared_http_client",
+                           return_value=SimpleNamespace(get=slow_echo)), \
+                mock.patch("app.utility_providers.sqlite_cache.get_water_providers_from_db", return_value=[]), \
+                mock.patch("app.services.water_lookup.load_water_systems_csv", return_value=[csv_row]):
+            providers = lookup_utility_providers("33602", lat=27.9, lon=-82.4, state_abbreviation="FL",
+                                                 city="Tampa", timings=timings)
+        self.assertEqual(timings["water"]["status"], "ok")
+        self.assertEqual([p.name for p in providers if p.provider_type == "water"], ["Tampa Water Dept"])
+        self.assertEqual(len(echo_timeouts), 1)
+        self.assertLessEqual(echo_timeouts[0], 0.5)
+
+    def test_no_coordinates_or_zip_skips_those_legs(self):
+        self._patch(
+            census=_slow(0, _GEO),
+            rewiring=_slow(0, []),
+            water=lambda *_a, **_kw: [],
+            internet=lambda *_a, **_kw: [],
+        )
+        timings = {}
+        self.assertEqual(lookup_utility_providers(None, state_abbreviation=None, timings=timings), [])
+        self.assertEqual(
+            {k: v["status"] for k, v in timings.items()},
+            {"census": "skipped", "electric_gas": "skipped", "water": "skipped", "internet": "ok"},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""SQLite water provider cache: normalized lookup keys, covering-index plans, pooled read-only connections."""
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from app.config import get_settings
+from app.utility_providers import sqlite_cache
+from app.utility_providers.sqlite_cache import (
+    get_water_providers_from_db,
+    upsert_water_providers_bulk,
+    upsert_water_providers_merge,
+)
+
+
+def _row(pwsid, name, city, state="FL", **kw):
+    return dict(pwsid=pwsid, pwsname=name, state=state, contactcity=city, contactstate=state, contactphone="555", **kw)
+
+
+class TestWaterProviderCache(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "utility.db")
+        patcher = mock.patch.object(get_settings(), "fcc_internet_cache_path", self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._close_pool)
+
+    def _close_pool(self):
+        pool = sqlite_cache._read_pools.pop(self.path, None)
+        while pool is not None and not pool.empty():
+            pool.get_nowait().close()
+
+    def test_lookup_matches_case_and_whitespace_variants(self):
+        upsert_water_providers_bulk(
+            [
+                _row("FL1", "Tampa Water", "  tampa "),
+                _row("FL2", "Bay Utility", "TAMPA"),
+                _row("FL3", "Port Water", "Port  St. Lucie"),
+                _row("GA1", "Atlanta Water", "Atlanta", state="GA"),
+            ]
+        )
+        upsert_water_providers_merge([_row("FL4", "Acme Water", "Tampa", state=" fl ")])
+        names = [p["name"] for p in get_water_providers_from_db("fl", city="Tampa")]
+        self.assertEqual(names, ["Acme Water", "Bay Utility", "Tampa Water"])
+        self.assertEqual([p["name"] for p in get_water_providers_from_db("FL", city="port st. lucie")], ["Port Water"])
+        self.assertEqual(len(get_water_providers_from_db("FL")), 4)
+        self.assertEqual(get_water_providers_from_db("FL", city="Nowhere"), [])
+        # The second lookup reused the pooled read-only connection.
+        self.assertEqual(sqlite_cache._read_pools[self.path].qsize(), 1)
+        with sqlite_cache.read_connection("water") as conn:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            with self.assertRaises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM water_provider_cache")
+
+    def test_lookups_use_covering_indexes(self):
+        upsert_water_providers_bulk([_row("FL1", "Tampa Water", "Tampa")])
+        cols = "pwsid, pwsname, contactcity, contactstate, contactphone, contactemail"
+        with sqlite_cache.read_connection("water") as conn:
+            for where, args, index in [
+                ("state_key = ? AND city_key = ?", ("FL", "TAMPA"), "idx_water_cache_city_key"),
+                ("state_key = ?", ("FL",), "idx_water_cache_state_key"),
+            ]:
+                plan = " ".join(
+                    r[-1]
+                    for r in conn.execute(
+                        f"EXPLAIN QUERY PLAN SELECT {cols} FROM water_provider_cache WHERE {where} ORDER BY pwsname LIMIT 100",
+                        args,
+                    )
+                )
+                self.assertIn(f"COVERING INDEX {index}", plan)
+                self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_legacy_rows_are_backfilled(self):
+        conn = sqlite3.connect(self.path)
+        conn.executescript(
+            """
+            CREATE TABLE water_provider_cache (
+                pwsid TEXT NOT NULL PRIMARY KEY, pwsname TEXT NOT NULL, state TEXT, contactcity TEXT,
+                contactstate TEXT NOT NULL, contactphone TEXT, status TEXT NOT NULL,
+                updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+            );
+            INSERT INTO water_provider_cache (pwsid, pwsname, state, contactcity, contactstate, status)
+            VALUES ('FL9', 'Old Water', 'FL', ' Key  West ', 'fl', 'Active');
+            """
+        )
+        conn.close()
+        self.assertEqual([p["name"] for p in get_water_providers_from_db("FL", city="key west")], ["Old Water"])
+
+
+if __name__ == "__main__":
+    unittest.main()